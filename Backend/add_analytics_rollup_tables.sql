@@ -0,0 +1,55 @@
+-- Pre-aggregated analytics for the admin and editor dashboards.
+-- Content_Analytics_Daily is refreshed incrementally by utils/analytics_rollup.py
+-- from a high-water mark on Content.Updated_At / Content_Metrics.Last_Updated.
+-- Requires add_content_counters.sql.
+USE lawfort;
+
+-- Status changes made without touching Updated_At must still move the high-water mark
+ALTER TABLE Content MODIFY Updated_At DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP;
+
+CREATE INDEX idx_content_updated_at ON Content (Updated_At);
+CREATE INDEX idx_content_metrics_last_updated ON Content_Metrics (Last_Updated);
+
+-- One row per (creation date, content type, creator, status)
+CREATE TABLE IF NOT EXISTS Content_Analytics_Daily (
+    Created_Date DATE NOT NULL,
+    Content_Type VARCHAR(20) NOT NULL,
+    Creator_ID INT NOT NULL,
+    Status VARCHAR(20) NOT NULL,
+    Content_Count INT NOT NULL DEFAULT 0,
+    Views BIGINT NOT NULL DEFAULT 0,
+    Likes BIGINT NOT NULL DEFAULT 0,
+    Shares BIGINT NOT NULL DEFAULT 0,
+    Comments BIGINT NOT NULL DEFAULT 0,
+    Applications BIGINT NOT NULL DEFAULT 0,
+    Time_Spent_Sum BIGINT NOT NULL DEFAULT 0, -- Sum of Avg_Time_Spent, divide by Content_Count
+    Bounce_Rate_Sum DECIMAL(14,2) NOT NULL DEFAULT 0.00, -- Sum of Bounce_Rate, divide by Content_Count
+    Last_Created_At DATETIME,
+    PRIMARY KEY (Created_Date, Content_Type, Creator_ID, Status),
+    INDEX idx_analytics_daily_creator (Creator_ID, Created_Date),
+    INDEX idx_analytics_daily_type (Content_Type, Status)
+);
+
+-- What each content item currently contributes to Content_Analytics_Daily
+CREATE TABLE IF NOT EXISTS Content_Analytics_Snapshot (
+    Content_ID INT PRIMARY KEY,
+    Created_Date DATE NOT NULL,
+    Content_Type VARCHAR(20) NOT NULL,
+    Creator_ID INT NOT NULL,
+    Status VARCHAR(20) NOT NULL,
+    Views INT NOT NULL DEFAULT 0,
+    Likes INT NOT NULL DEFAULT 0,
+    Shares INT NOT NULL DEFAULT 0,
+    Comments INT NOT NULL DEFAULT 0,
+    Applications INT NOT NULL DEFAULT 0,
+    Time_Spent INT NOT NULL DEFAULT 0,
+    Bounce_Rate DECIMAL(5,2) NOT NULL DEFAULT 0.00,
+    Created_At DATETIME
+);
+
+CREATE TABLE IF NOT EXISTS Analytics_Refresh_State (
+    Name VARCHAR(50) PRIMARY KEY,
+    High_Water_Mark DATETIME,
+    Last_Refreshed_At DATETIME,
+    Last_Row_Count INT DEFAULT 0
+);
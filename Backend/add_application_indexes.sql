@@ -0,0 +1,18 @@
+-- Application indexes for the unified admin applications listing.
+-- /api/admin/applications merges job applications, internship applications
+-- and research paper reviews with UNION ALL; each branch reads its newest rows
+-- from one of these indexes (InnoDB appends the primary key, which breaks ties)
+-- and stops at the page size instead of loading the whole history.
+USE lawfort;
+
+ALTER TABLE Job_Applications
+    ADD INDEX idx_job_applications_date (Application_Date),
+    ADD INDEX idx_job_applications_status_date (Status, Application_Date);
+
+ALTER TABLE Internship_Applications
+    ADD INDEX idx_internship_applications_date (Application_Date),
+    ADD INDEX idx_internship_applications_status_date (Status, Application_Date);
+
+ALTER TABLE Research_Paper_Reviews
+    ADD INDEX idx_research_reviews_submitted (Submitted_At, Content_ID),
+    ADD INDEX idx_research_reviews_status_submitted (Status, Submitted_At, Content_ID);
@@ -0,0 +1,33 @@
+-- Audit log indexes and partitioned archive.
+-- idx_audit_logs_timestamp serves the newest-first /admin/audit_logs pages
+-- and lets the archiver in utils/audit_log.py find old entries; the
+-- (Admin_ID, Timestamp) and (Action_Type, Timestamp) indexes serve the same
+-- pages filtered by admin or action type.
+-- Entries older than AUDIT_RETENTION_DAYS (default 180) move to
+-- Audit_Logs_Archive, which is partitioned by month. Only the catch-all pmax
+-- partition is created here; the archiver splits monthly partitions off it
+-- before moving rows into those months. Audit_Logs itself stays unpartitioned
+-- because partitioned InnoDB tables cannot have foreign keys.
+USE lawfort;
+
+ALTER TABLE Audit_Logs
+    ADD INDEX idx_audit_logs_timestamp (Timestamp),
+    ADD INDEX idx_audit_logs_admin_timestamp (Admin_ID, Timestamp),
+    ADD INDEX idx_audit_logs_action_timestamp (Action_Type, Timestamp);
+
+CREATE TABLE IF NOT EXISTS Audit_Logs_Archive (
+    Log_ID INT NOT NULL, -- Same ID as in Audit_Logs
+    Admin_ID INT,
+    Action_Type VARCHAR(255),
+    Action_Details TEXT,
+    Timestamp DATETIME NOT NULL,
+    Archived_At DATETIME DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (Log_ID, Timestamp),
+    INDEX idx_audit_archive_timestamp (Timestamp),
+    INDEX idx_audit_archive_admin (Admin_ID, Timestamp),
+    INDEX idx_audit_archive_action (Action_Type, Timestamp)
+)
+PARTITION BY RANGE (TO_DAYS(Timestamp)) (
+    PARTITION p_start VALUES LESS THAN (TO_DAYS('2000-01-01')),
+    PARTITION pmax VALUES LESS THAN MAXVALUE
+);
@@ -0,0 +1,43 @@
+-- Denormalized comment and application counters on Content_Metrics.
+-- Listing and analytics queries read these instead of counting
+-- Content_Comments / *_Applications per row. Handlers keep them current;
+-- POST /admin/metrics/reconcile (and the periodic reconciler) fixes drift.
+-- Requires add_content_metrics_unique_key.sql.
+USE lawfort;
+
+ALTER TABLE Content_Metrics ADD COLUMN Applications_Count INT DEFAULT 0 AFTER Comments_Count;
+
+-- Every content item gets a metrics row so counters can be upserted
+INSERT INTO Content_Metrics (Content_ID)
+SELECT c.Content_ID
+FROM Content c
+LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
+WHERE cm.Content_ID IS NULL;
+
+-- Backfill the counters from the source tables
+UPDATE Content_Metrics cm
+LEFT JOIN (
+    SELECT Content_ID, COUNT(*) AS actual
+    FROM Content_Comments
+    WHERE Status = 'Active'
+    GROUP BY Content_ID
+) comments ON comments.Content_ID = cm.Content_ID
+SET cm.Comments_Count = COALESCE(comments.actual, 0);
+
+UPDATE Content_Metrics cm
+LEFT JOIN (
+    SELECT apps.Content_ID, SUM(apps.total) AS actual
+    FROM (
+        SELECT j.Content_ID, COUNT(*) AS total
+        FROM Job_Applications ja
+        JOIN Jobs j ON ja.Job_ID = j.Job_ID
+        GROUP BY j.Content_ID
+        UNION ALL
+        SELECT i.Content_ID, COUNT(*) AS total
+        FROM Internship_Applications ia
+        JOIN Internships i ON ia.Internship_ID = i.Internship_ID
+        GROUP BY i.Content_ID
+    ) apps
+    GROUP BY apps.Content_ID
+) applications ON applications.Content_ID = cm.Content_ID
+SET cm.Applications_Count = COALESCE(applications.actual, 0);
@@ -46,36 +46,10 @@ SET Likes = (
 Last_Updated = NOW()
 WHERE cm.Content_ID IN (SELECT DISTINCT Content_ID FROM Content_Likes);
 
--- Add a trigger to automatically update Content_Metrics when likes are added
-DELIMITER //
-
-DROP TRIGGER IF EXISTS update_likes_on_insert //
-CREATE TRIGGER update_likes_on_insert
-    AFTER INSERT ON Content_Likes
-    FOR EACH ROW
-BEGIN
-    -- Update the likes count in Content_Metrics
-    UPDATE Content_Metrics 
-    SET Likes = Likes + 1, Last_Updated = NOW()
-    WHERE Content_ID = NEW.Content_ID;
-    
-    -- If no metrics record exists, create one
-    INSERT IGNORE INTO Content_Metrics (Content_ID, Views, Likes, Shares, Comments_Count)
-    VALUES (NEW.Content_ID, 0, 1, 0, 0);
-END //
-
-DROP TRIGGER IF EXISTS update_likes_on_delete //
-CREATE TRIGGER update_likes_on_delete
-    AFTER DELETE ON Content_Likes
-    FOR EACH ROW
-BEGIN
-    -- Update the likes count in Content_Metrics
-    UPDATE Content_Metrics 
-    SET Likes = GREATEST(Likes - 1, 0), Last_Updated = NOW()
-    WHERE Content_ID = OLD.Content_ID;
-END //
-
-DELIMITER ;
+-- Content_Metrics.Likes is maintained by the like toggle in app.py (see
+-- drop_content_likes_triggers.sql), so no triggers are created here.
+DROP TRIGGER IF EXISTS update_likes_on_insert;
+DROP TRIGGER IF EXISTS update_likes_on_delete;
 
 -- Verify the table was created successfully
 SELECT 'Content_Likes table created successfully!' as Status;
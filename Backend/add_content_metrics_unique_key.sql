@@ -0,0 +1,29 @@
+-- Give Content_Metrics one row per content item so counters can be upserted
+-- with INSERT ... ON DUPLICATE KEY UPDATE (used by the batched view counter)
+USE lawfort;
+
+-- Fold duplicate metric rows into the oldest row for each content item
+UPDATE Content_Metrics keep_row
+JOIN (
+    SELECT Content_ID,
+           MIN(Metric_ID) AS Keep_ID,
+           SUM(Views) AS Views,
+           SUM(Shares) AS Shares,
+           MAX(Likes) AS Likes,
+           MAX(Comments_Count) AS Comments_Count,
+           MAX(Last_Updated) AS Last_Updated
+    FROM Content_Metrics
+    GROUP BY Content_ID
+    HAVING COUNT(*) > 1
+) dup ON keep_row.Metric_ID = dup.Keep_ID
+SET keep_row.Views = dup.Views,
+    keep_row.Shares = dup.Shares,
+    keep_row.Likes = dup.Likes,
+    keep_row.Comments_Count = dup.Comments_Count,
+    keep_row.Last_Updated = dup.Last_Updated;
+
+DELETE cm FROM Content_Metrics cm
+JOIN Content_Metrics keep_row
+    ON keep_row.Content_ID = cm.Content_ID AND keep_row.Metric_ID < cm.Metric_ID;
+
+ALTER TABLE Content_Metrics ADD UNIQUE KEY unique_content_metrics (Content_ID);
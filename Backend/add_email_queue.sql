@@ -0,0 +1,28 @@
+-- Persistent outbound mail queue.
+-- Email_Logs holds each message once; Email_Queue holds one delivery per
+-- recipient, claimed by the workers in utils/mailer.py with
+-- FOR UPDATE SKIP LOCKED (MySQL 8.0+). Sent/failed counts are written back to
+-- Email_Logs in batches; a message is 'pending' until every recipient is done.
+USE lawfort;
+
+ALTER TABLE Email_Logs
+    ADD COLUMN Recipient_Count INT NOT NULL DEFAULT 0,
+    ADD COLUMN Sent_Count INT NOT NULL DEFAULT 0,
+    ADD COLUMN Failed_Count INT NOT NULL DEFAULT 0,
+    ADD INDEX idx_email_logs_sent (Sent_At);
+
+CREATE TABLE IF NOT EXISTS Email_Queue (
+    Queue_ID BIGINT AUTO_INCREMENT PRIMARY KEY,
+    Email_ID INT NOT NULL,
+    Recipient VARCHAR(255) NOT NULL,
+    Domain VARCHAR(255) NOT NULL, -- Lower-cased, for per-domain rate limits
+    Status ENUM('queued', 'sent', 'failed') NOT NULL DEFAULT 'queued',
+    Attempts INT NOT NULL DEFAULT 0,
+    Next_Attempt_At DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    Last_Error VARCHAR(1000) NULL,
+    Created_At DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    Sent_At DATETIME NULL,
+    INDEX idx_email_queue_due (Status, Next_Attempt_At),
+    INDEX idx_email_queue_email (Email_ID, Status),
+    FOREIGN KEY (Email_ID) REFERENCES Email_Logs(Email_ID) ON DELETE CASCADE
+);
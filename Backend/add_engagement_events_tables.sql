@@ -0,0 +1,33 @@
+-- Append-only content engagement events and their per-day compaction.
+-- Written by utils/engagement_events.py; time-range analytics read
+-- Content_Engagement_Daily. Raw events are purged after
+-- ENGAGEMENT_RETENTION_DAYS (default 30). Requires add_analytics_rollup_tables.sql.
+USE lawfort;
+
+CREATE TABLE IF NOT EXISTS Content_Engagement_Events (
+    Event_ID BIGINT AUTO_INCREMENT PRIMARY KEY,
+    Content_ID INT NOT NULL,
+    Event_Type ENUM('view', 'like', 'unlike', 'share', 'comment', 'dwell') NOT NULL,
+    User_ID INT NULL,
+    Viewer_Key VARCHAR(64) NULL, -- user:<id>, session:<sha1> or client:<sha1>
+    Value INT NOT NULL DEFAULT 0, -- Seconds on the page for dwell events
+    Occurred_At DATETIME NOT NULL,
+    INDEX idx_engagement_events_time (Occurred_At),
+    INDEX idx_engagement_events_content (Content_ID, Occurred_At)
+);
+
+CREATE TABLE IF NOT EXISTS Content_Engagement_Daily (
+    Event_Date DATE NOT NULL,
+    Content_ID INT NOT NULL,
+    Views INT NOT NULL DEFAULT 0,
+    Unique_Viewers INT NOT NULL DEFAULT 0,
+    Likes INT NOT NULL DEFAULT 0,
+    Unlikes INT NOT NULL DEFAULT 0,
+    Shares INT NOT NULL DEFAULT 0,
+    Comments INT NOT NULL DEFAULT 0,
+    Dwell_Count INT NOT NULL DEFAULT 0,
+    Dwell_Seconds BIGINT NOT NULL DEFAULT 0,
+    Bounces INT NOT NULL DEFAULT 0, -- Dwell pings shorter than 10 seconds
+    PRIMARY KEY (Event_Date, Content_ID),
+    INDEX idx_engagement_daily_content (Content_ID, Event_Date)
+);
@@ -0,0 +1,13 @@
+-- Stored engagement score for top-content leaderboards.
+-- MySQL recomputes Engagement_Score whenever Views, Likes, Shares or
+-- Comments_Count change, and the index lets utils/leaderboard.py read the
+-- top K rows without scoring and sorting all content.
+-- Requires add_content_metrics_unique_key.sql.
+USE lawfort;
+
+ALTER TABLE Content_Metrics
+    ADD COLUMN Engagement_Score DECIMAL(14, 2) GENERATED ALWAYS AS (
+        COALESCE(Views, 0) * 0.4 + COALESCE(Likes, 0) * 0.3 +
+        COALESCE(Shares, 0) * 0.2 + COALESCE(Comments_Count, 0) * 0.1
+    ) STORED,
+    ADD INDEX idx_content_metrics_engagement (Engagement_Score);
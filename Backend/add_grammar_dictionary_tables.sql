@@ -0,0 +1,21 @@
+-- Per-user legal dictionary and rule settings for the grammar checker
+USE lawfort;
+
+-- Terms (Latin phrases, case names, citations) the user never wants flagged as misspellings
+CREATE TABLE IF NOT EXISTS User_Grammar_Dictionary (
+    Entry_ID INT AUTO_INCREMENT PRIMARY KEY,
+    User_ID INT NOT NULL,
+    Term VARCHAR(100) NOT NULL,
+    Created_At DATETIME DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (User_ID) REFERENCES Users(User_ID) ON DELETE CASCADE,
+    UNIQUE KEY unique_user_term (User_ID, Term)
+);
+
+-- LanguageTool rules/categories disabled for every check made by the user
+CREATE TABLE IF NOT EXISTS User_Grammar_Settings (
+    User_ID INT PRIMARY KEY,
+    Disabled_Rules TEXT,            -- Comma-separated LanguageTool rule ids
+    Disabled_Categories TEXT,       -- Comma-separated LanguageTool category ids
+    Updated_At DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (User_ID) REFERENCES Users(User_ID) ON DELETE CASCADE
+);
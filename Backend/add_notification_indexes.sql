@@ -0,0 +1,27 @@
+-- Notification indexes and archive table.
+-- (User_ID, Is_Read, Created_At) serves unread lists, unread counts and
+-- mark-all-read as index ranges; (User_ID, Created_At) serves the full list
+-- newest first; (Is_Read, Created_At) lets the retention job in
+-- utils/notifications.py find old read notifications without a table scan.
+-- Read notifications older than NOTIFICATION_RETENTION_DAYS (default 90) are
+-- moved to Notifications_Archive in batches. Requires add_notifications_table.sql.
+USE lawfort;
+
+ALTER TABLE Notifications
+    ADD INDEX idx_notifications_user_read_created (User_ID, Is_Read, Created_At),
+    ADD INDEX idx_notifications_user_created (User_ID, Created_At),
+    ADD INDEX idx_notifications_read_created (Is_Read, Created_At);
+
+CREATE TABLE IF NOT EXISTS Notifications_Archive (
+    Notification_ID INT PRIMARY KEY, -- Same ID as in Notifications
+    User_ID INT,
+    Type VARCHAR(50),
+    Title VARCHAR(255),
+    Message TEXT,
+    Is_Read BOOLEAN,
+    Created_At DATETIME,
+    Related_Content_ID INT,
+    Action_URL VARCHAR(255),
+    Archived_At DATETIME DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_notifications_archive_user (User_ID, Created_At)
+);
@@ -0,0 +1,15 @@
+-- Single-use tickets for opening /api/notifications/stream.
+-- EventSource cannot send an Authorization header; instead of the session
+-- token, the URL carries a ticket issued by
+-- POST /api/notifications/stream-ticket. Only the SHA-256 of each ticket is
+-- stored; a ticket is deleted when redeemed and expired ones are pruned as
+-- new tickets are issued.
+USE lawfort;
+
+CREATE TABLE IF NOT EXISTS Notification_Stream_Tickets (
+    Ticket_Hash CHAR(64) PRIMARY KEY,
+    User_ID INT NOT NULL,
+    Expires_At DATETIME NOT NULL,
+    INDEX idx_stream_tickets_expires (Expires_At),
+    FOREIGN KEY (User_ID) REFERENCES Users(User_ID) ON DELETE CASCADE
+);
@@ -0,0 +1,21 @@
+-- Transactional outbox.
+-- Content and application writes insert an Outbox_Events row in their own
+-- transaction; the dispatcher in utils/outbox.py claims pending events with
+-- FOR UPDATE SKIP LOCKED (MySQL 8.0+) and runs the notification/audit side
+-- effects. Done events are purged after a day; failed events stay for
+-- inspection with their Last_Error.
+USE lawfort;
+
+CREATE TABLE IF NOT EXISTS Outbox_Events (
+    Event_ID BIGINT AUTO_INCREMENT PRIMARY KEY,
+    Event_Type VARCHAR(64) NOT NULL,
+    Payload JSON NOT NULL,
+    Status ENUM('pending', 'done', 'failed') NOT NULL DEFAULT 'pending',
+    Attempts INT NOT NULL DEFAULT 0,
+    Available_At DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    Created_At DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    Processed_At DATETIME NULL,
+    Last_Error VARCHAR(1000) NULL,
+    INDEX idx_outbox_due (Status, Available_At, Event_ID),
+    INDEX idx_outbox_processed (Status, Processed_At)
+);
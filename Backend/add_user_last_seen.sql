@@ -0,0 +1,24 @@
+-- Users.Last_Seen_At and admin user listing indexes.
+-- Last_Seen_At is the time of a user's latest login or authenticated request,
+-- written in batches by utils/last_seen.py (at most once per user every
+-- LAST_SEEN_RESOLUTION seconds). It replaces the per-user Session subquery
+-- behind "active in the last 30 days" on /admin/users and /admin/analytics.
+-- The Created_At indexes serve the newest-first keyset pages of /admin/users,
+-- alone or filtered by status or role.
+USE lawfort;
+
+ALTER TABLE Users
+    ADD COLUMN Last_Seen_At DATETIME NULL,
+    ADD INDEX idx_users_last_seen (Last_Seen_At),
+    ADD INDEX idx_users_created (Created_At),
+    ADD INDEX idx_users_status_created (Status, Created_At),
+    ADD INDEX idx_users_role_created (Role_ID, Created_At);
+
+-- Backfill from existing sessions
+UPDATE Users u
+JOIN (
+    SELECT User_ID, MAX(Last_Active_Timestamp) AS Last_Seen_At
+    FROM Session
+    GROUP BY User_ID
+) s ON u.User_ID = s.User_ID
+SET u.Last_Seen_At = s.Last_Seen_At;
@@ -1,20 +1,41 @@
 import os
 from dotenv import load_dotenv
-from flask import Flask, request, jsonify
+from flask import Flask, request, jsonify, Response, stream_with_context, g
 from mysql.connector import pooling
+from mysql.connector.errors import PoolError
 import bcrypt
 import uuid
 import json
+import hashlib
 from datetime import datetime, date
 from flask_cors import CORS
 from google.auth.transport import requests as google_requests
 from google.oauth2 import id_token
 from functools import wraps
 from werkzeug.utils import secure_filename
-from grammar_checker import check_grammar_api
+from grammar_checker import check_grammar_api, get_grammar_checker_pool, get_revision_tracker, CheckOptions, normalize_rule_ids
 import PyPDF2
 import io
 from utils.pdf_thumbnail import generate_research_paper_thumbnail
+from utils.compression import compressed
+from utils.grammar_dictionary import GrammarDictionaryStore, normalize_terms
+from utils.metrics import get_metrics_registry
+from utils.view_counter import ViewCounter
+from utils.content_counters import CounterReconciler, increment_content_counter
+from utils.analytics_rollup import AnalyticsRollup
+from utils.engagement_events import MAX_DWELL_SECONDS, EngagementCompactor, EngagementEventWriter
+from utils.dashboard_cache import DashboardCache
+from utils.parallel_queries import ParallelQueryRunner, Query
+from utils.leaderboard import top_content_sql, top_content, trending_content
+from utils.query_builder import (AnalyticsQuery, PreparedStatementCache, CONTENT_TYPES,
+                                 TIME_RANGE_DAYS)
+from utils.notifications import NotificationArchiver, NotificationDispatcher, RoleDirectory, notification_rows
+from utils.notification_stream import NotificationHub, StreamTickets, UnreadCounter
+from utils.mailer import DomainRateLimiter, EmailQueue, MailDispatcher, MailSender, SMTPConnectionPool
+from utils.exports import EXPORT_FORMATS, export_lines, keyset_rows
+from utils.last_seen import LastSeenTracker
+from utils.audit_log import AuditLogArchiver, AuditLogWriter, insert_audit_entry
+from utils.outbox import OutboxDispatcher, publish_event
 
 # Load environment variables from .env file
 load_dotenv()
@@ -53,6 +74,44 @@ db_config = {
 
 # Create connection pool
 connection_pool = pooling.MySQLConnectionPool(**db_config)
+
+# Read-only analytics queries run as prepared statements on their own pool. It does not
+# reset sessions on checkout, since a reset would deallocate the prepared statements.
+analytics_pool = pooling.MySQLConnectionPool(
+    **{key: value for key, value in db_config.items() if key not in ('pool_name', 'pool_size')},
+    pool_name='lawfort_analytics_pool',
+    pool_size=int(os.getenv('ANALYTICS_POOL_SIZE', 4)),
+    pool_reset_session=False
+)
+analytics_statements = PreparedStatementCache()
+
+# Exports hold a connection for as long as the client keeps reading, so they
+# get their own small pool instead of taking connections from request handlers
+export_pool = pooling.MySQLConnectionPool(
+    **{key: value for key, value in db_config.items() if key not in ('pool_name', 'pool_size')},
+    pool_name='lawfort_export_pool',
+    pool_size=int(os.getenv('EXPORT_POOL_SIZE', 2))
+)
+
+# Extra connections for the dashboard query fan-out. The request keeps its own
+# connection from the main pool; when this pool is empty the remaining queries
+# run on that connection instead of taking more from request handlers.
+dashboard_pool = pooling.MySQLConnectionPool(
+    **{key: value for key, value in db_config.items() if key not in ('pool_name', 'pool_size')},
+    pool_name='lawfort_dashboard_pool',
+    pool_size=int(os.getenv('DASHBOARD_POOL_SIZE', 4))
+)
+
+# Background writers and timers use their own pool, sized so every one of their
+# threads can hold a connection at once: ten single-threaded writers and timers
+# plus the mail and outbox workers. Request handlers never wait on them.
+BACKGROUND_THREADS = 10 + int(os.getenv('MAIL_WORKERS', 2)) + int(os.getenv('OUTBOX_WORKERS', 1))
+background_pool = pooling.MySQLConnectionPool(
+    **{key: value for key, value in db_config.items() if key not in ('pool_name', 'pool_size')},
+    pool_name='lawfort_background_pool',
+    pool_size=min(int(os.getenv('BACKGROUND_POOL_SIZE', BACKGROUND_THREADS)), pooling.CNX_POOL_MAXSIZE)
+)
+
 app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'pabbo@123')
 
 # Google OAuth Configuration
@@ -77,6 +136,266 @@ def allowed_file(filename):
 def get_db_connection():
     return connection_pool.get_connection()
 
+def get_analytics_connection():
+    """Connection for read-only analytics queries (use with analytics_statements)"""
+    return analytics_pool.get_connection()
+
+def get_dashboard_connection():
+    """Extra connection for a dashboard's parallel queries"""
+    return dashboard_pool.get_connection()
+
+def get_background_connection():
+    """Connection for background writers and timers"""
+    return background_pool.get_connection()
+
+def streaming_export(export_format, filename, build_chunk, key_of, after=None):
+    """
+    Stream a keyset-paginated query as a CSV or NDJSON download.
+
+    Returns a 503 response when every export connection is in use.
+    """
+    try:
+        connection = export_pool.get_connection()
+    except PoolError:
+        return jsonify({"success": False, "message": "Too many exports running, try again shortly"}), 503
+
+    response = Response(
+        export_lines(keyset_rows(connection, build_chunk, key_of, after=after), export_format),
+        content_type=EXPORT_FORMATS[export_format],
+        headers={
+            'Content-Disposition': f'attachment; filename={filename}.{export_format}',
+            'Cache-Control': 'no-cache',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+    response.call_on_close(connection.close)
+    return response
+
+# Batched view counting for content detail pages
+view_counter = ViewCounter(
+    get_background_connection,
+    flush_interval=float(os.getenv('VIEW_FLUSH_INTERVAL', 5)),
+    flush_threshold=int(os.getenv('VIEW_FLUSH_THRESHOLD', 200)),
+    dedupe_window=float(os.getenv('VIEW_DEDUPE_WINDOW', 1800))
+)
+
+# Append-only engagement events (views, likes, shares, comments, dwell pings)
+engagement_events = EngagementEventWriter(
+    get_background_connection,
+    flush_interval=float(os.getenv('ENGAGEMENT_FLUSH_INTERVAL', 5)),
+    flush_threshold=int(os.getenv('ENGAGEMENT_FLUSH_THRESHOLD', 500)),
+    dedupe_window=float(os.getenv('SHARE_DEDUPE_WINDOW', 1800))
+)
+
+# Per-day compaction of engagement events for time-range analytics
+engagement_compactor = EngagementCompactor(
+    get_background_connection,
+    interval=float(os.getenv('ENGAGEMENT_COMPACT_INTERVAL', 300)),
+    retention_days=int(os.getenv('ENGAGEMENT_RETENTION_DAYS', 30))
+)
+engagement_compactor.start()
+
+# Notification fan-out: in-memory role directory, multi-row inserts, deferred batches.
+# Role and status changes invalidate the directory; the TTL bounds how long
+# changes made by other processes go unseen.
+role_directory = RoleDirectory(
+    get_db_connection,
+    ttl=float(os.getenv('NOTIFICATION_ROLE_CACHE_TTL', 300))
+)
+notification_hub = NotificationHub(
+    UnreadCounter(get_db_connection, max_age=float(os.getenv('UNREAD_COUNT_MAX_AGE', 300))),
+    max_streams_per_user=int(os.getenv('NOTIFICATION_STREAMS_PER_USER', 5))
+)
+stream_tickets = StreamTickets(get_db_connection, ttl=float(os.getenv('NOTIFICATION_STREAM_TICKET_TTL', 30)))
+notifications = NotificationDispatcher(
+    get_background_connection,
+    role_directory,
+    hub=notification_hub,
+    flush_interval=float(os.getenv('NOTIFICATION_FLUSH_INTERVAL', 1)),
+    flush_threshold=int(os.getenv('NOTIFICATION_FLUSH_THRESHOLD', 200))
+)
+
+# Read notifications past the retention window move to Notifications_Archive
+notification_archiver = NotificationArchiver(
+    get_background_connection,
+    interval=float(os.getenv('NOTIFICATION_ARCHIVE_INTERVAL', 3600)),
+    retention_days=int(os.getenv('NOTIFICATION_RETENTION_DAYS', 90))
+)
+notification_archiver.start()
+
+# Outbound mail: persistent queue drained by background workers over pooled
+# SMTP sessions (nothing is sent until SMTP_HOST is set)
+email_queue = EmailQueue(get_background_connection)
+mail_dispatcher = MailDispatcher(
+    email_queue,
+    MailSender(
+        SMTPConnectionPool(
+            os.getenv('SMTP_HOST', 'localhost'),
+            port=int(os.getenv('SMTP_PORT', 587)),
+            username=os.getenv('SMTP_USERNAME') or None,
+            password=os.getenv('SMTP_PASSWORD') or None,
+            starttls=os.getenv('SMTP_STARTTLS', 'true').lower() == 'true',
+            use_ssl=os.getenv('SMTP_USE_SSL', 'false').lower() == 'true',
+            max_connections=int(os.getenv('MAIL_WORKERS', 2))
+        ),
+        from_address=os.getenv('MAIL_FROM', 'LawFort <no-reply@lawfort.com>'),
+        recipients_per_message=int(os.getenv('MAIL_RECIPIENTS_PER_MESSAGE', 50))
+    ),
+    DomainRateLimiter(
+        rate=float(os.getenv('MAIL_DOMAIN_RATE', 5)),
+        burst=int(os.getenv('MAIL_DOMAIN_BURST', 20))
+    ),
+    workers=int(os.getenv('MAIL_WORKERS', 2)) if os.getenv('SMTP_HOST') else 0,
+    max_attempts=int(os.getenv('MAIL_MAX_ATTEMPTS', 5))
+)
+mail_dispatcher.start()
+
+# Users.Last_Seen_At, written at most once per user every LAST_SEEN_RESOLUTION seconds
+last_seen = LastSeenTracker(
+    get_background_connection,
+    resolution=float(os.getenv('LAST_SEEN_RESOLUTION', 300)),
+    flush_interval=float(os.getenv('LAST_SEEN_FLUSH_INTERVAL', 30))
+)
+
+# Audit entries are staged per request and group-committed in the background
+audit_log = AuditLogWriter(
+    get_background_connection,
+    flush_interval=float(os.getenv('AUDIT_FLUSH_INTERVAL', 1)),
+    flush_threshold=int(os.getenv('AUDIT_FLUSH_THRESHOLD', 200))
+)
+audit_log_archiver = AuditLogArchiver(
+    get_background_connection,
+    interval=float(os.getenv('AUDIT_ARCHIVE_INTERVAL', 86400)),
+    retention_days=int(os.getenv('AUDIT_RETENTION_DAYS', 180))
+)
+audit_log_archiver.start()
+
+def audit(admin_id, action_type, details):
+    """Stage an admin action; commit_audited() queues it once the action is committed"""
+    g.setdefault('audit_entries', []).append((admin_id, action_type, details, datetime.now()))
+
+def commit_audited(connection):
+    """Commit the handler's transaction, then queue the audit entries staged for it"""
+    connection.commit()
+    entries = g.pop('audit_entries', None)
+    if entries:
+        audit_log.log_many(entries)
+
+# Side effects of content and application writes: the writing transaction records
+# an Outbox_Events row and these workers handle it (see OUTBOX EVENT HANDLERS)
+outbox = OutboxDispatcher(
+    get_background_connection,
+    workers=int(os.getenv('OUTBOX_WORKERS', 1)),
+    poll_interval=float(os.getenv('OUTBOX_POLL_INTERVAL', 1)),
+    max_attempts=int(os.getenv('OUTBOX_MAX_ATTEMPTS', 10))
+)
+
+# Periodic correction of Comments_Count / Applications_Count drift
+counter_reconciler = CounterReconciler(
+    get_background_connection,
+    interval=float(os.getenv('COUNTER_RECONCILE_INTERVAL', 3600))
+)
+counter_reconciler.start()
+
+# Incrementally refreshed rollups behind the analytics dashboards
+analytics_rollup = AnalyticsRollup(
+    get_background_connection,
+    interval=float(os.getenv('ANALYTICS_REFRESH_INTERVAL', 60))
+)
+analytics_rollup.start()
+
+# Per-user dashboard payloads (short TTL, served stale while one refresh runs)
+dashboard_cache = DashboardCache(
+    ttl=float(os.getenv('DASHBOARD_CACHE_TTL', 30)),
+    stale_ttl=float(os.getenv('DASHBOARD_STALE_TTL', 300))
+)
+
+# Independent dashboard aggregates run side by side; extra connections come from dashboard_pool
+parallel_queries = ParallelQueryRunner(
+    get_dashboard_connection,
+    max_concurrency=int(os.getenv('PARALLEL_QUERY_CONCURRENCY', 3)),
+    timeout=float(os.getenv('PARALLEL_QUERY_TIMEOUT', 10))
+)
+analytics_queries = ParallelQueryRunner(
+    get_analytics_connection,
+    max_concurrency=int(os.getenv('PARALLEL_QUERY_CONCURRENCY', 3)),
+    timeout=float(os.getenv('PARALLEL_QUERY_TIMEOUT', 10)),
+    statement_cache=analytics_statements
+)
+
+def get_viewer_key(user_id=None):
+    """Identify the viewer for view de-duplication (user, session, or client fingerprint)"""
+    if user_id:
+        return f"user:{user_id}"
+
+    session_token = request.headers.get('Authorization')
+    if session_token:
+        if session_token.startswith('Bearer '):
+            session_token = session_token[7:]
+        return "session:" + hashlib.sha1(session_token.encode('utf-8')).hexdigest()
+
+    client = f"{request.remote_addr}|{request.headers.get('User-Agent', '')}"
+    return "client:" + hashlib.sha1(client.encode('utf-8')).hexdigest()
+
+def record_content_view(content_id, user_id=None):
+    """Count a detail page view and log it as an engagement event (repeat views are ignored)"""
+    viewer_key = get_viewer_key(user_id)
+    if view_counter.record_view(content_id, viewer_key):
+        engagement_events.record(content_id, 'view', user_id=user_id, viewer_key=viewer_key)
+
+# Owner of the item a route id refers to, by the kind of id the route takes
+CONTENT_OWNER_QUERIES = {
+    'content': "SELECT User_ID FROM Content WHERE Content_ID = %s",
+    'note': "SELECT c.User_ID FROM Notes n JOIN Content c ON n.Content_ID = c.Content_ID WHERE n.Note_ID = %s",
+    'course': "SELECT c.User_ID FROM Available_Courses ac JOIN Content c ON ac.Content_ID = c.Content_ID WHERE ac.Course_ID = %s",
+    'job': "SELECT c.User_ID FROM Jobs j JOIN Content c ON j.Content_ID = c.Content_ID WHERE j.Job_ID = %s",
+    'internship': "SELECT c.User_ID FROM Internships i JOIN Content c ON i.Content_ID = c.Content_ID WHERE i.Internship_ID = %s",
+}
+
+def lookup_content_owner(kind, item_id):
+    """User_ID owning the item (None if it does not exist or the lookup fails)"""
+    try:
+        connection = get_db_connection()
+        cursor = connection.cursor()
+        try:
+            cursor.execute(CONTENT_OWNER_QUERIES[kind], (item_id,))
+            row = cursor.fetchone()
+            return row[0] if row else None
+        finally:
+            cursor.close()
+            connection.close()
+    except Exception as e:
+        print(f"Error looking up owner of {kind} {item_id}: {e}")
+        return None
+
+def invalidates_dashboards(*scopes, owner=None):
+    """
+    Drop cached dashboards after a successful write (use below require_permission)
+
+    The acting user's entries are always dropped. With owner set to a key of
+    CONTENT_OWNER_QUERIES, the owner of the item named in the URL is looked up
+    before the write (so deletes still find it) and their entries are dropped
+    too, so an admin's or reviewer's change reaches the author's dashboards.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(user_id, *args, **kwargs):
+            owner_id = None
+            if owner is not None:
+                item_id = next(iter(kwargs.values()), None) if kwargs else (args[0] if args else None)
+                if item_id is not None:
+                    owner_id = lookup_content_owner(owner, item_id)
+
+            result = f(user_id, *args, **kwargs)
+            status = result[1] if isinstance(result, tuple) and len(result) > 1 else getattr(result, 'status_code', 200)
+            if status < 400:
+                dashboard_cache.invalidate(user_id, *scopes)
+                if owner_id is not None and owner_id != user_id:
+                    dashboard_cache.invalidate(owner_id, *scopes)
+            return result
+        return decorated_function
+    return decorator
+
 # Function to hash passwords
 def hash_password(password):
     return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
@@ -167,30 +486,48 @@ def verify_google_token(token):
         print(f"Unexpected error during token verification: {e}")
         return None
 
-# Email function placeholder (for future implementation)
-def send_email(to_emails, subject, content, _sender_id=None):
+# Queue an email for background delivery
+def send_email(to_emails, subject, content, sender_id=None, email_type='notification'):
     """
-    Email function placeholder - to be implemented with actual email service
+    Queue an email for delivery by the mail workers; returns the Email_ID or None on failure
     """
     try:
         # Ensure to_emails is a list
         if isinstance(to_emails, str):
             to_emails = [to_emails]
 
-        # TODO: Implement actual email sending logic
-        # For now, return True to maintain compatibility
-        return True
+        email_id, _ = email_queue.enqueue(sender_id, to_emails, subject, content, email_type)
+        mail_dispatcher.wake()
+        return email_id
 
     except Exception as e:
-        return False
+        print(f"Error queueing email: {e}")
+        return None
 
-# Email logging placeholder (for future implementation)
-def log_email_in_db(sender_id, _recipient_emails, _subject, _content, status):
+# Record an email that was not sent through the queue
+def log_email_in_db(sender_id, recipient_emails, subject, content, status, email_type='notification', error_message=None):
     """
-    Email logging placeholder - to be implemented with actual database logging
+    Insert an Email_Logs row for an email delivered (or attempted) outside the queue
     """
-    # TODO: Implement actual email logging to database
-    return True
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                INSERT INTO Email_Logs (Sender_ID, Recipient_Emails, Subject, Content, Email_Type, Status,
+                                        Error_Message, Recipient_Count, Sent_Count, Failed_Count)
+                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+            """, (sender_id, json.dumps(recipient_emails), subject, content, email_type, status, error_message,
+                  len(recipient_emails), len(recipient_emails) if status == 'sent' else 0,
+                  len(recipient_emails) if status == 'failed' else 0))
+            conn.commit()
+            return True
+        finally:
+            cursor.close()
+            conn.close()
+    except Exception as e:
+        print(f"Error logging email: {e}")
+        return False
 
 @app.route('/register', methods=['POST'])
 def register_user():
@@ -256,6 +593,7 @@ def register_user():
               license_number, practice_area, location, years_of_experience, linkedin_profile, alumni_of, professional_organizations))
 
         conn.commit()
+        role_directory.invalidate([3])
         return jsonify({'message': 'Registration successful.'}), 201
     except Exception as e:
         conn.rollback()
@@ -299,6 +637,7 @@ def login_user():
             """, (user['User_ID'], session_token, datetime.now()))
 
             conn.commit()
+            last_seen.touch(user['User_ID'])
             return jsonify({
                 'message': 'Login successful',
                 'session_token': session_token,
@@ -325,6 +664,7 @@ def login_user():
                 """, (user['User_ID'], session_token, datetime.now()))
 
                 conn.commit()
+                last_seen.touch(user['User_ID'])
                 return jsonify({
                     'message': 'Login successful',
                     'session_token': session_token,
@@ -402,6 +742,7 @@ def google_auth():
             """, (existing_user['User_ID'], session_token, datetime.now()))
 
             conn.commit()
+            last_seen.touch(existing_user['User_ID'])
 
             return jsonify({
                 'message': 'Login successful',
@@ -451,6 +792,8 @@ def google_auth():
             """, (user_id, session_token, datetime.now()))
 
             conn.commit()
+            last_seen.touch(user_id)
+            role_directory.invalidate([3])
 
             return jsonify({
                 'message': 'Registration successful',
@@ -560,26 +903,14 @@ def request_editor_access():
 
         user_info = cursor.fetchone()
 
-        # Create notifications for all admins about new editor access request
-        cursor.execute("""
-            SELECT User_ID FROM Users WHERE Role_ID = 1
-        """)
-
-        admins = cursor.fetchall()
-
-        for admin in admins:
-            notification_title = "New Editor Access Request"
-            notification_message = f"{user_info[0] if user_info else 'A user'} has requested editor access"
-            if user_info and user_info[1]:
-                notification_message += f" (Practice Area: {user_info[1]})"
-            action_url = "/admin/access-requests"
-
-            cursor.execute("""
-                INSERT INTO Notifications (User_ID, Type, Title, Message, Action_URL)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (admin[0], 'access_request', notification_title, notification_message, action_url))
-
         conn.commit()
+
+        # Notify all admins about the new editor access request (written in the background)
+        notification_message = f"{user_info[0] if user_info else 'A user'} has requested editor access"
+        if user_info and user_info[1]:
+            notification_message += f" (Practice Area: {user_info[1]})"
+        notifications.notify_roles([1], 'access_request', "New Editor Access Request", notification_message,
+                                   action_url="/admin/access-requests")
         return jsonify({'message': 'Request for editor access sent to admin.'}), 200
     except Exception as e:
         conn.rollback()
@@ -637,18 +968,12 @@ def admin_approve_deny_access():
             cursor.execute("UPDATE Users SET Role_ID = 2 WHERE User_ID = %s", (user_id,))  # Set role to Editor
 
             # Log the admin action
-            cursor.execute("""
-                INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                VALUES (%s, %s, %s)
-            """, (admin_id, 'Approve Editor Access', f'Approved editor access for user {user_id}'))
+            audit(admin_id, 'Approve Editor Access', f'Approved editor access for user {user_id}')
 
-            # Create notification for user about approval
-            cursor.execute("""
-                INSERT INTO Notifications (User_ID, Type, Title, Message, Action_URL)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (user_id, 'access_approved', 'Editor Access Approved',
-                  'Congratulations! Your request for editor access has been approved. You can now create and manage content.',
-                  '/editor-dashboard'))
+            # Notification for user about approval
+            notification = ('access_approved', 'Editor Access Approved',
+                            'Congratulations! Your request for editor access has been approved. You can now create and manage content.',
+                            '/editor-dashboard')
 
             message = 'Editor access granted.'
         else:
@@ -659,22 +984,21 @@ def admin_approve_deny_access():
             """, (admin_id, request_id))
 
             # Log the admin action
-            cursor.execute("""
-                INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                VALUES (%s, %s, %s)
-            """, (admin_id, 'Deny Editor Access', f'Denied editor access for user {user_id}'))
+            audit(admin_id, 'Deny Editor Access', f'Denied editor access for user {user_id}')
 
-            # Create notification for user about denial
-            cursor.execute("""
-                INSERT INTO Notifications (User_ID, Type, Title, Message, Action_URL)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (user_id, 'access_denied', 'Editor Access Request Denied',
-                  'Your request for editor access has been denied. Please contact support if you have questions.',
-                  '/profile'))
+            # Notification for user about denial
+            notification = ('access_denied', 'Editor Access Request Denied',
+                            'Your request for editor access has been denied. Please contact support if you have questions.',
+                            '/profile')
 
             message = 'Editor access denied.'
 
-        conn.commit()
+        commit_audited(conn)
+        if action == 'Approve':
+            role_directory.invalidate()
+
+        notification_type, title, notification_message, action_url = notification
+        notifications.notify([user_id], notification_type, title, notification_message, action_url=action_url)
         return jsonify({'message': message, 'success': True}), 200
     except Exception as e:
         conn.rollback()
@@ -721,21 +1045,52 @@ def get_access_requests():
 
 @app.route('/admin/users', methods=['GET'])
 def get_all_users():
+    # Filters: q (every word in the email or name), role (Role_Name), status, active (true/false);
+    # pages of `limit` newest first, ?cursor=<next_cursor> for the next page
+    search = (request.args.get('q') or '').strip()
+    role = request.args.get('role')
+    status = request.args.get('status')
+    active = request.args.get('active')
+    limit = max(1, min(request.args.get('limit', 100, type=int), 500))
+
+    page_cursor = None
+    if request.args.get('cursor'):
+        try:
+            created_at, cursor_user_id = request.args['cursor'].split(',')
+            page_cursor = (datetime.fromisoformat(created_at), int(cursor_user_id))
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+
+    query = AnalyticsQuery("""
+        SELECT u.User_ID, u.Email, u.Role_ID, u.Status, u.Created_At,
+               up.Full_Name, up.Phone, up.Bio, up.Practice_Area, up.Location, up.Years_of_Experience,
+               r.Role_Name,
+               u.Last_Seen_At > DATE_SUB(NOW(), INTERVAL 30 DAY) as is_active, u.Last_Seen_At
+        FROM Users u
+        LEFT JOIN User_Profile up ON u.User_ID = up.User_ID
+        LEFT JOIN Roles r ON u.Role_ID = r.Role_ID
+    """)
+    # Each word may match anywhere in the email or name ("smith" finds "John Smith").
+    # Substring matches cannot use an index; the newest-first walk stops after
+    # `limit` matches, so a page costs at most one pass over Users.
+    for word in search.split()[:5]:
+        pattern = '%' + word.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        query.where("(u.Email LIKE %s OR up.Full_Name LIKE %s)", pattern, pattern)
+    query.where_if(bool(role) and role != 'all', "r.Role_Name = %s", role)
+    query.where_if(bool(status), "u.Status = %s", status)
+    if active in ('true', 'false'):
+        query.where("u.Last_Seen_At > DATE_SUB(NOW(), INTERVAL 30 DAY)" if active == 'true' else
+                    "(u.Last_Seen_At IS NULL OR u.Last_Seen_At <= DATE_SUB(NOW(), INTERVAL 30 DAY))")
+    if page_cursor:
+        query.where("(u.Created_At < %s OR (u.Created_At = %s AND u.User_ID < %s))",
+                    page_cursor[0], page_cursor[0], page_cursor[1])
+    query.order_by("u.Created_At DESC, u.User_ID DESC").limit(limit)
+
     conn = get_db_connection()
     cursor = conn.cursor(buffered=True)
 
     try:
-        cursor.execute("""
-            SELECT u.User_ID, u.Email, u.Role_ID, u.Status, u.Created_At,
-                   up.Full_Name, up.Phone, up.Bio, up.Practice_Area, up.Location, up.Years_of_Experience,
-                   r.Role_Name,
-                   (SELECT COUNT(*) FROM Session s WHERE s.User_ID = u.User_ID AND
-                    s.Last_Active_Timestamp > DATE_SUB(NOW(), INTERVAL 30 DAY)) as is_active
-            FROM Users u
-            LEFT JOIN User_Profile up ON u.User_ID = up.User_ID
-            LEFT JOIN Roles r ON u.Role_ID = r.Role_ID
-            ORDER BY u.Created_At DESC
-        """)
+        cursor.execute(*query.build())
 
         users = cursor.fetchall()
 
@@ -754,10 +1109,15 @@ def get_all_users():
                 'location': user[9] or '',
                 'years_of_experience': user[10] or 0,
                 'role_name': user[11] or 'User',
-                'is_active': bool(user[12])
+                'is_active': bool(user[12]),
+                'last_seen_at': user[13].isoformat() if user[13] else None
             })
 
-        return jsonify({'users': user_list}), 200
+        next_cursor = None
+        if len(users) == limit and users[-1][4]:
+            next_cursor = f"{users[-1][4].isoformat()},{users[-1][0]}"
+
+        return jsonify({'users': user_list, 'next_cursor': next_cursor}), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     finally:
@@ -779,11 +1139,11 @@ def get_admin_analytics():
         """)
         role_counts = cursor.fetchall()
 
-        # Get active users (logged in within last 30 days)
+        # Get active users (seen within last 30 days)
         cursor.execute("""
-            SELECT COUNT(DISTINCT s.User_ID) as active_users
-            FROM Session s
-            WHERE s.Last_Active_Timestamp > DATE_SUB(NOW(), INTERVAL 30 DAY)
+            SELECT COUNT(*) as active_users
+            FROM Users
+            WHERE Last_Seen_At > DATE_SUB(NOW(), INTERVAL 30 DAY)
         """)
         active_users = cursor.fetchone()[0]
 
@@ -823,18 +1183,43 @@ def get_admin_analytics():
 
 @app.route('/admin/audit_logs', methods=['GET'])
 def get_audit_logs():
+    # Filters: admin_id, action_type, date_from, date_to; archive=true reads
+    # Audit_Logs_Archive. Pages of `limit` newest first, ?cursor=<next_cursor> continues
+    limit = max(1, min(request.args.get('limit', 100, type=int), 500))
+    admin_id = request.args.get('admin_id', type=int)
+    action_type = request.args.get('action_type')
+    date_from = request.args.get('date_from')
+    date_to = request.args.get('date_to')
+    table = 'Audit_Logs_Archive' if request.args.get('archive') == 'true' else 'Audit_Logs'
+
+    page_cursor = None
+    if request.args.get('cursor'):
+        try:
+            timestamp, log_id = request.args['cursor'].split(',')
+            page_cursor = (datetime.fromisoformat(timestamp), int(log_id))
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+
+    query = AnalyticsQuery(f"""
+        SELECT al.Log_ID, al.Admin_ID, al.Action_Type, al.Action_Details, al.Timestamp,
+               up.Full_Name as admin_name
+        FROM {table} al
+        LEFT JOIN User_Profile up ON al.Admin_ID = up.User_ID
+    """)
+    query.where_if(admin_id is not None, "al.Admin_ID = %s", admin_id)
+    query.where_if(bool(action_type), "al.Action_Type = %s", action_type)
+    query.where_if(bool(date_from), "al.Timestamp >= %s", date_from)
+    query.where_if(bool(date_to), "al.Timestamp <= %s", date_to)
+    if page_cursor:
+        query.where("(al.Timestamp < %s OR (al.Timestamp = %s AND al.Log_ID < %s))",
+                    page_cursor[0], page_cursor[0], page_cursor[1])
+    query.order_by("al.Timestamp DESC, al.Log_ID DESC").limit(limit)
+
     conn = get_db_connection()
     cursor = conn.cursor(buffered=True)
 
     try:
-        cursor.execute("""
-            SELECT al.Log_ID, al.Admin_ID, al.Action_Type, al.Action_Details, al.Timestamp,
-                   up.Full_Name as admin_name
-            FROM Audit_Logs al
-            LEFT JOIN User_Profile up ON al.Admin_ID = up.User_ID
-            ORDER BY al.Timestamp DESC
-            LIMIT 100
-        """)
+        cursor.execute(*query.build())
 
         logs = cursor.fetchall()
 
@@ -849,7 +1234,11 @@ def get_audit_logs():
                 'admin_name': log[5] or 'Unknown Admin'
             })
 
-        return jsonify({'audit_logs': audit_logs}), 200
+        next_cursor = None
+        if len(logs) == limit and logs[-1][4]:
+            next_cursor = f"{logs[-1][4].isoformat()},{logs[-1][0]}"
+
+        return jsonify({'audit_logs': audit_logs, 'next_cursor': next_cursor}), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     finally:
@@ -881,12 +1270,10 @@ def update_user_role():
         cursor.execute("UPDATE Users SET Role_ID = %s WHERE User_ID = %s", (new_role_id, user_id))
 
         # Log the action
-        cursor.execute("""
-            INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-            VALUES (%s, %s, %s)
-        """, (admin_id, 'Update User Role', f'Changed user {user_id} role from {current_role[0]} to {new_role_id}'))
+        audit(admin_id, 'Update User Role', f'Changed user {user_id} role from {current_role[0]} to {new_role_id}')
 
-        conn.commit()
+        commit_audited(conn)
+        role_directory.invalidate([current_role[0], new_role_id])
         return jsonify({'message': 'User role updated successfully'}), 200
     except Exception as e:
         conn.rollback()
@@ -915,7 +1302,7 @@ def update_user_status():
 
     try:
         # Get current status
-        cursor.execute("SELECT Status FROM Users WHERE User_ID = %s", (user_id,))
+        cursor.execute("SELECT Status, Role_ID FROM Users WHERE User_ID = %s", (user_id,))
         current_status = cursor.fetchone()
 
         if not current_status:
@@ -925,12 +1312,10 @@ def update_user_status():
         cursor.execute("UPDATE Users SET Status = %s WHERE User_ID = %s", (new_status, user_id))
 
         # Log the action
-        cursor.execute("""
-            INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-            VALUES (%s, %s, %s)
-        """, (admin_id, 'Update User Status', f'Changed user {user_id} status from {current_status[0]} to {new_status}'))
+        audit(admin_id, 'Update User Status', f'Changed user {user_id} status from {current_status[0]} to {new_status}')
 
-        conn.commit()
+        commit_audited(conn)
+        role_directory.invalidate([current_status[1]])
         return jsonify({'message': f'User status updated to {new_status} successfully'}), 200
     except Exception as e:
         conn.rollback()
@@ -1011,12 +1396,9 @@ def update_user_profile():
 
         # Log the action
         updated_fields = list(profile_data.keys())
-        cursor.execute("""
-            INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-            VALUES (%s, %s, %s)
-        """, (admin_id, 'Update User Profile', f'Updated profile for user {user_id}. Fields: {", ".join(updated_fields)}'))
+        audit(admin_id, 'Update User Profile', f'Updated profile for user {user_id}. Fields: {", ".join(updated_fields)}')
 
-        conn.commit()
+        commit_audited(conn)
         return jsonify({'message': 'User profile updated successfully'}), 200
     except Exception as e:
         conn.rollback()
@@ -1100,12 +1482,10 @@ def create_user():
 
         # Log the action
         role_name = {1: 'Admin', 2: 'Editor', 3: 'User'}.get(role_id, 'User')
-        cursor.execute("""
-            INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-            VALUES (%s, %s, %s)
-        """, (admin_id, 'Create User', f'Created new {role_name} account for {email} (User ID: {user_id})'))
+        audit(admin_id, 'Create User', f'Created new {role_name} account for {email} (User ID: {user_id})')
 
-        conn.commit()
+        commit_audited(conn)
+        role_directory.invalidate([role_id])
         return jsonify({
             'message': f'User created successfully',
             'user_id': user_id
@@ -1151,12 +1531,9 @@ def change_user_password():
         """, (hashed_password, user_id))
 
         # Log the action
-        cursor.execute("""
-            INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-            VALUES (%s, %s, %s)
-        """, (admin_id, 'Change Password', f'Changed password for user {user[0]} (User ID: {user_id})'))
+        audit(admin_id, 'Change Password', f'Changed password for user {user[0]} (User ID: {user_id})')
 
-        conn.commit()
+        commit_audited(conn)
         return jsonify({'message': 'Password changed successfully'}), 200
     except Exception as e:
         conn.rollback()
@@ -1253,6 +1630,7 @@ def validate_session():
         session = cursor.fetchone()
 
         if session:
+            last_seen.touch(session[0])
             return jsonify({'valid': True, 'user_id': session[0]}), 200
         else:
             return jsonify({'valid': False}), 401
@@ -1284,80 +1662,92 @@ def get_user_dashboard():
             return jsonify({'error': 'Invalid session token'}), 401
 
         user_id = session['User_ID']
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    finally:
+        cursor.close()
+        conn.close()
 
-        # Get applications count and pending count
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total_applications,
-                COUNT(CASE WHEN ja.Status = 'Pending' THEN 1 END) as pending_job_applications,
-                COUNT(CASE WHEN ja.Status = 'Under Review' THEN 1 END) as under_review_job_applications
-            FROM Job_Applications ja
-            WHERE ja.User_ID = %s
-        """, (user_id,))
-        job_stats = cursor.fetchone()
-
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total_applications,
-                COUNT(CASE WHEN ia.Status = 'Pending' THEN 1 END) as pending_internship_applications,
-                COUNT(CASE WHEN ia.Status = 'Under Review' THEN 1 END) as under_review_internship_applications
-            FROM Internship_Applications ia
-            WHERE ia.User_ID = %s
-        """, (user_id,))
-        internship_stats = cursor.fetchone()
+    try:
+        dashboard_data = dashboard_cache.get('user_dashboard', user_id,
+                                             lambda: build_user_dashboard(user_id))
+        return jsonify(dashboard_data), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
-        # Get saved content count
-        cursor.execute("""
-            SELECT COUNT(*) as saved_count
-            FROM User_Saved_Content usc
-            WHERE usc.User_ID = %s
-        """, (user_id,))
-        saved_stats = cursor.fetchone()
+def build_user_dashboard(user_id):
+    """Compute the user dashboard payload (served through dashboard_cache)"""
+    conn = get_db_connection()
 
-        # Get saved content by type for more detailed stats
-        cursor.execute("""
-            SELECT
-                c.Content_Type,
-                COUNT(*) as count
-            FROM User_Saved_Content usc
-            JOIN Content c ON usc.Content_ID = c.Content_ID
-            WHERE usc.User_ID = %s
-            GROUP BY c.Content_Type
-        """, (user_id,))
-        saved_by_type = cursor.fetchall()
+    try:
+        results = parallel_queries.run({
+            # Get applications count and pending count
+            'job_stats': Query("""
+                SELECT
+                    COUNT(*) as total_applications,
+                    COUNT(CASE WHEN ja.Status = 'Pending' THEN 1 END) as pending_job_applications,
+                    COUNT(CASE WHEN ja.Status = 'Under Review' THEN 1 END) as under_review_job_applications
+                FROM Job_Applications ja
+                WHERE ja.User_ID = %s
+            """, (user_id,), 'one'),
+
+            'internship_stats': Query("""
+                SELECT
+                    COUNT(*) as total_applications,
+                    COUNT(CASE WHEN ia.Status = 'Pending' THEN 1 END) as pending_internship_applications,
+                    COUNT(CASE WHEN ia.Status = 'Under Review' THEN 1 END) as under_review_internship_applications
+                FROM Internship_Applications ia
+                WHERE ia.User_ID = %s
+            """, (user_id,), 'one'),
+
+            # Get saved content by type for more detailed stats
+            'saved_by_type': Query("""
+                SELECT
+                    c.Content_Type,
+                    COUNT(*) as count
+                FROM User_Saved_Content usc
+                JOIN Content c ON usc.Content_ID = c.Content_ID
+                WHERE usc.User_ID = %s
+                GROUP BY c.Content_Type
+            """, (user_id,)),
+
+            # Get recent applications (last 5)
+            'recent_applications': Query("""
+                SELECT
+                    ja.Application_ID as id,
+                    c.Title as position,
+                    j.Company_Name as company,
+                    ja.Status as status,
+                    ja.Application_Date as applied_date,
+                    'job' as type
+                FROM Job_Applications ja
+                JOIN Jobs j ON ja.Job_ID = j.Job_ID
+                JOIN Content c ON j.Content_ID = c.Content_ID
+                WHERE ja.User_ID = %s
 
-        # Get recent applications (last 5)
-        cursor.execute("""
-            SELECT
-                ja.Application_ID as id,
-                c.Title as position,
-                j.Company_Name as company,
-                ja.Status as status,
-                ja.Application_Date as applied_date,
-                'job' as type
-            FROM Job_Applications ja
-            JOIN Jobs j ON ja.Job_ID = j.Job_ID
-            JOIN Content c ON j.Content_ID = c.Content_ID
-            WHERE ja.User_ID = %s
+                UNION ALL
 
-            UNION ALL
+                SELECT
+                    ia.Application_ID as id,
+                    c.Title as position,
+                    i.Company_Name as company,
+                    ia.Status as status,
+                    ia.Application_Date as applied_date,
+                    'internship' as type
+                FROM Internship_Applications ia
+                JOIN Internships i ON ia.Internship_ID = i.Internship_ID
+                JOIN Content c ON i.Content_ID = c.Content_ID
+                WHERE ia.User_ID = %s
 
-            SELECT
-                ia.Application_ID as id,
-                c.Title as position,
-                i.Company_Name as company,
-                ia.Status as status,
-                ia.Application_Date as applied_date,
-                'internship' as type
-            FROM Internship_Applications ia
-            JOIN Internships i ON ia.Internship_ID = i.Internship_ID
-            JOIN Content c ON i.Content_ID = c.Content_ID
-            WHERE ia.User_ID = %s
+                ORDER BY applied_date DESC
+                LIMIT 5
+            """, (user_id, user_id))
+        }, connection=conn)
 
-            ORDER BY applied_date DESC
-            LIMIT 5
-        """, (user_id, user_id))
-        recent_applications = cursor.fetchall()
+        job_stats = results['job_stats']
+        internship_stats = results['internship_stats']
+        saved_by_type = results['saved_by_type']
+        recent_applications = results['recent_applications']
 
         # Calculate stats
         total_applications = (job_stats['total_applications'] or 0) + (internship_stats['total_applications'] or 0)
@@ -1397,12 +1787,8 @@ def get_user_dashboard():
             'upcoming_events': []  # TODO: Implement events system
         }
 
-        return jsonify(dashboard_data), 200
-
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return dashboard_data
     finally:
-        cursor.close()
         conn.close()
 
 # ===== NOTIFICATION SYSTEM ENDPOINTS =====
@@ -1460,29 +1846,26 @@ def get_user_notifications():
             LIMIT %s OFFSET %s
         """, params + [limit, offset])
 
-        notifications = cursor.fetchall()
-
-        # Get total count
-        cursor.execute(f"""
-            SELECT COUNT(*) as total
-            FROM Notifications n
-            {where_clause}
-        """, params)
+        user_notifications = cursor.fetchall()
 
-        total_count = cursor.fetchone()['total']
+        # Unread count is cached per user and kept current by the notification hub
+        unread_count = notification_hub.unread.get(user_id)
 
-        # Get unread count
-        cursor.execute("""
-            SELECT COUNT(*) as unread_count
-            FROM Notifications n
-            WHERE n.User_ID = %s AND n.Is_Read = FALSE
-        """, (user_id,))
+        # Get total count
+        if unread_only:
+            total_count = unread_count
+        else:
+            cursor.execute(f"""
+                SELECT COUNT(*) as total
+                FROM Notifications n
+                {where_clause}
+            """, params)
 
-        unread_count = cursor.fetchone()['unread_count']
+            total_count = cursor.fetchone()['total']
 
         return jsonify({
             'success': True,
-            'notifications': notifications,
+            'notifications': user_notifications,
             'total': total_count,
             'unread_count': unread_count,
             'limit': limit,
@@ -1522,13 +1905,22 @@ def mark_notification_read(notification_id):
         cursor.execute("""
             UPDATE Notifications
             SET Is_Read = TRUE
-            WHERE Notification_ID = %s AND User_ID = %s
+            WHERE Notification_ID = %s AND User_ID = %s AND Is_Read = FALSE
         """, (notification_id, user_id))
+        newly_read = cursor.rowcount
 
-        if cursor.rowcount == 0:
-            return jsonify({'error': 'Notification not found or access denied'}), 404
+        if newly_read == 0:
+            # Already read, or not the user's notification
+            cursor.execute("""
+                SELECT Notification_ID FROM Notifications
+                WHERE Notification_ID = %s AND User_ID = %s
+            """, (notification_id, user_id))
+            if not cursor.fetchone():
+                return jsonify({'error': 'Notification not found or access denied'}), 404
 
         conn.commit()
+        if newly_read:
+            notification_hub.notifications_read(user_id, newly_read)
         return jsonify({'success': True, 'message': 'Notification marked as read'}), 200
 
     except Exception as e:
@@ -1561,15 +1953,34 @@ def mark_all_notifications_read():
 
         user_id = session['User_ID']
 
-        # Mark all notifications as read for the user
-        cursor.execute("""
-            UPDATE Notifications
-            SET Is_Read = TRUE
-            WHERE User_ID = %s AND Is_Read = FALSE
-        """, (user_id,))
+        # Optional newest notification the client has seen; later arrivals stay unread
+        data = request.get_json(silent=True) or {}
+        up_to_id = data.get('up_to_id')
+        if up_to_id is not None and not str(up_to_id).isdigit():
+            return jsonify({'error': 'up_to_id must be a notification ID'}), 400
+
+        # Mark all notifications as read for the user: one range of
+        # idx_notifications_user_read_created (User_ID, Is_Read = FALSE)
+        if up_to_id is not None:
+            cursor.execute("""
+                UPDATE Notifications
+                SET Is_Read = TRUE
+                WHERE User_ID = %s AND Is_Read = FALSE AND Notification_ID <= %s
+            """, (user_id, int(up_to_id)))
+        else:
+            cursor.execute("""
+                UPDATE Notifications
+                SET Is_Read = TRUE
+                WHERE User_ID = %s AND Is_Read = FALSE
+            """, (user_id,))
+        marked = cursor.rowcount
 
         conn.commit()
-        return jsonify({'success': True, 'message': f'{cursor.rowcount} notifications marked as read'}), 200
+        if up_to_id is not None:
+            notification_hub.notifications_read(user_id, marked)
+        else:
+            notification_hub.all_notifications_read(user_id)
+        return jsonify({'success': True, 'message': f'{marked} notifications marked as read'}), 200
 
     except Exception as e:
         conn.rollback()
@@ -1601,16 +2012,25 @@ def delete_notification(notification_id):
 
         user_id = session['User_ID']
 
-        # Delete notification (only if it belongs to the user)
+        # Lock the notification (only if it belongs to the user); its read state decides the unread count
         cursor.execute("""
-            DELETE FROM Notifications
+            SELECT Is_Read FROM Notifications
             WHERE Notification_ID = %s AND User_ID = %s
+            FOR UPDATE
         """, (notification_id, user_id))
+        notification = cursor.fetchone()
 
-        if cursor.rowcount == 0:
+        if not notification:
             return jsonify({'error': 'Notification not found or access denied'}), 404
 
+        cursor.execute("""
+            DELETE FROM Notifications
+            WHERE Notification_ID = %s AND User_ID = %s
+        """, (notification_id, user_id))
+
         conn.commit()
+        if not notification['Is_Read']:
+            notification_hub.notifications_read(user_id)
         return jsonify({'success': True, 'message': 'Notification deleted'}), 200
 
     except Exception as e:
@@ -1620,60 +2040,69 @@ def delete_notification(notification_id):
         cursor.close()
         conn.close()
 
-# Helper function to create notifications
-def create_notification(user_id, notification_type, title, message, related_content_id=None, action_url=None):
+@app.route('/api/notifications/stream-ticket', methods=['POST'])
+def create_notification_stream_ticket():
     """
-    Helper function to create a notification in the database
+    Exchange the session (Authorization header) for a single-use stream ticket
     """
-    try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO Notifications (User_ID, Type, Title, Message, Related_Content_ID, Action_URL)
-            VALUES (%s, %s, %s, %s, %s, %s)
-        """, (user_id, notification_type, title, message, related_content_id, action_url))
+    user_id = get_session_user_id()
+    if not user_id:
+        return jsonify({'error': 'Invalid session token'}), 401
 
-        conn.commit()
-        cursor.close()
-        conn.close()
-        return True
+    try:
+        ticket = stream_tickets.issue(user_id)
+        return jsonify({'ticket': ticket, 'expires_in': int(stream_tickets.ttl)}), 201
     except Exception as e:
-        print(f"Error creating notification: {e}")
-        return False
+        return jsonify({'error': str(e)}), 500
 
-# Email management endpoints (dummy implementation for frontend compatibility)
-@app.route('/admin/send_email', methods=['POST'])
-def admin_send_email():
+@app.route('/api/notifications/stream', methods=['GET'])
+def stream_notifications():
     """
-    Dummy email endpoint that simulates sending emails without actual email delivery
-    or database operations. Returns success response for frontend compatibility.
+    Push new notifications and unread count changes as Server-Sent Events.
+
+    EventSource cannot send headers, so browsers pass ?ticket= from
+    POST /api/notifications/stream-ticket (session tokens are not accepted in
+    the URL, where they would be logged). Events: unread_count
+    {"unread_count": n} (sent first and after every change) and notification
+    (the new notification row). An idle stream receives a comment line every
+    NOTIFICATION_STREAM_KEEPALIVE seconds.
     """
-    data = request.get_json()
-    admin_id = data.get('admin_id')
-    recipient_user_ids = data.get('recipient_user_ids', [])
-    subject = data.get('subject', 'LawFort Notification')
-    content = data.get('content', '')
-    email_type = data.get('email_type', 'announcement')
+    ticket = request.args.get('ticket')
+    try:
+        user_id = stream_tickets.redeem(ticket) if ticket else get_session_user_id()
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
-    if not admin_id or not recipient_user_ids:
-        return jsonify({'error': 'Admin ID and recipient user IDs are required'}), 400
+    if not user_id:
+        return jsonify({'error': 'Valid stream ticket or session token required'}), 401
 
-    try:
-        # Simulate email sending without database operations
-        recipient_count = len(recipient_user_ids)
+    subscription = notification_hub.subscribe(user_id)
+    keepalive = float(os.getenv('NOTIFICATION_STREAM_KEEPALIVE', 15))
 
-        # TODO: Implement actual email sending logic here
+    def generate():
+        for item in notification_hub.events(user_id, subscription, keepalive=keepalive):
+            yield ': keepalive\n\n' if item is None else sse_event(*item)
 
-        # Always return success for frontend compatibility
-        return jsonify({
-            'message': f'Email sent successfully to {recipient_count} recipients',
-            'recipients_count': recipient_count
-        }), 200
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
+# Helper function to create notifications
+def create_notification(user_id, notification_type, title, message, related_content_id=None, action_url=None):
+    """
+    Helper function to create a notification (queued and written in the next batch)
+    """
+    try:
+        notifications.notify([user_id], notification_type, title, message,
+                             related_content_id=related_content_id, action_url=action_url)
+        return True
     except Exception as e:
-        return jsonify({'error': 'Failed to send email'}), 500
+        print(f"Error creating notification: {e}")
+        return False
 
+# Email management endpoints
 @app.route('/admin/email_logs', methods=['GET'])
 def get_email_logs():
     """
@@ -1685,8 +2114,9 @@ def get_email_logs():
     try:
         cursor.execute("""
             SELECT el.Email_ID, el.Sender_ID, up.Full_Name as sender_name,
-                   JSON_LENGTH(el.Recipient_Emails) as recipient_count,
-                   el.Subject, el.Email_Type, el.Status, el.Sent_At, el.Error_Message
+                   COALESCE(NULLIF(el.Recipient_Count, 0), JSON_LENGTH(el.Recipient_Emails)) as recipient_count,
+                   el.Subject, el.Email_Type, el.Status, el.Sent_At, el.Error_Message,
+                   el.Sent_Count, el.Failed_Count
             FROM Email_Logs el
             LEFT JOIN User_Profile up ON el.Sender_ID = up.User_ID
             ORDER BY el.Sent_At DESC
@@ -1706,7 +2136,9 @@ def get_email_logs():
                 'email_type': log[5],
                 'status': log[6],
                 'sent_at': log[7].isoformat() if log[7] else None,
-                'error_message': log[8]
+                'error_message': log[8],
+                'sent_count': log[9],
+                'failed_count': log[10]
             })
 
         return jsonify({'email_logs': email_logs}), 200
@@ -1891,6 +2323,7 @@ def require_permission(permission_name, check_ownership=False):
                 user_id = session['User_ID']
                 cursor.close()
                 connection.close()
+                last_seen.touch(user_id)
 
                 # For ownership-based permissions, get content_id from URL parameters
                 content_owner_id = None
@@ -1912,6 +2345,44 @@ def require_permission(permission_name, check_ownership=False):
         return decorated_function
     return decorator
 
+# Resolve the session user for routes where authentication is optional.
+# Handlers that already hold a connection pass their cursor so the lookup
+# does not borrow a second one from the pool.
+def get_session_user_id(cursor=None):
+    session_token = request.headers.get('Authorization')
+    if not session_token:
+        return None
+
+    # Remove 'Bearer ' prefix if present
+    if session_token.startswith('Bearer '):
+        session_token = session_token[7:]
+
+    if cursor is not None:
+        cursor.execute("SELECT User_ID FROM Session WHERE Session_Token = %s", (session_token,))
+        session = cursor.fetchone()
+        if not session:
+            return None
+        user_id = session['User_ID'] if isinstance(session, dict) else session[0]
+        last_seen.touch(user_id)
+        return user_id
+
+    try:
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT User_ID FROM Session WHERE Session_Token = %s", (session_token,))
+            session = cursor.fetchone()
+            if not session:
+                return None
+            last_seen.touch(session[0])
+            return session[0]
+        finally:
+            cursor.close()
+            conn.close()
+    except Exception as e:
+        print(f"Error resolving session user: {e}")
+        return None
+
 # JSON encoder to handle date objects
 class CustomJSONEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -1945,15 +2416,19 @@ def get_blog_posts():
                    c.Is_Featured as is_featured, bp.Category as category,
                    bp.Allow_Comments as allow_comments, bp.Is_Published as is_published,
                    bp.Publication_Date as publication_date, up.Full_Name as author_name,
-                   (SELECT COUNT(*) FROM Content_Comments cc WHERE cc.Content_ID = c.Content_ID AND cc.Status = 'Active') as comment_count
+                   COALESCE(cm.Comments_Count, 0) as comment_count,
+                   COALESCE(cm.Likes, 0) as like_count, (cl.Like_ID IS NOT NULL) as is_liked
             FROM Content c
             JOIN Blog_Posts bp ON c.Content_ID = bp.Content_ID
             JOIN Users u ON c.User_ID = u.User_ID
             JOIN User_Profile up ON u.User_ID = up.User_ID
+            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
+            LEFT JOIN Content_Likes cl ON c.Content_ID = cl.Content_ID AND cl.User_ID = %s
             WHERE c.Content_Type = 'Blog_Post' AND bp.Is_Published = TRUE
         """
 
-        params = []
+        # Like status is embedded for signed-in callers (anonymous callers never match)
+        params = [get_session_user_id(cursor)]
 
         # Add filters
         if category:
@@ -1970,6 +2445,8 @@ def get_blog_posts():
 
         cursor.execute(query, params)
         blog_posts = cursor.fetchall()
+        for post in blog_posts:
+            post['is_liked'] = bool(post['is_liked'])
 
         # Get total count for pagination
         count_query = """
@@ -2050,14 +2527,9 @@ def get_blog_post(post_id):
 
         comments = cursor.fetchall()
 
-        # Update view count in metrics
-        cursor.execute("""
-            UPDATE Content_Metrics
-            SET Views = Views + 1, Last_Updated = NOW()
-            WHERE Content_ID = %s
-        """, (post_id,))
+        # Count the view; repeat views are de-duplicated and flushed in batches
+        record_content_view(post_id)
 
-        connection.commit()
         cursor.close()
         connection.close()
 
@@ -2071,6 +2543,7 @@ def get_blog_post(post_id):
 
 @app.route('/api/blog-posts', methods=['POST'])
 @require_permission('content_create_own')
+@invalidates_dashboards('editor_dashboard', 'editor_analytics')
 def create_blog_post(user_id):
     try:
         data = request.json
@@ -2143,12 +2616,9 @@ def create_blog_post(user_id):
 
             # Log the action if user is admin
             if user_role_result['Role_ID'] == 1:
-                cursor.execute("""
-                    INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                    VALUES (%s, 'Create Blog Post', %s)
-                """, (user_id, f"Created blog post: {data.get('title')}"))
+                audit(user_id, 'Create Blog Post', f"Created blog post: {data.get('title')}")
 
-            connection.commit()
+            commit_audited(connection)
             cursor.close()
             connection.close()
 
@@ -2169,6 +2639,7 @@ def create_blog_post(user_id):
 
 @app.route('/api/blog-posts/<int:post_id>', methods=['PUT'])
 @require_permission('content_update_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='content')
 def update_blog_post(user_id, post_id):
     try:
         data = request.json
@@ -2250,12 +2721,9 @@ def update_blog_post(user_id, post_id):
 
         # Log the action if user is admin
         if user_role == 1:
-            cursor.execute("""
-                INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                VALUES (%s, 'Update Blog Post', CONCAT('Updated blog post ID: ', %s))
-            """, (user_id, post_id))
+            audit(user_id, 'Update Blog Post', f"Updated blog post ID: {post_id}")
 
-        connection.commit()
+        commit_audited(connection)
         cursor.close()
         connection.close()
 
@@ -2268,6 +2736,7 @@ def update_blog_post(user_id, post_id):
 
 @app.route('/api/blog-posts/<int:post_id>', methods=['DELETE'])
 @require_permission('content_delete_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='content')
 def delete_blog_post(user_id, post_id):
     try:
         connection = get_db_connection()
@@ -2310,12 +2779,9 @@ def delete_blog_post(user_id, post_id):
 
         # Log the action if user is admin
         if user_role == 1:
-            cursor.execute("""
-                INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                VALUES (%s, 'Delete Blog Post', CONCAT('Deleted blog post ID: ', %s))
-            """, (user_id, post_id))
+            audit(user_id, 'Delete Blog Post', f"Deleted blog post ID: {post_id}")
 
-        connection.commit()
+        commit_audited(connection)
         cursor.close()
         connection.close()
 
@@ -2354,17 +2820,15 @@ def add_blog_comment(user_id, post_id):
             # Get the new comment ID
             new_comment_id = cursor.lastrowid
 
-            # Update comment count in metrics
-            cursor.execute("""
-                UPDATE Content_Metrics
-                SET Comments_Count = Comments_Count + 1, Last_Updated = NOW()
-                WHERE Content_ID = %s
-            """, (post_id,))
+            # Update comment count in metrics (creates the row if missing)
+            increment_content_counter(cursor, post_id, 'Comments_Count')
 
             connection.commit()
             cursor.close()
             connection.close()
 
+            engagement_events.record(post_id, 'comment', user_id=user_id, viewer_key=get_viewer_key(user_id))
+
             return jsonify({
                 "success": True,
                 "message": "Comment added successfully",
@@ -2380,11 +2844,60 @@ def add_blog_comment(user_id, post_id):
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
+# MySQL error code for a transaction chosen as deadlock victim
+MYSQL_DEADLOCK_ERRNO = 1213
+
+# Attempts for the like toggle when concurrent toggles deadlock
+LIKE_TOGGLE_ATTEMPTS = 3
+
+def toggle_content_like(cursor, user_id, content_id):
+    """
+    Toggle a like on the unique (User_ID, Content_ID) key and apply the counter delta.
+
+    The insert only succeeds if the like did not exist, otherwise the like is
+    removed. The counter delta follows the rows actually changed, so
+    concurrent clicks can never push Content_Metrics.Likes out of step.
+    Returns (is_liked, like_count); the caller commits.
+    """
+    cursor.execute("""
+        INSERT IGNORE INTO Content_Likes (User_ID, Content_ID)
+        VALUES (%s, %s)
+    """, (user_id, content_id))
+
+    if cursor.rowcount == 1:
+        is_liked = True
+        delta = 1
+    else:
+        cursor.execute("""
+            DELETE FROM Content_Likes
+            WHERE User_ID = %s AND Content_ID = %s
+        """, (user_id, content_id))
+        is_liked = False
+        delta = -cursor.rowcount
+
+    # Apply the delta to the counter in the same transaction
+    if delta:
+        cursor.execute("""
+            INSERT INTO Content_Metrics (Content_ID, Views, Likes, Shares, Comments_Count)
+            VALUES (%s, 0, %s, 0, 0)
+            ON DUPLICATE KEY UPDATE
+            Likes = GREATEST(Likes + %s, 0), Last_Updated = NOW()
+        """, (content_id, max(delta, 0), delta))
+
+    cursor.execute("""
+        SELECT Likes FROM Content_Metrics
+        WHERE Content_ID = %s
+    """, (content_id,))
+
+    result = cursor.fetchone()
+    return is_liked, (result['Likes'] if result else 0)
+
 # Generic content comment endpoint
 @app.route('/api/content/<int:content_id>/like', methods=['POST'])
 @require_permission('content_read_public')
 def like_content(user_id, content_id):
     """Like or unlike content (blog posts, research papers, etc.)"""
+    connection = None
     try:
         connection = get_db_connection()
         cursor = connection.cursor(dictionary=True)
@@ -2398,68 +2911,177 @@ def like_content(user_id, content_id):
 
         content = cursor.fetchone()
         if not content:
+            cursor.close()
+            connection.close()
             return jsonify({"success": False, "message": "Content not found or inactive"}), 404
 
-        # Check if user has already liked this content
-        cursor.execute("""
-            SELECT Like_ID FROM Content_Likes
-            WHERE User_ID = %s AND Content_ID = %s
-        """, (user_id, content_id))
+        for attempt in range(LIKE_TOGGLE_ATTEMPTS):
+            try:
+                is_liked, like_count = toggle_content_like(cursor, user_id, content_id)
+                connection.commit()
+                break
+            except Exception as e:
+                # Simultaneous toggles by the same user can deadlock; the victim retries
+                if getattr(e, 'errno', None) != MYSQL_DEADLOCK_ERRNO or attempt == LIKE_TOGGLE_ATTEMPTS - 1:
+                    raise
+                connection.rollback()
 
-        existing_like = cursor.fetchone()
+        action = "liked" if is_liked else "unliked"
 
-        if existing_like:
-            # User has already liked, so unlike it
-            cursor.execute("""
-                DELETE FROM Content_Likes
-                WHERE User_ID = %s AND Content_ID = %s
-            """, (user_id, content_id))
+        cursor.close()
+        connection.close()
+
+        engagement_events.record(content_id, 'like' if is_liked else 'unlike',
+                                 user_id=user_id, viewer_key=get_viewer_key(user_id))
+
+        return jsonify({
+            "success": True,
+            "action": action,
+            "is_liked": is_liked,
+            "like_count": like_count,
+            "message": f"Content {action} successfully"
+        })
+
+    except Exception as e:
+        if connection:
+            connection.rollback()
+            connection.close()
+        return jsonify({"success": False, "message": str(e)}), 500
+
+def lookup_engagement_target(content_id):
+    """Whether content exists and is active, plus the optional session user, in one connection"""
+    connection = get_db_connection()
+    cursor = connection.cursor(dictionary=True)
+    try:
+        cursor.execute("SELECT 1 FROM Content WHERE Content_ID = %s AND Status = 'Active'", (content_id,))
+        content_active = cursor.fetchone() is not None
+        user_id = get_session_user_id(cursor) if content_active else None
+        return content_active, user_id
+    finally:
+        cursor.close()
+        connection.close()
+
+@app.route('/api/content/<int:content_id>/share', methods=['POST'])
+def share_content(content_id):
+    """Count a share of content (Web Share API or copied link)"""
+    try:
+        content_active, user_id = lookup_engagement_target(content_id)
+        if not content_active:
+            return jsonify({"success": False, "message": "Content not found or not active"}), 404
+
+        # Repeat shares by one viewer are ignored for SHARE_DEDUPE_WINDOW seconds;
+        # Content_Metrics.Shares is updated from the events by the compactor
+        engagement_events.record(content_id, 'share', user_id=user_id, viewer_key=get_viewer_key(user_id))
+
+        return jsonify({"success": True, "message": "Share recorded"})
+
+    except Exception as e:
+        return jsonify({"success": False, "message": str(e)}), 500
+
+@app.route('/api/content/<int:content_id>/dwell', methods=['POST'])
+def record_content_dwell(content_id):
+    """Record time spent on a content page; sent with navigator.sendBeacon when the page is hidden"""
+    # sendBeacon posts text/plain, so parse the body regardless of Content-Type
+    data = request.get_json(force=True, silent=True) or {}
+    try:
+        seconds = int(data.get('seconds', 0))
+    except (TypeError, ValueError):
+        return jsonify({"success": False, "message": "seconds must be an integer"}), 400
 
-            action = "unliked"
-            is_liked = False
+    if seconds < 0:
+        return jsonify({"success": False, "message": "seconds must not be negative"}), 400
+
+    try:
+        content_active, user_id = lookup_engagement_target(content_id)
+    except Exception as e:
+        return jsonify({"success": False, "message": str(e)}), 500
+    if not content_active:
+        return jsonify({"success": False, "message": "Content not found or not active"}), 404
+
+    # Pings longer than MAX_DWELL_SECONDS come from tabs left open, not reading
+    engagement_events.record(content_id, 'dwell', user_id=user_id,
+                             viewer_key=get_viewer_key(user_id), value=min(seconds, MAX_DWELL_SECONDS))
+    return jsonify({"success": True}), 202
+
+@app.route('/api/content/leaderboard', methods=['GET'])
+def get_content_leaderboard():
+    """Top active content by engagement score, or by time-decayed recent engagement (mode=trending)"""
+    try:
+        mode = request.args.get('mode', 'top')
+        content_type = request.args.get('type') or None
+        limit = request.args.get('limit', 10, type=int)
+
+        if mode not in ('top', 'trending'):
+            return jsonify({"success": False, "message": "mode must be 'top' or 'trending'"}), 400
+
+        connection = get_db_connection()
+        cursor = connection.cursor(dictionary=True)
+
+        if mode == 'trending':
+            items = trending_content(cursor, limit=limit, days=request.args.get('days', 7, type=int),
+                                     half_life_days=request.args.get('half_life', 2.0, type=float),
+                                     content_type=content_type)
         else:
-            # User hasn't liked, so like it
-            cursor.execute("""
-                INSERT INTO Content_Likes (User_ID, Content_ID)
-                VALUES (%s, %s)
-            """, (user_id, content_id))
+            items = top_content(cursor, limit=limit, content_type=content_type)
 
-            action = "liked"
-            is_liked = True
+        cursor.close()
+        connection.close()
 
-        connection.commit()
+        return jsonify({"success": True, "mode": mode, "items": items})
 
-        # Get updated like count from Content_Likes table directly
-        cursor.execute("""
-            SELECT COUNT(*) as like_count FROM Content_Likes
-            WHERE Content_ID = %s
-        """, (content_id,))
+    except Exception as e:
+        return jsonify({"success": False, "message": str(e)}), 500
 
-        result = cursor.fetchone()
-        like_count = result['like_count'] if result else 0
+# Upper bound on content ids resolved by one bulk like-status request
+MAX_LIKE_STATUS_IDS = 100
 
-        # Update Content_Metrics table
-        cursor.execute("""
-            INSERT INTO Content_Metrics (Content_ID, Views, Likes, Shares, Comments_Count)
-            VALUES (%s, 0, %s, 0, 0)
-            ON DUPLICATE KEY UPDATE
-            Likes = %s, Last_Updated = NOW()
-        """, (content_id, like_count, like_count))
+@app.route('/api/content/like-status', methods=['GET'])
+@require_permission('content_read_public')
+def get_bulk_like_status(user_id):
+    """Get like status and counts for many content ids (?ids=1,2,3) in one query"""
+    try:
+        raw_ids = ','.join(request.args.getlist('ids'))
+        try:
+            content_ids = list(dict.fromkeys(int(value) for value in raw_ids.split(',') if value.strip()))
+        except ValueError:
+            return jsonify({"success": False, "message": "ids must be comma-separated integers"}), 400
+
+        if not content_ids:
+            return jsonify({"success": False, "message": "At least one content id is required"}), 400
+        if len(content_ids) > MAX_LIKE_STATUS_IDS:
+            return jsonify({"success": False, "message": f"At most {MAX_LIKE_STATUS_IDS} ids per request"}), 400
+
+        connection = get_db_connection()
+        cursor = connection.cursor(dictionary=True)
+
+        placeholders = ', '.join(['%s'] * len(content_ids))
+        cursor.execute(f"""
+            SELECT c.Content_ID as content_id,
+                   COALESCE(cm.Likes, 0) as like_count,
+                   (cl.Like_ID IS NOT NULL) as is_liked
+            FROM Content c
+            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
+            LEFT JOIN Content_Likes cl ON c.Content_ID = cl.Content_ID AND cl.User_ID = %s
+            WHERE c.Content_ID IN ({placeholders})
+        """, [user_id] + content_ids)
+
+        statuses = {
+            str(row['content_id']): {
+                "is_liked": bool(row['is_liked']),
+                "like_count": int(row['like_count'])
+            }
+            for row in cursor.fetchall()
+        }
 
         cursor.close()
         connection.close()
 
         return jsonify({
             "success": True,
-            "action": action,
-            "is_liked": is_liked,
-            "like_count": like_count,
-            "message": f"Content {action} successfully"
+            "statuses": statuses
         })
 
     except Exception as e:
-        if connection:
-            connection.rollback()
         return jsonify({"success": False, "message": str(e)}), 500
 
 @app.route('/api/content/<int:content_id>/like-status', methods=['GET'])
@@ -2470,30 +3092,28 @@ def get_like_status(user_id, content_id):
         connection = get_db_connection()
         cursor = connection.cursor(dictionary=True)
 
-        # Check if user has liked this content
+        # Like flag from the unique key, count from the maintained counter
         cursor.execute("""
-            SELECT Like_ID FROM Content_Likes
-            WHERE User_ID = %s AND Content_ID = %s
-        """, (user_id, content_id))
-
-        is_liked = cursor.fetchone() is not None
-
-        # Get total like count from Content_Likes table directly
-        cursor.execute("""
-            SELECT COUNT(*) as like_count FROM Content_Likes
-            WHERE Content_ID = %s
-        """, (content_id,))
+            SELECT
+                EXISTS(
+                    SELECT 1 FROM Content_Likes
+                    WHERE User_ID = %s AND Content_ID = %s
+                ) as is_liked,
+                COALESCE((
+                    SELECT Likes FROM Content_Metrics
+                    WHERE Content_ID = %s
+                ), 0) as like_count
+        """, (user_id, content_id, content_id))
 
         result = cursor.fetchone()
-        like_count = result['like_count'] if result else 0
 
         cursor.close()
         connection.close()
 
         return jsonify({
             "success": True,
-            "is_liked": is_liked,
-            "like_count": like_count
+            "is_liked": bool(result['is_liked']),
+            "like_count": int(result['like_count'])
         })
 
     except Exception as e:
@@ -2556,12 +3176,8 @@ def add_content_comment(user_id, content_id):
             # Get the new comment ID
             new_comment_id = cursor.lastrowid
 
-            # Update comment count in metrics
-            cursor.execute("""
-                UPDATE Content_Metrics
-                SET Comments_Count = Comments_Count + 1, Last_Updated = NOW()
-                WHERE Content_ID = %s
-            """, (content_id,))
+            # Update comment count in metrics (creates the row if missing)
+            increment_content_counter(cursor, content_id, 'Comments_Count')
 
             # Get content author for notification
             cursor.execute("""
@@ -2573,21 +3189,22 @@ def add_content_comment(user_id, content_id):
 
             content_info = cursor.fetchone()
 
-            # Create notification for content author (if not commenting on own content)
+            # Notification for content author (if not commenting on own content)
             if content_info and content_info['User_ID'] != user_id:
                 notification_title = f"New Comment on Your {content_info['Content_Type'].replace('_', ' ')}"
                 notification_message = f"{content_info['commenter_name']} commented on your {content_info['Content_Type'].replace('_', ' ').lower()}: {content_info['Title']}"
                 action_url = f"/content/{content_id}"
 
-                cursor.execute("""
-                    INSERT INTO Notifications (User_ID, Type, Title, Message, Related_Content_ID, Action_URL)
-                    VALUES (%s, %s, %s, %s, %s, %s)
-                """, (content_info['User_ID'], 'content_comment', notification_title, notification_message, content_id, action_url))
-
             connection.commit()
             cursor.close()
             connection.close()
 
+            if content_info and content_info['User_ID'] != user_id:
+                notifications.notify([content_info['User_ID']], 'content_comment', notification_title,
+                                     notification_message, related_content_id=content_id, action_url=action_url)
+
+            engagement_events.record(content_id, 'comment', user_id=user_id, viewer_key=get_viewer_key(user_id))
+
             return jsonify({
                 "success": True,
                 "message": "Comment added successfully",
@@ -2628,43 +3245,59 @@ def get_editor_analytics(user_id):
                 'required_roles': ['Editor', 'Admin']
             }), 403
 
-        # Get content statistics for the editor
-        cursor.execute("""
-            SELECT
-                c.Content_Type,
-                COUNT(*) as count,
-                SUM(COALESCE(cm.Views, 0)) as total_views,
-                SUM(COALESCE(cm.Likes, 0)) as total_likes,
-                SUM(COALESCE(cm.Shares, 0)) as total_shares,
-                SUM(COALESCE(cm.Comments_Count, 0)) as total_comments,
-                SUM(CASE WHEN c.Status = 'Active' THEN 1 ELSE 0 END) as active_count
-            FROM Content c
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
-            WHERE c.User_ID = %s AND c.Status != 'Deleted'
-            GROUP BY c.Content_Type
-        """, (user_id,))
+        cursor.close()
+        conn.close()
+
+        analytics = dashboard_cache.get('editor_analytics', user_id,
+                                        lambda: build_editor_analytics(user_id))
+        return jsonify(analytics), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
 
-        content_stats = cursor.fetchall()
+def build_editor_analytics(user_id):
+    """Compute the editor analytics payload (served through dashboard_cache)"""
+    conn = get_analytics_connection()
 
-        # Get total applications for editor's job and internship postings
-        cursor.execute("""
+    try:
+        # Get content statistics for the editor (from the daily rollup)
+        content_stats = analytics_statements.execute(conn, """
             SELECT
-                COUNT(DISTINCT ja.Application_ID) as job_applications,
-                COUNT(DISTINCT ia.Application_ID) as internship_applications,
-                COUNT(DISTINCT CASE WHEN ja.Status = 'Pending' THEN ja.Application_ID END) as pending_job_applications,
-                COUNT(DISTINCT CASE WHEN ia.Status = 'Pending' THEN ia.Application_ID END) as pending_internship_applications
-            FROM Content c
-            LEFT JOIN Jobs j ON c.Content_ID = j.Content_ID
-            LEFT JOIN Job_Applications ja ON j.Job_ID = ja.Job_ID
-            LEFT JOIN Internships i ON c.Content_ID = i.Content_ID
-            LEFT JOIN Internship_Applications ia ON i.Internship_ID = ia.Internship_ID
-            WHERE c.User_ID = %s AND c.Status = 'Active'
+                Content_Type,
+                CAST(SUM(Content_Count) AS SIGNED) as count,
+                SUM(Views) as total_views,
+                SUM(Likes) as total_likes,
+                SUM(Shares) as total_shares,
+                SUM(Comments) as total_comments,
+                SUM(CASE WHEN Status = 'Active' THEN Content_Count ELSE 0 END) as active_count
+            FROM Content_Analytics_Daily
+            WHERE Creator_ID = %s AND Status != 'Deleted'
+            GROUP BY Content_Type
         """, (user_id,))
 
-        application_stats = cursor.fetchone()
+        # Get total applications for editor's job and internship postings
+        application_stats = analytics_statements.execute(conn, """
+            SELECT
+                CAST(COALESCE(SUM(CASE WHEN Content_Type = 'Job' THEN Applications ELSE 0 END), 0) AS SIGNED) as job_applications,
+                CAST(COALESCE(SUM(CASE WHEN Content_Type = 'Internship' THEN Applications ELSE 0 END), 0) AS SIGNED) as internship_applications
+            FROM Content_Analytics_Daily
+            WHERE Creator_ID = %s AND Status = 'Active'
+        """, (user_id,), fetch='one')
+
+        # Pending counts change with application status, so they are read live (scoped to this editor)
+        application_stats.update(analytics_statements.execute(conn, """
+            SELECT
+                (SELECT COUNT(*) FROM Job_Applications ja
+                 JOIN Jobs j ON ja.Job_ID = j.Job_ID
+                 JOIN Content c ON j.Content_ID = c.Content_ID
+                 WHERE c.User_ID = %s AND c.Status = 'Active' AND ja.Status = 'Pending') as pending_job_applications,
+                (SELECT COUNT(*) FROM Internship_Applications ia
+                 JOIN Internships i ON ia.Internship_ID = i.Internship_ID
+                 JOIN Content c ON i.Content_ID = c.Content_ID
+                 WHERE c.User_ID = %s AND c.Status = 'Active' AND ia.Status = 'Pending') as pending_internship_applications
+        """, (user_id, user_id), fetch='one'))
 
         # Get recent content with metrics
-        cursor.execute("""
+        recent_content = analytics_statements.execute(conn, """
             SELECT
                 c.Content_ID,
                 c.Title,
@@ -2674,19 +3307,7 @@ def get_editor_analytics(user_id):
                 c.Updated_At,
                 COALESCE(cm.Views, 0) as views,
                 COALESCE(cm.Comments_Count, 0) as comments,
-                CASE
-                    WHEN c.Content_Type = 'Job' THEN (
-                        SELECT COUNT(*) FROM Job_Applications ja
-                        JOIN Jobs j ON ja.Job_ID = j.Job_ID
-                        WHERE j.Content_ID = c.Content_ID
-                    )
-                    WHEN c.Content_Type = 'Internship' THEN (
-                        SELECT COUNT(*) FROM Internship_Applications ia
-                        JOIN Internships i ON ia.Internship_ID = i.Internship_ID
-                        WHERE i.Content_ID = c.Content_ID
-                    )
-                    ELSE 0
-                END as applications
+                COALESCE(cm.Applications_Count, 0) as applications
             FROM Content c
             LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
             WHERE c.User_ID = %s AND c.Status != 'Deleted'
@@ -2694,8 +3315,6 @@ def get_editor_analytics(user_id):
             LIMIT 10
         """, (user_id,))
 
-        recent_content = cursor.fetchall()
-
         # Process content statistics
         stats_dict = {}
         total_views = 0
@@ -2713,21 +3332,18 @@ def get_editor_analytics(user_id):
             total_views += stat['total_views'] or 0
 
         # Get engagement metrics
-        cursor.execute("""
+        engagement_stats = analytics_statements.execute(conn, """
             SELECT
-                AVG(COALESCE(cm.Avg_Time_Spent, 0)) as avg_time_spent,
-                AVG(COALESCE(cm.Bounce_Rate, 0)) as avg_bounce_rate,
-                SUM(COALESCE(cm.Likes, 0)) as total_likes,
-                SUM(COALESCE(cm.Shares, 0)) as total_shares
-            FROM Content c
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
-            WHERE c.User_ID = %s AND c.Status != 'Deleted'
-        """, (user_id,))
-
-        engagement_stats = cursor.fetchone()
+                SUM(Time_Spent_Sum) / NULLIF(SUM(Content_Count), 0) as avg_time_spent,
+                SUM(Bounce_Rate_Sum) / NULLIF(SUM(Content_Count), 0) as avg_bounce_rate,
+                SUM(Likes) as total_likes,
+                SUM(Shares) as total_shares
+            FROM Content_Analytics_Daily
+            WHERE Creator_ID = %s AND Status != 'Deleted'
+        """, (user_id,), fetch='one')
 
         # Get trending content (top 5 by recent activity)
-        cursor.execute("""
+        trending_content = analytics_statements.execute(conn, """
             SELECT
                 c.Content_ID,
                 c.Title,
@@ -2739,35 +3355,29 @@ def get_editor_analytics(user_id):
                 COALESCE(cm.Comments_Count, 0) as comments,
                 COALESCE(cm.Avg_Time_Spent, 0) as avg_time_spent,
                 COALESCE(cm.Bounce_Rate, 0) as bounce_rate,
-                (COALESCE(cm.Views, 0) * 0.4 + COALESCE(cm.Likes, 0) * 0.3 +
-                 COALESCE(cm.Shares, 0) * 0.2 + COALESCE(cm.Comments_Count, 0) * 0.1) as engagement_score
+                COALESCE(cm.Engagement_Score, 0) as engagement_score
             FROM Content c
             LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
             WHERE c.User_ID = %s AND c.Status = 'Active'
-            ORDER BY engagement_score DESC, cm.Last_Updated DESC
+            ORDER BY cm.Engagement_Score DESC, cm.Last_Updated DESC
             LIMIT 5
         """, (user_id,))
 
-        trending_content = cursor.fetchall()
-
         # Get time-based analytics (last 30 days)
-        cursor.execute("""
+        time_analytics = analytics_statements.execute(conn, """
             SELECT
-                DATE(c.Created_At) as date,
-                COUNT(*) as content_created,
-                SUM(COALESCE(cm.Views, 0)) as daily_views,
-                SUM(COALESCE(cm.Likes, 0)) as daily_likes,
-                SUM(COALESCE(cm.Comments_Count, 0)) as daily_comments
-            FROM Content c
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
-            WHERE c.User_ID = %s AND c.Created_At >= DATE_SUB(NOW(), INTERVAL 30 DAY)
-            GROUP BY DATE(c.Created_At)
+                Created_Date as date,
+                CAST(SUM(Content_Count) AS SIGNED) as content_created,
+                SUM(Views) as daily_views,
+                SUM(Likes) as daily_likes,
+                SUM(Comments) as daily_comments
+            FROM Content_Analytics_Daily
+            WHERE Creator_ID = %s AND Created_Date >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)
+            GROUP BY Created_Date
             ORDER BY date DESC
             LIMIT 30
         """, (user_id,))
 
-        time_analytics = cursor.fetchall()
-
         # Prepare enhanced response
         analytics = {
             'content_stats': {
@@ -2796,139 +3406,271 @@ def get_editor_analytics(user_id):
             'time_analytics': time_analytics
         }
 
-        return jsonify(analytics), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return analytics
     finally:
-        cursor.close()
         conn.close()
 
 # ===== ADMIN ANALYTICS ROUTES =====
 
-@app.route('/admin/analytics/enhanced', methods=['GET'])
+@app.route('/admin/metrics/reconcile', methods=['POST'])
 @require_permission('system_admin')
-def get_enhanced_admin_analytics(user_id):
+def reconcile_metrics_counters(user_id):
+    """Recompute Comments_Count / Applications_Count and correct drifted rows"""
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(buffered=True, dictionary=True)
+        corrected = counter_reconciler.run_once()
 
-        # Get global content statistics
-        cursor.execute("""
-            SELECT
-                c.Content_Type,
-                COUNT(*) as total_count,
-                SUM(CASE WHEN c.Status = 'Active' THEN 1 ELSE 0 END) as active_count,
-                SUM(COALESCE(cm.Views, 0)) as total_views,
-                SUM(COALESCE(cm.Likes, 0)) as total_likes,
-                SUM(COALESCE(cm.Shares, 0)) as total_shares,
-                SUM(COALESCE(cm.Comments_Count, 0)) as total_comments,
-                AVG(COALESCE(cm.Avg_Time_Spent, 0)) as avg_time_spent,
-                AVG(COALESCE(cm.Bounce_Rate, 0)) as avg_bounce_rate
-            FROM Content c
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
-            WHERE c.Status != 'Deleted'
-            GROUP BY c.Content_Type
-        """)
+        return jsonify({
+            "success": True,
+            "message": "Content counters reconciled",
+            "corrected": corrected
+        })
+    except Exception as e:
+        print(f"Error reconciling content counters: {e}")
+        return jsonify({"success": False, "message": str(e)}), 500
 
-        global_content_stats = cursor.fetchall()
+@app.route('/admin/send_email', methods=['POST'])
+@require_permission('system_admin')
+def admin_send_email(user_id):
+    """
+    Queue an email to the given users from the signed-in admin. Delivery
+    happens in the background; progress is visible in /admin/email_logs.
+    """
+    data = request.get_json()
+    recipient_user_ids = data.get('recipient_user_ids', [])
+    subject = data.get('subject', 'LawFort Notification')
+    content = data.get('content', '')
+    email_type = data.get('email_type', 'announcement')
 
-        # Get content creation by role
-        cursor.execute("""
-            SELECT
-                r.Role_Name,
-                c.Content_Type,
-                COUNT(*) as count,
-                SUM(COALESCE(cm.Views, 0)) as total_views
-            FROM Content c
-            JOIN Users u ON c.User_ID = u.User_ID
-            JOIN Roles r ON u.Role_ID = r.Role_ID
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
-            WHERE c.Status != 'Deleted'
-            GROUP BY r.Role_Name, c.Content_Type
-            ORDER BY r.Role_Name, c.Content_Type
-        """)
+    if not recipient_user_ids:
+        return jsonify({'error': 'Recipient user IDs are required'}), 400
 
-        role_content_stats = cursor.fetchall()
+    try:
+        recipient_user_ids = sorted({int(recipient_id) for recipient_id in recipient_user_ids})
+    except (TypeError, ValueError):
+        return jsonify({'error': 'Invalid recipient user IDs'}), 400
 
-        # Get top performing content across all creators
-        cursor.execute("""
-            SELECT
-                c.Content_ID,
-                c.Title,
-                c.Content_Type,
-                c.Created_At,
-                up.Full_Name as author_name,
-                COALESCE(cm.Views, 0) as views,
-                COALESCE(cm.Likes, 0) as likes,
-                COALESCE(cm.Shares, 0) as shares,
-                COALESCE(cm.Comments_Count, 0) as comments,
-                (COALESCE(cm.Views, 0) * 0.4 + COALESCE(cm.Likes, 0) * 0.3 +
-                 COALESCE(cm.Shares, 0) * 0.2 + COALESCE(cm.Comments_Count, 0) * 0.1) as engagement_score
-            FROM Content c
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
-            LEFT JOIN User_Profile up ON c.User_ID = up.User_ID
-            WHERE c.Status = 'Active'
-            ORDER BY engagement_score DESC
-            LIMIT 10
-        """)
+    conn = get_db_connection()
+    cursor = conn.cursor()
 
-        top_content = cursor.fetchall()
+    try:
+        # Resolve addresses of active users, a chunk of IDs at a time
+        recipient_emails = []
+        for offset in range(0, len(recipient_user_ids), 1000):
+            chunk = recipient_user_ids[offset:offset + 1000]
+            cursor.execute(f"""
+                SELECT Email FROM Users
+                WHERE User_ID IN ({', '.join(['%s'] * len(chunk))}) AND Status = 'Active'
+            """, chunk)
+            recipient_emails.extend(row[0] for row in cursor.fetchall())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+    finally:
+        cursor.close()
+        conn.close()
 
-        # Get user activity analytics
-        cursor.execute("""
-            SELECT
-                up.Full_Name as creator_name,
-                u.User_ID,
-                r.Role_Name,
-                COUNT(c.Content_ID) as content_count,
-                SUM(COALESCE(cm.Views, 0)) as total_views,
-                SUM(COALESCE(cm.Likes, 0)) as total_likes,
-                MAX(c.Created_At) as last_activity
-            FROM Users u
-            JOIN User_Profile up ON u.User_ID = up.User_ID
-            JOIN Roles r ON u.Role_ID = r.Role_ID
-            LEFT JOIN Content c ON u.User_ID = c.User_ID AND c.Status != 'Deleted'
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
-            WHERE r.Role_Name IN ('Editor', 'Admin')
-            GROUP BY u.User_ID, up.Full_Name, r.Role_Name
-            HAVING content_count > 0
-            ORDER BY total_views DESC
-            LIMIT 10
-        """)
+    if not recipient_emails:
+        return jsonify({'error': 'None of the recipients is an active user'}), 400
 
-        top_creators = cursor.fetchall()
+    try:
+        email_id, recipient_count = email_queue.enqueue(user_id, recipient_emails, subject, content, email_type)
+        mail_dispatcher.wake()
 
-        # Get content moderation metrics
-        cursor.execute("""
-            SELECT
-                COUNT(CASE WHEN c.Status = 'Pending' THEN 1 END) as pending_content,
-                COUNT(CASE WHEN c.Status = 'Banned' THEN 1 END) as banned_content,
-                COUNT(CASE WHEN c.Status = 'Restricted' THEN 1 END) as restricted_content,
-                COUNT(CASE WHEN rpr.Status = 'Pending' THEN 1 END) as pending_research_reviews
-            FROM Content c
-            LEFT JOIN Research_Papers rp ON c.Content_ID = rp.Content_ID
-            LEFT JOIN Research_Paper_Reviews rpr ON rp.Paper_ID = rpr.Content_ID
-        """)
+        return jsonify({
+            'message': f'Email queued for {recipient_count} recipients',
+            'email_id': email_id,
+            'recipients_count': recipient_count
+        }), 202
 
-        moderation_stats = cursor.fetchone()
+    except Exception as e:
+        print(f"Error queueing email: {e}")
+        return jsonify({'error': 'Failed to queue email'}), 500
 
-        # Get platform-wide engagement trends (last 30 days)
-        cursor.execute("""
-            SELECT
-                DATE(c.Created_At) as date,
-                COUNT(*) as content_created,
-                SUM(COALESCE(cm.Views, 0)) as daily_views,
-                SUM(COALESCE(cm.Likes, 0)) as daily_likes,
-                SUM(COALESCE(cm.Comments_Count, 0)) as daily_comments
-            FROM Content c
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
-            WHERE c.Created_At >= DATE_SUB(NOW(), INTERVAL 30 DAY)
-            GROUP BY DATE(c.Created_At)
-            ORDER BY date DESC
-            LIMIT 30
-        """)
+@app.route('/admin/notifications/archive', methods=['POST'])
+@require_permission('system_admin')
+def archive_notifications(user_id):
+    """Move read notifications past the retention window to the archive now"""
+    try:
+        result = notification_archiver.archive()
+
+        return jsonify({
+            "success": True,
+            "message": "Notification archiving already running" if result['skipped'] else "Notifications archived",
+            "result": result
+        })
+    except Exception as e:
+        print(f"Error archiving notifications: {e}")
+        return jsonify({"success": False, "message": str(e)}), 500
+
+USER_EXPORT_QUERY = """
+    SELECT u.User_ID, u.Email, u.Role_ID, r.Role_Name, u.Status, u.Created_At,
+           up.Full_Name, up.Phone, up.Bio, up.Practice_Area, up.Location, up.Years_of_Experience,
+           u.Last_Seen_At, u.Last_Seen_At > DATE_SUB(NOW(), INTERVAL 30 DAY) AS Is_Active
+    FROM Users u
+    LEFT JOIN User_Profile up ON u.User_ID = up.User_ID
+    LEFT JOIN Roles r ON u.Role_ID = r.Role_ID
+    WHERE u.User_ID > %s
+    ORDER BY u.User_ID
+    LIMIT %s
+"""
+
+@app.route('/admin/users/export', methods=['GET'])
+@require_permission('system_admin')
+def export_users(user_id):
+    """Stream every user as CSV or NDJSON (?after=<User_ID> resumes after that user)"""
+    export_format = request.args.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"success": False, "message": "format must be csv or ndjson"}), 400
+
+    after = request.args.get('after', '0')
+    if not after.isdigit():
+        return jsonify({"success": False, "message": "after must be a user ID"}), 400
+
+    return streaming_export(
+        export_format, 'users',
+        lambda after_id, chunk_size: (USER_EXPORT_QUERY, (after_id, chunk_size)),
+        lambda row: row['User_ID'],
+        after=int(after)
+    )
+
+@app.route('/admin/audit_logs/archive', methods=['POST'])
+@require_permission('system_admin')
+def archive_audit_logs(user_id):
+    """Move audit entries past the retention window to the partitioned archive now"""
+    try:
+        audit_log.flush()
+        result = audit_log_archiver.archive()
+
+        return jsonify({
+            "success": True,
+            "message": "Audit log archiving already running" if result['skipped'] else "Audit logs archived",
+            "result": result
+        })
+    except Exception as e:
+        print(f"Error archiving audit logs: {e}")
+        return jsonify({"success": False, "message": str(e)}), 500
+
+@app.route('/admin/analytics/refresh', methods=['POST'])
+@require_permission('system_admin')
+def refresh_analytics_rollup(user_id):
+    """Fold recent changes into the analytics rollups now (full=true re-reads all content)"""
+    try:
+        data = request.get_json(silent=True) or {}
+        result = analytics_rollup.refresh(full=bool(data.get('full')))
+        engagement_events.flush()
+        engagement = engagement_compactor.compact()
+
+        return jsonify({
+            "success": True,
+            "message": "Analytics refresh already running" if result['skipped'] else "Analytics rollup refreshed",
+            "result": result,
+            "engagement": engagement,
+            "status": analytics_rollup.status()
+        })
+    except Exception as e:
+        print(f"Error refreshing analytics rollup: {e}")
+        return jsonify({"success": False, "message": str(e)}), 500
+
+@app.route('/admin/analytics/enhanced', methods=['GET'])
+@require_permission('system_admin')
+def get_enhanced_admin_analytics(user_id):
+    try:
+        conn = get_analytics_connection()
+
+        results = analytics_queries.run({
+            # Get global content statistics (from the daily rollup)
+            'global_content_stats': Query("""
+                SELECT
+                    Content_Type,
+                    CAST(SUM(Content_Count) AS SIGNED) as total_count,
+                    SUM(CASE WHEN Status = 'Active' THEN Content_Count ELSE 0 END) as active_count,
+                    SUM(Views) as total_views,
+                    SUM(Likes) as total_likes,
+                    SUM(Shares) as total_shares,
+                    SUM(Comments) as total_comments,
+                    SUM(Time_Spent_Sum) / NULLIF(SUM(Content_Count), 0) as avg_time_spent,
+                    SUM(Bounce_Rate_Sum) / NULLIF(SUM(Content_Count), 0) as avg_bounce_rate
+                FROM Content_Analytics_Daily
+                WHERE Status != 'Deleted'
+                GROUP BY Content_Type
+            """),
+
+            # Get content creation by role (creators' current roles)
+            'role_content_stats': Query("""
+                SELECT
+                    r.Role_Name,
+                    d.Content_Type,
+                    CAST(SUM(d.Content_Count) AS SIGNED) as count,
+                    SUM(d.Views) as total_views
+                FROM Content_Analytics_Daily d
+                JOIN Users u ON d.Creator_ID = u.User_ID
+                JOIN Roles r ON u.Role_ID = r.Role_ID
+                WHERE d.Status != 'Deleted'
+                GROUP BY r.Role_Name, d.Content_Type
+                ORDER BY r.Role_Name, d.Content_Type
+            """),
+
+            # Get top performing content across all creators (engagement score index)
+            'top_content': Query(*top_content_sql(10)),
+
+            # Get user activity analytics
+            'top_creators': Query("""
+                SELECT
+                    up.Full_Name as creator_name,
+                    u.User_ID,
+                    r.Role_Name,
+                    CAST(SUM(d.Content_Count) AS SIGNED) as content_count,
+                    SUM(d.Views) as total_views,
+                    SUM(d.Likes) as total_likes,
+                    MAX(d.Last_Created_At) as last_activity
+                FROM Content_Analytics_Daily d
+                JOIN Users u ON d.Creator_ID = u.User_ID
+                JOIN User_Profile up ON u.User_ID = up.User_ID
+                JOIN Roles r ON u.Role_ID = r.Role_ID
+                WHERE r.Role_Name IN ('Editor', 'Admin') AND d.Status != 'Deleted'
+                GROUP BY u.User_ID, up.Full_Name, r.Role_Name
+                HAVING content_count > 0
+                ORDER BY total_views DESC
+                LIMIT 10
+            """),
+
+            # Get content moderation metrics
+            'moderation_stats': Query("""
+                SELECT
+                    CAST(COALESCE(SUM(CASE WHEN Status = 'Pending' THEN Content_Count END), 0) AS SIGNED) as pending_content,
+                    CAST(COALESCE(SUM(CASE WHEN Status = 'Banned' THEN Content_Count END), 0) AS SIGNED) as banned_content,
+                    CAST(COALESCE(SUM(CASE WHEN Status = 'Restricted' THEN Content_Count END), 0) AS SIGNED) as restricted_content
+                FROM Content_Analytics_Daily
+            """, (), 'one'),
+
+            'research_reviews': Query("""
+                SELECT COUNT(*) as pending_research_reviews
+                FROM Research_Paper_Reviews rpr
+                JOIN Research_Papers rp ON rp.Paper_ID = rpr.Content_ID
+                WHERE rpr.Status = 'Pending'
+            """, (), 'one'),
+
+            # Get platform-wide engagement trends (last 30 days)
+            'platform_trends': Query("""
+                SELECT
+                    Created_Date as date,
+                    CAST(SUM(Content_Count) AS SIGNED) as content_created,
+                    SUM(Views) as daily_views,
+                    SUM(Likes) as daily_likes,
+                    SUM(Comments) as daily_comments
+                FROM Content_Analytics_Daily
+                WHERE Created_Date >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)
+                GROUP BY Created_Date
+                ORDER BY date DESC
+                LIMIT 30
+            """)
+        }, connection=conn)
 
-        platform_trends = cursor.fetchall()
+        global_content_stats = results['global_content_stats']
+        role_content_stats = results['role_content_stats']
+        top_content = results['top_content']
+        top_creators = results['top_creators']
+        moderation_stats = {**results['moderation_stats'], **results['research_reviews']}
+        platform_trends = results['platform_trends']
 
         # Process global content stats
         global_stats_dict = {}
@@ -2986,122 +3728,93 @@ def get_enhanced_admin_analytics(user_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     finally:
-        cursor.close()
         conn.close()
 
 @app.route('/api/content/analytics', methods=['GET'])
 @require_permission('system_admin')
 def get_content_analytics(user_id):
+    # Get query parameters
+    time_range = request.args.get('timeRange', '7d')
+    content_type = request.args.get('contentType', 'all')
+
+    if time_range not in TIME_RANGE_DAYS:
+        time_range = '7d'
+    if content_type != 'all' and content_type not in CONTENT_TYPES:
+        return jsonify({'error': f"Unknown content type: {content_type}"}), 400
+
+    days_back = TIME_RANGE_DAYS[time_range]
+    filter_type = content_type != 'all'
+
+    def in_range(query):
+        """Restrict a Content_Engagement_Daily query to the range and content type"""
+        return (query
+                .where("d.Event_Date >= CURDATE() - INTERVAL %s DAY", days_back)
+                .where("c.Status = 'Active'")
+                .where_if(filter_type, "c.Content_Type = %s", content_type))
+
+    conn = None
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(buffered=True, dictionary=True)
-
-        # Get query parameters
-        time_range = request.args.get('timeRange', '7d')
-        content_type = request.args.get('contentType', 'all')
-
-        # Calculate date filter based on time range
-        if time_range == '7d':
-            date_filter = "DATE_SUB(NOW(), INTERVAL 7 DAY)"
-        elif time_range == '30d':
-            date_filter = "DATE_SUB(NOW(), INTERVAL 30 DAY)"
-        elif time_range == '90d':
-            date_filter = "DATE_SUB(NOW(), INTERVAL 90 DAY)"
-        elif time_range == '1y':
-            date_filter = "DATE_SUB(NOW(), INTERVAL 1 YEAR)"
-        else:
-            date_filter = "DATE_SUB(NOW(), INTERVAL 7 DAY)"
+        conn = get_analytics_connection()
 
-        # Build content type filter
-        content_type_filter = ""
-        if content_type != 'all':
-            content_type_filter = f"AND c.Content_Type = '{content_type}'"
-
-        # Get total metrics
-        cursor.execute(f"""
+        # Get total engagement within the range (from compacted daily events)
+        totals_query = in_range(AnalyticsQuery("""
             SELECT
-                SUM(COALESCE(cm.Views, 0)) as total_views,
-                SUM(COALESCE(cm.Likes, 0)) as total_likes,
-                SUM(COALESCE(cm.Shares, 0)) as total_shares,
-                SUM(COALESCE(cm.Comments_Count, 0)) as total_comments
-            FROM Content c
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
-            WHERE c.Created_At >= {date_filter}
-            AND c.Status = 'Active'
-            {content_type_filter}
-        """)
-
-        totals = cursor.fetchone()
-
-        # Get top performing content
-        cursor.execute(f"""
+                SUM(d.Views) as total_views,
+                SUM(d.Likes) as total_likes,
+                SUM(d.Shares) as total_shares,
+                SUM(d.Comments) as total_comments,
+                SUM(d.Dwell_Seconds) / NULLIF(SUM(d.Dwell_Count), 0) as avg_time_spent,
+                100 * SUM(d.Bounces) / NULLIF(SUM(d.Dwell_Count), 0) as bounce_rate
+            FROM Content_Engagement_Daily d
+            JOIN Content c ON d.Content_ID = c.Content_ID
+        """))
+        totals = analytics_statements.execute(conn, *totals_query.build(), fetch='one')
+
+        # Get top performing content by views within the range
+        top_content_query = in_range(AnalyticsQuery("""
             SELECT
                 c.Content_ID as content_id,
                 c.Title as title,
                 c.Content_Type as content_type,
-                COALESCE(cm.Views, 0) as views,
-                COALESCE(cm.Likes, 0) as likes,
-                COALESCE(cm.Shares, 0) as shares,
-                COALESCE(cm.Comments_Count, 0) as comments,
+                SUM(d.Views) as views,
+                SUM(d.Likes) as likes,
+                SUM(d.Shares) as shares,
+                SUM(d.Comments) as comments,
                 c.Created_At as created_at,
                 up.Full_Name as author_name
-            FROM Content c
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
+            FROM Content_Engagement_Daily d
+            JOIN Content c ON d.Content_ID = c.Content_ID
             LEFT JOIN User_Profile up ON c.User_ID = up.User_ID
-            WHERE c.Created_At >= {date_filter}
-            AND c.Status = 'Active'
-            {content_type_filter}
-            ORDER BY COALESCE(cm.Views, 0) DESC
-            LIMIT 10
-        """)
-
-        top_content = cursor.fetchall()
+        """))
+        top_content_query.group_by("c.Content_ID, c.Title, c.Content_Type, c.Created_At, up.Full_Name")
+        top_content_query.order_by("views DESC").limit(10)
+        top_content = analytics_statements.execute(conn, *top_content_query.build())
 
         # Get content by type statistics
-        cursor.execute(f"""
+        content_by_type_query = AnalyticsQuery("""
             SELECT
-                c.Content_Type as type,
-                COUNT(*) as count,
-                SUM(COALESCE(cm.Views, 0)) as views
-            FROM Content c
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
-            WHERE c.Created_At >= {date_filter}
-            AND c.Status = 'Active'
-            GROUP BY c.Content_Type
-            ORDER BY views DESC
+                Content_Type as type,
+                CAST(SUM(Content_Count) AS SIGNED) as count,
+                SUM(Views) as views
+            FROM Content_Analytics_Daily
         """)
-
-        content_by_type = cursor.fetchall()
-
-        # Get daily views and likes for the time period
-        if time_range == '7d':
-            date_format = '%Y-%m-%d'
-            days_back = 7
-        elif time_range == '30d':
-            date_format = '%Y-%m-%d'
-            days_back = 30
-        elif time_range == '90d':
-            date_format = '%Y-%m-%d'
-            days_back = 90
-        else:  # 1y
-            date_format = '%Y-%m'
-            days_back = 365
-
-        cursor.execute(f"""
+        content_by_type_query.where("Created_Date >= CURDATE() - INTERVAL %s DAY", days_back)
+        content_by_type_query.where("Status = 'Active'")
+        content_by_type_query.group_by("Content_Type").order_by("views DESC")
+        content_by_type = analytics_statements.execute(conn, *content_by_type_query.build())
+
+        # Get daily views and likes for the time period (monthly for a year)
+        date_format = '%Y-%m' if time_range == '1y' else '%Y-%m-%d'
+        daily_views_query = in_range(AnalyticsQuery("""
             SELECT
-                DATE_FORMAT(c.Created_At, '{date_format}') as date,
-                SUM(COALESCE(cm.Views, 0)) as views,
-                SUM(COALESCE(cm.Likes, 0)) as likes
-            FROM Content c
-            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
-            WHERE c.Created_At >= {date_filter}
-            AND c.Status = 'Active'
-            {content_type_filter}
-            GROUP BY DATE_FORMAT(c.Created_At, '{date_format}')
-            ORDER BY date ASC
-        """)
-
-        daily_views = cursor.fetchall()
+                DATE_FORMAT(d.Event_Date, %s) as date,
+                SUM(d.Views) as views,
+                SUM(d.Likes) as likes
+            FROM Content_Engagement_Daily d
+            JOIN Content c ON d.Content_ID = c.Content_ID
+        """, date_format))
+        daily_views_query.group_by("date").order_by("date ASC")
+        daily_views = analytics_statements.execute(conn, *daily_views_query.build())
 
         # Format the response
         analytics = {
@@ -3109,6 +3822,8 @@ def get_content_analytics(user_id):
             'totalLikes': totals['total_likes'] or 0,
             'totalShares': totals['total_shares'] or 0,
             'totalComments': totals['total_comments'] or 0,
+            'avgTimeSpent': round(totals['avg_time_spent'] or 0, 2),
+            'bounceRate': round(totals['bounce_rate'] or 0, 2),
             'topContent': top_content,
             'contentByType': content_by_type,
             'dailyViews': daily_views
@@ -3118,8 +3833,8 @@ def get_content_analytics(user_id):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
     finally:
-        cursor.close()
-        conn.close()
+        if conn:
+            conn.close()
 
 # ===== RESEARCH PAPER ROUTES =====
 
@@ -3144,15 +3859,19 @@ def get_research_papers():
                    c.Is_Featured as is_featured, rp.Authors as authors,
                    rp.Publication as publication, rp.Publication_Date as publication_date,
                    rp.DOI as doi, rp.Keywords as keywords, rp.Abstract as abstract,
-                   rp.Citation_Count as citation_count, up.Full_Name as author_name
+                   rp.Citation_Count as citation_count, up.Full_Name as author_name,
+                   COALESCE(cm.Likes, 0) as like_count, (cl.Like_ID IS NOT NULL) as is_liked
             FROM Content c
             JOIN Research_Papers rp ON c.Content_ID = rp.Content_ID
             JOIN Users u ON c.User_ID = u.User_ID
             JOIN User_Profile up ON u.User_ID = up.User_ID
+            LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
+            LEFT JOIN Content_Likes cl ON c.Content_ID = cl.Content_ID AND cl.User_ID = %s
             WHERE c.Content_Type = 'Research_Paper'
         """
 
-        params = []
+        # Like status is embedded for signed-in callers (anonymous callers never match)
+        params = [get_session_user_id(cursor)]
 
         # Add filters
         if keywords:
@@ -3170,6 +3889,8 @@ def get_research_papers():
 
         cursor.execute(query, params)
         research_papers = cursor.fetchall()
+        for paper in research_papers:
+            paper['is_liked'] = bool(paper['is_liked'])
 
         # Get total count for pagination
         count_query = """
@@ -3234,14 +3955,9 @@ def get_research_paper(paper_id):
             connection.close()
             return jsonify({"success": False, "message": "Research paper not found"}), 404
 
-        # Update view count in metrics
-        cursor.execute("""
-            UPDATE Content_Metrics
-            SET Views = Views + 1, Last_Updated = NOW()
-            WHERE Content_ID = %s
-        """, (paper_id,))
+        # Count the view; repeat views are de-duplicated and flushed in batches
+        record_content_view(paper_id)
 
-        connection.commit()
         cursor.close()
         connection.close()
 
@@ -3254,6 +3970,7 @@ def get_research_paper(paper_id):
 
 @app.route('/api/research-papers', methods=['POST'])
 @require_permission('content_create_own')
+@invalidates_dashboards('editor_dashboard', 'editor_analytics')
 def create_research_paper(user_id):
     try:
         data = request.json
@@ -3335,12 +4052,9 @@ def create_research_paper(user_id):
 
             # Log the action if user is admin
             if user_role_result['Role_ID'] == 1:
-                cursor.execute("""
-                    INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                    VALUES (%s, 'Create Research Paper', %s)
-                """, (user_id, f"Created research paper: {data.get('title')}"))
+                audit(user_id, 'Create Research Paper', f"Created research paper: {data.get('title')}")
 
-            connection.commit()
+            commit_audited(connection)
             cursor.close()
             connection.close()
 
@@ -3361,6 +4075,7 @@ def create_research_paper(user_id):
 
 @app.route('/api/research-papers/<int:paper_id>', methods=['PUT'])
 @require_permission('content_update_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='content')
 def update_research_paper(user_id, paper_id):
     try:
         data = request.json
@@ -3533,6 +4248,7 @@ def update_research_paper(user_id, paper_id):
 
 @app.route('/api/research-papers/<int:paper_id>', methods=['DELETE'])
 @require_permission('content_delete_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='content')
 def delete_research_paper(user_id, paper_id):
     try:
         connection = get_db_connection()
@@ -3575,12 +4291,9 @@ def delete_research_paper(user_id, paper_id):
 
         # Log the action if user is admin
         if user_role == 1:
-            cursor.execute("""
-                INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                VALUES (%s, 'Delete Research Paper', CONCAT('Deleted research paper ID: ', %s))
-            """, (user_id, paper_id))
+            audit(user_id, 'Delete Research Paper', f"Deleted research paper ID: {paper_id}")
 
-        connection.commit()
+        commit_audited(connection)
         cursor.close()
         connection.close()
 
@@ -3595,9 +4308,18 @@ def delete_research_paper(user_id, paper_id):
 @require_permission('content_create')
 def get_editor_dashboard(user_id):
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor(buffered=True, dictionary=True)
+        dashboard_data = dashboard_cache.get('editor_dashboard', user_id,
+                                             lambda: build_editor_dashboard(user_id))
+        return jsonify(dashboard_data), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def build_editor_dashboard(user_id):
+    """Compute the editor dashboard payload (served through dashboard_cache)"""
+    conn = get_db_connection()
+    cursor = conn.cursor(buffered=True, dictionary=True)
 
+    try:
         # Get editor's content statistics
         cursor.execute("""
             SELECT
@@ -3621,7 +4343,7 @@ def get_editor_dashboard(user_id):
                 COALESCE(SUM(cm.Views), 0) as total_views,
                 COALESCE(SUM(cm.Likes), 0) as total_likes,
                 COALESCE(SUM(cm.Shares), 0) as total_shares,
-                COALESCE(SUM(cm.Comments), 0) as total_comments
+                COALESCE(SUM(cm.Comments_Count), 0) as total_comments
             FROM Content c
             LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
             WHERE c.User_ID = %s
@@ -3639,7 +4361,7 @@ def get_editor_dashboard(user_id):
                 c.Created_At,
                 COALESCE(cm.Views, 0) as views,
                 COALESCE(cm.Likes, 0) as likes,
-                COALESCE(cm.Comments, 0) as comments
+                COALESCE(cm.Comments_Count, 0) as comments
             FROM Content c
             LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
             WHERE c.User_ID = %s
@@ -3739,9 +4461,7 @@ def get_editor_dashboard(user_id):
             'recent_applications': recent_applications
         }
 
-        return jsonify(dashboard_data), 200
-    except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return dashboard_data
     finally:
         cursor.close()
         conn.close()
@@ -3906,14 +4626,9 @@ def get_note(note_id):
             connection.close()
             return jsonify({"success": False, "message": "Note not found"}), 404
 
-        # Update view count
-        cursor.execute("""
-            UPDATE Content_Metrics
-            SET Views = Views + 1, Last_Updated = NOW()
-            WHERE Content_ID = %s
-        """, (note['content_id'],))
+        # Count the view; repeat views are de-duplicated and flushed in batches
+        record_content_view(note['content_id'])
 
-        connection.commit()
         cursor.close()
         connection.close()
 
@@ -3927,6 +4642,7 @@ def get_note(note_id):
 
 @app.route('/api/notes', methods=['POST'])
 @require_permission('content_create_own')
+@invalidates_dashboards('editor_dashboard', 'editor_analytics')
 def create_note(user_id):
     try:
         data = request.json
@@ -3999,12 +4715,9 @@ def create_note(user_id):
 
             # Log the action if user is admin
             if user_role_result['Role_ID'] == 1:
-                cursor.execute("""
-                    INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                    VALUES (%s, 'Create Note', %s)
-                """, (user_id, f"Created note: {data.get('title')}"))
+                audit(user_id, 'Create Note', f"Created note: {data.get('title')}")
 
-            connection.commit()
+            commit_audited(connection)
             cursor.close()
             connection.close()
 
@@ -4026,6 +4739,7 @@ def create_note(user_id):
 # Update an existing note
 @app.route('/api/notes/<int:note_id>', methods=['PUT'])
 @require_permission('content_update_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='note')
 def update_note(user_id, note_id):
     try:
         data = request.json
@@ -4115,6 +4829,7 @@ def update_note(user_id, note_id):
 # Delete a note
 @app.route('/api/notes/<int:note_id>', methods=['DELETE'])
 @require_permission('content_delete_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='note')
 def delete_note(user_id, note_id):
     try:
         connection = get_db_connection()
@@ -4289,6 +5004,7 @@ def get_user_notes_library(user_id):
 # Save a public note to user's library - Real implementation
 @app.route('/api/notes/<int:note_id>/save', methods=['POST'])
 @require_permission('content_create')
+@invalidates_dashboards('user_dashboard', 'editor_dashboard', 'editor_analytics')
 def save_note_to_library(user_id, note_id):
     try:
         connection = get_db_connection()
@@ -4448,6 +5164,7 @@ def get_courses():
 
 @app.route('/api/courses', methods=['POST'])
 @require_permission('content_create')
+@invalidates_dashboards('editor_dashboard', 'editor_analytics')
 def create_course(user_id):
     try:
         data = request.json
@@ -4496,6 +5213,7 @@ def create_course(user_id):
 
 @app.route('/api/courses/<int:course_id>', methods=['PUT'])
 @require_permission('content_update_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='course')
 def update_course(user_id, course_id):
     try:
         data = request.json
@@ -4584,6 +5302,7 @@ def update_course(user_id, course_id):
 
 @app.route('/api/courses/<int:course_id>', methods=['DELETE'])
 @require_permission('content_delete_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='course')
 def delete_course(user_id, course_id):
     try:
         connection = get_db_connection()
@@ -4642,6 +5361,7 @@ def delete_course(user_id, course_id):
 
 @app.route('/api/content/<int:content_id>/status', methods=['PUT'])
 @require_permission('content_update')
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='content')
 def update_content_status(user_id, content_id):
     try:
         data = request.json
@@ -4855,14 +5575,9 @@ def get_job(user_id, job_id):
 
         application = cursor.fetchone()
 
-        # Update view count in metrics
-        cursor.execute("""
-            UPDATE Content_Metrics
-            SET Views = Views + 1, Last_Updated = NOW()
-            WHERE Content_ID = %s
-        """, (job['content_id'],))
+        # Count the view; repeat views are de-duplicated and flushed in batches
+        record_content_view(job['content_id'], user_id)
 
-        connection.commit()
         cursor.close()
         connection.close()
 
@@ -4877,6 +5592,7 @@ def get_job(user_id, job_id):
 
 @app.route('/api/jobs', methods=['POST'])
 @require_permission('content_create_own')
+@invalidates_dashboards('editor_dashboard', 'editor_analytics')
 def create_job(user_id):
     try:
         data = request.json
@@ -4943,12 +5659,9 @@ def create_job(user_id):
 
             # Log the action if user is admin
             if user_role_result['Role_ID'] == 1:
-                cursor.execute("""
-                    INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                    VALUES (%s, 'Create Job Posting', %s)
-                """, (user_id, f"Created job posting: {data.get('title')}"))
+                audit(user_id, 'Create Job Posting', f"Created job posting: {data.get('title')}")
 
-            connection.commit()
+            commit_audited(connection)
             cursor.close()
             connection.close()
 
@@ -4982,7 +5695,7 @@ def apply_for_job(user_id, job_id):
 
         # Check if the job exists and is active (bypass stored procedure for now)
         cursor.execute("""
-            SELECT j.Application_Deadline, c.Status
+            SELECT j.Application_Deadline, j.Content_ID, c.Status, c.User_ID as Owner_ID
             FROM Jobs j
             JOIN Content c ON j.Content_ID = c.Content_ID
             WHERE j.Job_ID = %s
@@ -5005,48 +5718,29 @@ def apply_for_job(user_id, job_id):
         """, (job_id, user_id))
 
         already_applied = cursor.fetchone()['count']
-        if already_applied > 0:
-            return jsonify({"success": False, "message": "You have already applied for this job"}), 400
-
-        # Insert the application
-        cursor.execute("""
-            INSERT INTO Job_Applications (Job_ID, User_ID, Resume_URL, Cover_Letter)
-            VALUES (%s, %s, %s, %s)
-        """, (job_id, user_id, data.get('resume_url'), data.get('cover_letter', '')))
-
-        procedure_result = ["Application submitted successfully"]
-
-        # Create notification for admins and editors
-        cursor.execute("""
-            SELECT up.Full_Name, j.Company_Name, c.Title
-            FROM User_Profile up
-            JOIN Jobs j ON j.Job_ID = %s
-            JOIN Content c ON j.Content_ID = c.Content_ID
-            WHERE up.User_ID = %s
-        """, (job_id, user_id))
+        if already_applied > 0:
+            return jsonify({"success": False, "message": "You have already applied for this job"}), 400
 
-        applicant_info = cursor.fetchone()
-        if applicant_info:
-            notification_message = f"New job application: {applicant_info['Full_Name']} applied for {applicant_info['Title']} at {applicant_info['Company_Name']}"
+        # Insert the application
+        cursor.execute("""
+            INSERT INTO Job_Applications (Job_ID, User_ID, Resume_URL, Cover_Letter)
+            VALUES (%s, %s, %s, %s)
+        """, (job_id, user_id, data.get('resume_url'), data.get('cover_letter', '')))
 
-            # Get all admins and editors
-            cursor.execute("""
-                SELECT User_ID FROM Users
-                WHERE Role_ID IN (1, 2)
-            """)
+        increment_content_counter(cursor, job_info['Content_ID'], 'Applications_Count')
 
-            admin_editors = cursor.fetchall()
+        procedure_result = ["Application submitted successfully"]
 
-            # Insert notifications for all admins and editors
-            for admin_editor in admin_editors:
-                cursor.execute("""
-                    INSERT INTO Notifications (User_ID, Type, Title, Message, Related_Content_ID)
-                    VALUES (%s, 'application', 'New Job Application', %s, %s)
-                """, (admin_editor['User_ID'], notification_message, job_id))
+        # Admins and editors are notified by the outbox dispatcher
+        publish_event(cursor, 'application_created', {'kind': 'job', 'position_id': job_id, 'user_id': user_id})
 
         connection.commit()
         cursor.close()
         connection.close()
+        outbox.wake()
+
+        dashboard_cache.invalidate(user_id, 'user_dashboard')
+        dashboard_cache.invalidate(job_info['Owner_ID'], 'editor_dashboard', 'editor_analytics')
 
         return jsonify({
             "success": True,
@@ -5057,6 +5751,7 @@ def apply_for_job(user_id, job_id):
 
 @app.route('/api/jobs/<int:job_id>', methods=['PUT'])
 @require_permission('content_update_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='job')
 def update_job(user_id, job_id):
     try:
         data = request.json
@@ -5138,12 +5833,9 @@ def update_job(user_id, job_id):
 
         # Log the action if user is admin
         if user_role == 1:
-            cursor.execute("""
-                INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                VALUES (%s, 'Update Job Posting', CONCAT('Updated job posting ID: ', %s))
-            """, (user_id, job_id))
+            audit(user_id, 'Update Job Posting', f"Updated job posting ID: {job_id}")
 
-        connection.commit()
+        commit_audited(connection)
         cursor.close()
         connection.close()
 
@@ -5156,6 +5848,7 @@ def update_job(user_id, job_id):
 
 @app.route('/api/jobs/<int:job_id>', methods=['DELETE'])
 @require_permission('content_delete_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='job')
 def delete_job(user_id, job_id):
     try:
         connection = get_db_connection()
@@ -5201,12 +5894,9 @@ def delete_job(user_id, job_id):
 
         # Log the action if user is admin
         if user_role == 1:
-            cursor.execute("""
-                INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                VALUES (%s, 'Delete Job Posting', CONCAT('Deleted job posting ID: ', %s))
-            """, (user_id, job_id))
+            audit(user_id, 'Delete Job Posting', f"Deleted job posting ID: {job_id}")
 
-        connection.commit()
+        commit_audited(connection)
         cursor.close()
         connection.close()
 
@@ -5366,14 +6056,9 @@ def get_internship(user_id, internship_id):
 
         application = cursor.fetchone()
 
-        # Update view count in metrics
-        cursor.execute("""
-            UPDATE Content_Metrics
-            SET Views = Views + 1, Last_Updated = NOW()
-            WHERE Content_ID = %s
-        """, (internship['content_id'],))
+        # Count the view; repeat views are de-duplicated and flushed in batches
+        record_content_view(internship['content_id'], user_id)
 
-        connection.commit()
         cursor.close()
         connection.close()
 
@@ -5388,6 +6073,7 @@ def get_internship(user_id, internship_id):
 
 @app.route('/api/internships', methods=['POST'])
 @require_permission('content_create_own')
+@invalidates_dashboards('editor_dashboard', 'editor_analytics')
 def create_internship(user_id):
     try:
         data = request.json
@@ -5454,12 +6140,9 @@ def create_internship(user_id):
 
             # Log the action if user is admin
             if user_role_result['Role_ID'] == 1:
-                cursor.execute("""
-                    INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                    VALUES (%s, 'Create Internship Posting', %s)
-                """, (user_id, f"Created internship posting: {data.get('title')}"))
+                audit(user_id, 'Create Internship Posting', f"Created internship posting: {data.get('title')}")
 
-            connection.commit()
+            commit_audited(connection)
             cursor.close()
             connection.close()
 
@@ -5493,7 +6176,7 @@ def apply_for_internship(user_id, internship_id):
 
         # Check if the internship exists and is active (bypass stored procedure for now)
         cursor.execute("""
-            SELECT i.Application_Deadline, c.Status
+            SELECT i.Application_Deadline, i.Content_ID, c.Status, c.User_ID as Owner_ID
             FROM Internships i
             JOIN Content c ON i.Content_ID = c.Content_ID
             WHERE i.Internship_ID = %s
@@ -5525,39 +6208,20 @@ def apply_for_internship(user_id, internship_id):
             VALUES (%s, %s, %s, %s)
         """, (internship_id, user_id, data.get('resume_url'), data.get('cover_letter', '')))
 
-        procedure_result = ["Application submitted successfully"]
-
-        # Create notification for admins and editors
-        cursor.execute("""
-            SELECT up.Full_Name, i.Company_Name, c.Title
-            FROM User_Profile up
-            JOIN Internships i ON i.Internship_ID = %s
-            JOIN Content c ON i.Content_ID = c.Content_ID
-            WHERE up.User_ID = %s
-        """, (internship_id, user_id))
-
-        applicant_info = cursor.fetchone()
-        if applicant_info:
-            notification_message = f"New internship application: {applicant_info['Full_Name']} applied for {applicant_info['Title']} at {applicant_info['Company_Name']}"
-
-            # Get all admins and editors
-            cursor.execute("""
-                SELECT User_ID FROM Users
-                WHERE Role_ID IN (1, 2)
-            """)
+        increment_content_counter(cursor, internship_info['Content_ID'], 'Applications_Count')
 
-            admin_editors = cursor.fetchall()
+        procedure_result = ["Application submitted successfully"]
 
-            # Insert notifications for all admins and editors
-            for admin_editor in admin_editors:
-                cursor.execute("""
-                    INSERT INTO Notifications (User_ID, Type, Title, Message, Related_Content_ID)
-                    VALUES (%s, 'application', 'New Internship Application', %s, %s)
-                """, (admin_editor['User_ID'], notification_message, internship_id))
+        # Admins and editors are notified by the outbox dispatcher
+        publish_event(cursor, 'application_created', {'kind': 'internship', 'position_id': internship_id, 'user_id': user_id})
 
         connection.commit()
         cursor.close()
         connection.close()
+        outbox.wake()
+
+        dashboard_cache.invalidate(user_id, 'user_dashboard')
+        dashboard_cache.invalidate(internship_info['Owner_ID'], 'editor_dashboard', 'editor_analytics')
 
         return jsonify({
             "success": True,
@@ -5568,6 +6232,7 @@ def apply_for_internship(user_id, internship_id):
 
 @app.route('/api/internships/<int:internship_id>', methods=['PUT'])
 @require_permission('content_update_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='internship')
 def update_internship(user_id, internship_id):
     try:
         data = request.json
@@ -5649,12 +6314,9 @@ def update_internship(user_id, internship_id):
 
         # Log the action if user is admin
         if user_role == 1:
-            cursor.execute("""
-                INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                VALUES (%s, 'Update Internship Posting', CONCAT('Updated internship posting ID: ', %s))
-            """, (user_id, internship_id))
+            audit(user_id, 'Update Internship Posting', f"Updated internship posting ID: {internship_id}")
 
-        connection.commit()
+        commit_audited(connection)
         cursor.close()
         connection.close()
 
@@ -5667,6 +6329,7 @@ def update_internship(user_id, internship_id):
 
 @app.route('/api/internships/<int:internship_id>', methods=['DELETE'])
 @require_permission('content_delete_own', check_ownership=True)
+@invalidates_dashboards('editor_dashboard', 'editor_analytics', owner='internship')
 def delete_internship(user_id, internship_id):
     try:
         connection = get_db_connection()
@@ -5712,12 +6375,9 @@ def delete_internship(user_id, internship_id):
 
         # Log the action if user is admin
         if user_role == 1:
-            cursor.execute("""
-                INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-                VALUES (%s, 'Delete Internship Posting', CONCAT('Deleted internship posting ID: ', %s))
-            """, (user_id, internship_id))
+            audit(user_id, 'Delete Internship Posting', f"Deleted internship posting ID: {internship_id}")
 
-        connection.commit()
+        commit_audited(connection)
         cursor.close()
         connection.close()
 
@@ -5828,143 +6488,202 @@ def get_user_research_paper_applications(user_id):
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
-@app.route('/api/admin/applications', methods=['GET'])
-@require_permission('content_update_all')
-def get_all_applications(user_id):
-    try:
-        connection = get_db_connection()
-        cursor = connection.cursor(dictionary=True)
-
-        # Get query parameters for filtering
-        application_type = request.args.get('type', 'all')  # 'jobs', 'internships', 'research-papers', 'all'
-        status = request.args.get('status')
-        company = request.args.get('company')
-        date_from = request.args.get('date_from')
-        date_to = request.args.get('date_to')
-        limit = request.args.get('limit', 50, type=int)
-        offset = request.args.get('offset', 0, type=int)
-
-        applications = []
-
-        # Get job applications if requested
-        if application_type in ['jobs', 'all']:
-            job_query = """
-                SELECT ja.Application_ID, ja.Job_ID as Position_ID, ja.User_ID, ja.Application_Date,
-                       ja.Status, ja.Resume_URL, ja.Cover_Letter, ja.Notes,
-                       j.Company_Name, c.Title as Position_Title, j.Location, j.Job_Type as Position_Type,
-                       up.Full_Name as Applicant_Name, u.Email as Applicant_Email,
-                       'Job' as Application_Type
-                FROM Job_Applications ja
-                JOIN Jobs j ON ja.Job_ID = j.Job_ID
-                JOIN Content c ON j.Content_ID = c.Content_ID
-                JOIN Users u ON ja.User_ID = u.User_ID
-                JOIN User_Profile up ON u.User_ID = up.User_ID
-                WHERE 1=1
-            """
-
-            job_params = []
+# Unified applications listing. Each source is one UNION ALL branch with the
+# same columns (research-only columns are NULL elsewhere), ordered newest first
+# by (Application_Date, Application_Type, Application_ID) so pages are stable.
+APPLICATION_SOURCES = {
+    'Job': {
+        'select': """
+            SELECT ja.Application_ID, ja.Job_ID as Position_ID, ja.User_ID, ja.Application_Date,
+                   ja.Status, ja.Resume_URL, ja.Cover_Letter, ja.Notes,
+                   j.Company_Name, c.Title as Position_Title, j.Location, j.Job_Type as Position_Type,
+                   up.Full_Name as Applicant_Name, u.Email as Applicant_Email,
+                   'Job' as Application_Type,
+                   NULL as Authors, NULL as Abstract, NULL as Keywords
+            FROM Job_Applications ja
+            JOIN Jobs j ON ja.Job_ID = j.Job_ID
+            JOIN Content c ON j.Content_ID = c.Content_ID
+            JOIN Users u ON ja.User_ID = u.User_ID
+            JOIN User_Profile up ON u.User_ID = up.User_ID
+        """,
+        'date': 'ja.Application_Date',
+        'id': 'ja.Application_ID',
+        'status': 'ja.Status',
+        'company': 'j.Company_Name',
+    },
+    'Internship': {
+        'select': """
+            SELECT ia.Application_ID, ia.Internship_ID as Position_ID, ia.User_ID, ia.Application_Date,
+                   ia.Status, ia.Resume_URL, ia.Cover_Letter, ia.Notes,
+                   i.Company_Name, c.Title as Position_Title, i.Location, i.Internship_Type as Position_Type,
+                   up.Full_Name as Applicant_Name, u.Email as Applicant_Email,
+                   'Internship' as Application_Type,
+                   NULL as Authors, NULL as Abstract, NULL as Keywords
+            FROM Internship_Applications ia
+            JOIN Internships i ON ia.Internship_ID = i.Internship_ID
+            JOIN Content c ON i.Content_ID = c.Content_ID
+            JOIN Users u ON ia.User_ID = u.User_ID
+            JOIN User_Profile up ON u.User_ID = up.User_ID
+        """,
+        'date': 'ia.Application_Date',
+        'id': 'ia.Application_ID',
+        'status': 'ia.Status',
+        'company': 'i.Company_Name',
+    },
+    'Research_Paper': {
+        'select': """
+            SELECT c.Content_ID as Application_ID, c.Content_ID as Position_ID, c.User_ID,
+                   rpr.Submitted_At as Application_Date, rpr.Status,
+                   '' as Resume_URL, rpr.Review_Comments as Cover_Letter, rpr.Review_Comments as Notes,
+                   'Research Submission' as Company_Name, c.Title as Position_Title,
+                   'Academic' as Location, 'Research Paper' as Position_Type,
+                   up.Full_Name as Applicant_Name, u.Email as Applicant_Email,
+                   'Research_Paper' as Application_Type,
+                   rp.Authors, rp.Abstract, rp.Keywords
+            FROM Research_Paper_Reviews rpr
+            JOIN Content c ON rpr.Content_ID = c.Content_ID
+            JOIN Research_Papers rp ON c.Content_ID = rp.Content_ID
+            JOIN Users u ON c.User_ID = u.User_ID
+            JOIN User_Profile up ON u.User_ID = up.User_ID
+        """,
+        'date': 'rpr.Submitted_At',
+        'id': 'rpr.Content_ID',
+        'status': 'rpr.Status',
+        'company': None,  # Research submissions are not filtered by company
+        'where': "c.Content_Type = 'Research_Paper'",
+    },
+}
 
-            if status:
-                job_query += " AND ja.Status = %s"
-                job_params.append(status)
+APPLICATION_TYPE_SOURCES = {
+    'jobs': ('Job',),
+    'internships': ('Internship',),
+    'research-papers': ('Research_Paper',),
+    'all': ('Job', 'Internship', 'Research_Paper'),
+}
 
-            if company:
-                job_query += " AND j.Company_Name LIKE %s"
-                job_params.append(f"%{company}%")
+def parse_application_cursor(value):
+    """Split a next_cursor value ("<ISO date>,<type>,<id>") into its parts"""
+    application_date, application_type, application_id = value.split(',')
+    if application_type not in APPLICATION_SOURCES:
+        raise ValueError(application_type)
+    return datetime.fromisoformat(application_date), application_type, int(application_id)
 
-            if date_from:
-                job_query += " AND ja.Application_Date >= %s"
-                job_params.append(date_from)
+def application_branch(application_type, filters, page_cursor=None, count=False, row_limit=None):
+    """
+    One source of the unified applications listing.
 
-            if date_to:
-                job_query += " AND ja.Application_Date <= %s"
-                job_params.append(date_to)
+    Args:
+        application_type (str): Key of APPLICATION_SOURCES
+        filters (dict): status, company, date_from and date_to (None when absent)
+        page_cursor (tuple): (date, type, id) of the last row already returned
+        count (bool): Build a COUNT(*) instead of the row query
+        row_limit (int): Rows this branch may contribute to the page
 
-            cursor.execute(job_query, job_params)
-            job_applications = cursor.fetchall()
-            applications.extend(job_applications)
+    Returns:
+        Tuple[str, tuple]: SQL and parameters
+    """
+    source = APPLICATION_SOURCES[application_type]
+    select = source['select']
+    if count:
+        select = "SELECT COUNT(*) AS total\n" + select[select.index('FROM'):]
+
+    query = AnalyticsQuery(select)
+    query.where_if('where' in source, source.get('where', ''))
+    query.where_if(bool(filters['status']), f"{source['status']} = %s", filters['status'])
+    if filters['company'] and source['company']:
+        query.where(f"{source['company']} LIKE %s", f"%{filters['company']}%")
+    query.where_if(bool(filters['date_from']), f"{source['date']} >= %s", filters['date_from'])
+    query.where_if(bool(filters['date_to']), f"{source['date']} <= %s", filters['date_to'])
+
+    if page_cursor:
+        # Rows sort by date, then type, then id, all descending
+        cursor_date, cursor_type, cursor_id = page_cursor
+        if application_type == cursor_type:
+            query.where(f"({source['date']} < %s OR ({source['date']} = %s AND {source['id']} < %s))",
+                        cursor_date, cursor_date, cursor_id)
+        elif application_type < cursor_type:
+            query.where(f"{source['date']} <= %s", cursor_date)
+        else:
+            query.where(f"{source['date']} < %s", cursor_date)
 
-        # Get internship applications if requested
-        if application_type in ['internships', 'all']:
-            internship_query = """
-                SELECT ia.Application_ID, ia.Internship_ID as Position_ID, ia.User_ID, ia.Application_Date,
-                       ia.Status, ia.Resume_URL, ia.Cover_Letter, ia.Notes,
-                       i.Company_Name, c.Title as Position_Title, i.Location, i.Internship_Type as Position_Type,
-                       up.Full_Name as Applicant_Name, u.Email as Applicant_Email,
-                       'Internship' as Application_Type
-                FROM Internship_Applications ia
-                JOIN Internships i ON ia.Internship_ID = i.Internship_ID
-                JOIN Content c ON i.Content_ID = c.Content_ID
-                JOIN Users u ON ia.User_ID = u.User_ID
-                JOIN User_Profile up ON u.User_ID = up.User_ID
-                WHERE 1=1
-            """
+    if not count:
+        query.order_by(f"{source['date']} DESC, {source['id']} DESC").limit(row_limit)
+    return query.build()
 
-            internship_params = []
-
-            if status:
-                internship_query += " AND ia.Status = %s"
-                internship_params.append(status)
-
-            if company:
-                internship_query += " AND i.Company_Name LIKE %s"
-                internship_params.append(f"%{company}%")
-
-            if date_from:
-                internship_query += " AND ia.Application_Date >= %s"
-                internship_params.append(date_from)
-
-            if date_to:
-                internship_query += " AND ia.Application_Date <= %s"
-                internship_params.append(date_to)
-
-            cursor.execute(internship_query, internship_params)
-            internship_applications = cursor.fetchall()
-            applications.extend(internship_applications)
-
-        # Get research paper applications if requested
-        if application_type in ['research-papers', 'all']:
-            research_query = """
-                SELECT c.Content_ID as Application_ID, c.Content_ID as Position_ID, c.User_ID,
-                       rpr.Submitted_At as Application_Date, rpr.Status,
-                       '' as Resume_URL, rpr.Review_Comments as Cover_Letter, rpr.Review_Comments as Notes,
-                       'Research Submission' as Company_Name, c.Title as Position_Title,
-                       'Academic' as Location, 'Research Paper' as Position_Type,
-                       up.Full_Name as Applicant_Name, u.Email as Applicant_Email,
-                       'Research_Paper' as Application_Type,
-                       rp.Authors, rp.Abstract, rp.Keywords
-                FROM Content c
-                JOIN Research_Papers rp ON c.Content_ID = rp.Content_ID
-                JOIN Research_Paper_Reviews rpr ON c.Content_ID = rpr.Content_ID
-                JOIN Users u ON c.User_ID = u.User_ID
-                JOIN User_Profile up ON u.User_ID = up.User_ID
-                WHERE c.Content_Type = 'Research_Paper'
-            """
+def applications_page(sources, filters, page_cursor, limit, offset=0):
+    """
+    Merged page of the unified applications listing.
 
-            research_params = []
+    A branch can only contribute rows up to offset + limit, so each one stops
+    there on its date index before the merge.
 
-            if status:
-                research_query += " AND rpr.Status = %s"
-                research_params.append(status)
+    Returns:
+        Tuple[str, list]: SQL and parameters
+    """
+    branches = [application_branch(source, filters, page_cursor, row_limit=offset + limit)
+                for source in sources]
+    sql = "\nUNION ALL\n".join(f"({branch_sql})" for branch_sql, _ in branches) + """
+        ORDER BY Application_Date DESC, Application_Type DESC, Application_ID DESC
+        LIMIT %s OFFSET %s
+    """
+    return sql, [param for _, params in branches for param in params] + [limit, offset]
+
+def application_cursor(row):
+    """Cursor continuing after an applications row (see parse_application_cursor)"""
+    return f"{row['Application_Date'].isoformat()},{row['Application_Type']},{row['Application_ID']}"
+
+def application_filters(args):
+    """Listing filters from the query string (None when absent)"""
+    return {
+        'status': args.get('status'),
+        'company': args.get('company'),
+        'date_from': args.get('date_from'),
+        'date_to': args.get('date_to'),
+    }
 
-            if date_from:
-                research_query += " AND rpr.Submitted_At >= %s"
-                research_params.append(date_from)
+@app.route('/api/admin/applications', methods=['GET'])
+@require_permission('content_update_all')
+def get_all_applications(user_id):
+    try:
+        connection = get_db_connection()
+        cursor = connection.cursor(dictionary=True)
 
-            if date_to:
-                research_query += " AND rpr.Submitted_At <= %s"
-                research_params.append(date_to)
+        # Get query parameters for filtering
+        application_type = request.args.get('type', 'all')  # 'jobs', 'internships', 'research-papers', 'all'
+        filters = application_filters(request.args)
+        limit = max(1, min(request.args.get('limit', 50, type=int), 500))
+        offset = max(0, request.args.get('offset', 0, type=int))
 
-            cursor.execute(research_query, research_params)
-            research_applications = cursor.fetchall()
-            applications.extend(research_applications)
+        # ?cursor=<next_cursor> continues after the previous page instead of skipping offset rows
+        page_cursor = None
+        if request.args.get('cursor'):
+            try:
+                page_cursor = parse_application_cursor(request.args['cursor'])
+            except ValueError:
+                cursor.close()
+                connection.close()
+                return jsonify({"success": False, "message": "Invalid cursor"}), 400
+            offset = 0
 
-        # Sort by application date (most recent first)
-        applications.sort(key=lambda x: x['Application_Date'], reverse=True)
+        applications = []
+        total_count = 0 if page_cursor is None else None  # Not recounted on cursor pages
+        sources = APPLICATION_TYPE_SOURCES.get(application_type, ())
+
+        if sources:
+            cursor.execute(*applications_page(sources, filters, page_cursor, limit, offset))
+            applications = cursor.fetchall()
+
+            if page_cursor is None:
+                counts = [application_branch(source, filters, count=True) for source in sources]
+                cursor.execute(
+                    "SELECT " + " + ".join(f"({sql})" for sql, _ in counts) + " AS total",
+                    [param for _, params in counts for param in params]
+                )
+                total_count = int(cursor.fetchone()['total'])
 
-        # Apply pagination
-        total_count = len(applications)
-        applications = applications[offset:offset + limit]
+        next_cursor = None
+        if len(applications) == limit and applications[-1]['Application_Date']:
+            next_cursor = application_cursor(applications[-1])
 
         cursor.close()
         connection.close()
@@ -5974,11 +6693,37 @@ def get_all_applications(user_id):
             "applications": applications,
             "total": total_count,
             "limit": limit,
-            "offset": offset
+            "offset": offset,
+            "next_cursor": next_cursor
         })
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
+@app.route('/api/admin/applications/export', methods=['GET'])
+@require_permission('content_update_all')
+def export_applications(user_id):
+    """Stream the filtered applications newest first as CSV or NDJSON (?after=<cursor> resumes)"""
+    export_format = request.args.get('format', 'csv')
+    if export_format not in EXPORT_FORMATS:
+        return jsonify({"success": False, "message": "format must be csv or ndjson"}), 400
+
+    sources = APPLICATION_TYPE_SOURCES.get(request.args.get('type', 'all'))
+    if not sources:
+        return jsonify({"success": False, "message": "Invalid application type"}), 400
+
+    try:
+        after = parse_application_cursor(request.args['after']) if request.args.get('after') else None
+    except ValueError:
+        return jsonify({"success": False, "message": "Invalid cursor"}), 400
+
+    filters = application_filters(request.args)
+    return streaming_export(
+        export_format, 'applications',
+        lambda page_cursor, chunk_size: applications_page(sources, filters, page_cursor, chunk_size),
+        lambda row: (row['Application_Date'], row['Application_Type'], row['Application_ID']),
+        after=after
+    )
+
 @app.route('/api/editor/applications/jobs', methods=['GET'])
 @require_permission('content_update')
 def get_editor_job_applications(user_id):
@@ -6100,21 +6845,22 @@ def update_job_application_status(user_id, application_id):
             WHERE Application_ID = %s
         """, (data.get('status'), data.get('notes', ''), application_id))
 
-        # Create notification for applicant about status change
+        # Notification for applicant about status change
         if app_details:
             notification_title = f"Job Application Status Update"
             notification_message = f"Your application for {app_details['Title']} at {app_details['Company_Name']} has been updated to: {data.get('status')}"
             action_url = f"/applications"
 
-            cursor.execute("""
-                INSERT INTO Notifications (User_ID, Type, Title, Message, Related_Content_ID, Action_URL)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (app_details['User_ID'], 'application_status', notification_title, notification_message, application_id, action_url))
-
         connection.commit()
         cursor.close()
         connection.close()
 
+        if app_details:
+            notifications.notify([app_details['User_ID']], 'application_status', notification_title,
+                                 notification_message, related_content_id=application_id, action_url=action_url)
+            dashboard_cache.invalidate(app_details['User_ID'], 'user_dashboard')
+        dashboard_cache.invalidate(result['User_ID'], 'editor_dashboard', 'editor_analytics')
+
         return jsonify({
             "success": True,
             "message": "Application status updated successfully"
@@ -6175,21 +6921,22 @@ def update_internship_application_status(user_id, application_id):
             WHERE Application_ID = %s
         """, (data.get('status'), data.get('notes', ''), application_id))
 
-        # Create notification for applicant about status change
+        # Notification for applicant about status change
         if app_details:
             notification_title = f"Internship Application Status Update"
             notification_message = f"Your application for {app_details['Title']} at {app_details['Company_Name']} has been updated to: {data.get('status')}"
             action_url = f"/applications"
 
-            cursor.execute("""
-                INSERT INTO Notifications (User_ID, Type, Title, Message, Related_Content_ID, Action_URL)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (app_details['User_ID'], 'application_status', notification_title, notification_message, application_id, action_url))
-
         connection.commit()
         cursor.close()
         connection.close()
 
+        if app_details:
+            notifications.notify([app_details['User_ID']], 'application_status', notification_title,
+                                 notification_message, related_content_id=application_id, action_url=action_url)
+            dashboard_cache.invalidate(app_details['User_ID'], 'user_dashboard')
+        dashboard_cache.invalidate(result['User_ID'], 'editor_dashboard', 'editor_analytics')
+
         return jsonify({
             "success": True,
             "message": "Application status updated successfully"
@@ -6338,6 +7085,7 @@ def get_user_saved_content(user_id):
 
 @app.route('/api/user/save-content', methods=['POST'])
 @require_permission('content_save')
+@invalidates_dashboards('user_dashboard')
 def save_content(user_id):
     try:
         print(f"DEBUG: save_content called for user_id: {user_id}")
@@ -6411,30 +7159,13 @@ def save_content(user_id):
         save_id = cursor.lastrowid
         print(f"DEBUG: Content saved successfully with save_id: {save_id}")
 
-        # Get content author and saver info for notification
-        cursor.execute("""
-            SELECT c.User_ID as author_id, c.Title, c.Content_Type, up.Full_Name as saver_name
-            FROM Content c
-            JOIN User_Profile up ON up.User_ID = %s
-            WHERE c.Content_ID = %s
-        """, (user_id, content_id))
-
-        content_info = cursor.fetchone()
-
-        # Create notification for content author (if not saving own content)
-        if content_info and content_info['author_id'] != user_id:
-            notification_title = f"Content Saved"
-            notification_message = f"{content_info['saver_name']} saved your {content_info['Content_Type'].replace('_', ' ').lower()}: {content_info['Title']}"
-            action_url = f"/content/{content_id}"
-
-            cursor.execute("""
-                INSERT INTO Notifications (User_ID, Type, Title, Message, Related_Content_ID, Action_URL)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (content_info['author_id'], 'content_saved', notification_title, notification_message, content_id, action_url))
+        # The author is notified by the outbox dispatcher
+        publish_event(cursor, 'content_saved', {'content_id': content_id, 'user_id': user_id})
 
         connection.commit()
         cursor.close()
         connection.close()
+        outbox.wake()
 
         return jsonify({
             "success": True,
@@ -6447,6 +7178,7 @@ def save_content(user_id):
 
 @app.route('/api/user/unsave-content/<int:content_id>', methods=['DELETE'])
 @require_permission('content_save')
+@invalidates_dashboards('user_dashboard')
 def unsave_content(user_id, content_id):
     try:
         connection = get_db_connection()
@@ -6537,22 +7269,16 @@ def submit_research_paper_for_review(user_id):
             VALUES (%s, 'Pending')
         """, (new_content_id,))
 
-        # Create notification for admins and editors about new research paper submission
-        cursor.execute("""
-            INSERT INTO Notifications (User_ID, Type, Title, Message, Related_Content_ID)
-            SELECT u.User_ID, 'research_paper_submitted', 'New Research Paper Submitted',
-                   CONCAT('A new research paper "', %s, '" has been submitted for review.'), %s
-            FROM Users u
-            JOIN Permissions p ON u.Role_ID = p.Role_ID
-            WHERE p.Permission_Name = 'research_review'
-        """, (data.get('title'), new_content_id))
-
         # Create metrics entry
         cursor.execute("INSERT INTO Content_Metrics (Content_ID) VALUES (%s)", (new_content_id,))
 
+        # Reviewers are notified by the outbox dispatcher
+        publish_event(cursor, 'research_paper_submitted', {'content_id': new_content_id, 'title': data.get('title')})
+
         connection.commit()
         cursor.close()
         connection.close()
+        outbox.wake()
 
         return jsonify({
             "success": True,
@@ -6600,6 +7326,7 @@ def get_pending_research_papers(user_id):
 
 @app.route('/api/research-papers/<int:content_id>/review', methods=['POST'])
 @require_permission('research_review')
+@invalidates_dashboards('user_dashboard', 'editor_dashboard', 'editor_analytics', owner='content')
 def review_research_paper(user_id, content_id):
     try:
         data = request.json
@@ -6647,41 +7374,16 @@ def review_research_paper(user_id, content_id):
             UPDATE Content SET Status = %s WHERE Content_ID = %s
         """, (content_status, content_id))
 
-        # Get paper details for notification
-        cursor.execute("""
-            SELECT c.Title, c.User_ID FROM Content c WHERE c.Content_ID = %s
-        """, (content_id,))
-        paper_info = cursor.fetchone()
-
-        # Create notification for the author
-        if paper_info:
-            if action == 'approve':
-                notification_message = f'Your research paper "{paper_info["Title"]}" has been approved and published!'
-            elif action == 'reject':
-                notification_message = f'Your research paper "{paper_info["Title"]}" has been rejected. {comments if comments else ""}'
-            else:  # request_revision
-                notification_message = f'Your research paper "{paper_info["Title"]}" needs revision. {comments if comments else ""}'
-
-            cursor.execute("""
-                INSERT INTO Notifications (User_ID, Type, Title, Message, Related_Content_ID)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (
-                paper_info['User_ID'],
-                f'research_paper_{action}d',
-                f'Research Paper {action.title()}d',
-                notification_message,
-                content_id
-            ))
-
-        # Log the action
-        cursor.execute("""
-            INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-            VALUES (%s, 'Research Paper Review', %s)
-        """, (user_id, f"Reviewed research paper {content_id}: {action}"))
+        # The author is notified and the review audited by the outbox dispatcher
+        publish_event(cursor, 'research_paper_reviewed', {
+            'content_id': content_id, 'reviewer_id': user_id, 'action': action, 'new_status': new_status,
+            'comments': comments, 'via': 'review', 'reviewed_at': datetime.now()
+        })
 
         connection.commit()
         cursor.close()
         connection.close()
+        outbox.wake()
 
         return jsonify({
             "success": True,
@@ -6692,6 +7394,7 @@ def review_research_paper(user_id, content_id):
 
 @app.route('/api/admin/research-papers/<int:content_id>/review', methods=['PUT'])
 @require_permission('research_review')
+@invalidates_dashboards('user_dashboard', 'editor_dashboard', 'editor_analytics', owner='content')
 def update_research_paper_review_status(user_id, content_id):
     try:
         data = request.json
@@ -6751,37 +7454,16 @@ def update_research_paper_review_status(user_id, content_id):
             WHERE Content_ID = %s
         """, (content_status, content_id))
 
-        # Get paper and author info for notifications
-        cursor.execute("""
-            SELECT c.Title, c.User_ID, up.Full_Name, u.Email
-            FROM Content c
-            JOIN Users u ON c.User_ID = u.User_ID
-            JOIN User_Profile up ON u.User_ID = up.User_ID
-            WHERE c.Content_ID = %s
-        """, (content_id,))
-
-        paper_info = cursor.fetchone()
-        if paper_info:
-            # Create notification for the author
-            notification_title = f"Research Paper {new_status}"
-            notification_message = f"Your research paper '{paper_info['Title']}' has been {new_status.lower()}"
-            if comments:
-                notification_message += f". Comments: {comments}"
-
-            cursor.execute("""
-                INSERT INTO Notifications (User_ID, Type, Title, Message, Related_Content_ID)
-                VALUES (%s, 'application', %s, %s, %s)
-            """, (paper_info['User_ID'], notification_title, notification_message, content_id))
-
-        # Log the action
-        cursor.execute("""
-            INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details)
-            VALUES (%s, 'Research Paper Review', %s)
-        """, (user_id, f"Updated research paper {content_id} status to {new_status}"))
+        # The author is notified and the review audited by the outbox dispatcher
+        publish_event(cursor, 'research_paper_reviewed', {
+            'content_id': content_id, 'reviewer_id': user_id, 'action': action, 'new_status': new_status,
+            'comments': comments, 'via': 'status', 'reviewed_at': datetime.now()
+        })
 
         connection.commit()
         cursor.close()
         connection.close()
+        outbox.wake()
 
         return jsonify({
             "success": True,
@@ -6790,6 +7472,93 @@ def update_research_paper_review_status(user_id, content_id):
     except Exception as e:
         return jsonify({"success": False, "message": str(e)}), 500
 
+# ===== OUTBOX EVENT HANDLERS =====
+# Each runs in the dispatcher's transaction; the returned callback runs after commit.
+
+@outbox.handler('application_created')
+def handle_application_created(cursor, event):
+    """Notify admins and editors of a new job or internship application"""
+    if event['kind'] == 'job':
+        position_query = "SELECT j.Company_Name, c.Title FROM Jobs j JOIN Content c ON j.Content_ID = c.Content_ID WHERE j.Job_ID = %s"
+    else:
+        position_query = "SELECT i.Company_Name, c.Title FROM Internships i JOIN Content c ON i.Content_ID = c.Content_ID WHERE i.Internship_ID = %s"
+    cursor.execute(position_query, (event['position_id'],))
+    position = cursor.fetchone()
+    cursor.execute("SELECT Full_Name FROM User_Profile WHERE User_ID = %s", (event['user_id'],))
+    applicant = cursor.fetchone()
+    if not position or not applicant:
+        return None
+
+    label = 'Job' if event['kind'] == 'job' else 'Internship'
+    message = f"New {event['kind']} application: {applicant['Full_Name']} applied for {position['Title']} at {position['Company_Name']}"
+    rows = notification_rows(role_directory.users_with_roles([1, 2]), 'application',
+                             f'New {label} Application', message, related_content_id=event['position_id'])
+    return notifications.insert(cursor, rows)
+
+@outbox.handler('content_saved')
+def handle_content_saved(cursor, event):
+    """Tell the author that someone saved their content"""
+    cursor.execute("""
+        SELECT c.User_ID as author_id, c.Title, c.Content_Type, up.Full_Name as saver_name
+        FROM Content c
+        JOIN User_Profile up ON up.User_ID = %s
+        WHERE c.Content_ID = %s
+    """, (event['user_id'], event['content_id']))
+    content_info = cursor.fetchone()
+    if not content_info or content_info['author_id'] == event['user_id']:
+        return None
+
+    message = f"{content_info['saver_name']} saved your {content_info['Content_Type'].replace('_', ' ').lower()}: {content_info['Title']}"
+    rows = notification_rows([content_info['author_id']], 'content_saved', "Content Saved", message,
+                             related_content_id=event['content_id'], action_url=f"/content/{event['content_id']}")
+    return notifications.insert(cursor, rows)
+
+@outbox.handler('research_paper_submitted')
+def handle_research_paper_submitted(cursor, event):
+    """Notify reviewers of a new research paper submission"""
+    rows = notification_rows(role_directory.users_with_permission('research_review'),
+                             'research_paper_submitted', 'New Research Paper Submitted',
+                             f'A new research paper "{event["title"]}" has been submitted for review.',
+                             related_content_id=event['content_id'])
+    return notifications.insert(cursor, rows)
+
+@outbox.handler('research_paper_reviewed')
+def handle_research_paper_reviewed(cursor, event):
+    """Audit a research paper review and notify the author"""
+    content_id, action, new_status, comments = event['content_id'], event['action'], event['new_status'], event['comments']
+    reviewed_at = datetime.fromisoformat(event['reviewed_at'])
+
+    if event['via'] == 'review':
+        details = f"Reviewed research paper {content_id}: {action}"
+    else:
+        details = f"Updated research paper {content_id} status to {new_status}"
+    insert_audit_entry(cursor, event['reviewer_id'], 'Research Paper Review', details, reviewed_at)
+
+    cursor.execute("SELECT Title, User_ID FROM Content WHERE Content_ID = %s", (content_id,))
+    paper_info = cursor.fetchone()
+    if not paper_info:
+        return None
+
+    if event['via'] == 'review':
+        notification_type, title = f'research_paper_{action}d', f'Research Paper {action.title()}d'
+        if action == 'approve':
+            message = f'Your research paper "{paper_info["Title"]}" has been approved and published!'
+        elif action == 'reject':
+            message = f'Your research paper "{paper_info["Title"]}" has been rejected. {comments if comments else ""}'
+        else:  # request_revision
+            message = f'Your research paper "{paper_info["Title"]}" needs revision. {comments if comments else ""}'
+    else:
+        notification_type, title = 'application', f"Research Paper {new_status}"
+        message = f"Your research paper '{paper_info['Title']}' has been {new_status.lower()}"
+        if comments:
+            message += f". Comments: {comments}"
+
+    rows = notification_rows([paper_info['User_ID']], notification_type, title, message,
+                             related_content_id=content_id)
+    return notifications.insert(cursor, rows)
+
+outbox.start()
+
 # ===== DEBUG ENDPOINTS =====
 
 @app.route('/api/debug/user-permissions', methods=['GET'])
@@ -7208,10 +7977,46 @@ def uploaded_research_paper_thumbnail_options(filename):
     return response
 
 # Grammar Checker Endpoints
+
+# Per-user legal dictionaries and disabled rules, cached in memory
+grammar_dictionary_store = GrammarDictionaryStore(get_db_connection)
+
+def build_grammar_options(data, user_id=None):
+    """
+    Combine the user's saved dictionary/settings with per-request overrides.
+
+    Request body may carry "disabled_rules", "disabled_categories" and
+    "ignore_words" lists; they are applied on top of the user's profile.
+    """
+    options = CheckOptions.build(
+        disabled_rules=data.get('disabled_rules'),
+        disabled_categories=data.get('disabled_categories'),
+        ignore_words=data.get('ignore_words')
+    )
+
+    if user_id is not None:
+        try:
+            profile = grammar_dictionary_store.get_profile(user_id)
+            options = options.merge(CheckOptions.build(
+                disabled_rules=profile.disabled_rules,
+                disabled_categories=profile.disabled_categories,
+                ignore_words=profile.terms
+            ))
+        except Exception as e:
+            # A dictionary lookup failure should not block the grammar check
+            print(f"Error loading grammar dictionary for user {user_id}: {e}")
+
+    return options
+
 @app.route('/api/grammar/check', methods=['POST'])
+@compressed
 def check_grammar():
     """
     Check text for grammar, spelling, and style issues
+
+    Pass "format": "compact" (or ?format=compact) to receive issues with
+    sentences and repeated strings referenced by index into shared tables.
+    Signed-in users' dictionaries and disabled rules are applied automatically.
     """
     try:
         data = request.get_json()
@@ -7234,12 +8039,16 @@ def check_grammar():
                 'word_count': 0
             }), 200
 
+        response_format = data.get('format') or request.args.get('format', 'full')
+
         print(f"Grammar check request - Text length: {len(text)}")  # Debug log
 
+        options = build_grammar_options(data, get_session_user_id())
+
         # Use the grammar checker
-        result = check_grammar_api(text)
+        result = check_grammar_api(text, compact=(response_format == 'compact'), options=options)
 
-        print(f"Grammar check result - Success: {result['success']}, Issues: {len(result.get('issues', []))}")  # Debug log
+        print(f"Grammar check result - Success: {result['success']}, Issues: {result['statistics']['total_issues']}")  # Debug log
 
         return jsonify(result), 200
 
@@ -7252,7 +8061,89 @@ def check_grammar():
             'statistics': {'total_issues': 0, 'by_type': {}, 'severity_distribution': {}}
         }), 500
 
+def sse_event(event, payload):
+    """Format a Server-Sent Events message with a JSON payload"""
+    return f"event: {event}\ndata: {json.dumps(payload, cls=CustomJSONEncoder)}\n\n"
+
+@app.route('/api/grammar/stream', methods=['POST'])
+def stream_grammar_check():
+    """
+    Check text sentence chunk by sentence chunk and stream issues as Server-Sent Events.
+
+    Body: {"text": "...", "document_id": "editor-42", "revision": 7}
+    A newer revision of the same document_id cancels older streams, and a
+    client disconnect stops the generator before the next chunk is checked.
+    """
+    data = request.get_json(silent=True)
+    if not data:
+        return jsonify({'success': False, 'error': 'No JSON data provided'}), 400
+
+    text = data.get('text', '')
+    document_id = data.get('document_id')
+    revision = data.get('revision')
+
+    if revision is not None:
+        try:
+            revision = int(revision)
+        except (TypeError, ValueError):
+            return jsonify({'success': False, 'error': 'revision must be an integer'}), 400
+
+    options = build_grammar_options(data, get_session_user_id())
+
+    tracker = get_revision_tracker()
+    if document_id:
+        document_id = str(document_id)
+        revision = tracker.begin(document_id, revision)
+
+    def is_cancelled():
+        return bool(document_id) and not tracker.is_current(document_id, revision)
+
+    def generate():
+        yield sse_event('start', {
+            'document_id': document_id,
+            'revision': revision,
+            'text_length': len(text)
+        })
+
+        pool = get_grammar_checker_pool()
+        all_issues = []
+        try:
+            for chunk_start, chunk_end, issues in pool.check_text_stream(text, is_cancelled=is_cancelled, options=options):
+                all_issues.extend(issues)
+                yield sse_event('issues', {
+                    'revision': revision,
+                    'chunk_start': chunk_start,
+                    'chunk_end': chunk_end,
+                    'issues': [issue.to_dict() for issue in issues]
+                })
+
+            if is_cancelled():
+                yield sse_event('cancelled', {'revision': revision, 'reason': 'superseded'})
+                return
+
+            yield sse_event('done', {
+                'revision': revision,
+                'statistics': pool.primary().get_statistics(all_issues),
+                'text_length': len(text),
+                'word_count': len(text.split()) if text else 0
+            })
+        except GeneratorExit:
+            # Client disconnected; stop checking the remaining chunks
+            print(f"Grammar stream closed by client - Revision: {revision}")  # Debug log
+            raise
+        except Exception as e:
+            print(f"Grammar stream error: {str(e)}")  # Debug log
+            get_metrics_registry().counter('grammar_errors_total', {'type': type(e).__name__}).inc()
+            yield sse_event('error', {'revision': revision, 'error': str(e)})
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/api/grammar/apply-suggestion', methods=['POST'])
+@compressed
 def apply_grammar_suggestion():
     """
     Apply a grammar suggestion to text
@@ -7283,6 +8174,115 @@ def apply_grammar_suggestion():
             'error': str(e)
         }), 500
 
+@app.route('/api/grammar/dictionary', methods=['GET'])
+def get_grammar_dictionary():
+    """
+    Get the signed-in user's legal dictionary and disabled rules
+    """
+    user_id = get_session_user_id()
+    if user_id is None:
+        return jsonify({'success': False, 'error': 'Valid session token required'}), 401
+
+    try:
+        profile = grammar_dictionary_store.get_profile(user_id)
+        return jsonify({'success': True, **profile.to_dict()}), 200
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/grammar/dictionary', methods=['POST'])
+def add_grammar_dictionary_terms():
+    """
+    Add terms to the signed-in user's legal dictionary
+
+    Body: {"terms": ["res judicata", "Marbury", "U.S.C."]}
+    """
+    user_id = get_session_user_id()
+    if user_id is None:
+        return jsonify({'success': False, 'error': 'Valid session token required'}), 401
+
+    try:
+        data = request.get_json(silent=True) or {}
+        terms = normalize_terms(data.get('terms'))
+        if not terms:
+            return jsonify({'success': False, 'error': 'At least one term is required'}), 400
+
+        profile = grammar_dictionary_store.add_terms(user_id, terms)
+        return jsonify({'success': True, **profile.to_dict()}), 200
+
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/grammar/dictionary', methods=['DELETE'])
+def remove_grammar_dictionary_terms():
+    """
+    Remove terms from the signed-in user's legal dictionary
+
+    Body: {"terms": ["Marbury"]}
+    """
+    user_id = get_session_user_id()
+    if user_id is None:
+        return jsonify({'success': False, 'error': 'Valid session token required'}), 401
+
+    try:
+        data = request.get_json(silent=True) or {}
+        terms = normalize_terms(data.get('terms'))
+        if not terms:
+            return jsonify({'success': False, 'error': 'At least one term is required'}), 400
+
+        profile = grammar_dictionary_store.remove_terms(user_id, terms)
+        return jsonify({'success': True, **profile.to_dict()}), 200
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/grammar/settings', methods=['PUT'])
+def update_grammar_settings():
+    """
+    Replace the LanguageTool rules and categories disabled for the signed-in user
+
+    Body: {"disabled_rules": ["EN_QUOTES"], "disabled_categories": ["TYPOGRAPHY"]}
+    """
+    user_id = get_session_user_id()
+    if user_id is None:
+        return jsonify({'success': False, 'error': 'Valid session token required'}), 401
+
+    try:
+        data = request.get_json(silent=True) or {}
+        profile = grammar_dictionary_store.update_settings(
+            user_id,
+            normalize_rule_ids(data.get('disabled_rules')),
+            normalize_rule_ids(data.get('disabled_categories'))
+        )
+        return jsonify({'success': True, **profile.to_dict()}), 200
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+@app.route('/api/grammar/metrics', methods=['GET'])
+@require_permission('system_admin')
+def grammar_checker_metrics(user_id):
+    """
+    Latency histograms, cache hit rate, pool wait time and error counts for the grammar checker
+    """
+    try:
+        metrics = get_metrics_registry()
+        hits = metrics.counter_total('grammar_dictionary_cache_hits_total')
+        misses = metrics.counter_total('grammar_dictionary_cache_misses_total')
+        pool = get_grammar_checker_pool()
+
+        return jsonify({
+            'success': True,
+            'metrics': metrics.snapshot(prefix='grammar_'),
+            'dictionary_cache_hit_rate': round(hits / (hits + misses), 4) if hits + misses else None,
+            'pool': pool.stats()
+        }), 200
+
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/grammar/health', methods=['GET'])
 def grammar_checker_health():
     """
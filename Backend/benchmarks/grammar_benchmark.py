@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""
+Offline grammar checker benchmark over a synthetic legal corpus.
+
+Measures, against a real LanguageTool server:
+  - cold start: LanguageTool start-up and the first check
+  - warm latency (p50/p90/p99) per document category
+  - throughput (documents and characters per second) at several pool sizes
+  - resident memory per checker instance (Java server plus Python process)
+
+Results are written as JSON together with the git commit, so runs on
+different commits can be compared with --compare.
+
+Usage:
+    python benchmarks/grammar_benchmark.py
+    python benchmarks/grammar_benchmark.py --pool-sizes 1,2,4 --repeat 5
+    python benchmarks/grammar_benchmark.py --compare benchmarks/results/grammar_abc1234.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import language_tool_python
+
+from grammar_checker import GrammarChecker, GrammarCheckerPool
+from utils.metrics import get_metrics_registry
+from legal_corpus import CORPUS_VERSION, build_corpus, describe_corpus
+
+# Optional, more portable RSS measurement
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+def git_info():
+    """Return the current commit and whether the work tree has local changes"""
+    def _git(*args):
+        try:
+            return subprocess.check_output(['git', *args], cwd=BACKEND_DIR,
+                                           stderr=subprocess.DEVNULL).decode().strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status = _git('status', '--porcelain')
+    return {
+        'commit': _git('rev-parse', 'HEAD'),
+        'short_commit': _git('rev-parse', '--short', 'HEAD'),
+        'dirty': bool(status) if status is not None else None,
+    }
+
+
+def rss_bytes(pid):
+    """Resident set size of a process in bytes, or None if it cannot be read"""
+    if pid is None:
+        return None
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return None
+    try:
+        with open(f'/proc/{pid}/status', encoding='utf-8') as status:
+            for line in status:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+def server_pid(checker):
+    """PID of the LanguageTool server owned by a checker (None for remote servers)"""
+    server = getattr(checker._tool, '_server', None)
+    return getattr(server, 'pid', None)
+
+
+def percentiles(samples):
+    """Exact p50/p90/p99, mean and max of a list of seconds"""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def _pick(q):
+        return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+    return {
+        'count': len(ordered),
+        'mean': round(sum(ordered) / len(ordered), 6),
+        'p50': round(_pick(0.5), 6),
+        'p90': round(_pick(0.9), 6),
+        'p99': round(_pick(0.99), 6),
+        'max': round(ordered[-1], 6),
+    }
+
+
+def measure_cold_start(language, sample_text):
+    """Time LanguageTool start-up and the first (JIT-cold) check"""
+    start = time.perf_counter()
+    checker = GrammarChecker(language)
+    init_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    checker.check_text(sample_text)
+    first_check_seconds = time.perf_counter() - start
+
+    return checker, {
+        'init_seconds': round(init_seconds, 3),
+        'first_check_seconds': round(first_check_seconds, 3),
+    }
+
+
+def measure_warm_latency(checker, corpus, repeat, warmup):
+    """Per-category latency for repeated checks on an already warm checker"""
+    for document in corpus[:warmup]:
+        checker.check_text(document['text'])
+
+    registry = get_metrics_registry()
+    registry.reset()
+
+    samples = {}
+    issue_counts = {}
+    for _ in range(repeat):
+        for document in corpus:
+            start = time.perf_counter()
+            issues = checker.check_text(document['text'])
+            elapsed = time.perf_counter() - start
+            samples.setdefault(document['category'], []).append(elapsed)
+            issue_counts[document['category']] = issue_counts.get(document['category'], 0) + len(issues)
+
+    snapshot = registry.snapshot(prefix='grammar_')
+    breakdown = {
+        name: snapshot['histograms'][name][0]
+        for name in ('grammar_languagetool_seconds', 'grammar_postprocess_seconds')
+        if snapshot['histograms'].get(name)
+    }
+
+    return {
+        'by_category': {
+            category: {**percentiles(values), 'issues_per_run': issue_counts[category] // repeat}
+            for category, values in samples.items()
+        },
+        'overall': percentiles([value for values in samples.values() for value in values]),
+        'languagetool_vs_postprocess': {
+            name: {key: entry[key] for key in ('count', 'sum', 'mean', 'p50', 'p99')}
+            for name, entry in breakdown.items()
+        },
+    }
+
+
+def measure_throughput(language, corpus, pool_size, repeat, concurrency_factor):
+    """Documents and characters per second when the corpus is checked concurrently"""
+    pool = GrammarCheckerPool(size=pool_size, language=language, timeout=600)
+    try:
+        # Start and warm every instance before timing
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            list(executor.map(lambda document: pool.check_text(document['text']), corpus[:pool_size]))
+        get_metrics_registry().reset()
+
+        workers = pool_size * concurrency_factor
+        documents = corpus * repeat
+        characters = sum(len(document['text']) for document in documents)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda document: pool.check_text(document['text']), documents))
+        elapsed = time.perf_counter() - start
+
+        pids = [server_pid(checker) for checker in pool._checkers]
+        server_rss = [rss_bytes(pid) for pid in pids]
+        wait = get_metrics_registry().histogram('grammar_pool_wait_seconds').snapshot()
+
+        return {
+            'pool_size': pool_size,
+            'workers': workers,
+            'documents': len(documents),
+            'seconds': round(elapsed, 3),
+            'documents_per_second': round(len(documents) / elapsed, 3),
+            'characters_per_second': round(characters / elapsed, 1),
+            'pool_wait_p99': wait['p99'],
+            'server_rss_bytes': server_rss,
+        }
+    finally:
+        pool.close()
+
+
+def measure_memory(checker):
+    """Resident memory of one checker's LanguageTool server and the Python process"""
+    return {
+        'languagetool_server_rss_bytes': rss_bytes(server_pid(checker)),
+        'python_process_rss_bytes': rss_bytes(os.getpid()),
+    }
+
+
+def run_benchmark(args):
+    corpus = build_corpus(seed=args.seed, scale=args.scale)
+    if args.categories:
+        corpus = [document for document in corpus if document['category'] in args.categories]
+
+    results = {
+        'benchmark': 'grammar_checker',
+        'timestamp': datetime.utcnow().isoformat() + 'Z',
+        'git': git_info(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'language_tool_python': getattr(language_tool_python, '__version__', None),
+        },
+        'config': {
+            'language': args.language,
+            'seed': args.seed,
+            'scale': args.scale,
+            'repeat': args.repeat,
+            'pool_sizes': args.pool_sizes,
+            'corpus_version': CORPUS_VERSION,
+        },
+        'corpus': describe_corpus(corpus),
+    }
+
+    print(f"Cold start ({args.language})...")
+    checker, results['cold_start'] = measure_cold_start(args.language, corpus[0]['text'])
+    try:
+        results['memory_per_instance'] = measure_memory(checker)
+        print("Warm latency...")
+        results['warm_latency'] = measure_warm_latency(checker, corpus, args.repeat, args.warmup)
+    finally:
+        checker.close()
+
+    results['throughput'] = []
+    for pool_size in args.pool_sizes:
+        print(f"Throughput with pool size {pool_size}...")
+        results['throughput'].append(
+            measure_throughput(args.language, corpus, pool_size, args.throughput_repeat, args.concurrency_factor))
+
+    return results
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:.1f}" if seconds is not None else '-'
+
+
+def print_report(results):
+    git = results['git']
+    print()
+    print(f"Grammar checker benchmark - commit {git['short_commit']}{' (dirty)' if git['dirty'] else ''}")
+    print("=" * 72)
+    cold = results['cold_start']
+    print(f"Cold start: init {cold['init_seconds']}s, first check {cold['first_check_seconds']}s")
+
+    memory = results['memory_per_instance']
+    if memory['languagetool_server_rss_bytes']:
+        print(f"LanguageTool server RSS: {memory['languagetool_server_rss_bytes'] / 2**20:.0f} MB")
+
+    print(f"\n{'category':<12}{'docs':>6}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'issues':>8}")
+    for category, entry in results['warm_latency']['by_category'].items():
+        print(f"{category:<12}{entry['count']:>6}{_ms(entry['p50']):>10}{_ms(entry['p90']):>10}"
+              f"{_ms(entry['p99']):>10}{entry['issues_per_run']:>8}")
+
+    print(f"\n{'pool':<6}{'workers':>8}{'docs/s':>10}{'chars/s':>12}{'wait p99 ms':>13}")
+    for entry in results['throughput']:
+        print(f"{entry['pool_size']:<6}{entry['workers']:>8}{entry['documents_per_second']:>10}"
+              f"{entry['characters_per_second']:>12}{_ms(entry['pool_wait_p99']):>13}")
+
+
+def print_comparison(baseline, results):
+    """Print relative changes against an earlier result file"""
+    def _delta(old, new):
+        if not old or new is None:
+            return '-'
+        return f"{(new - old) / old:+.1%}"
+
+    print(f"\nCompared with {baseline['git'].get('short_commit')}:")
+    for category, entry in results['warm_latency']['by_category'].items():
+        old = baseline.get('warm_latency', {}).get('by_category', {}).get(category)
+        if old:
+            print(f"  {category:<10} p50 {_delta(old['p50'], entry['p50']):>8}   p99 {_delta(old['p99'], entry['p99']):>8}")
+
+    old_throughput = {entry['pool_size']: entry for entry in baseline.get('throughput', [])}
+    for entry in results['throughput']:
+        old = old_throughput.get(entry['pool_size'])
+        if old:
+            print(f"  pool {entry['pool_size']:<5} docs/s {_delta(old['documents_per_second'], entry['documents_per_second']):>8}")
+
+    old_cold = baseline.get('cold_start', {}).get('init_seconds')
+    print(f"  cold start {_delta(old_cold, results['cold_start']['init_seconds']):>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--language', default='en-US', help='LanguageTool language code')
+    parser.add_argument('--seed', type=int, default=2024, help='Corpus seed')
+    parser.add_argument('--scale', type=float, default=1.0, help='Multiplier for documents per category')
+    parser.add_argument('--categories', type=lambda value: value.split(','),
+                        help='Comma-separated categories to include (note,abstract,brief)')
+    parser.add_argument('--repeat', type=int, default=3, help='Warm latency passes over the corpus')
+    parser.add_argument('--warmup', type=int, default=10, help='Documents checked before timing warm latency')
+    parser.add_argument('--pool-sizes', type=lambda value: [int(size) for size in value.split(',')],
+                        default=[1, 2], help='Comma-separated pool sizes for the throughput test')
+    parser.add_argument('--throughput-repeat', type=int, default=1, help='Corpus passes per throughput run')
+    parser.add_argument('--concurrency-factor', type=int, default=2, help='Worker threads per pooled checker')
+    parser.add_argument('--output', help='Result file (default: benchmarks/results/grammar_<commit>.json)')
+    parser.add_argument('--compare', help='Earlier result file to compare against')
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+    print_report(results)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            print_comparison(json.load(file), results)
+
+    output = args.output or os.path.join(
+        BACKEND_DIR, 'benchmarks', 'results', f"grammar_{results['git']['short_commit'] or 'unknown'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
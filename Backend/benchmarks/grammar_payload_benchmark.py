@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Payload size and serialization benchmark for grammar check responses.
+
+Compares the original one-object-per-issue JSON format with the compact
+format (shared sentence/string tables) produced by IssueList, with and
+without gzip/brotli compression. Issues are synthesized, so LanguageTool
+does not need to be running.
+
+Usage:
+    python benchmarks/grammar_payload_benchmark.py --issues 500 --repeat 50
+"""
+
+import argparse
+import gzip
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from grammar_checker import GrammarIssue, IssueList
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+RULES = [
+    ('MORFOLOGIK_RULE_EN_US', 'spelling', 'Possible spelling mistake found.', 'Spelling mistake'),
+    ('COMMA_PARENTHESIS_WHITESPACE', 'typography', 'Put a space after the comma, but not before the comma.', 'Punctuation'),
+    ('PASSIVE_VOICE', 'style', 'Passive voice can make a sentence less clear.', 'Passive voice'),
+    ('HE_VERB_AGR', 'grammar', 'The pronoun and the verb do not agree.', 'Grammatical problem'),
+    ('EN_COMPOUNDS', 'grammar', 'This word is normally spelled with a hyphen.', 'Compound'),
+    ('WHITESPACE_RULE', 'typography', 'Possible typo: you repeated a whitespace', 'Whitespace'),
+]
+
+SENTENCE_TEMPLATES = [
+    "The appellant contends that the trial court erred in granting summary judgment because genuine issues of material fact remained regarding the {term} clause.",
+    "Pursuant to section {n} of the Act, the respondent was obliged to serve notice within thirty days of the alleged breach of the {term} agreement.",
+    "In light of the foregoing authorities, we are persuaded that the doctrine of {term} applies with equal force to the facts of the present case.",
+    "The petitioner further submits that the impugned order was passed without affording a reasonable opportunity of hearing under the {term} rules.",
+]
+
+TERMS = ['res judicata', 'estoppel', 'indemnity', 'force majeure', 'arbitration', 'quantum meruit']
+
+
+def build_issues(issue_count, issues_per_sentence, seed=42):
+    """Synthesize a realistic spread of issues over a long document"""
+    rng = random.Random(seed)
+    issues = []
+    offset = 0
+    sentence = None
+
+    for index in range(issue_count):
+        if index % issues_per_sentence == 0:
+            sentence = rng.choice(SENTENCE_TEMPLATES).format(term=rng.choice(TERMS), n=rng.randint(1, 400))
+            offset += len(sentence) + 1
+
+        rule_id, issue_type, message, short_message = rng.choice(RULES)
+        position = rng.randint(0, max(len(sentence) - 12, 1))
+        issues.append(GrammarIssue(
+            offset=offset + position,
+            length=rng.randint(3, 10),
+            message=message,
+            short_message=short_message,
+            issue_type=issue_type,
+            rule_id=rule_id,
+            replacements=[rng.choice(TERMS) for _ in range(rng.randint(0, 3))],
+            context='...' + sentence[max(position - 20, 0):position + 20] + '...',
+            sentence=sentence
+        ))
+
+    return issues
+
+
+def time_call(func, repeat):
+    """Return the median wall time of func() in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def measure_memory(factory):
+    """Return the bytes allocated while building a structure"""
+    tracemalloc.start()
+    snapshot_before = tracemalloc.take_snapshot()
+    structure = factory()
+    snapshot_after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocated = sum(stat.size_diff for stat in snapshot_after.compare_to(snapshot_before, 'filename'))
+    del structure
+    return allocated
+
+
+def run_benchmark(issue_count, issues_per_sentence, repeat):
+    issues = build_issues(issue_count, issues_per_sentence)
+
+    full_body = json.dumps([issue.to_dict() for issue in issues]).encode('utf-8')
+    compact_body = json.dumps(IssueList(issues).to_compact_dict()).encode('utf-8')
+
+    results = {
+        'issue_count': issue_count,
+        'issues_per_sentence': issues_per_sentence,
+        'formats': {}
+    }
+
+    for name, body in (('full', full_body), ('compact', compact_body)):
+        sizes = {
+            'identity': len(body),
+            'gzip': len(gzip.compress(body, compresslevel=6)),
+        }
+        if brotli is not None:
+            sizes['br'] = len(brotli.compress(body, quality=5))
+        results['formats'][name] = {'bytes': sizes}
+
+    results['formats']['full']['serialize_ms'] = time_call(
+        lambda: json.dumps([issue.to_dict() for issue in issues]), repeat)
+    results['formats']['compact']['serialize_ms'] = time_call(
+        lambda: json.dumps(IssueList(issues).to_compact_dict()), repeat)
+
+    results['formats']['full']['memory_bytes'] = measure_memory(
+        lambda: build_issues(issue_count, issues_per_sentence))
+    results['formats']['compact']['memory_bytes'] = measure_memory(
+        lambda: IssueList(build_issues(issue_count, issues_per_sentence)))
+
+    return results
+
+
+def print_report(results):
+    print(f"Grammar payload benchmark - {results['issue_count']} issues, "
+          f"{results['issues_per_sentence']} per sentence")
+    print("=" * 72)
+    print(f"{'format':<10}{'identity':>12}{'gzip':>12}{'br':>12}{'serialize ms':>14}")
+    for name, data in results['formats'].items():
+        sizes = data['bytes']
+        print(f"{name:<10}{sizes['identity']:>12}{sizes['gzip']:>12}"
+              f"{sizes.get('br', '-'):>12}{data['serialize_ms']:>14.2f}")
+
+    full = results['formats']['full']['bytes']['identity']
+    compact = results['formats']['compact']['bytes']['identity']
+    print(f"\nCompact payload is {compact / full:.0%} of the full payload before compression")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--issues', type=int, default=500, help='Number of synthetic issues')
+    parser.add_argument('--per-sentence', type=int, default=3, help='Issues sharing one sentence')
+    parser.add_argument('--repeat', type=int, default=50, help='Timing repetitions')
+    parser.add_argument('--json', dest='json_path', help='Also write results to this JSON file')
+    args = parser.parse_args()
+
+    results = run_benchmark(args.issues, args.per_sentence, args.repeat)
+    print_report(results)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,143 @@
+"""
+Deterministic synthetic legal corpus for grammar checker benchmarks.
+
+Documents are assembled from legal sentence templates filled with case
+names, statutory citations and Latin terms, with a fixed share of seeded
+spelling, agreement and punctuation errors. The same seed always produces
+the same corpus, so benchmark runs on different commits check identical
+text.
+
+Categories:
+    note      - short case notes (roughly 300-700 characters)
+    abstract  - research paper abstracts (roughly 1,200-2,200 characters)
+    brief     - long briefs (roughly 9,000-14,000 characters)
+"""
+
+import random
+
+CORPUS_VERSION = 1
+
+CASES = [
+    'Marbury v. Madison, 5 U.S. 137 (1803)',
+    'Donoghue v. Stevenson [1932] AC 562',
+    'Kesavananda Bharati v. State of Kerala, (1973) 4 SCC 225',
+    'Hadley v. Baxendale (1854) 9 Exch 341',
+    'Maneka Gandhi v. Union of India, AIR 1978 SC 597',
+    'Brown v. Board of Education, 347 U.S. 483 (1954)',
+    'Carlill v. Carbolic Smoke Ball Co. [1893] 1 QB 256',
+]
+
+STATUTES = [
+    '42 U.S.C. § 1983',
+    'Section 73 of the Indian Contract Act, 1872',
+    'Art. 21 of the Constitution',
+    'Order XXXIX Rule 1 of the Code of Civil Procedure',
+    'Fed. R. Civ. P. 56(a)',
+    'Section 34 of the Arbitration and Conciliation Act, 1996',
+]
+
+LATIN = [
+    'res judicata', 'stare decisis', 'obiter dicta', 'ratio decidendi',
+    'mens rea', 'actus reus', 'ultra vires', 'audi alteram partem',
+    'prima facie', 'inter alia', 'quantum meruit', 'sub judice',
+]
+
+SUBJECTS = ['the appellant', 'the respondent', 'the petitioner', 'the tribunal', 'the High Court', 'the arbitrator']
+
+CLEAN_TEMPLATES = [
+    "In {case}, the court held that the principle of {latin} applies where the earlier proceedings were decided on the merits.",
+    "{Subject} contends that the impugned order is contrary to {statute} and must therefore be set aside.",
+    "The question of {latin} was not raised before the trial court, and it cannot be urged for the first time in appeal.",
+    "Relying on {case}, {subject} argues that the damages claimed are too remote to be recoverable.",
+    "It is well settled that a decision rendered without jurisdiction is a nullity and that {latin} does not attach to it.",
+    "The scope of judicial review under {statute} is limited to examining whether the decision-making process was fair.",
+    "{Subject} has not demonstrated a {latin} case warranting interim relief under {statute}.",
+    "The observations in {case} were {latin} and are therefore not binding on this court.",
+]
+
+# Templates with a deliberate, well-known error so every run produces issues
+ERROR_TEMPLATES = [
+    "{Subject} have filed the appeal within the period of limitation prescribed under {statute}.",
+    "The court were of the view that {latin} did not apply to the facts of this case.",
+    "The aggreement between the parties was executed on the same day as the alleged breach.",
+    "The judgement of the lower court is , in our view , unsustainable in law.",
+    "{Subject} recieved the notice only after the statutory period had expired.",
+    "This are the reasons for which the application under {statute} must fail.",
+    "The the contract contains an arbitration clause which binds both parties.",
+    "Their is no material on record to support the finding of {latin}.",
+]
+
+ERROR_RATE = 0.2
+
+# Category name -> (document count, minimum length, maximum length)
+CATEGORIES = {
+    'note': (24, 300, 700),
+    'abstract': (12, 1200, 2200),
+    'brief': (4, 9000, 14000),
+}
+
+
+def _sentence(rng):
+    """Build one sentence, occasionally with a seeded error"""
+    templates = ERROR_TEMPLATES if rng.random() < ERROR_RATE else CLEAN_TEMPLATES
+    subject = rng.choice(SUBJECTS)
+    return rng.choice(templates).format(
+        case=rng.choice(CASES),
+        statute=rng.choice(STATUTES),
+        latin=rng.choice(LATIN),
+        subject=subject,
+        Subject=subject[0].upper() + subject[1:],
+    )
+
+
+def _document(rng, min_length, max_length):
+    """Build paragraphs of sentences until the target length is reached"""
+    target = rng.randint(min_length, max_length)
+    paragraphs = []
+    length = 0
+    while length < target:
+        paragraph = ' '.join(_sentence(rng) for _ in range(rng.randint(2, 5)))
+        paragraphs.append(paragraph)
+        length += len(paragraph) + 2
+    return '\n\n'.join(paragraphs)
+
+
+def build_corpus(seed=2024, scale=1.0):
+    """
+    Build the benchmark corpus.
+
+    Args:
+        seed (int): Random seed; the same seed always yields the same corpus
+        scale (float): Multiplier applied to the number of documents per category
+
+    Returns:
+        list: Documents as dicts with 'id', 'category' and 'text'
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for category, (count, min_length, max_length) in CATEGORIES.items():
+        for index in range(max(1, int(count * scale))):
+            corpus.append({
+                'id': f"{category}-{index:03d}",
+                'category': category,
+                'text': _document(rng, min_length, max_length),
+            })
+    return corpus
+
+
+def describe_corpus(corpus):
+    """Summarize document counts and character totals per category"""
+    summary = {}
+    for document in corpus:
+        entry = summary.setdefault(document['category'], {'documents': 0, 'characters': 0})
+        entry['documents'] += 1
+        entry['characters'] += len(document['text'])
+    return summary
+
+
+if __name__ == '__main__':
+    corpus = build_corpus()
+    for category, entry in describe_corpus(corpus).items():
+        print(f"{category:<10}{entry['documents']:>6} documents{entry['characters']:>10} characters")
+    print()
+    print(corpus[0]['text'])
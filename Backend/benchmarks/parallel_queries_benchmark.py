@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Parallel dashboard query benchmark against a seeded local MySQL.
+
+Seeds a scratch database with synthetic content, metrics and applications,
+then runs a batch of independent dashboard-style aggregates (per type, per
+status, daily trends, top content, top creators, application pipeline)
+through ParallelQueryRunner at several concurrency caps. Concurrency 1 is
+the sequential baseline. The report shows batch latency next to the sum and
+the maximum of the individual query times, i.e. the two bounds the parallel
+batch should move between.
+
+The scratch database is created with the credentials from .env (DB_HOST,
+DB_USER, DB_PASSWORD) and is never the application database.
+
+Usage:
+    python benchmarks/parallel_queries_benchmark.py
+    python benchmarks/parallel_queries_benchmark.py --content 200000 --concurrency 1,2,3,4,6
+    python benchmarks/parallel_queries_benchmark.py --reuse --repeat 50
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+import mysql.connector
+from dotenv import load_dotenv
+from mysql.connector import pooling
+
+from utils.metrics import get_metrics_registry
+from utils.parallel_queries import ParallelQueryRunner, Query
+
+CONTENT_TYPES = ['Blog_Post', 'Research_Paper', 'Note', 'Job', 'Internship', 'Course']
+STATUSES = ['Active'] * 8 + ['Draft', 'Pending', 'Inactive']
+APPLICATION_STATUSES = ['Pending', 'Under Review', 'Accepted', 'Rejected']
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS Bench_Content (
+        Content_ID INT PRIMARY KEY,
+        User_ID INT NOT NULL,
+        Content_Type VARCHAR(32) NOT NULL,
+        Status VARCHAR(16) NOT NULL,
+        Title VARCHAR(255) NOT NULL,
+        Created_At DATETIME NOT NULL,
+        KEY idx_bench_content_user (User_ID),
+        KEY idx_bench_content_created (Created_At)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Bench_Metrics (
+        Content_ID INT PRIMARY KEY,
+        Views INT NOT NULL,
+        Likes INT NOT NULL,
+        Shares INT NOT NULL,
+        Comments_Count INT NOT NULL,
+        Avg_Time_Spent DECIMAL(10, 2) NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Bench_Applications (
+        Application_ID INT PRIMARY KEY,
+        Content_ID INT NOT NULL,
+        User_ID INT NOT NULL,
+        Status VARCHAR(16) NOT NULL,
+        Application_Date DATETIME NOT NULL,
+        KEY idx_bench_applications_content (Content_ID),
+        KEY idx_bench_applications_user (User_ID)
+    )
+    """,
+]
+
+# Shapes of the admin analytics / user dashboard aggregates, on the bench tables
+QUERIES = {
+    'by_type': Query("""
+        SELECT c.Content_Type, COUNT(*) as total_count,
+               SUM(m.Views) as total_views, SUM(m.Likes) as total_likes,
+               AVG(m.Avg_Time_Spent) as avg_time_spent
+        FROM Bench_Content c
+        JOIN Bench_Metrics m ON c.Content_ID = m.Content_ID
+        WHERE c.Status != 'Deleted'
+        GROUP BY c.Content_Type
+    """),
+    'by_status': Query("""
+        SELECT Status, COUNT(*) as count FROM Bench_Content GROUP BY Status
+    """),
+    'daily_trends': Query("""
+        SELECT DATE(c.Created_At) as date, COUNT(*) as content_created,
+               SUM(m.Views) as daily_views, SUM(m.Likes) as daily_likes
+        FROM Bench_Content c
+        JOIN Bench_Metrics m ON c.Content_ID = m.Content_ID
+        WHERE c.Created_At >= DATE_SUB(NOW(), INTERVAL 30 DAY)
+        GROUP BY DATE(c.Created_At)
+        ORDER BY date DESC
+    """),
+    'top_content': Query("""
+        SELECT c.Content_ID, c.Title,
+               (m.Views * 0.4 + m.Likes * 0.3 + m.Shares * 0.2 + m.Comments_Count * 0.1) as engagement_score
+        FROM Bench_Content c
+        JOIN Bench_Metrics m ON c.Content_ID = m.Content_ID
+        WHERE c.Status = 'Active'
+        ORDER BY engagement_score DESC
+        LIMIT 10
+    """),
+    'top_creators': Query("""
+        SELECT c.User_ID, COUNT(*) as content_count, SUM(m.Views) as total_views
+        FROM Bench_Content c
+        JOIN Bench_Metrics m ON c.Content_ID = m.Content_ID
+        GROUP BY c.User_ID
+        ORDER BY total_views DESC
+        LIMIT 10
+    """),
+    'application_pipeline': Query("""
+        SELECT c.Content_Type, a.Status, COUNT(*) as count
+        FROM Bench_Applications a
+        JOIN Bench_Content c ON a.Content_ID = c.Content_ID
+        GROUP BY c.Content_Type, a.Status
+    """),
+}
+
+
+def git_info():
+    """Return the current commit and whether the work tree has local changes"""
+    def _git(*args):
+        try:
+            return subprocess.check_output(['git', *args], cwd=BACKEND_DIR,
+                                           stderr=subprocess.DEVNULL).decode().strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    status = _git('status', '--porcelain')
+    return {
+        'commit': _git('rev-parse', 'HEAD'),
+        'short_commit': _git('rev-parse', '--short', 'HEAD'),
+        'dirty': bool(status) if status is not None else None,
+    }
+
+
+def percentiles(samples):
+    """Exact p50/p90/p99, mean and max of a list of seconds"""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+
+    def _pick(q):
+        return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+    return {
+        'count': len(ordered),
+        'mean': round(sum(ordered) / len(ordered), 6),
+        'p50': round(_pick(0.5), 6),
+        'p90': round(_pick(0.9), 6),
+        'p99': round(_pick(0.99), 6),
+        'max': round(ordered[-1], 6),
+    }
+
+
+def connection_settings():
+    load_dotenv(os.path.join(BACKEND_DIR, '.env'))
+    return {
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'user': os.getenv('DB_USER', 'root'),
+        'password': os.getenv('DB_PASSWORD', ''),
+    }
+
+
+def seed_database(settings, database, content_count, applications_per_job, seed, reuse):
+    """Create the scratch database and fill it with deterministic synthetic rows"""
+    conn = mysql.connector.connect(**settings)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{database}`")
+        cursor.execute(f"USE `{database}`")
+        for statement in SCHEMA:
+            cursor.execute(statement)
+
+        cursor.execute("SELECT COUNT(*) FROM Bench_Content")
+        existing = cursor.fetchone()[0]
+        if reuse and existing:
+            print(f"Reusing {existing} seeded content rows in {database}")
+            return existing
+
+        for table in ('Bench_Applications', 'Bench_Metrics', 'Bench_Content'):
+            cursor.execute(f"TRUNCATE TABLE {table}")
+        conn.commit()
+
+        rng = random.Random(seed)
+        now = datetime.now()
+        creators = max(10, content_count // 50)
+        application_id = 0
+        batch = 5000
+        start = time.perf_counter()
+
+        for offset in range(0, content_count, batch):
+            content_rows, metric_rows, application_rows = [], [], []
+            for content_id in range(offset + 1, min(offset + batch, content_count) + 1):
+                content_type = rng.choice(CONTENT_TYPES)
+                created_at = now - timedelta(minutes=rng.randint(0, 60 * 24 * 365))
+                content_rows.append((content_id, rng.randint(1, creators), content_type, rng.choice(STATUSES),
+                                     f"{content_type} {content_id}", created_at))
+                views = int(rng.paretovariate(1.2) * 20)
+                metric_rows.append((content_id, views, views // rng.randint(5, 40), views // rng.randint(20, 200),
+                                    views // rng.randint(10, 100), round(rng.uniform(5, 600), 2)))
+                if content_type in ('Job', 'Internship'):
+                    for _ in range(rng.randint(0, applications_per_job * 2)):
+                        application_id += 1
+                        application_rows.append((application_id, content_id, rng.randint(1, creators * 20),
+                                                 rng.choice(APPLICATION_STATUSES),
+                                                 created_at + timedelta(hours=rng.randint(1, 24 * 30))))
+
+            cursor.executemany("INSERT INTO Bench_Content VALUES (%s, %s, %s, %s, %s, %s)", content_rows)
+            cursor.executemany("INSERT INTO Bench_Metrics VALUES (%s, %s, %s, %s, %s, %s)", metric_rows)
+            if application_rows:
+                cursor.executemany("INSERT INTO Bench_Applications VALUES (%s, %s, %s, %s, %s)", application_rows)
+            conn.commit()
+
+        for table in ('Bench_Content', 'Bench_Metrics', 'Bench_Applications'):
+            cursor.execute(f"ANALYZE TABLE {table}")
+            cursor.fetchall()
+
+        print(f"Seeded {content_count} content rows and {application_id} applications "
+              f"in {time.perf_counter() - start:.1f}s")
+        return content_count
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def measure_individual(pool, repeat):
+    """Time each query alone, to get the sum (sequential) and max (ideal parallel) bounds"""
+    timings = {}
+    conn = pool.get_connection()
+    cursor = conn.cursor(buffered=True, dictionary=True)
+    try:
+        for name, query in QUERIES.items():
+            samples = []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                cursor.execute(query.sql, tuple(query.params))
+                cursor.fetchall()
+                samples.append(time.perf_counter() - start)
+            timings[name] = percentiles(samples)
+    finally:
+        cursor.close()
+        conn.close()
+    return timings
+
+
+def measure_batches(pool, concurrency, repeat, warmup, timeout):
+    """Batch latency through ParallelQueryRunner with the given concurrency cap"""
+    runner = ParallelQueryRunner(pool.get_connection, max_concurrency=concurrency, timeout=timeout)
+    try:
+        for _ in range(warmup):
+            runner.run(QUERIES)
+
+        registry = get_metrics_registry()
+        registry.reset()
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            runner.run(QUERIES)
+            samples.append(time.perf_counter() - start)
+
+        connections = registry.histogram('parallel_query_connections').snapshot()
+        return {
+            'concurrency': concurrency,
+            'latency': percentiles(samples),
+            'connections_mean': connections['mean'],
+            'fallbacks': registry.counter('parallel_query_fallbacks_total').value,
+        }
+    finally:
+        runner.close()
+
+
+def run_benchmark(args):
+    settings = connection_settings()
+    rows = seed_database(settings, args.database, args.content, args.applications_per_job, args.seed, args.reuse)
+
+    pool = pooling.MySQLConnectionPool(pool_name='parallel_query_bench', pool_size=max(args.concurrency) + 1,
+                                       database=args.database, **settings)
+
+    results = {
+        'benchmark': 'parallel_queries',
+        'timestamp': datetime.utcnow().isoformat() + 'Z',
+        'git': git_info(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'mysql_connector': mysql.connector.__version__,
+        },
+        'config': {
+            'database': args.database,
+            'content_rows': rows,
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'concurrency': args.concurrency,
+        },
+    }
+
+    print("Individual query timings...")
+    individual = measure_individual(pool, args.repeat)
+    results['individual'] = individual
+    results['bounds'] = {
+        'sum_p50': round(sum(entry['p50'] for entry in individual.values()), 6),
+        'max_p50': round(max(entry['p50'] for entry in individual.values()), 6),
+    }
+
+    results['batches'] = []
+    for concurrency in args.concurrency:
+        print(f"Batches with concurrency {concurrency}...")
+        results['batches'].append(measure_batches(pool, concurrency, args.repeat, args.warmup, args.timeout))
+
+    if not args.keep:
+        conn = mysql.connector.connect(**settings)
+        try:
+            conn.cursor().execute(f"DROP DATABASE `{args.database}`")
+        finally:
+            conn.close()
+
+    return results
+
+
+def _ms(seconds):
+    return f"{seconds * 1000:.1f}" if seconds is not None else '-'
+
+
+def print_report(results):
+    git = results['git']
+    print()
+    print(f"Parallel query benchmark - commit {git['short_commit']}{' (dirty)' if git['dirty'] else ''}")
+    print("=" * 72)
+    print(f"{results['config']['content_rows']} content rows, {len(results['individual'])} queries per batch")
+    print(f"\n{'query':<24}{'p50 ms':>10}{'p90 ms':>10}")
+    for name, entry in results['individual'].items():
+        print(f"{name:<24}{_ms(entry['p50']):>10}{_ms(entry['p90']):>10}")
+    bounds = results['bounds']
+    print(f"\nSequential bound (sum of p50): {_ms(bounds['sum_p50'])} ms, "
+          f"slowest query p50: {_ms(bounds['max_p50'])} ms")
+
+    baseline = next((entry for entry in results['batches'] if entry['concurrency'] == 1), None)
+    print(f"\n{'cap':<6}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'conns':>8}{'speed-up':>10}")
+    for entry in results['batches']:
+        latency = entry['latency']
+        speedup = f"{baseline['latency']['p50'] / latency['p50']:.2f}x" if baseline else '-'
+        print(f"{entry['concurrency']:<6}{_ms(latency['p50']):>10}{_ms(latency['p90']):>10}"
+              f"{_ms(latency['p99']):>10}{entry['connections_mean']:>8.1f}{speedup:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database', default='lawfort_bench', help='Scratch database (created and dropped)')
+    parser.add_argument('--content', type=int, default=50000, help='Content rows to seed')
+    parser.add_argument('--applications-per-job', type=int, default=5, help='Mean applications per job/internship')
+    parser.add_argument('--seed', type=int, default=2024, help='Data seed')
+    parser.add_argument('--reuse', action='store_true', help='Keep already seeded rows instead of reseeding')
+    parser.add_argument('--keep', action='store_true', help='Do not drop the scratch database afterwards')
+    parser.add_argument('--concurrency', type=lambda value: [int(cap) for cap in value.split(',')],
+                        default=[1, 2, 3, 4], help='Comma-separated concurrency caps (1 = sequential)')
+    parser.add_argument('--repeat', type=int, default=20, help='Timed batches per concurrency cap')
+    parser.add_argument('--warmup', type=int, default=3, help='Untimed batches per concurrency cap')
+    parser.add_argument('--timeout', type=float, default=60.0, help='Batch time budget in seconds')
+    parser.add_argument('--output', help='Result file (default: benchmarks/results/parallel_queries_<commit>.json)')
+    args = parser.parse_args()
+
+    results = run_benchmark(args)
+    print_report(results)
+
+    output = args.output or os.path.join(
+        BACKEND_DIR, 'benchmarks', 'results', f"parallel_queries_{results['git']['short_commit'] or 'unknown'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,18 @@
+-- Content_Metrics.Likes is now maintained by the like toggle in app.py, which
+-- applies a +1/-1 delta in the same transaction as the Content_Likes change.
+-- Drop the triggers from add_content_likes_table.sql so likes are not counted twice.
+-- Run after add_content_metrics_unique_key.sql.
+USE lawfort;
+
+DROP TRIGGER IF EXISTS update_likes_on_insert;
+DROP TRIGGER IF EXISTS update_likes_on_delete;
+
+-- Reconcile counters with the like rows once
+UPDATE Content_Metrics cm
+LEFT JOIN (
+    SELECT Content_ID, COUNT(*) AS Like_Count
+    FROM Content_Likes
+    GROUP BY Content_ID
+) cl ON cl.Content_ID = cm.Content_ID
+SET cm.Likes = COALESCE(cl.Like_Count, 0),
+    cm.Last_Updated = NOW();
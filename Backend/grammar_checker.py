@@ -4,12 +4,23 @@ Provides grammar checking functionality for the MinimalBlogWriter
 """
 
 import language_tool_python
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Tuple, Callable, FrozenSet, Iterable
 import json
 import logging
-from dataclasses import dataclass
+import os
+import queue
+import re
+import threading
+import time
+import urllib.parse
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from contextlib import contextmanager
 from enum import Enum
 
+from utils.metrics import get_metrics_registry
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -24,6 +35,9 @@ class IssueType(Enum):
 @dataclass
 class GrammarIssue:
     """Represents a grammar/style issue found in text"""
+    __slots__ = ('offset', 'length', 'message', 'short_message', 'issue_type',
+                 'rule_id', 'replacements', 'context', 'sentence')
+
     offset: int
     length: int
     message: str
@@ -48,6 +62,300 @@ class GrammarIssue:
             'sentence': self.sentence
         }
 
+# Field order of an issue row in the compact response format
+COMPACT_ISSUE_FIELDS = ['offset', 'length', 'message', 'short_message', 'issue_type',
+                        'rule_id', 'replacements', 'context', 'sentence']
+
+class IssueList:
+    """
+    Column-oriented, array-backed list of grammar issues
+
+    Offsets and lengths live in integer arrays, and the strings that repeat
+    across issues (sentences, messages, rule ids, issue types) are stored
+    once in shared tables and referenced by index. Long documents with
+    hundreds of issues therefore keep a single copy of every sentence in
+    memory and in the compact JSON payload.
+    """
+
+    __slots__ = ('_offsets', '_lengths', '_message_ids', '_short_message_ids',
+                 '_type_ids', '_rule_ids', '_replacements', '_contexts',
+                 '_sentence_ids', '_strings', '_string_index', '_sentences',
+                 '_sentence_index')
+
+    def __init__(self, issues: Optional[List[GrammarIssue]] = None):
+        self._offsets = array('l')
+        self._lengths = array('l')
+        self._message_ids = array('l')
+        self._short_message_ids = array('l')
+        self._type_ids = array('l')
+        self._rule_ids = array('l')
+        self._replacements = []
+        self._contexts = []
+        self._sentence_ids = array('l')
+        self._strings = []
+        self._string_index = {}
+        self._sentences = []
+        self._sentence_index = {}
+
+        for issue in issues or []:
+            self.append(issue)
+
+    @staticmethod
+    def _intern(value: str, table: List[str], index: Dict[str, int]) -> int:
+        position = index.get(value)
+        if position is None:
+            position = len(table)
+            table.append(value)
+            index[value] = position
+        return position
+
+    def append(self, issue: GrammarIssue):
+        """Add an issue to the list"""
+        self._offsets.append(issue.offset)
+        self._lengths.append(issue.length)
+        self._message_ids.append(self._intern(issue.message, self._strings, self._string_index))
+        self._short_message_ids.append(self._intern(issue.short_message, self._strings, self._string_index))
+        self._type_ids.append(self._intern(issue.issue_type, self._strings, self._string_index))
+        self._rule_ids.append(self._intern(issue.rule_id, self._strings, self._string_index))
+        self._replacements.append(list(issue.replacements))
+        self._contexts.append(issue.context)
+        self._sentence_ids.append(self._intern(issue.sentence, self._sentences, self._sentence_index))
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index: int) -> GrammarIssue:
+        return GrammarIssue(
+            offset=self._offsets[index],
+            length=self._lengths[index],
+            message=self._strings[self._message_ids[index]],
+            short_message=self._strings[self._short_message_ids[index]],
+            issue_type=self._strings[self._type_ids[index]],
+            rule_id=self._strings[self._rule_ids[index]],
+            replacements=self._replacements[index],
+            context=self._contexts[index],
+            sentence=self._sentences[self._sentence_ids[index]]
+        )
+
+    def __iter__(self) -> Iterator[GrammarIssue]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Serialize in the original one-object-per-issue format"""
+        return [issue.to_dict() for issue in self]
+
+    def to_compact_dict(self) -> Dict[str, Any]:
+        """
+        Serialize with shared string tables
+
+        Each issue is a row ordered as COMPACT_ISSUE_FIELDS, where message,
+        short_message, issue_type and rule_id index into 'strings' and
+        sentence indexes into 'sentences'.
+        """
+        rows = [
+            [offset, length, message_id, short_message_id, type_id, rule_id,
+             replacements, context, sentence_id]
+            for offset, length, message_id, short_message_id, type_id, rule_id,
+                replacements, context, sentence_id in zip(
+                    self._offsets, self._lengths, self._message_ids,
+                    self._short_message_ids, self._type_ids, self._rule_ids,
+                    self._replacements, self._contexts, self._sentence_ids)
+        ]
+        return {
+            'format': 'compact-v1',
+            'fields': COMPACT_ISSUE_FIELDS,
+            'strings': self._strings,
+            'sentences': self._sentences,
+            'issues': rows
+        }
+
+# Abbreviations common in legal writing that end with a period but do not
+# end a sentence ("Roe v. Wade", "42 U.S.C. § 1983", "No. 12-345")
+LEGAL_ABBREVIATIONS = {
+    'v', 'vs', 'no', 'nos', 'sec', 'secs', 'art', 'arts', 'id', 'cf', 'al',
+    'e.g', 'i.e', 'etc', 'inc', 'corp', 'co', 'ltd', 'llc', 'u.s', 'u.s.c',
+    'f', 'supp', 'cir', 'ct', 'app', 'mr', 'mrs', 'ms', 'dr', 'hon', 'j', 'jj',
+    'para', 'paras', 'p', 'pp', 'ch', 'ed', 'eds', 'rev', 'stat', 'reg'
+}
+
+# Candidate sentence boundary: terminal punctuation (optionally followed by a
+# closing quote/bracket) and whitespace, or a blank line between paragraphs
+_SENTENCE_BOUNDARY = re.compile(r'[.!?]["\')\]]*\s+|\n\s*\n')
+
+# Default target size of a chunk sent to LanguageTool in one request
+DEFAULT_CHUNK_SIZE = 600
+
+
+def split_into_chunks(text: str, max_chunk_chars: int = DEFAULT_CHUNK_SIZE) -> List[Tuple[int, int]]:
+    """
+    Split text into sentence-aligned chunks
+
+    Sentences are grouped until a chunk reaches max_chunk_chars, so short
+    texts are still checked in a single LanguageTool request. A single
+    sentence longer than max_chunk_chars becomes its own chunk.
+
+    Args:
+        text: Text to split
+        max_chunk_chars: Target maximum chunk length in characters
+
+    Returns:
+        List of (start, end) offsets covering the whole text in order
+    """
+    if not text:
+        return []
+
+    sentence_ends = []
+    for boundary in _SENTENCE_BOUNDARY.finditer(text):
+        preceding = text[:boundary.start()].rsplit(None, 1)
+        last_word = preceding[-1].lower().lstrip('("\'') if preceding else ''
+        if boundary.group().startswith('.') and last_word in LEGAL_ABBREVIATIONS:
+            continue
+        sentence_ends.append(boundary.end())
+
+    if not sentence_ends or sentence_ends[-1] != len(text):
+        sentence_ends.append(len(text))
+
+    chunks = []
+    chunk_start = 0
+    previous_end = 0
+    for end in sentence_ends:
+        if end - chunk_start > max_chunk_chars and previous_end > chunk_start:
+            chunks.append((chunk_start, previous_end))
+            chunk_start = previous_end
+        previous_end = end
+
+    if previous_end > chunk_start:
+        chunks.append((chunk_start, previous_end))
+
+    return chunks
+
+# LanguageTool rule and category ids are upper-case words joined by underscores
+_RULE_ID_PATTERN = re.compile(r'^[A-Za-z0-9_]{1,100}$')
+
+# Upper bounds on per-request options sent to LanguageTool
+MAX_DISABLED_RULES = 200
+MAX_IGNORE_WORDS = 5000
+
+# LanguageTool category used for spelling rules (MORFOLOGIK_*, HUNSPELL_*)
+SPELLING_CATEGORY = 'TYPOS'
+
+def normalize_rule_ids(rule_ids: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """
+    Keep only well-formed LanguageTool rule/category ids
+
+    Args:
+        rule_ids: Rule or category ids from a request or user settings
+
+    Returns:
+        Frozen set of valid ids (at most MAX_DISABLED_RULES)
+    """
+    if not rule_ids:
+        return frozenset()
+
+    valid = []
+    for rule_id in rule_ids:
+        if isinstance(rule_id, str) and _RULE_ID_PATTERN.match(rule_id.strip()):
+            valid.append(rule_id.strip())
+        if len(valid) >= MAX_DISABLED_RULES:
+            break
+    return frozenset(valid)
+
+def normalize_ignore_words(terms: Optional[Iterable[str]]) -> FrozenSet[str]:
+    """
+    Build the lower-case spelling ignore set from dictionary terms
+
+    Multi-word terms such as "res judicata" or "Marbury v. Madison" also
+    contribute their individual words, because LanguageTool reports
+    spelling mistakes one token at a time.
+
+    Args:
+        terms: Dictionary terms
+
+    Returns:
+        Frozen set of lower-case words and phrases
+    """
+    if not terms:
+        return frozenset()
+
+    words = set()
+    for term in terms:
+        if not isinstance(term, str):
+            continue
+        term = term.strip().lower()
+        if not term:
+            continue
+        words.add(term)
+        parts = term.split()
+        if len(parts) > 1:
+            words.update(part.strip('.,;:()') for part in parts)
+        if len(words) >= MAX_IGNORE_WORDS:
+            break
+    words.discard('')
+    return frozenset(words)
+
+@dataclass(frozen=True)
+class CheckOptions:
+    """Per-request LanguageTool options (disabled rules and spelling ignore list)"""
+    disabled_rules: FrozenSet[str] = field(default_factory=frozenset)
+    disabled_categories: FrozenSet[str] = field(default_factory=frozenset)
+    ignore_words: FrozenSet[str] = field(default_factory=frozenset)
+
+    @classmethod
+    def build(cls, disabled_rules: Optional[Iterable[str]] = None,
+              disabled_categories: Optional[Iterable[str]] = None,
+              ignore_words: Optional[Iterable[str]] = None) -> 'CheckOptions':
+        """Create options from untrusted input, dropping malformed ids"""
+        return cls(
+            disabled_rules=normalize_rule_ids(disabled_rules),
+            disabled_categories=normalize_rule_ids(disabled_categories),
+            ignore_words=normalize_ignore_words(ignore_words)
+        )
+
+    def merge(self, other: Optional['CheckOptions']) -> 'CheckOptions':
+        """Combine two option sets (e.g. user settings and request overrides)"""
+        if other is None:
+            return self
+        return CheckOptions(
+            disabled_rules=self.disabled_rules | other.disabled_rules,
+            disabled_categories=self.disabled_categories | other.disabled_categories,
+            ignore_words=self.ignore_words | other.ignore_words
+        )
+
+    @property
+    def changes_query(self) -> bool:
+        """True when the options must be sent to LanguageTool with the request"""
+        return bool(self.disabled_rules or self.disabled_categories)
+
+# Post-processing is pure Python and much faster than LanguageTool itself
+POSTPROCESS_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1)
+
+# Upper bounds (in characters) of the text-length buckets used for latency metrics
+TEXT_LENGTH_BUCKETS = (500, 2000, 10000, 50000)
+
+def text_length_bucket(length: int) -> str:
+    """
+    Label a text length with its metrics bucket
+
+    Args:
+        length: Text length in characters
+
+    Returns:
+        Bucket label such as "500-2000" or "50000+"
+    """
+    lower = 0
+    for upper in TEXT_LENGTH_BUCKETS:
+        if length < upper:
+            return f"{lower}-{upper}"
+        lower = upper
+    return f"{lower}+"
+
+def record_grammar_error(error: Exception):
+    """Count a grammar checker error by exception type"""
+    get_metrics_registry().counter(
+        'grammar_errors_total', {'type': type(error).__name__}
+    ).inc()
+
 class GrammarChecker:
     """Grammar checker service using LanguageTool"""
     
@@ -71,12 +379,14 @@ class GrammarChecker:
             logger.error(f"Failed to initialize LanguageTool: {e}")
             raise
     
-    def check_text(self, text: str) -> List[GrammarIssue]:
+    def check_text(self, text: str, options: Optional[CheckOptions] = None) -> List[GrammarIssue]:
         """
         Check text for grammar, spelling, and style issues
         
         Args:
             text: Text to check
+            options: Optional per-request disabled rules/categories and
+                spelling ignore list
             
         Returns:
             List of GrammarIssue objects
@@ -85,49 +395,172 @@ class GrammarChecker:
             return []
         
         try:
-            matches = self._tool.check(text)
-            issues = []
-
-            for match in matches:
-                try:
-                    issue_type = self._categorize_issue(match)
-
-                    # Get short message - LanguageTool doesn't have shortMessage attribute
-                    short_msg = getattr(match, 'shortMessage', None) or match.message
-                    if len(short_msg) > 100:
-                        short_msg = short_msg[:97] + "..."
-
-                    # Safely get all match attributes
-                    offset = getattr(match, 'offset', 0)
-                    length = getattr(match, 'errorLength', 0)
-                    message = getattr(match, 'message', 'Grammar issue detected')
-                    rule_id = getattr(match, 'ruleId', 'UNKNOWN')
-                    replacements = getattr(match, 'replacements', [])[:5]
-                    context = getattr(match, 'context', '')
-                    sentence = getattr(match, 'sentence', '')
-
-                    issue = GrammarIssue(
-                        offset=offset,
-                        length=length,
-                        message=message,
-                        short_message=short_msg,
-                        issue_type=issue_type.value,
-                        rule_id=rule_id,
-                        replacements=replacements,
-                        context=context,
-                        sentence=sentence
-                    )
-                    issues.append(issue)
-
-                except Exception as match_error:
-                    logger.warning(f"Error processing match: {match_error}")
-                    continue
-
-            return issues
+            return self.check_chunk(text, options)
 
         except Exception as e:
             logger.error(f"Error checking text: {e}")
+            record_grammar_error(e)
             return []
+
+    def check_text_stream(self, text: str,
+                          is_cancelled: Optional[Callable[[], bool]] = None,
+                          options: Optional[CheckOptions] = None
+                          ) -> Iterator[Tuple[int, int, List[GrammarIssue]]]:
+        """
+        Check text chunk by chunk, yielding issues as each chunk completes
+
+        Chunks are checked lazily, so a consumer that stops iterating (for
+        example because the HTTP client disconnected) stops the remaining
+        LanguageTool work as well.
+
+        Args:
+            text: Text to check
+            is_cancelled: Optional callable checked before each chunk; when it
+                returns True the stream ends early
+            options: Optional per-request disabled rules/categories and
+                spelling ignore list
+
+        Yields:
+            Tuples of (chunk_start, chunk_end, issues) where issue offsets are
+            relative to the full text
+        """
+        if not text or not text.strip():
+            return
+
+        for start, end in split_into_chunks(text):
+            if is_cancelled and is_cancelled():
+                logger.info("Grammar stream cancelled before chunk at offset %d", start)
+                return
+
+            try:
+                issues = self.check_chunk(text[start:end], options, base_offset=start)
+            except Exception as e:
+                logger.error(f"Error checking chunk at offset {start}: {e}")
+                record_grammar_error(e)
+                issues = []
+
+            yield start, end, issues
+
+    def check_chunk(self, text: str, options: Optional[CheckOptions] = None,
+                    base_offset: int = 0) -> List[GrammarIssue]:
+        """
+        Check a piece of text, recording LanguageTool and post-processing time
+
+        Unlike check_text, errors are raised to the caller.
+
+        Args:
+            text: Text to check
+            options: Optional per-request options
+            base_offset: Offset added to every issue (used for chunked checks)
+
+        Returns:
+            List of GrammarIssue objects
+        """
+        metrics = get_metrics_registry()
+
+        with metrics.histogram('grammar_languagetool_seconds').time():
+            matches = self._query_matches(text, options)
+
+        with metrics.histogram('grammar_postprocess_seconds', buckets=POSTPROCESS_BUCKETS).time():
+            if options is not None and options.ignore_words:
+                matches = [match for match in matches
+                           if not self._is_ignored_spelling(text, match, options.ignore_words)]
+            return self._build_issues(matches, base_offset=base_offset)
+
+    def _query_matches(self, text: str, options: Optional[CheckOptions] = None) -> list:
+        """
+        Run LanguageTool on text with per-request options
+
+        Disabled rules and categories are sent as LanguageTool's
+        disabledRules/disabledCategories query parameters on top of the
+        instance defaults, so the shared LanguageTool instance is never
+        mutated between requests. The local server has no per-request
+        spelling ignore list, so check_chunk drops spelling matches for
+        dictionary words before any GrammarIssue is built.
+
+        Args:
+            text: Text to check
+            options: Optional per-request options
+
+        Returns:
+            List of LanguageTool match objects
+        """
+        if options is None or not options.changes_query:
+            return self._tool.check(text)
+
+        params = self._tool._create_params(text)
+        if options.disabled_rules:
+            rules = set(options.disabled_rules) | set(self._tool.disabled_rules)
+            params['disabledRules'] = ','.join(sorted(rules))
+        if options.disabled_categories:
+            categories = set(options.disabled_categories) | set(self._tool.disabled_categories)
+            params['disabledCategories'] = ','.join(sorted(categories))
+
+        url = urllib.parse.urljoin(self._tool._url, 'check')
+        response = self._tool._query_server(url, params)
+        return [language_tool_python.Match(match) for match in response['matches']]
+
+    @staticmethod
+    def _is_ignored_spelling(text: str, match, ignore_words: FrozenSet[str]) -> bool:
+        """Check whether a spelling match flags a word from the user's dictionary"""
+        category = getattr(match, 'category', '') or ''
+        issue_type = getattr(match, 'ruleIssueType', '') or ''
+        if category != SPELLING_CATEGORY and issue_type != 'misspelling':
+            return False
+
+        offset = getattr(match, 'offset', 0)
+        word = text[offset:offset + getattr(match, 'errorLength', 0)].strip().lower()
+        return bool(word) and word in ignore_words
+
+    def _build_issues(self, matches, base_offset: int = 0) -> List[GrammarIssue]:
+        """
+        Convert LanguageTool matches into GrammarIssue objects
+
+        Args:
+            matches: LanguageTool match objects
+            base_offset: Offset added to every match (used for chunked checks)
+
+        Returns:
+            List of GrammarIssue objects
+        """
+        issues = []
+
+        for match in matches:
+            try:
+                issue_type = self._categorize_issue(match)
+
+                # Get short message - LanguageTool doesn't have shortMessage attribute
+                short_msg = getattr(match, 'shortMessage', None) or match.message
+                if len(short_msg) > 100:
+                    short_msg = short_msg[:97] + "..."
+
+                # Safely get all match attributes
+                offset = getattr(match, 'offset', 0) + base_offset
+                length = getattr(match, 'errorLength', 0)
+                message = getattr(match, 'message', 'Grammar issue detected')
+                rule_id = getattr(match, 'ruleId', 'UNKNOWN')
+                replacements = getattr(match, 'replacements', [])[:5]
+                context = getattr(match, 'context', '')
+                sentence = getattr(match, 'sentence', '')
+
+                issue = GrammarIssue(
+                    offset=offset,
+                    length=length,
+                    message=message,
+                    short_message=short_msg,
+                    issue_type=issue_type.value,
+                    rule_id=rule_id,
+                    replacements=replacements,
+                    context=context,
+                    sentence=sentence
+                )
+                issues.append(issue)
+
+            except Exception as match_error:
+                logger.warning(f"Error processing match: {match_error}")
+                continue
+
+        return issues
     
     def _categorize_issue(self, match) -> IssueType:
         """
@@ -225,34 +658,267 @@ class GrammarChecker:
             self._tool.close()
             logger.info("LanguageTool instance closed")
 
-# Global grammar checker instance
-_grammar_checker = None
+class RevisionTracker:
+    """
+    Tracks the latest revision checked for each document
+
+    Streaming checks register the revision they are working on; once a newer
+    revision of the same document is registered the older stream reports
+    itself as cancelled and stops checking further chunks.
+    """
+
+    def __init__(self, max_documents: int = 10000):
+        """
+        Initialize the tracker
+
+        Args:
+            max_documents: Maximum number of documents remembered before the
+                least recently used ones are forgotten
+        """
+        self.max_documents = max_documents
+        self._revisions = OrderedDict()
+        self._lock = threading.Lock()
+        self._counter = 0
+
+    def begin(self, document_id: str, revision: Optional[int] = None) -> int:
+        """
+        Register a new revision of a document as the current one
+
+        Args:
+            document_id: Client-chosen identifier of the document being edited
+            revision: Client revision number; generated when omitted
+
+        Returns:
+            The revision number that was registered
+        """
+        with self._lock:
+            if revision is None:
+                self._counter += 1
+                revision = self._counter
+
+            current = self._revisions.get(document_id)
+            if current is None or revision >= current:
+                self._revisions[document_id] = revision
+            self._revisions.move_to_end(document_id)
+
+            while len(self._revisions) > self.max_documents:
+                self._revisions.popitem(last=False)
+
+            return revision
+
+    def is_current(self, document_id: str, revision: int) -> bool:
+        """Return True while no newer revision of the document has been registered"""
+        with self._lock:
+            current = self._revisions.get(document_id)
+            return current is None or current <= revision
+
+# Global revision tracker for streaming checks
+_revision_tracker = RevisionTracker()
+
+def get_revision_tracker() -> RevisionTracker:
+    """Get the global revision tracker used by streaming grammar checks"""
+    return _revision_tracker
+
+class GrammarCheckerPool:
+    """
+    Fixed-size pool of GrammarChecker instances
+
+    Each instance owns its own LanguageTool server, so the pool size trades
+    memory (roughly 200-500MB per instance) for concurrent checks. Checkers
+    are created lazily up to the pool size and leased exclusively; time spent
+    waiting for a free checker is recorded as grammar_pool_wait_seconds.
+    """
+
+    def __init__(self, size: int = 1, language: str = 'en-US', timeout: float = 30.0,
+                 checker_factory: Optional[Callable[[], GrammarChecker]] = None):
+        """
+        Initialize the pool
+
+        Args:
+            size: Maximum number of GrammarChecker instances
+            language: Language code for new instances
+            timeout: Seconds to wait for a free checker before giving up
+            checker_factory: Optional callable creating checkers (defaults to GrammarChecker(language))
+        """
+        self.size = max(1, size)
+        self.language = language
+        self.timeout = timeout
+        self._checker_factory = checker_factory or (lambda: GrammarChecker(self.language))
+        self._idle = queue.LifoQueue()
+        self._checkers: List[GrammarChecker] = []
+        self._reserved = 0  # Checkers created or being created
+        self._lock = threading.Lock()
+
+    @property
+    def created(self) -> int:
+        """Number of checkers created so far"""
+        return len(self._checkers)
+
+    @property
+    def idle(self) -> int:
+        """Number of checkers currently free"""
+        return self._idle.qsize()
+
+    def primary(self) -> GrammarChecker:
+        """Get the first checker, creating it if needed (used for non-checking helpers)"""
+        with self._lock:
+            if self._checkers:
+                return self._checkers[0]
+        self._idle.put(self._acquire())
+        return self._checkers[0]
+
+    @contextmanager
+    def lease(self) -> Iterator[GrammarChecker]:
+        """
+        Borrow a checker for the duration of a with-block
+
+        Raises:
+            TimeoutError: If no checker becomes free within the pool timeout
+        """
+        start = time.perf_counter()
+        checker = self._acquire()
+        get_metrics_registry().histogram('grammar_pool_wait_seconds').observe(time.perf_counter() - start)
+        try:
+            yield checker
+        finally:
+            self._idle.put(checker)
+
+    def _acquire(self) -> GrammarChecker:
+        """Take an idle checker, growing the pool while below its size"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        # Reserve the slot under the lock but start LanguageTool outside it,
+        # so other callers are not held up by a slow start-up
+        with self._lock:
+            grow = self._reserved < self.size
+            if grow:
+                self._reserved += 1
+        if grow:
+            try:
+                checker = self._checker_factory()
+            except Exception:
+                with self._lock:
+                    self._reserved -= 1
+                raise
+            with self._lock:
+                self._checkers.append(checker)
+            return checker
+
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No grammar checker became available within {self.timeout}s")
+
+    def check_text(self, text: str, options: Optional[CheckOptions] = None) -> List[GrammarIssue]:
+        """
+        Check text on a leased checker, recording latency by text length
+
+        Args:
+            text: Text to check
+            options: Optional per-request options
+
+        Returns:
+            List of GrammarIssue objects
+        """
+        histogram = get_metrics_registry().histogram(
+            'grammar_check_seconds', {'length': text_length_bucket(len(text or ''))}
+        )
+        with histogram.time():
+            with self.lease() as checker:
+                return checker.check_text(text, options)
+
+    def check_text_stream(self, text: str,
+                          is_cancelled: Optional[Callable[[], bool]] = None,
+                          options: Optional[CheckOptions] = None
+                          ) -> Iterator[Tuple[int, int, List[GrammarIssue]]]:
+        """
+        Stream chunked results, leasing a checker per chunk
+
+        A checker is only held while its chunk is being checked, so a slow
+        stream consumer never starves other requests.
+        """
+        if not text or not text.strip():
+            return
+
+        metrics = get_metrics_registry()
+        for start, end in split_into_chunks(text):
+            if is_cancelled and is_cancelled():
+                logger.info("Grammar stream cancelled before chunk at offset %d", start)
+                return
+
+            histogram = metrics.histogram(
+                'grammar_check_seconds', {'length': text_length_bucket(end - start)}
+            )
+            try:
+                with histogram.time():
+                    with self.lease() as checker:
+                        issues = checker.check_chunk(text[start:end], options, base_offset=start)
+            except Exception as e:
+                logger.error(f"Error checking chunk at offset {start}: {e}")
+                record_grammar_error(e)
+                issues = []
+
+            yield start, end, issues
+
+    def close(self):
+        """Close every LanguageTool instance in the pool"""
+        with self._lock:
+            for checker in self._checkers:
+                checker.close()
+            self._checkers.clear()
+            self._idle = queue.LifoQueue()
+
+    def stats(self) -> Dict[str, int]:
+        """Pool size and utilisation for the metrics endpoint"""
+        return {'size': self.size, 'created': self.created, 'idle': self.idle}
+
+# Global grammar checker pool
+_grammar_checker_pool = None
+_grammar_checker_pool_lock = threading.Lock()
+
+def get_grammar_checker_pool() -> GrammarCheckerPool:
+    """Get or create the global grammar checker pool (sized by GRAMMAR_POOL_SIZE)"""
+    global _grammar_checker_pool
+    if _grammar_checker_pool is None:
+        with _grammar_checker_pool_lock:
+            if _grammar_checker_pool is None:
+                _grammar_checker_pool = GrammarCheckerPool(
+                    size=int(os.getenv('GRAMMAR_POOL_SIZE', 1)),
+                    timeout=float(os.getenv('GRAMMAR_POOL_TIMEOUT', 30))
+                )
+    return _grammar_checker_pool
 
 def get_grammar_checker() -> GrammarChecker:
     """Get or create global grammar checker instance"""
-    global _grammar_checker
-    if _grammar_checker is None:
-        _grammar_checker = GrammarChecker()
-    return _grammar_checker
+    return get_grammar_checker_pool().primary()
 
-def check_grammar_api(text: str) -> Dict[str, Any]:
+def check_grammar_api(text: str, compact: bool = False,
+                      options: Optional[CheckOptions] = None) -> Dict[str, Any]:
     """
     API function for grammar checking
     
     Args:
         text: Text to check
+        compact: Return issues in the compact format, with sentences and
+            repeated strings referenced by index into shared tables
+        options: Optional per-request disabled rules/categories and
+            spelling ignore list
         
     Returns:
         Dictionary with issues and statistics
     """
     try:
-        checker = get_grammar_checker()
-        issues = checker.check_text(text)
-        statistics = checker.get_statistics(issues)
+        pool = get_grammar_checker_pool()
+        issues = pool.check_text(text, options)
+        statistics = pool.primary().get_statistics(issues)
+        issue_list = IssueList(issues)
         
         return {
             'success': True,
-            'issues': [issue.to_dict() for issue in issues],
+            'issues': issue_list.to_compact_dict() if compact else issue_list.to_dicts(),
             'statistics': statistics,
             'text_length': len(text),
             'word_count': len(text.split()) if text else 0
@@ -260,6 +926,7 @@ def check_grammar_api(text: str) -> Dict[str, Any]:
     
     except Exception as e:
         logger.error(f"Grammar check API error: {e}")
+        record_grammar_error(e)
         return {
             'success': False,
             'error': str(e),
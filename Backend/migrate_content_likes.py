@@ -1,7 +1,8 @@
 #!/usr/bin/env python3
 """
 Migration script to add Content_Likes table for the like system functionality.
-This script creates the necessary table and triggers for tracking user likes on content.
+This script creates the necessary table for tracking user likes on content.
+Like counts in Content_Metrics are maintained by the like endpoint itself.
 """
 
 import mysql.connector
@@ -99,10 +100,11 @@ def run_migration():
                 for column in columns:
                     print(f"   {column[0]} - {column[1]} {column[2] if column[2] else ''}")
                 
-                # Check if triggers were created
-                cursor.execute("SHOW TRIGGERS LIKE 'update_likes_on_%'")
+                # Like counting triggers would double count with the like endpoint
+                cursor.execute("SHOW TRIGGERS LIKE 'Content_Likes'")
                 triggers = cursor.fetchall()
-                print(f"\n🔧 Created {len(triggers)} triggers for automatic like counting")
+                if triggers:
+                    print(f"\n⚠️  Found {len(triggers)} triggers on Content_Likes - run drop_content_likes_triggers.sql")
                 
             else:
                 print("❌ Content_Likes table was not created")
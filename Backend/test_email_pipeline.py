@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Test script for the outbound email pipeline.
+Runs a local SMTP sink (aiosmtpd) and checks pooled delivery, recipient
+batching, bounce handling and per-domain rate limits. With the backend
+running against the sink, it also queues an announcement through
+/admin/send_email and waits for Email_Logs to report it delivered:
+
+    SMTP_HOST=127.0.0.1 SMTP_PORT=8025 SMTP_STARTTLS=false python app.py
+
+Requires the development dependencies: pip install -r requirements-dev.txt
+(skipped under pytest when aiosmtpd is missing)
+"""
+
+import time
+
+import pytest
+import requests
+
+Controller = pytest.importorskip('aiosmtpd.controller').Controller
+
+from utils.mailer import DomainRateLimiter, MailSender, SMTPConnectionPool
+
+BASE_URL = "http://localhost:5000"
+
+SINK_HOST = "127.0.0.1"
+SINK_PORT = 8025
+
+class SinkHandler:
+    """Accepts every message; refuses bounce-* recipients (550) and defer-* recipients (451)"""
+
+    def __init__(self):
+        self.envelopes = []
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        local_part = address.split('@', 1)[0]
+        if local_part.startswith('bounce'):
+            return '550 5.1.1 No such user'
+        if local_part.startswith('defer'):
+            return '451 4.3.0 Try again later'
+        envelope.rcpt_tos.append(address)
+        return '250 OK'
+
+    async def handle_DATA(self, server, session, envelope):
+        self.envelopes.append(envelope)
+        return '250 Message accepted for delivery'
+
+def start_sink():
+    handler = SinkHandler()
+    controller = Controller(handler, hostname=SINK_HOST, port=SINK_PORT)
+    controller.start()
+    return controller, handler
+
+def test_batched_delivery():
+    """120 recipients go out as 3 transactions over one reused connection"""
+    print("🧪 Testing batched SMTP delivery")
+    print("=" * 50)
+
+    controller, handler = start_sink()
+    try:
+        pool = SMTPConnectionPool(SINK_HOST, SINK_PORT, starttls=False, max_connections=1)
+        sender = MailSender(pool, 'LawFort <no-reply@lawfort.test>', recipients_per_message=50)
+        recipients = [f"user{index}@example.test" for index in range(120)]
+
+        results = sender.send(recipients, 'Announcement', 'Hello from LawFort')
+        pool.close()
+    finally:
+        controller.stop()
+
+    delivered = sum(len(envelope.rcpt_tos) for envelope in handler.envelopes)
+    print(f"   Transactions: {len(handler.envelopes)} (expected 3)")
+    print(f"   Recipients delivered: {delivered} (expected 120)")
+    passed = len(handler.envelopes) == 3 and delivered == 120 and all(error is None for error in results.values())
+
+    first = handler.envelopes[0].content.decode('utf-8', 'replace')
+    hidden = 'undisclosed-recipients' in first and 'user0@example.test' not in first
+    print(f"   Recipients hidden from each other: {hidden}")
+
+    print("✅ Batched delivery works" if passed and hidden else "❌ Batched delivery failed")
+    assert passed and hidden
+
+def test_bounces():
+    """5xx refusals are permanent, 4xx refusals are retried"""
+    print("\n🧪 Testing bounce classification")
+    print("=" * 50)
+
+    controller, handler = start_sink()
+    try:
+        pool = SMTPConnectionPool(SINK_HOST, SINK_PORT, starttls=False)
+        sender = MailSender(pool, 'no-reply@lawfort.test')
+        results = sender.send(['ok@example.test', 'bounce@example.test', 'defer@example.test'],
+                              'Status', 'Body')
+        pool.close()
+    finally:
+        controller.stop()
+
+    passed = (results['ok@example.test'] is None
+              and results['bounce@example.test'].permanent
+              and not results['defer@example.test'].permanent)
+    for recipient, error in results.items():
+        print(f"   {recipient}: {'delivered' if error is None else error} "
+              f"{'(permanent)' if error is not None and error.permanent else ''}")
+
+    print("✅ Bounces classified correctly" if passed else "❌ Bounce classification failed")
+    assert passed
+
+def test_domain_rate_limit():
+    """A domain gets its burst at once, the rest spread over its rate"""
+    print("\n🧪 Testing per-domain rate limits")
+    print("=" * 50)
+
+    limiter = DomainRateLimiter(rate=10, burst=5)
+    allowed, delays = limiter.acquire('example.test', 8)
+    other_allowed, _ = limiter.acquire('other.test', 5)
+
+    print(f"   example.test: {allowed} allowed now (expected 5), delays {[round(d, 2) for d in delays]}")
+    print(f"   other.test unaffected: {other_allowed} allowed (expected 5)")
+    passed = (allowed == 5 and len(delays) == 3 and delays == sorted(delays)
+              and 0 < delays[0] <= 0.11 and other_allowed == 5)
+
+    print("✅ Rate limits applied per domain" if passed else "❌ Rate limiting failed")
+    assert passed
+
+def test_announcement_through_api():
+    """Queue an announcement and wait for the workers to deliver it to the sink"""
+    print("\n🧪 Testing /admin/send_email end to end")
+    print("=" * 50)
+
+    try:
+        login_response = requests.post(f"{BASE_URL}/login", json={
+            'email': 'admin@lawfort.com',
+            'password': 'admin123'
+        }, timeout=5)
+    except requests.ConnectionError:
+        print("ℹ️  Backend not running; skipping the end-to-end test")
+        return
+
+    if login_response.status_code != 200:
+        print(f"❌ Login failed: {login_response.status_code} - {login_response.text}")
+        return
+
+    headers = {'Authorization': f"Bearer {login_response.json()['session_token']}"}
+    users = requests.get(f"{BASE_URL}/admin/users_for_email").json().get('users', [])
+    recipient_ids = [user['user_id'] for user in users]
+    print(f"1. 📬 Queueing an announcement to {len(recipient_ids)} active users...")
+
+    controller, handler = start_sink()
+    try:
+        start = time.perf_counter()
+        response = requests.post(f"{BASE_URL}/admin/send_email", headers=headers, json={
+            'recipient_user_ids': recipient_ids,
+            'subject': 'Pipeline test',
+            'content': 'This is a test announcement.',
+            'email_type': 'test'
+        })
+        print(f"   Response {response.status_code} in {(time.perf_counter() - start) * 1000:.0f} ms: {response.json()}")
+        assert response.status_code == 202
+        email_id = response.json()['email_id']
+
+        print("\n2. ⏳ Waiting for delivery...")
+        log = None
+        for _ in range(60):
+            logs = requests.get(f"{BASE_URL}/admin/email_logs").json().get('email_logs', [])
+            log = next((entry for entry in logs if entry['email_id'] == email_id), None)
+            if log and log['status'] != 'pending':
+                break
+            time.sleep(1)
+    finally:
+        controller.stop()
+
+    delivered = sum(len(envelope.rcpt_tos) for envelope in handler.envelopes)
+    print(f"   Email_Logs: {log}")
+    print(f"   Sink received {delivered} recipients in {len(handler.envelopes)} transactions")
+    passed = log is not None and log['status'] == 'sent' and log['sent_count'] == delivered
+    print("✅ Announcement delivered" if passed else "❌ Announcement not delivered")
+    assert passed
+
+if __name__ == "__main__":
+    try:
+        test_batched_delivery()
+        test_bounces()
+        test_domain_rate_limit()
+        test_announcement_through_api()
+        print("\n🎉 All tests completed!")
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
@@ -7,9 +7,16 @@ Tests the like/unlike API endpoints and database integration.
 import requests
 import json
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 BASE_URL = "http://localhost:5000"
 
+# Users and parallel clicks used by the concurrency test; keep them at or
+# below DB_POOL_SIZE, otherwise requests fail with "pool exhausted"
+CONCURRENT_USERS = 4
+RAPID_TOGGLES = 5
+
 def test_like_system():
     """Test the complete like system functionality"""
     print("🧪 Testing LawFort Like System")
@@ -122,10 +129,103 @@ def test_multiple_users():
     print("ℹ️  Multiple user testing requires additional user accounts")
     print("   Current test uses admin account only")
 
+def login(email, password):
+    """Log in and return auth headers, or None on failure"""
+    response = requests.post(f"{BASE_URL}/login", json={'email': email, 'password': password})
+    if response.status_code != 200:
+        return None
+    return {'Authorization': f"Bearer {response.json().get('session_token')}"}
+
+def register_test_user():
+    """Register a throwaway user for the concurrency test and return auth headers"""
+    email = f"like-test-{uuid.uuid4().hex[:12]}@lawfort.test"
+    password = 'LikeTest123!'
+    response = requests.post(f"{BASE_URL}/register", json={
+        'email': email, 'password': password, 'full_name': 'Like Test User',
+        'phone': '', 'bio': '', 'profile_pic': '', 'law_specialization': '',
+        'education': '', 'bar_exam_status': '', 'license_number': '',
+        'practice_area': '', 'location': '', 'years_of_experience': 0,
+        'linkedin_profile': '', 'alumni_of': '', 'professional_organizations': ''
+    })
+    if response.status_code != 201:
+        raise RuntimeError(f"Registration failed: {response.status_code} - {response.text}")
+    return login(email, password)
+
+def get_like_status(content_id, headers):
+    response = requests.get(f"{BASE_URL}/api/content/{content_id}/like-status", headers=headers)
+    response.raise_for_status()
+    return response.json()
+
+def toggle_like(content_id, headers):
+    response = requests.post(f"{BASE_URL}/api/content/{content_id}/like", headers=headers)
+    return response.status_code, response.json()
+
+def test_concurrent_likes():
+    """Hammer one post with parallel likes and verify the final like count"""
+    print("\n🧪 Testing Concurrent Likes")
+    print("=" * 50)
+
+    admin_headers = login('admin@lawfort.com', 'admin123')
+    if not admin_headers:
+        print("❌ Admin login failed")
+        return False
+
+    blog_posts = requests.get(f"{BASE_URL}/api/blog-posts", headers=admin_headers).json().get('blog_posts', [])
+    if not blog_posts:
+        print("❌ No blog posts found to test with")
+        return False
+    content_id = blog_posts[0]['content_id']
+
+    print(f"1. 👥 Registering {CONCURRENT_USERS} test users...")
+    users = [register_test_user() for _ in range(CONCURRENT_USERS)]
+    initial_count = get_like_status(content_id, admin_headers)['like_count']
+    print(f"✅ Initial like count for content {content_id}: {initial_count}")
+
+    # Every user likes the post at the same moment
+    print(f"\n2. ❤️  {CONCURRENT_USERS} users liking in parallel...")
+    with ThreadPoolExecutor(max_workers=CONCURRENT_USERS) as executor:
+        results = list(executor.map(lambda headers: toggle_like(content_id, headers), users))
+
+    failures = [result for result in results if result[0] != 200]
+    after_likes = get_like_status(content_id, admin_headers)['like_count']
+    print(f"   Count after parallel likes: {after_likes} (expected {initial_count + CONCURRENT_USERS})")
+    passed = not failures and after_likes == initial_count + CONCURRENT_USERS
+
+    # One user clicks many times at once; each click flips the state exactly once
+    print(f"\n3. 🔁 One user toggling {RAPID_TOGGLES} times in parallel...")
+    with ThreadPoolExecutor(max_workers=RAPID_TOGGLES) as executor:
+        rapid = list(executor.map(lambda _: toggle_like(content_id, users[0]), range(RAPID_TOGGLES)))
+
+    rapid_failures = [result for result in rapid if result[0] != 200]
+    status = get_like_status(content_id, users[0])
+    expected_liked = RAPID_TOGGLES % 2 == 0
+    expected_count = initial_count + CONCURRENT_USERS - (0 if status['is_liked'] else 1)
+    print(f"   Liked: {status['is_liked']} (expected {expected_liked}), "
+          f"count: {status['like_count']} (expected {expected_count})")
+    passed = passed and not rapid_failures and status['is_liked'] == expected_liked \
+        and status['like_count'] == expected_count
+
+    # Undo every like in parallel and check the counter returns to where it started
+    print("\n4. 💔 Removing all test likes in parallel...")
+    likers = [headers for headers in users if get_like_status(content_id, headers)['is_liked']]
+    with ThreadPoolExecutor(max_workers=max(len(likers), 1)) as executor:
+        list(executor.map(lambda headers: toggle_like(content_id, headers), likers))
+
+    final_count = get_like_status(content_id, admin_headers)['like_count']
+    print(f"   Final like count: {final_count} (expected {initial_count})")
+    passed = passed and final_count == initial_count
+
+    if passed:
+        print("\n✅ Like counts stayed consistent under concurrent clicks")
+    else:
+        print(f"\n❌ Like counts drifted (failed requests: {len(failures) + len(rapid_failures)})")
+    return passed
+
 if __name__ == "__main__":
     try:
         test_like_system()
         test_multiple_users()
+        test_concurrent_likes()
         print("\n🎉 All tests completed!")
     except Exception as e:
         print(f"\n❌ Test failed with error: {e}")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Smoke test for the user dashboard endpoint.
+Saving and unsaving content invalidates the cached dashboard, so the
+requests after those calls go through build_user_dashboard and its
+parallel queries instead of the cache.
+"""
+
+import requests
+
+BASE_URL = "http://localhost:5000"
+
+STAT_KEYS = ('applications_submitted', 'courses_enrolled', 'blog_posts_read', 'saved_jobs')
+
+def get_dashboard(headers):
+    """Fetch the dashboard and check the payload shape"""
+    response = requests.get(f"{BASE_URL}/api/user/dashboard", headers=headers)
+    if response.status_code != 200:
+        print(f"   ❌ Dashboard request failed: {response.status_code} - {response.text}")
+        return None
+
+    data = response.json()
+    missing = [key for key in STAT_KEYS if key not in data.get('stats', {})]
+    if missing or not isinstance(data.get('recent_applications'), list):
+        print(f"   ❌ Dashboard payload is missing keys: {missing or ['recent_applications']}")
+        return None
+    return data
+
+def test_user_dashboard():
+    """Load the user dashboard before and after invalidating its cache"""
+    print("🧪 Testing User Dashboard")
+    print("=" * 50)
+
+    print("1. 🔐 Logging in as admin...")
+    try:
+        login_response = requests.post(f"{BASE_URL}/login", json={
+            'email': 'admin@lawfort.com',
+            'password': 'admin123'
+        })
+    except requests.ConnectionError:
+        print(f"⚠️  Backend not reachable at {BASE_URL}, skipping")
+        return
+
+    if login_response.status_code != 200:
+        print(f"❌ Login failed: {login_response.status_code} - {login_response.text}")
+        return
+
+    headers = {'Authorization': f"Bearer {login_response.json().get('session_token')}"}
+
+    print("\n2. 📊 Loading the dashboard...")
+    passed = get_dashboard(headers) is not None
+
+    print("\n3. 🔄 Saving a blog post to invalidate the cached dashboard...")
+    blog_posts = requests.get(f"{BASE_URL}/api/blog-posts", headers=headers).json().get('blog_posts', [])
+    if not blog_posts:
+        print("❌ No blog posts found to test with")
+        return
+    content_id = blog_posts[0]['content_id']
+
+    save_response = requests.post(f"{BASE_URL}/api/user/save-content", headers=headers,
+                                  json={'content_id': content_id})
+    passed = passed and get_dashboard(headers) is not None
+
+    if save_response.status_code == 200:
+        requests.delete(f"{BASE_URL}/api/user/unsave-content/{content_id}", headers=headers)
+        passed = passed and get_dashboard(headers) is not None
+
+    if passed:
+        print("\n✅ Dashboard built and served without errors")
+    else:
+        print("\n❌ Dashboard requests failed")
+    assert passed
+
+if __name__ == "__main__":
+    try:
+        test_user_dashboard()
+        print("\n🎉 All tests completed!")
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
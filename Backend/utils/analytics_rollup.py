@@ -0,0 +1,269 @@
+"""
+Analytics Rollup Utility
+
+This module maintains Content_Analytics_Daily, a rollup of content counts and
+engagement totals per creation date, content type, creator and status, so the
+analytics dashboards aggregate a few rollup rows instead of scanning Content
+and Content_Metrics on every load.
+
+Refreshes are incremental. Content whose row or metrics changed since the
+last high-water mark is re-read, its previous contribution (kept in
+Content_Analytics_Snapshot) is subtracted from the rollup and its current
+values are added. Re-processing a content item is therefore harmless, which
+lets each refresh overlap the previous one by a few seconds.
+"""
+
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Callable, Dict, List, Optional
+
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Name of the refresh state row and of the MySQL lock that serializes refreshes
+REFRESH_NAME = 'content_analytics_daily'
+
+# Seconds re-read before the high-water mark to cover changes committed late
+HIGH_WATER_OVERLAP = 5
+
+# Content IDs folded into the rollup per transaction
+REFRESH_BATCH_SIZE = 500
+
+# Current values of one content item, in the same column order as the snapshot
+CURRENT_VALUES_SQL = """
+    SELECT c.Content_ID,
+           DATE(c.Created_At),
+           COALESCE(c.Content_Type, ''),
+           COALESCE(c.User_ID, 0),
+           COALESCE(c.Status, ''),
+           COALESCE(cm.Views, 0),
+           COALESCE(cm.Likes, 0),
+           COALESCE(cm.Shares, 0),
+           COALESCE(cm.Comments_Count, 0),
+           COALESCE(cm.Applications_Count, 0),
+           COALESCE(cm.Avg_Time_Spent, 0),
+           COALESCE(cm.Bounce_Rate, 0),
+           c.Created_At
+    FROM Content c
+    LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
+    WHERE c.Content_ID IN ({placeholders}) AND c.Created_At IS NOT NULL
+"""
+
+# The snapshot shares column names with the rollup, so in INSERT ... SELECT
+# every rollup column in the UPDATE clause must be qualified (ERROR 1052 otherwise)
+ROLLUP_UPSERT_SQL = """
+    INSERT INTO Content_Analytics_Daily
+        (Created_Date, Content_Type, Creator_ID, Status, Content_Count, Views, Likes, Shares,
+         Comments, Applications, Time_Spent_Sum, Bounce_Rate_Sum, Last_Created_At)
+    {select}
+    ON DUPLICATE KEY UPDATE
+        Content_Count = Content_Analytics_Daily.Content_Count + VALUES(Content_Count),
+        Views = Content_Analytics_Daily.Views + VALUES(Views),
+        Likes = Content_Analytics_Daily.Likes + VALUES(Likes),
+        Shares = Content_Analytics_Daily.Shares + VALUES(Shares),
+        Comments = Content_Analytics_Daily.Comments + VALUES(Comments),
+        Applications = Content_Analytics_Daily.Applications + VALUES(Applications),
+        Time_Spent_Sum = Content_Analytics_Daily.Time_Spent_Sum + VALUES(Time_Spent_Sum),
+        Bounce_Rate_Sum = Content_Analytics_Daily.Bounce_Rate_Sum + VALUES(Bounce_Rate_Sum),
+        Last_Created_At = GREATEST(COALESCE(Content_Analytics_Daily.Last_Created_At, VALUES(Last_Created_At)),
+                                   COALESCE(VALUES(Last_Created_At), Content_Analytics_Daily.Last_Created_At))
+"""
+
+
+class AnalyticsRollup:
+    """
+    Incremental refresher for Content_Analytics_Daily.
+
+    A background thread calls refresh() every interval seconds. Refreshes from
+    several processes are serialized with a MySQL named lock; a process that
+    finds the lock taken skips its turn.
+    """
+
+    def __init__(self, connection_factory: Callable, interval: float = 60.0,
+                 batch_size: int = REFRESH_BATCH_SIZE):
+        """
+        Initialize the refresher.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            interval (float): Seconds between refreshes; 0 or less disables the timer
+            batch_size (int): Content IDs folded into the rollup per transaction
+        """
+        self._connection_factory = connection_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self.last_refresh: Optional[float] = None
+        self.last_result: Optional[Dict] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the periodic refresh (no-op when disabled or already running)"""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name='analytics-rollup', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the periodic refresh"""
+        self._stopped.set()
+
+    def refresh(self, full: bool = False) -> Dict:
+        """
+        Fold content changed since the high-water mark into the rollup.
+
+        Args:
+            full (bool): Re-read every content item and drop snapshot rows for
+                content that no longer exists
+
+        Returns:
+            Dict: 'refreshed' content count, 'high_water_mark' and 'skipped'
+                (True when another process holds the refresh lock)
+        """
+        metrics = get_metrics_registry()
+        start = time.perf_counter()
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT GET_LOCK(%s, 0)", (REFRESH_NAME,))
+            if cursor.fetchone()[0] != 1:
+                return {'refreshed': 0, 'high_water_mark': None, 'skipped': True}
+
+            try:
+                cursor.execute("SELECT NOW()")
+                new_mark = cursor.fetchone()[0]
+                since = None if full else self._high_water_mark(cursor)
+                conn.commit()
+
+                content_ids = self._changed_content_ids(cursor, since)
+                if full:
+                    content_ids = sorted(set(content_ids) | set(self._orphaned_content_ids(cursor)))
+
+                for offset in range(0, len(content_ids), self.batch_size):
+                    self._fold_batch(conn, cursor, content_ids[offset:offset + self.batch_size])
+
+                cursor.execute("DELETE FROM Content_Analytics_Daily WHERE Content_Count <= 0")
+                cursor.execute("""
+                    INSERT INTO Analytics_Refresh_State (Name, High_Water_Mark, Last_Refreshed_At, Last_Row_Count)
+                    VALUES (%s, %s, NOW(), %s)
+                    ON DUPLICATE KEY UPDATE
+                        High_Water_Mark = VALUES(High_Water_Mark),
+                        Last_Refreshed_At = NOW(),
+                        Last_Row_Count = VALUES(Last_Row_Count)
+                """, (REFRESH_NAME, new_mark, len(content_ids)))
+                conn.commit()
+            finally:
+                cursor.execute("SELECT RELEASE_LOCK(%s)", (REFRESH_NAME,))
+                cursor.fetchone()
+        except Exception:
+            conn.rollback()
+            metrics.counter('analytics_rollup_errors_total').inc()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        metrics.histogram('analytics_rollup_refresh_seconds').observe(time.perf_counter() - start)
+        metrics.counter('analytics_rollup_content_refreshed_total').inc(len(content_ids))
+        self.last_refresh = time.time()
+        self.last_result = {'refreshed': len(content_ids), 'high_water_mark': new_mark.isoformat(),
+                            'skipped': False}
+        return self.last_result
+
+    def status(self) -> Dict:
+        """
+        Describe the last refresh of this process.
+
+        Returns:
+            Dict: Interval, seconds since the last refresh and its result
+        """
+        return {
+            'interval': self.interval,
+            'seconds_since_refresh': round(time.time() - self.last_refresh, 1) if self.last_refresh else None,
+            'last_result': self.last_result,
+        }
+
+    @staticmethod
+    def _high_water_mark(cursor):
+        cursor.execute("SELECT High_Water_Mark FROM Analytics_Refresh_State WHERE Name = %s", (REFRESH_NAME,))
+        row = cursor.fetchone()
+        if not row or row[0] is None:
+            return None
+        return row[0] - timedelta(seconds=HIGH_WATER_OVERLAP)
+
+    @staticmethod
+    def _changed_content_ids(cursor, since) -> List[int]:
+        """Content whose row or metrics changed since the mark (all content when since is None)"""
+        if since is None:
+            cursor.execute("SELECT Content_ID FROM Content ORDER BY Content_ID")
+        else:
+            # Two index range scans instead of an OR across the join
+            cursor.execute("""
+                SELECT Content_ID FROM Content WHERE Updated_At >= %s
+                UNION
+                SELECT Content_ID FROM Content_Metrics WHERE Last_Updated >= %s AND Content_ID IS NOT NULL
+                ORDER BY Content_ID
+            """, (since, since))
+        return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def _orphaned_content_ids(cursor) -> List[int]:
+        """Snapshot rows whose content was hard-deleted"""
+        cursor.execute("""
+            SELECT s.Content_ID
+            FROM Content_Analytics_Snapshot s
+            LEFT JOIN Content c ON s.Content_ID = c.Content_ID
+            WHERE c.Content_ID IS NULL
+        """)
+        return [row[0] for row in cursor.fetchall()]
+
+    @staticmethod
+    def _fold_batch(conn, cursor, content_ids: List[int]):
+        """Replace the previous contribution of each content item with its current values"""
+        placeholders = ', '.join(['%s'] * len(content_ids))
+        try:
+            # Subtract what these items contributed at the previous refresh
+            cursor.execute(ROLLUP_UPSERT_SQL.format(select=f"""
+                SELECT s.Created_Date, s.Content_Type, s.Creator_ID, s.Status, -1, -s.Views, -s.Likes,
+                       -s.Shares, -s.Comments, -s.Applications, -s.Time_Spent, -s.Bounce_Rate, NULL
+                FROM Content_Analytics_Snapshot s
+                WHERE s.Content_ID IN ({placeholders})
+            """), content_ids)
+
+            cursor.execute(f"DELETE FROM Content_Analytics_Snapshot WHERE Content_ID IN ({placeholders})",
+                           content_ids)
+
+            current = CURRENT_VALUES_SQL.format(placeholders=placeholders)
+            cursor.execute(f"""
+                INSERT INTO Content_Analytics_Snapshot
+                    (Content_ID, Created_Date, Content_Type, Creator_ID, Status, Views, Likes, Shares,
+                     Comments, Applications, Time_Spent, Bounce_Rate, Created_At)
+                {current}
+            """, content_ids)
+
+            # Add their current values
+            cursor.execute(ROLLUP_UPSERT_SQL.format(select=f"""
+                SELECT s.Created_Date, s.Content_Type, s.Creator_ID, s.Status, 1, s.Views, s.Likes,
+                       s.Shares, s.Comments, s.Applications, s.Time_Spent, s.Bounce_Rate, s.Created_At
+                FROM Content_Analytics_Snapshot s
+                WHERE s.Content_ID IN ({placeholders})
+            """), content_ids)
+
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _loop(self):
+        # Refresh once at start-up so a restart does not leave dashboards a full interval behind
+        while not self._stopped.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Analytics rollup refresh failed: {e}")
+            self._stopped.wait(self.interval)
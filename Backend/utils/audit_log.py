@@ -0,0 +1,356 @@
+"""
+Audit Log Utility
+
+This module writes Audit_Logs rows through an in-memory queue flushed by a
+background thread, so an admin action does not pay for its own audit INSERT
+and commit: every entry queued during a flush interval is written with
+multi-row INSERTs and a single commit. Each entry keeps the time it was
+logged, not the time it was flushed.
+
+AuditLogArchiver moves entries past the retention window to
+Audit_Logs_Archive in bounded batches. The archive is partitioned by month,
+so date-range queries over old entries read only the months they cover;
+the archiver adds the monthly partitions before moving rows into them.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from utils.buffered_writer import BufferedWriter
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# MySQL error raised when Admin_ID references a deleted user
+FOREIGN_KEY_ERRNO = 1452
+
+# Rows per INSERT statement
+INSERT_CHUNK_SIZE = 500
+
+# Entries moved to the archive per transaction
+ARCHIVE_BATCH_SIZE = 1000
+
+# MySQL lock held while archiving, so only one process archives at a time
+ARCHIVE_LOCK_NAME = 'audit_logs_archive'
+
+# (Admin_ID, Action_Type, Action_Details, Timestamp)
+AuditEntry = Tuple[Optional[int], str, str, datetime]
+
+
+def to_days(day: date) -> int:
+    """MySQL TO_DAYS() of a date"""
+    return day.toordinal() + 365
+
+
+def next_month(day: date) -> date:
+    """First day of the month after day"""
+    return date(day.year + day.month // 12, day.month % 12 + 1, 1)
+
+
+def insert_audit_entry(cursor, admin_id: Optional[int], action_type: str, details: str,
+                       timestamp: Optional[datetime] = None):
+    """Write one audit entry in the caller's transaction (a deleted admin is stored as NULL)"""
+    cursor.execute("""
+        INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details, Timestamp)
+        SELECT (SELECT User_ID FROM Users WHERE User_ID = %s), %s, %s, %s
+    """, (admin_id, action_type, details, timestamp or datetime.now()))
+
+
+class AuditLogWriter(BufferedWriter):
+    """
+    Group-commit writer for Audit_Logs.
+
+    Entries are flushed every flush_interval seconds or once flush_threshold
+    are pending. A failed flush keeps the batch for the next attempt; only
+    past max_pending are the oldest entries dropped (and logged as errors).
+    """
+
+    def __init__(self, connection_factory: Callable, flush_interval: float = 1.0,
+                 flush_threshold: int = 200, max_pending: int = 100000):
+        """
+        Initialize the writer.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            flush_interval (float): Maximum seconds an entry waits
+            flush_threshold (int): Pending entries that trigger an early flush
+            max_pending (int): Maximum entries kept in memory (oldest dropped first)
+        """
+        super().__init__('audit-log', flush_interval, flush_threshold)
+        self._connection_factory = connection_factory
+        self.max_pending = max_pending
+        self._pending = deque()
+
+    def log(self, admin_id: Optional[int], action_type: str, details: str,
+            timestamp: Optional[datetime] = None):
+        """
+        Queue one audit entry.
+
+        Args:
+            admin_id (Optional[int]): User who performed the action
+            action_type (str): Action, e.g. 'Update User Role'
+            details (str): Human-readable description
+            timestamp (Optional[datetime]): When it happened (default: now)
+        """
+        self.log_many([(admin_id, action_type, details, timestamp or datetime.now())])
+
+    def log_many(self, entries: Iterable[AuditEntry]):
+        """Queue several (admin_id, action_type, details, timestamp) entries"""
+        entries = list(entries)
+        if not entries:
+            return
+        with self._lock:
+            self._pending.extend(entries)
+            dropped = self._trim()
+            pending_size = len(self._pending)
+        get_metrics_registry().counter('audit_entries_logged_total').inc(len(entries))
+        if dropped:
+            logger.error(f"Audit log queue full, dropped {dropped} oldest entries")
+        self.start()
+        self._pending_changed(pending_size)
+
+    def pending(self) -> int:
+        """Number of queued entries"""
+        with self._lock:
+            return len(self._pending)
+
+    # BufferedWriter hooks
+
+    def _drain(self) -> Optional[List[AuditEntry]]:
+        if not self._pending:
+            return None
+        batch = list(self._pending)
+        self._pending.clear()
+        return batch
+
+    def _write(self, batch: List[AuditEntry]) -> int:
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            try:
+                self._insert(cursor, batch)
+            except Exception as e:
+                if getattr(e, 'errno', None) != FOREIGN_KEY_ERRNO:
+                    raise
+                # An admin was deleted since acting; keep the entry without the reference
+                conn.rollback()
+                batch = self._without_missing_admins(cursor, batch)
+                self._insert(cursor, batch)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        get_metrics_registry().counter('audit_entries_written_total').inc(len(batch))
+        return len(batch)
+
+    def _requeue(self, batch: List[AuditEntry]):
+        self._pending.extendleft(reversed(batch))
+        dropped = self._trim()
+        if dropped:
+            logger.error(f"Audit log queue full, dropped {dropped} oldest entries")
+
+    def _trim(self) -> int:
+        dropped = max(0, len(self._pending) - self.max_pending)
+        for _ in range(dropped):
+            self._pending.popleft()
+        if dropped:
+            get_metrics_registry().counter('audit_entries_dropped_total').inc(dropped)
+        return dropped
+
+    @staticmethod
+    def _insert(cursor, entries: List[AuditEntry]):
+        for start in range(0, len(entries), INSERT_CHUNK_SIZE):
+            chunk = entries[start:start + INSERT_CHUNK_SIZE]
+            placeholders = ', '.join(['(%s, %s, %s, %s)'] * len(chunk))
+            cursor.execute(f"""
+                INSERT INTO Audit_Logs (Admin_ID, Action_Type, Action_Details, Timestamp)
+                VALUES {placeholders}
+            """, [value for entry in chunk for value in entry])
+
+    @staticmethod
+    def _without_missing_admins(cursor, entries: List[AuditEntry]) -> List[AuditEntry]:
+        admin_ids = sorted({entry[0] for entry in entries if entry[0] is not None})
+        placeholders = ', '.join(['%s'] * len(admin_ids))
+        cursor.execute(f"SELECT User_ID FROM Users WHERE User_ID IN ({placeholders})", admin_ids)
+        existing = {row[0] for row in cursor.fetchall()}
+        return [entry if entry[0] in existing else (None,) + tuple(entry[1:]) for entry in entries]
+
+
+class AuditLogArchiver:
+    """
+    Moves audit entries older than retention_days to Audit_Logs_Archive on a timer.
+
+    Each batch copies and deletes up to batch_size rows in one transaction,
+    so locks are short and an interrupted pass loses nothing.
+    """
+
+    def __init__(self, connection_factory: Callable, interval: float = 86400.0, retention_days: int = 180,
+                 batch_size: int = ARCHIVE_BATCH_SIZE, max_batches: int = 100):
+        """
+        Initialize the archiver.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            interval (float): Seconds between passes; 0 or less disables the timer
+            retention_days (int): Days an entry stays in Audit_Logs (minimum 1)
+            batch_size (int): Rows moved per transaction
+            max_batches (int): Batches per pass (the rest waits for the next pass)
+        """
+        self._connection_factory = connection_factory
+        self.interval = interval
+        self.retention_days = max(1, retention_days)
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.last_result: Optional[Dict] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the periodic archiving (no-op when disabled or already running)"""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name='audit-log-archiver', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the periodic archiving"""
+        self._stopped.set()
+
+    def archive(self) -> Dict:
+        """
+        Move one pass worth of old audit entries to the archive.
+
+        Returns:
+            Dict: 'archived' rows, 'batches' run, 'partitions_added', 'remaining'
+                (True when the batch limit was hit) and 'skipped' (True when
+                another process is archiving)
+        """
+        metrics = get_metrics_registry()
+        start = time.perf_counter()
+        archived = batches = partitions_added = 0
+        remaining = False
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT GET_LOCK(%s, 0)", (ARCHIVE_LOCK_NAME,))
+            if cursor.fetchone()[0] != 1:
+                return {'archived': 0, 'batches': 0, 'partitions_added': 0, 'remaining': False, 'skipped': True}
+
+            try:
+                cutoff = datetime.now() - timedelta(days=self.retention_days)
+                partitions_added = self._add_partitions(cursor, cutoff.date())
+                while batches < self.max_batches:
+                    moved = self._archive_batch(conn, cursor, cutoff)
+                    archived += moved
+                    batches += 1
+                    if moved < self.batch_size:
+                        break
+                else:
+                    remaining = True
+            finally:
+                cursor.execute("SELECT RELEASE_LOCK(%s)", (ARCHIVE_LOCK_NAME,))
+                cursor.fetchone()
+        except Exception:
+            metrics.counter('audit_archive_errors_total').inc()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        metrics.counter('audit_entries_archived_total').inc(archived)
+        metrics.histogram('audit_archive_seconds').observe(time.perf_counter() - start)
+        self.last_result = {'archived': archived, 'batches': batches, 'partitions_added': partitions_added,
+                            'remaining': remaining, 'skipped': False}
+        return self.last_result
+
+    def _add_partitions(self, cursor, cutoff: date) -> int:
+        """
+        Split monthly partitions off the archive's catch-all partition up to the cutoff month.
+
+        Rows are only archived into months that already have a partition, so
+        the catch-all stays empty and splitting it copies nothing.
+        """
+        cursor.execute("""
+            SELECT MAX(CAST(PARTITION_DESCRIPTION AS UNSIGNED))
+            FROM INFORMATION_SCHEMA.PARTITIONS
+            WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'Audit_Logs_Archive'
+              AND PARTITION_DESCRIPTION <> 'MAXVALUE'
+        """)
+        last_boundary = cursor.fetchone()[0]
+        if last_boundary is None:
+            # Archive is not partitioned (older MySQL or a hand-made table)
+            return 0
+
+        cursor.execute("SELECT MIN(Timestamp) FROM Audit_Logs WHERE Timestamp < %s", (cutoff,))
+        oldest = cursor.fetchone()[0]
+        if oldest is None:
+            return 0
+
+        month = oldest.date().replace(day=1)
+        partitions = []
+        while month <= cutoff:
+            boundary = next_month(month)
+            if to_days(boundary) > last_boundary:
+                partitions.append(
+                    f"PARTITION p{month:%Y%m} VALUES LESS THAN ({to_days(boundary)})"
+                )
+            month = boundary
+        if not partitions:
+            return 0
+
+        cursor.execute(f"""
+            ALTER TABLE Audit_Logs_Archive REORGANIZE PARTITION pmax INTO (
+                {', '.join(partitions)},
+                PARTITION pmax VALUES LESS THAN MAXVALUE
+            )
+        """)
+        logger.info(f"Added {len(partitions)} monthly partitions to Audit_Logs_Archive")
+        return len(partitions)
+
+    def _archive_batch(self, conn, cursor, cutoff) -> int:
+        """Copy and delete the oldest batch_size entries logged before cutoff"""
+        try:
+            # Oldest first along idx_audit_logs_timestamp, locked until commit
+            cursor.execute("""
+                SELECT Log_ID
+                FROM Audit_Logs
+                WHERE Timestamp < %s
+                ORDER BY Timestamp
+                LIMIT %s
+                FOR UPDATE
+            """, (cutoff, self.batch_size))
+            log_ids = [row[0] for row in cursor.fetchall()]
+            if not log_ids:
+                conn.rollback()
+                return 0
+
+            placeholders = ', '.join(['%s'] * len(log_ids))
+            cursor.execute(f"""
+                INSERT IGNORE INTO Audit_Logs_Archive (Log_ID, Admin_ID, Action_Type, Action_Details, Timestamp)
+                SELECT Log_ID, Admin_ID, Action_Type, Action_Details, Timestamp
+                FROM Audit_Logs
+                WHERE Log_ID IN ({placeholders})
+            """, log_ids)
+            cursor.execute(f"DELETE FROM Audit_Logs WHERE Log_ID IN ({placeholders})", log_ids)
+            conn.commit()
+            return len(log_ids)
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _loop(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.archive()
+            except Exception as e:
+                logger.error(f"Audit log archiving failed: {e}")
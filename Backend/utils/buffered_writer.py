@@ -0,0 +1,140 @@
+"""
+Buffered Writer Utility
+
+This module provides a base class for services that collect writes in
+memory and flush them to MySQL in batches, either on a timer or when enough
+work has accumulated. A final flush runs when the process exits normally,
+so only a hard crash can lose buffered data, and at most one flush interval
+(or flush threshold) worth of it.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class BufferedWriter(ABC):
+    """
+    Base class for timer/threshold flushed write buffers.
+
+    Subclasses own the pending buffer and implement three hooks:
+
+    - _drain(): atomically take the pending batch (or None when empty)
+    - _write(batch): persist a batch; raising leaves it to _requeue
+    - _requeue(batch): put a failed batch back for the next flush
+
+    Subclasses call _pending_changed(size) after buffering so the flush
+    thread wakes early once flush_threshold is reached.
+    """
+
+    def __init__(self, name: str, flush_interval: float = 5.0, flush_threshold: int = 500):
+        """
+        Initialize the writer.
+
+        Args:
+            name (str): Name used in logs and metrics
+            flush_interval (float): Maximum seconds between flushes
+            flush_threshold (int): Pending size that triggers an early flush
+        """
+        self.name = name
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        """Start the background flush thread (idempotent)"""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=f"{self.name}-flusher", daemon=True
+            )
+            self._thread.start()
+            atexit.register(self.stop)
+            logger.info(f"{self.name} started (interval {self.flush_interval}s, threshold {self.flush_threshold})")
+
+    def stop(self, timeout: float = 10.0):
+        """Stop the flush thread and write whatever is still buffered"""
+        self._stopped.set()
+        self._wake.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._thread = None
+        self.flush()
+
+    def flush(self) -> int:
+        """
+        Write the pending batch now.
+
+        Returns:
+            int: Number of items written (0 when empty or on failure)
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch = self._drain()
+            if not batch:
+                return 0
+
+            metrics = get_metrics_registry()
+            start = time.perf_counter()
+            try:
+                written = self._write(batch)
+            except Exception as e:
+                logger.error(f"{self.name} flush failed, keeping batch for retry: {e}")
+                metrics.counter('buffered_writer_flush_errors_total', {'writer': self.name}).inc()
+                with self._lock:
+                    self._requeue(batch)
+                return 0
+
+            metrics.histogram('buffered_writer_flush_seconds', {'writer': self.name}).observe(
+                time.perf_counter() - start)
+            return written
+
+    def _pending_changed(self, pending_size: int):
+        """Wake the flush thread early when the buffer reaches the threshold"""
+        if pending_size >= self.flush_threshold:
+            self._wake.set()
+
+    def _run(self):
+        """Flush loop: every flush_interval, or sooner when woken"""
+        while not self._stopped.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._stopped.is_set():
+                break
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"{self.name} flush loop error: {e}")
+
+    # Hooks implemented by subclasses (called with self._lock held, except _write)
+
+    @abstractmethod
+    def _drain(self) -> Any:
+        pass
+
+    @abstractmethod
+    def _write(self, batch: Any) -> int:
+        pass
+
+    @abstractmethod
+    def _requeue(self, batch: Any):
+        pass
@@ -0,0 +1,128 @@
+"""
+HTTP Response Compression Utility
+
+This module negotiates gzip/brotli Content-Encoding for JSON responses
+based on the client's Accept-Encoding header.
+"""
+
+import gzip
+import logging
+from functools import wraps
+from typing import Optional
+
+from flask import request, make_response
+
+# Brotli is optional; without it only gzip is offered
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Responses smaller than this are sent uncompressed
+MIN_COMPRESS_SIZE = 1024
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the best supported encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding (str): Raw Accept-Encoding header value
+
+    Returns:
+        Optional[str]: 'br', 'gzip' or None when no supported encoding is acceptable
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(','):
+        token, _, params = part.strip().partition(';')
+        token = token.strip().lower()
+        if not token:
+            continue
+
+        quality = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[token] = quality
+
+    supported = ['br', 'gzip'] if brotli is not None else ['gzip']
+    best = None
+    best_quality = 0.0
+    for encoding in supported:
+        quality = accepted.get(encoding, accepted.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+
+    return best
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """
+    Compress a response body with the given encoding.
+
+    Args:
+        body (bytes): Uncompressed body
+        encoding (str): 'br' or 'gzip'
+
+    Returns:
+        bytes: Compressed body
+    """
+    if encoding == 'br':
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL)
+
+
+def compress_response(response, min_size: int = MIN_COMPRESS_SIZE):
+    """
+    Compress a Flask response in place when the client accepts it.
+
+    Streamed responses (such as Server-Sent Events), error responses and
+    bodies below min_size are left untouched.
+    """
+    response.vary.add('Accept-Encoding')
+
+    if (response.direct_passthrough or response.is_streamed or
+            response.status_code < 200 or response.status_code >= 300 or
+            'Content-Encoding' in response.headers):
+        return response
+
+    encoding = choose_encoding(request.headers.get('Accept-Encoding'))
+    if not encoding:
+        return response
+
+    body = response.get_data()
+    if len(body) < min_size:
+        return response
+
+    try:
+        response.set_data(compress_body(body, encoding))
+        response.headers['Content-Encoding'] = encoding
+    except Exception as e:
+        logger.warning(f"Response compression failed, sending uncompressed: {e}")
+
+    return response
+
+
+def compressed(view):
+    """
+    Decorator that applies gzip/brotli negotiation to a view's response.
+    """
+    @wraps(view)
+    def decorated_function(*args, **kwargs):
+        response = make_response(view(*args, **kwargs))
+        return compress_response(response)
+
+    return decorated_function
@@ -0,0 +1,192 @@
+"""
+Content Counters Utility
+
+This module keeps the denormalized counters in Content_Metrics
+(Comments_Count, Applications_Count) in step with the rows they count.
+Handlers apply +1/-1 deltas in the same transaction as the insert, and a
+reconciliation pass recomputes the counters in Content_ID ranges and
+corrects any row that has drifted (manual SQL, failed deltas, old data).
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Counter column -> query returning (Content_ID, actual) for a Content_ID range
+COUNTER_SOURCES = {
+    'Comments_Count': """
+        SELECT cc.Content_ID, COUNT(*) AS actual
+        FROM Content_Comments cc
+        WHERE cc.Status = 'Active' AND cc.Content_ID BETWEEN %(start)s AND %(end)s
+        GROUP BY cc.Content_ID
+    """,
+    'Applications_Count': """
+        SELECT apps.Content_ID, SUM(apps.total) AS actual
+        FROM (
+            SELECT j.Content_ID, COUNT(*) AS total
+            FROM Job_Applications ja
+            JOIN Jobs j ON ja.Job_ID = j.Job_ID
+            WHERE j.Content_ID BETWEEN %(start)s AND %(end)s
+            GROUP BY j.Content_ID
+            UNION ALL
+            SELECT i.Content_ID, COUNT(*) AS total
+            FROM Internship_Applications ia
+            JOIN Internships i ON ia.Internship_ID = i.Internship_ID
+            WHERE i.Content_ID BETWEEN %(start)s AND %(end)s
+            GROUP BY i.Content_ID
+        ) apps
+        GROUP BY apps.Content_ID
+    """,
+}
+
+# Content IDs reconciled per transaction
+RECONCILE_BATCH_SIZE = 1000
+
+
+def increment_content_counter(cursor, content_id: int, column: str, delta: int = 1):
+    """
+    Apply a delta to one Content_Metrics counter, creating the metrics row if needed.
+
+    The caller commits, so the counter changes atomically with the row it counts.
+
+    Args:
+        cursor: Open cursor inside the caller's transaction
+        content_id (int): Content ID
+        column (str): Counter column (a key of COUNTER_SOURCES)
+        delta (int): Amount to add (negative to decrement)
+    """
+    if column not in COUNTER_SOURCES:
+        raise ValueError(f"Unknown content counter: {column}")
+
+    cursor.execute(f"""
+        INSERT INTO Content_Metrics (Content_ID, {column}, Last_Updated)
+        VALUES (%s, %s, NOW())
+        ON DUPLICATE KEY UPDATE
+            {column} = GREATEST({column} + %s, 0),
+            Last_Updated = NOW()
+    """, (content_id, max(delta, 0), delta))
+
+
+def reconcile_content_counters(connection_factory: Callable,
+                               batch_size: int = RECONCILE_BATCH_SIZE) -> Dict[str, int]:
+    """
+    Recompute every counter and fix rows that have drifted.
+
+    Works through Content_ID ranges of batch_size, one short transaction per
+    range, so the pass never holds locks on the whole metrics table.
+
+    Args:
+        connection_factory (Callable): Returns a pooled MySQL connection
+        batch_size (int): Content IDs per transaction
+
+    Returns:
+        Dict[str, int]: Rows corrected per counter column, plus 'metrics_rows_created'
+    """
+    metrics = get_metrics_registry()
+    corrected = {column: 0 for column in COUNTER_SOURCES}
+    corrected['metrics_rows_created'] = 0
+
+    conn = connection_factory()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT COALESCE(MIN(Content_ID), 0), COALESCE(MAX(Content_ID), 0) FROM Content")
+        first_id, last_id = cursor.fetchone()
+
+        for start in range(first_id, last_id + 1, batch_size):
+            id_range = {'start': start, 'end': start + batch_size - 1}
+            try:
+                # Content without a metrics row would never show up in the UPDATE join
+                cursor.execute("""
+                    INSERT INTO Content_Metrics (Content_ID)
+                    SELECT c.Content_ID
+                    FROM Content c
+                    LEFT JOIN Content_Metrics cm ON c.Content_ID = cm.Content_ID
+                    WHERE c.Content_ID BETWEEN %(start)s AND %(end)s AND cm.Content_ID IS NULL
+                """, id_range)
+                corrected['metrics_rows_created'] += cursor.rowcount
+
+                for column, source in COUNTER_SOURCES.items():
+                    cursor.execute(f"""
+                        UPDATE Content_Metrics cm
+                        LEFT JOIN ({source}) counted ON counted.Content_ID = cm.Content_ID
+                        SET cm.{column} = COALESCE(counted.actual, 0)
+                        WHERE cm.Content_ID BETWEEN %(start)s AND %(end)s
+                          AND cm.{column} <> COALESCE(counted.actual, 0)
+                    """, id_range)
+                    if cursor.rowcount:
+                        corrected[column] += cursor.rowcount
+                        metrics.counter('content_counter_drift_total', {'counter': column}).inc(cursor.rowcount)
+
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+    finally:
+        cursor.close()
+        conn.close()
+
+    metrics.counter('content_counter_reconciliations_total').inc()
+    drifted = {column: count for column, count in corrected.items() if count}
+    if drifted:
+        logger.warning(f"Content counter reconciliation corrected {drifted}")
+    return corrected
+
+
+class CounterReconciler:
+    """
+    Runs reconcile_content_counters on a fixed interval in a daemon thread.
+    """
+
+    def __init__(self, connection_factory: Callable, interval: float = 3600.0):
+        """
+        Initialize the reconciler.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            interval (float): Seconds between passes; 0 or less disables the timer
+        """
+        self._connection_factory = connection_factory
+        self.interval = interval
+        self.last_run: Optional[float] = None
+        self.last_result: Optional[Dict[str, int]] = None
+        self._run_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the periodic pass (no-op when disabled or already running)"""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name='counter-reconciler', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the periodic pass"""
+        self._stopped.set()
+
+    def run_once(self) -> Dict[str, int]:
+        """
+        Run one pass now; concurrent callers wait for the running pass.
+
+        Returns:
+            Dict[str, int]: Rows corrected per counter
+        """
+        with self._run_lock:
+            result = reconcile_content_counters(self._connection_factory)
+            self.last_run = time.time()
+            self.last_result = result
+            return result
+
+    def _loop(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Content counter reconciliation failed: {e}")
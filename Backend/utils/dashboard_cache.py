@@ -0,0 +1,167 @@
+"""
+Dashboard Cache Utility
+
+This module caches per-user dashboard payloads in memory with a short TTL
+and stale-while-revalidate: after the TTL a cached payload is still served
+for a grace period while one background refresh recomputes it. Concurrent
+misses for the same key are coalesced (single-flight), so a burst of page
+refreshes runs the dashboard queries once. Writes that change a dashboard
+invalidate that user's entries directly.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """One in-progress computation that concurrent callers wait on"""
+
+    __slots__ = ('done', 'value', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class DashboardCache:
+    """
+    Per-user cache keyed by (scope, user_id).
+
+    An entry is fresh for ttl seconds and may be served stale for a further
+    stale_ttl seconds while it is recomputed in the background. Invalidated
+    entries are dropped, so the next request recomputes synchronously and
+    sees its own write.
+    """
+
+    def __init__(self, ttl: float = 30.0, stale_ttl: float = 300.0,
+                 max_entries: int = 10000, refresh_workers: int = 2):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl (float): Seconds an entry is served without recomputation
+            stale_ttl (float): Extra seconds a stale entry is served while refreshing
+            max_entries (int): Maximum cached entries (least recently used evicted)
+            refresh_workers (int): Threads used for background refreshes
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[Tuple[str, Hashable], Tuple[Any, float]]' = OrderedDict()
+        self._inflight: Dict[Tuple[str, Hashable], _Flight] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers,
+                                            thread_name_prefix='dashboard-refresh')
+
+    def get(self, scope: str, user_id: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached payload, computing or refreshing it as needed.
+
+        Args:
+            scope (str): Dashboard name, e.g. 'user_dashboard'
+            user_id (Hashable): User the payload belongs to
+            loader (Callable[[], Any]): Computes the payload; must not depend on the request context
+
+        Returns:
+            Any: The payload (treat as read-only, it is shared between requests)
+        """
+        key = (scope, user_id)
+        metrics = get_metrics_registry()
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, computed_at = entry
+                age = now - computed_at
+                if age < self.ttl:
+                    self._entries.move_to_end(key)
+                    metrics.counter('dashboard_cache_requests_total', {'scope': scope, 'result': 'hit'}).inc()
+                    return value
+                if age < self.ttl + self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    if key not in self._inflight:
+                        flight = self._inflight[key] = _Flight()
+                        self._executor.submit(self._compute, key, loader, flight)
+                    metrics.counter('dashboard_cache_requests_total', {'scope': scope, 'result': 'stale'}).inc()
+                    return value
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = _Flight()
+
+        metrics.counter('dashboard_cache_requests_total',
+                        {'scope': scope, 'result': 'miss' if leader else 'coalesced'}).inc()
+        if leader:
+            self._compute(key, loader, flight)
+        else:
+            flight.done.wait()
+
+        if flight.error is not None:
+            raise flight.error
+        return flight.value
+
+    def invalidate(self, user_id: Hashable, *scopes: str):
+        """
+        Drop cached payloads for a user.
+
+        Args:
+            user_id (Hashable): User whose dashboards changed
+            *scopes (str): Dashboards to drop; all of the user's dashboards when omitted
+        """
+        if user_id is None:
+            return
+        with self._lock:
+            keys = [(scope, user_id) for scope in scopes] if scopes else \
+                [key for key in {*self._entries, *self._inflight} if key[1] == user_id]
+            for key in keys:
+                self._entries.pop(key, None)
+                # A computation already running may predate the write: detach it so
+                # its result is not cached and new requests start a fresh one
+                self._inflight.pop(key, None)
+        get_metrics_registry().counter('dashboard_cache_invalidations_total').inc(len(keys))
+
+    def clear(self):
+        """Drop every cached payload"""
+        with self._lock:
+            self._inflight.clear()
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Current entry and in-flight counts"""
+        with self._lock:
+            return {'entries': len(self._entries), 'inflight': len(self._inflight)}
+
+    def _compute(self, key, loader: Callable[[], Any], flight: _Flight):
+        scope = key[0]
+        start = time.perf_counter()
+        try:
+            flight.value = loader()
+        except BaseException as e:
+            flight.error = e
+            logger.error(f"Dashboard computation failed for {key}: {e}")
+        finally:
+            get_metrics_registry().histogram('dashboard_compute_seconds', {'scope': scope}).observe(
+                time.perf_counter() - start)
+            with self._lock:
+                # Only cache results that were not invalidated while computing
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+                    if flight.error is None:
+                        self._entries[key] = (flight.value, time.monotonic())
+                        self._entries.move_to_end(key)
+                        while len(self._entries) > self.max_entries:
+                            self._entries.popitem(last=False)
+            flight.done.set()
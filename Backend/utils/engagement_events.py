@@ -0,0 +1,385 @@
+"""
+Engagement Events Utility
+
+This module records content engagement (views, likes, shares, comments and
+dwell-time pings) as an append-only event stream. Events are buffered in
+memory and written to Content_Engagement_Events in multi-row inserts.
+
+A compactor folds the raw events into Content_Engagement_Daily, one row per
+day and content item, which is what time-range analytics read. Each pass
+re-aggregates the days that can still receive events (yesterday and today)
+from the raw rows, so it is idempotent and never misses late batches. Raw
+events past the retention window are deleted in small batches afterwards.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from utils.buffered_writer import BufferedWriter
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+EVENT_TYPES = ('view', 'like', 'unlike', 'share', 'comment', 'dwell')
+
+# Event types where repeats by one viewer inside the dedupe window are dropped
+# (views are deduplicated by ViewCounter before they get here)
+DEDUPED_EVENT_TYPES = ('share',)
+
+# Longest dwell ping accepted, in seconds (longer values are clamped)
+MAX_DWELL_SECONDS = 4 * 60 * 60
+
+# A visit with a dwell shorter than this counts as a bounce
+BOUNCE_SECONDS = 10
+
+# Rows per INSERT statement
+FLUSH_CHUNK_SIZE = 500
+
+# Raw events deleted per statement during retention cleanup
+PURGE_BATCH_SIZE = 5000
+
+# Name of the compaction state row and MySQL lock
+COMPACTION_NAME = 'content_engagement_daily'
+
+
+class EngagementEventWriter(BufferedWriter):
+    """
+    Buffered, append-only writer for Content_Engagement_Events.
+
+    Events are kept in arrival order and flushed every flush_interval seconds
+    or once flush_threshold events are pending. When the buffer holds
+    max_pending events (for example during a database outage) the oldest
+    events are dropped first. Repeat DEDUPED_EVENT_TYPES events by one viewer
+    on one content item within dedupe_window seconds are ignored.
+    """
+
+    def __init__(self, connection_factory: Callable, flush_interval: float = 5.0,
+                 flush_threshold: int = 500, max_pending: int = 100000,
+                 dedupe_window: float = 1800.0, max_tracked_viewers: int = 100000):
+        """
+        Initialize the writer.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            flush_interval (float): Maximum seconds between flushes
+            flush_threshold (int): Pending events that trigger an early flush
+            max_pending (int): Maximum events kept in memory
+            dedupe_window (float): Seconds during which repeat shares by one viewer are ignored
+            max_tracked_viewers (int): Maximum (viewer, content, type) keys remembered for dedupe
+        """
+        super().__init__('engagement-events', flush_interval, flush_threshold)
+        self._connection_factory = connection_factory
+        self.max_pending = max_pending
+        self.dedupe_window = dedupe_window
+        self.max_tracked_viewers = max_tracked_viewers
+        self._pending = deque()
+        self._recent_events = OrderedDict()
+
+    def record(self, content_id: int, event_type: str, user_id: Optional[int] = None,
+               viewer_key: Optional[str] = None, value: int = 0) -> bool:
+        """
+        Buffer one engagement event.
+
+        Args:
+            content_id (int): Content ID
+            event_type (str): One of EVENT_TYPES
+            user_id (Optional[int]): Signed-in user, if any
+            viewer_key (Optional[str]): Stable viewer key (see get_viewer_key in app.py);
+                DEDUPED_EVENT_TYPES events without a key are never deduplicated
+            value (int): Event value; seconds on the page for 'dwell' events
+
+        Returns:
+            bool: True if the event was buffered, False if it was invalid or a repeat
+        """
+        if content_id is None or event_type not in EVENT_TYPES:
+            return False
+        if event_type == 'dwell':
+            value = max(0, min(int(value or 0), MAX_DWELL_SECONDS))
+
+        event = (int(content_id), event_type, user_id, (viewer_key or '')[:64] or None,
+                 int(value or 0), datetime.now().replace(microsecond=0))
+        metrics = get_metrics_registry()
+        now = time.monotonic()
+
+        with self._lock:
+            if event_type in DEDUPED_EVENT_TYPES and viewer_key:
+                key = (viewer_key, event[0], event_type)
+                last_seen = self._recent_events.get(key)
+                if last_seen is not None and now - last_seen < self.dedupe_window:
+                    metrics.counter('engagement_events_deduplicated_total', {'type': event_type}).inc()
+                    return False
+                self._recent_events[key] = now
+                self._recent_events.move_to_end(key)
+                while len(self._recent_events) > self.max_tracked_viewers:
+                    self._recent_events.popitem(last=False)
+
+            if len(self._pending) >= self.max_pending:
+                self._pending.popleft()
+                metrics.counter('engagement_events_dropped_total').inc()
+            self._pending.append(event)
+            pending = len(self._pending)
+
+        metrics.counter('engagement_events_recorded_total', {'type': event_type}).inc()
+        self.start()
+        self._pending_changed(pending)
+        return True
+
+    def _drain(self) -> Optional[List[tuple]]:
+        if not self._pending:
+            return None
+        batch = list(self._pending)
+        self._pending.clear()
+        return batch
+
+    def _requeue(self, batch: List[tuple]):
+        # Failed events go back in front of anything recorded since, oldest dropped on overflow
+        room = self.max_pending - len(self._pending)
+        if room < len(batch):
+            dropped = len(batch) - max(room, 0)
+            logger.warning(f"Engagement event buffer full, dropped {dropped} events")
+            get_metrics_registry().counter('engagement_events_dropped_total').inc(dropped)
+            batch = batch[dropped:]
+        self._pending.extendleft(reversed(batch))
+
+    def _write(self, batch: List[tuple]) -> int:
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            for start in range(0, len(batch), FLUSH_CHUNK_SIZE):
+                chunk = batch[start:start + FLUSH_CHUNK_SIZE]
+                placeholders = ', '.join(['(%s, %s, %s, %s, %s, %s)'] * len(chunk))
+                cursor.execute(f"""
+                    INSERT INTO Content_Engagement_Events
+                        (Content_ID, Event_Type, User_ID, Viewer_Key, Value, Occurred_At)
+                    VALUES {placeholders}
+                """, [value for event in chunk for value in event])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        get_metrics_registry().counter('engagement_events_flushed_total').inc(len(batch))
+        return len(batch)
+
+
+class EngagementCompactor:
+    """
+    Folds raw engagement events into Content_Engagement_Daily on a timer.
+
+    After each pass, Content_Metrics.Avg_Time_Spent and Bounce_Rate are
+    recomputed for the content that had dwell pings on the compacted days,
+    and Content_Metrics.Shares for the content that was shared on them.
+    """
+
+    def __init__(self, connection_factory: Callable, interval: float = 300.0,
+                 retention_days: int = 30):
+        """
+        Initialize the compactor.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            interval (float): Seconds between passes; 0 or less disables the timer
+            retention_days (int): Days of raw events kept after compaction (minimum 2)
+        """
+        self._connection_factory = connection_factory
+        self.interval = interval
+        self.retention_days = max(2, retention_days)
+        self.last_result: Optional[Dict] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the periodic compaction (no-op when disabled or already running)"""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name='engagement-compactor', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the periodic compaction"""
+        self._stopped.set()
+
+    def compact(self, since_date=None) -> Dict:
+        """
+        Re-aggregate raw events into daily rows.
+
+        Args:
+            since_date (Optional[date]): First day to rebuild; defaults to the day
+                before the last compacted day (or every retained day on the first run)
+
+        Returns:
+            Dict: 'days' rebuilt, 'daily_rows' written, 'purged' raw events and
+                'skipped' (True when another process holds the compaction lock)
+        """
+        metrics = get_metrics_registry()
+        start = time.perf_counter()
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT GET_LOCK(%s, 0)", (COMPACTION_NAME,))
+            if cursor.fetchone()[0] != 1:
+                return {'days': 0, 'daily_rows': 0, 'purged': 0, 'skipped': True}
+
+            try:
+                cursor.execute("SELECT CURDATE()")
+                today = cursor.fetchone()[0]
+                if since_date is None:
+                    since_date = self._resume_date(cursor, today)
+
+                daily_rows = 0
+                day = since_date
+                while day <= today:
+                    daily_rows += self._compact_day(conn, cursor, day)
+                    day += timedelta(days=1)
+
+                purged = self._purge(conn, cursor, today - timedelta(days=self.retention_days))
+
+                cursor.execute("""
+                    INSERT INTO Analytics_Refresh_State (Name, High_Water_Mark, Last_Refreshed_At, Last_Row_Count)
+                    VALUES (%s, %s, NOW(), %s)
+                    ON DUPLICATE KEY UPDATE
+                        High_Water_Mark = VALUES(High_Water_Mark),
+                        Last_Refreshed_At = NOW(),
+                        Last_Row_Count = VALUES(Last_Row_Count)
+                """, (COMPACTION_NAME, today, daily_rows))
+                conn.commit()
+            finally:
+                cursor.execute("SELECT RELEASE_LOCK(%s)", (COMPACTION_NAME,))
+                cursor.fetchone()
+        except Exception:
+            conn.rollback()
+            metrics.counter('engagement_compaction_errors_total').inc()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        metrics.histogram('engagement_compaction_seconds').observe(time.perf_counter() - start)
+        self.last_result = {'days': (today - since_date).days + 1, 'daily_rows': daily_rows,
+                            'purged': purged, 'skipped': False}
+        return self.last_result
+
+    def _resume_date(self, cursor, today):
+        """Day before the last compacted day, so late events for it are still picked up"""
+        cursor.execute("SELECT High_Water_Mark FROM Analytics_Refresh_State WHERE Name = %s",
+                       (COMPACTION_NAME,))
+        row = cursor.fetchone()
+        if row and row[0] is not None:
+            last_day = row[0].date() if isinstance(row[0], datetime) else row[0]
+            return min(last_day, today) - timedelta(days=1)
+
+        cursor.execute("SELECT DATE(MIN(Occurred_At)) FROM Content_Engagement_Events")
+        first_day = cursor.fetchone()[0]
+        return first_day or today
+
+    @staticmethod
+    def _compact_day(conn, cursor, day) -> int:
+        """Replace the daily rows for one day with a fresh aggregate of its raw events"""
+        day_start = datetime.combine(day, datetime.min.time())
+        day_end = day_start + timedelta(days=1)
+        try:
+            cursor.execute("""
+                INSERT INTO Content_Engagement_Daily
+                    (Event_Date, Content_ID, Views, Unique_Viewers, Likes, Unlikes, Shares, Comments,
+                     Dwell_Count, Dwell_Seconds, Bounces)
+                SELECT %s, e.Content_ID,
+                       SUM(e.Event_Type = 'view'),
+                       COUNT(DISTINCT CASE WHEN e.Event_Type = 'view' THEN e.Viewer_Key END),
+                       SUM(e.Event_Type = 'like'),
+                       SUM(e.Event_Type = 'unlike'),
+                       SUM(e.Event_Type = 'share'),
+                       SUM(e.Event_Type = 'comment'),
+                       SUM(e.Event_Type = 'dwell'),
+                       SUM(CASE WHEN e.Event_Type = 'dwell' THEN e.Value ELSE 0 END),
+                       SUM(e.Event_Type = 'dwell' AND e.Value < %s)
+                FROM Content_Engagement_Events e
+                WHERE e.Occurred_At >= %s AND e.Occurred_At < %s
+                GROUP BY e.Content_ID
+                ON DUPLICATE KEY UPDATE
+                    Views = VALUES(Views),
+                    Unique_Viewers = VALUES(Unique_Viewers),
+                    Likes = VALUES(Likes),
+                    Unlikes = VALUES(Unlikes),
+                    Shares = VALUES(Shares),
+                    Comments = VALUES(Comments),
+                    Dwell_Count = VALUES(Dwell_Count),
+                    Dwell_Seconds = VALUES(Dwell_Seconds),
+                    Bounces = VALUES(Bounces)
+            """, (day, BOUNCE_SECONDS, day_start, day_end))
+            daily_rows = cursor.rowcount
+
+            # Averages over every compacted day for the content that had dwell pings today
+            cursor.execute("""
+                UPDATE Content_Metrics cm
+                JOIN (
+                    SELECT d.Content_ID,
+                           SUM(d.Dwell_Seconds) / SUM(d.Dwell_Count) AS avg_time,
+                           100 * SUM(d.Bounces) / SUM(d.Dwell_Count) AS bounce_rate
+                    FROM Content_Engagement_Daily d
+                    WHERE d.Content_ID IN (
+                        SELECT Content_ID FROM Content_Engagement_Daily
+                        WHERE Event_Date = %s AND Dwell_Count > 0
+                    )
+                    GROUP BY d.Content_ID
+                    HAVING SUM(d.Dwell_Count) > 0
+                ) dwell ON dwell.Content_ID = cm.Content_ID
+                SET cm.Avg_Time_Spent = ROUND(dwell.avg_time),
+                    cm.Bounce_Rate = dwell.bounce_rate,
+                    cm.Last_Updated = NOW()
+            """, (day,))
+
+            # Share totals over every compacted day for the content shared today
+            cursor.execute("""
+                INSERT INTO Content_Metrics (Content_ID, Shares, Last_Updated)
+                SELECT d.Content_ID, SUM(d.Shares), NOW()
+                FROM Content_Engagement_Daily d
+                JOIN Content c ON c.Content_ID = d.Content_ID
+                WHERE d.Content_ID IN (
+                    SELECT Content_ID FROM Content_Engagement_Daily
+                    WHERE Event_Date = %s AND Shares > 0
+                )
+                GROUP BY d.Content_ID
+                ON DUPLICATE KEY UPDATE
+                    Shares = VALUES(Shares),
+                    Last_Updated = NOW()
+            """, (day,))
+
+            conn.commit()
+            return daily_rows
+        except Exception:
+            conn.rollback()
+            raise
+
+    @staticmethod
+    def _purge(conn, cursor, before_date) -> int:
+        """Delete raw events older than before_date in small batches"""
+        cutoff = datetime.combine(before_date, datetime.min.time())
+        purged = 0
+        while True:
+            cursor.execute("""
+                DELETE FROM Content_Engagement_Events
+                WHERE Occurred_At < %s
+                ORDER BY Occurred_At
+                LIMIT %s
+            """, (cutoff, PURGE_BATCH_SIZE))
+            deleted = cursor.rowcount
+            conn.commit()
+            purged += deleted
+            if deleted < PURGE_BATCH_SIZE:
+                return purged
+
+    def _loop(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.compact()
+            except Exception as e:
+                logger.error(f"Engagement compaction failed: {e}")
@@ -0,0 +1,293 @@
+"""
+Grammar Dictionary Utility
+
+This module keeps each user's legal dictionary (terms that should never be
+flagged as misspellings) and disabled LanguageTool rules in memory, backed by
+the User_Grammar_Dictionary and User_Grammar_Settings tables.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, FrozenSet, Iterable, List, Optional
+
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Longest term accepted into a dictionary (matches the Term column)
+MAX_TERM_LENGTH = 100
+
+# Maximum number of terms stored per user
+MAX_TERMS_PER_USER = 5000
+
+
+@dataclass(frozen=True)
+class GrammarProfile:
+    """A user's dictionary terms and disabled LanguageTool rules/categories"""
+    terms: FrozenSet[str] = field(default_factory=frozenset)
+    disabled_rules: FrozenSet[str] = field(default_factory=frozenset)
+    disabled_categories: FrozenSet[str] = field(default_factory=frozenset)
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'terms': sorted(self.terms, key=str.lower),
+            'disabled_rules': sorted(self.disabled_rules),
+            'disabled_categories': sorted(self.disabled_categories)
+        }
+
+
+def normalize_terms(terms: Optional[Iterable[str]]) -> List[str]:
+    """
+    Clean up dictionary terms from a request.
+
+    Args:
+        terms (Iterable[str]): Raw terms
+
+    Returns:
+        List[str]: Stripped, de-duplicated terms no longer than MAX_TERM_LENGTH
+    """
+    if not terms:
+        return []
+
+    cleaned = []
+    seen = set()
+    for term in terms:
+        if not isinstance(term, str):
+            continue
+        term = ' '.join(term.split())
+        if not term or len(term) > MAX_TERM_LENGTH or term.lower() in seen:
+            continue
+        seen.add(term.lower())
+        cleaned.append(term)
+    return cleaned
+
+
+def _split_ids(value: Optional[str]) -> FrozenSet[str]:
+    """Split a comma-separated id column into a set"""
+    if not value:
+        return frozenset()
+    return frozenset(part.strip() for part in value.split(',') if part.strip())
+
+
+class GrammarDictionaryStore:
+    """
+    Write-through, in-memory cache of per-user grammar profiles.
+
+    Profiles are loaded from MySQL on first use and kept in an LRU cache so
+    that grammar checks (which run on every editor pause) do not query the
+    database. Changes are written to MySQL first and then applied to the
+    cached profile.
+    """
+
+    def __init__(self, connection_factory: Callable, max_users: int = 5000, ttl_seconds: int = 600):
+        """
+        Initialize the dictionary store.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            max_users (int): Maximum number of cached profiles
+            ttl_seconds (int): Seconds before a cached profile is reloaded
+        """
+        self._connection_factory = connection_factory
+        self._max_users = max_users
+        self._ttl_seconds = ttl_seconds
+        self._profiles = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_profile(self, user_id: int) -> GrammarProfile:
+        """
+        Get a user's profile, loading it from the database on a cache miss.
+
+        Args:
+            user_id (int): User ID
+
+        Returns:
+            GrammarProfile: The user's terms and disabled rules
+        """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._profiles.get(user_id)
+            if cached is not None and now - cached[0] < self._ttl_seconds:
+                self._profiles.move_to_end(user_id)
+                get_metrics_registry().counter('grammar_dictionary_cache_hits_total').inc()
+                return cached[1]
+
+        get_metrics_registry().counter('grammar_dictionary_cache_misses_total').inc()
+        profile = self._load_profile(user_id)
+        self._store(user_id, profile)
+        return profile
+
+    def add_terms(self, user_id: int, terms: Iterable[str]) -> GrammarProfile:
+        """
+        Add terms to a user's dictionary.
+
+        Args:
+            user_id (int): User ID
+            terms (Iterable[str]): Terms to add
+
+        Returns:
+            GrammarProfile: The updated profile
+
+        Raises:
+            ValueError: If the dictionary would exceed MAX_TERMS_PER_USER
+        """
+        terms = normalize_terms(terms)
+        profile = self.get_profile(user_id)
+        existing = {term.lower() for term in profile.terms}
+        new_terms = [term for term in terms if term.lower() not in existing]
+        if not new_terms:
+            return profile
+        if len(profile.terms) + len(new_terms) > MAX_TERMS_PER_USER:
+            raise ValueError(f"Dictionary is limited to {MAX_TERMS_PER_USER} terms")
+
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(
+                "INSERT IGNORE INTO User_Grammar_Dictionary (User_ID, Term) VALUES (%s, %s)",
+                [(user_id, term) for term in new_terms]
+            )
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+
+        profile = GrammarProfile(
+            terms=profile.terms | frozenset(new_terms),
+            disabled_rules=profile.disabled_rules,
+            disabled_categories=profile.disabled_categories
+        )
+        self._store(user_id, profile)
+        return profile
+
+    def remove_terms(self, user_id: int, terms: Iterable[str]) -> GrammarProfile:
+        """
+        Remove terms from a user's dictionary (case-insensitive).
+
+        Args:
+            user_id (int): User ID
+            terms (Iterable[str]): Terms to remove
+
+        Returns:
+            GrammarProfile: The updated profile
+        """
+        terms = normalize_terms(terms)
+        profile = self.get_profile(user_id)
+        if not terms:
+            return profile
+
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            placeholders = ', '.join(['%s'] * len(terms))
+            cursor.execute(
+                f"DELETE FROM User_Grammar_Dictionary WHERE User_ID = %s AND Term IN ({placeholders})",
+                [user_id] + terms
+            )
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+
+        removed = {term.lower() for term in terms}
+        profile = GrammarProfile(
+            terms=frozenset(term for term in profile.terms if term.lower() not in removed),
+            disabled_rules=profile.disabled_rules,
+            disabled_categories=profile.disabled_categories
+        )
+        self._store(user_id, profile)
+        return profile
+
+    def update_settings(self, user_id: int, disabled_rules: Iterable[str],
+                        disabled_categories: Iterable[str]) -> GrammarProfile:
+        """
+        Replace a user's disabled rules and categories.
+
+        Args:
+            user_id (int): User ID
+            disabled_rules (Iterable[str]): Validated LanguageTool rule ids
+            disabled_categories (Iterable[str]): Validated LanguageTool category ids
+
+        Returns:
+            GrammarProfile: The updated profile
+        """
+        disabled_rules = frozenset(disabled_rules)
+        disabled_categories = frozenset(disabled_categories)
+        profile = self.get_profile(user_id)
+
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                INSERT INTO User_Grammar_Settings (User_ID, Disabled_Rules, Disabled_Categories)
+                VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    Disabled_Rules = VALUES(Disabled_Rules),
+                    Disabled_Categories = VALUES(Disabled_Categories)
+            """, (user_id, ','.join(sorted(disabled_rules)), ','.join(sorted(disabled_categories))))
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+
+        profile = GrammarProfile(
+            terms=profile.terms,
+            disabled_rules=disabled_rules,
+            disabled_categories=disabled_categories
+        )
+        self._store(user_id, profile)
+        return profile
+
+    def invalidate(self, user_id: Optional[int] = None):
+        """
+        Drop one cached profile, or all of them when user_id is None.
+
+        Args:
+            user_id (Optional[int]): User ID to drop
+        """
+        with self._lock:
+            if user_id is None:
+                self._profiles.clear()
+            else:
+                self._profiles.pop(user_id, None)
+
+    def _store(self, user_id: int, profile: GrammarProfile):
+        """Put a profile in the LRU cache, evicting the oldest entries"""
+        with self._lock:
+            self._profiles[user_id] = (time.monotonic(), profile)
+            self._profiles.move_to_end(user_id)
+            while len(self._profiles) > self._max_users:
+                self._profiles.popitem(last=False)
+
+    def _load_profile(self, user_id: int) -> GrammarProfile:
+        """Read a user's terms and settings from the database"""
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(
+                "SELECT Term FROM User_Grammar_Dictionary WHERE User_ID = %s",
+                (user_id,)
+            )
+            terms = frozenset(row[0] for row in cursor.fetchall())
+
+            cursor.execute("""
+                SELECT Disabled_Rules, Disabled_Categories
+                FROM User_Grammar_Settings
+                WHERE User_ID = %s
+            """, (user_id,))
+            settings = cursor.fetchone()
+        finally:
+            cursor.close()
+            conn.close()
+
+        return GrammarProfile(
+            terms=terms,
+            disabled_rules=_split_ids(settings[0]) if settings else frozenset(),
+            disabled_categories=_split_ids(settings[1]) if settings else frozenset()
+        )
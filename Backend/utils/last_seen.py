@@ -0,0 +1,138 @@
+"""
+Last Seen Utility
+
+This module maintains Users.Last_Seen_At, the time of each user's latest
+login or authenticated request, so "active users" is an indexed range on
+Users instead of a per-user scan of Session.
+
+Activity is recorded in memory at most once per user per resolution window
+and written in batched UPDATE statements, so a busy user costs one write
+every few minutes rather than one per request.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Callable, Dict, Optional
+
+from utils.buffered_writer import BufferedWriter
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Users per UPDATE statement
+FLUSH_CHUNK_SIZE = 500
+
+
+class LastSeenTracker(BufferedWriter):
+    """
+    Throttled writer for Users.Last_Seen_At.
+
+    A user seen again within resolution seconds of the last recorded time is
+    not recorded, so Last_Seen_At may lag real activity by up to resolution
+    plus one flush interval.
+    """
+
+    def __init__(self, connection_factory: Callable, resolution: float = 300.0,
+                 flush_interval: float = 30.0, flush_threshold: int = 1000,
+                 max_tracked_users: int = 100000, max_pending: int = 50000):
+        """
+        Initialize the tracker.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            resolution (float): Seconds during which repeat activity of a user is not recorded
+            flush_interval (float): Maximum seconds between flushes
+            flush_threshold (int): Pending users that trigger an early flush
+            max_tracked_users (int): Users remembered for throttling
+            max_pending (int): Maximum users kept after failed flushes
+        """
+        super().__init__('last-seen', flush_interval, flush_threshold)
+        self._connection_factory = connection_factory
+        self.resolution = resolution
+        self.max_tracked_users = max_tracked_users
+        self.max_pending = max_pending
+        self._pending: Dict[int, datetime] = {}
+        self._recent = OrderedDict()
+
+    def touch(self, user_id: Optional[int]) -> bool:
+        """
+        Record activity of a user.
+
+        Args:
+            user_id (Optional[int]): User ID (None is ignored)
+
+        Returns:
+            bool: True if recorded, False if throttled
+        """
+        if user_id is None:
+            return False
+        user_id = int(user_id)
+        now = time.monotonic()
+
+        with self._lock:
+            last = self._recent.get(user_id)
+            if last is not None and now - last < self.resolution:
+                return False
+            self._recent[user_id] = now
+            self._recent.move_to_end(user_id)
+            while len(self._recent) > self.max_tracked_users:
+                self._recent.popitem(last=False)
+
+            self._pending[user_id] = datetime.now().replace(microsecond=0)
+            pending = len(self._pending)
+
+        get_metrics_registry().counter('last_seen_recorded_total').inc()
+        self.start()
+        self._pending_changed(pending)
+        return True
+
+    def _drain(self) -> Optional[Dict[int, datetime]]:
+        if not self._pending:
+            return None
+        batch = self._pending
+        self._pending = {}
+        return batch
+
+    def _requeue(self, batch: Dict[int, datetime]):
+        dropped = 0
+        for user_id, seen_at in batch.items():
+            if user_id in self._pending:
+                self._pending[user_id] = max(self._pending[user_id], seen_at)
+            elif len(self._pending) < self.max_pending:
+                self._pending[user_id] = seen_at
+            else:
+                dropped += 1
+        if dropped:
+            logger.warning(f"Last seen buffer full, dropped {dropped} users")
+
+    def _write(self, batch: Dict[int, datetime]) -> int:
+        # Sorted ids keep row lock order consistent across processes
+        rows = sorted(batch.items())
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            for start in range(0, len(rows), FLUSH_CHUNK_SIZE):
+                chunk = rows[start:start + FLUSH_CHUNK_SIZE]
+                cases = ' '.join(['WHEN %s THEN %s'] * len(chunk))
+                placeholders = ', '.join(['%s'] * len(chunk))
+                # Never move Last_Seen_At backwards (another process may have written a later time)
+                cursor.execute(f"""
+                    UPDATE Users
+                    SET Last_Seen_At = GREATEST(COALESCE(Last_Seen_At, '1970-01-01'),
+                                                CASE User_ID {cases} END)
+                    WHERE User_ID IN ({placeholders})
+                """, [value for row in chunk for value in row] + [user_id for user_id, _ in chunk])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        get_metrics_registry().counter('last_seen_flushed_total').inc(len(rows))
+        return len(rows)
@@ -0,0 +1,135 @@
+"""
+Content Leaderboard Utility
+
+This module serves top-content lists without scoring and sorting every
+active row. Content_Metrics.Engagement_Score is a stored generated column
+(Views*0.4 + Likes*0.3 + Shares*0.2 + Comments_Count*0.1) kept current by
+MySQL whenever the metrics change, and its index is read backwards so a
+top-K query touches about K rows.
+
+The trending variant scores only the recent window of
+Content_Engagement_Daily, with each day's engagement halved every
+half_life_days, so content that was popular long ago drops out.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+# Upper bound on K for any leaderboard query
+MAX_LEADERBOARD_SIZE = 50
+
+# Same weights as the stored Engagement_Score, applied to daily engagement
+DAILY_ENGAGEMENT_SCORE = "(d.Views * 0.4 + GREATEST(d.Likes - d.Unlikes, 0) * 0.3 + d.Shares * 0.2 + d.Comments * 0.1)"
+
+
+def top_content_sql(limit: int = 10, content_type: Optional[str] = None) -> Tuple[str, tuple]:
+    """
+    Query for the highest all-time engagement among active content.
+
+    Args:
+        limit (int): Number of items (capped at MAX_LEADERBOARD_SIZE)
+        content_type (Optional[str]): Restrict to one Content_Type
+
+    Returns:
+        Tuple[str, tuple]: SQL and parameters
+    """
+    limit = max(1, min(int(limit), MAX_LEADERBOARD_SIZE))
+    type_filter = "AND c.Content_Type = %s" if content_type else ""
+    params = ((content_type,) if content_type else ()) + (limit,)
+
+    # Walk the score index from the top and join each row to its content,
+    # stopping after `limit` active rows
+    return f"""
+        SELECT
+            c.Content_ID,
+            c.Title,
+            c.Content_Type,
+            c.Created_At,
+            up.Full_Name as author_name,
+            cm.Views as views,
+            cm.Likes as likes,
+            cm.Shares as shares,
+            cm.Comments_Count as comments,
+            cm.Engagement_Score as engagement_score
+        FROM Content_Metrics cm FORCE INDEX (idx_content_metrics_engagement)
+        STRAIGHT_JOIN Content c ON c.Content_ID = cm.Content_ID
+        LEFT JOIN User_Profile up ON c.User_ID = up.User_ID
+        WHERE c.Status = 'Active' {type_filter}
+        ORDER BY cm.Engagement_Score DESC
+        LIMIT %s
+    """, params
+
+
+def top_content(cursor, limit: int = 10, content_type: Optional[str] = None) -> List[Dict]:
+    """
+    Highest all-time engagement among active content.
+
+    Args:
+        cursor: Dictionary cursor
+        limit (int): Number of items (capped at MAX_LEADERBOARD_SIZE)
+        content_type (Optional[str]): Restrict to one Content_Type
+
+    Returns:
+        List[Dict]: Content rows with metrics and engagement_score, best first
+    """
+    cursor.execute(*top_content_sql(limit, content_type))
+    return cursor.fetchall()
+
+
+def trending_content(cursor, limit: int = 10, days: int = 7, half_life_days: float = 2.0,
+                     content_type: Optional[str] = None) -> List[Dict]:
+    """
+    Highest time-decayed engagement over the last few days among active content.
+
+    Args:
+        cursor: Dictionary cursor
+        limit (int): Number of items (capped at MAX_LEADERBOARD_SIZE)
+        days (int): Window of daily engagement considered (1-90)
+        half_life_days (float): Days after which a day's engagement counts half
+        content_type (Optional[str]): Restrict to one Content_Type
+
+    Returns:
+        List[Dict]: Content rows with trending_score and window totals, best first
+    """
+    limit = max(1, min(int(limit), MAX_LEADERBOARD_SIZE))
+    days = max(1, min(int(days), 90))
+    half_life_days = max(float(half_life_days), 0.1)
+    type_filter = "AND c.Content_Type = %s" if content_type else ""
+
+    params = [half_life_days, days]
+    if content_type:
+        params.append(content_type)
+    params.append(limit)
+
+    cursor.execute(f"""
+        SELECT
+            c.Content_ID,
+            c.Title,
+            c.Content_Type,
+            c.Created_At,
+            up.Full_Name as author_name,
+            ranked.views,
+            ranked.likes,
+            ranked.shares,
+            ranked.comments,
+            ranked.trending_score
+        FROM (
+            SELECT
+                d.Content_ID,
+                SUM({DAILY_ENGAGEMENT_SCORE} * POW(0.5, DATEDIFF(CURDATE(), d.Event_Date) / %s)) as trending_score,
+                CAST(SUM(d.Views) AS SIGNED) as views,
+                CAST(SUM(GREATEST(d.Likes - d.Unlikes, 0)) AS SIGNED) as likes,
+                CAST(SUM(d.Shares) AS SIGNED) as shares,
+                CAST(SUM(d.Comments) AS SIGNED) as comments
+            FROM Content_Engagement_Daily d
+            JOIN Content c ON c.Content_ID = d.Content_ID
+            WHERE d.Event_Date >= CURDATE() - INTERVAL %s DAY
+            AND c.Status = 'Active' {type_filter}
+            GROUP BY d.Content_ID
+            ORDER BY trending_score DESC
+            LIMIT %s
+        ) ranked
+        JOIN Content c ON c.Content_ID = ranked.Content_ID
+        LEFT JOIN User_Profile up ON c.User_ID = up.User_ID
+        ORDER BY ranked.trending_score DESC
+    """, params)
+    return cursor.fetchall()
@@ -0,0 +1,640 @@
+"""
+Outbound Mail Utility
+
+This module delivers email through SMTP in the background. A message is
+stored once in Email_Logs and every recipient becomes a row in Email_Queue,
+so an announcement to thousands of users costs the request a few multi-row
+inserts and nothing else.
+
+Worker threads claim due queue rows (FOR UPDATE SKIP LOCKED, so several
+processes can share the queue), group them by message and recipient domain,
+and send each group as one SMTP transaction with up to
+recipients_per_message envelope recipients over pooled connections. A token
+bucket per recipient domain caps the sending rate; rows over the limit are
+pushed back until tokens are available. Temporary failures are retried with
+exponential backoff, permanent ones (5xx) fail at once. Delivery results of
+a batch are written with one statement per table.
+"""
+
+import logging
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from email.utils import formatdate, make_msgid
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Queue rows inserted per statement
+ENQUEUE_CHUNK_SIZE = 500
+
+# Seconds a claimed row stays invisible to other workers; a worker that dies
+# mid-batch releases its rows when this runs out
+CLAIM_LEASE_SECONDS = 300
+
+QUEUED = 'queued'
+SENT = 'sent'
+FAILED = 'failed'
+
+
+class DeliveryError(Exception):
+    """Delivery to a recipient failed; permanent errors are not retried"""
+
+    def __init__(self, message: str, permanent: bool = False):
+        super().__init__(message)
+        self.permanent = permanent
+
+
+def recipient_domain(address: str) -> str:
+    """Lower-cased domain part of an email address"""
+    return address.rsplit('@', 1)[-1].strip().lower()
+
+
+def backoff_delay(attempts: int, base: float = 60.0, maximum: float = 3600.0) -> float:
+    """
+    Seconds to wait before the next attempt.
+
+    Args:
+        attempts (int): Attempts made so far (1 after the first failure)
+        base (float): Delay after the first failure
+        maximum (float): Upper bound on the delay
+
+    Returns:
+        float: Delay in seconds
+    """
+    return min(base * (2 ** max(attempts - 1, 0)), maximum)
+
+
+class TokenBucket:
+    """Token bucket refilled at rate tokens per second, holding at most burst tokens"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+
+    def take(self, wanted: int) -> Tuple[int, List[float]]:
+        """
+        Take up to wanted tokens.
+
+        Args:
+            wanted (int): Tokens requested
+
+        Returns:
+            Tuple[int, List[float]]: Tokens granted, and for each token not granted
+                the seconds until it will be available (refill order, not reserved)
+        """
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+        granted = min(wanted, int(self._tokens))
+        self._tokens -= granted
+        return granted, [(index + 1 - self._tokens) / self.rate for index in range(wanted - granted)]
+
+
+class DomainRateLimiter:
+    """One TokenBucket per recipient domain (rate 0 or less disables limiting)"""
+
+    def __init__(self, rate: float = 5.0, burst: int = 20, overrides: Optional[Dict[str, Tuple[float, int]]] = None):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate (float): Recipients per second for each domain
+            burst (int): Recipients a domain may receive at once
+            overrides (Optional[Dict[str, Tuple[float, int]]]): (rate, burst) for specific domains
+        """
+        self.rate = rate
+        self.burst = burst
+        self.overrides = {domain.lower(): limits for domain, limits in (overrides or {}).items()}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, domain: str, wanted: int) -> Tuple[int, List[float]]:
+        """
+        Reserve sends to a domain.
+
+        Args:
+            domain (str): Recipient domain
+            wanted (int): Recipients to send to
+
+        Returns:
+            Tuple[int, List[float]]: Recipients allowed now, and a delay in seconds
+                for each of the others, spreading them over the domain's rate
+        """
+        rate, burst = self.overrides.get(domain, (self.rate, self.burst))
+        if rate <= 0:
+            return wanted, []
+        with self._lock:
+            bucket = self._buckets.get(domain)
+            if bucket is None:
+                bucket = self._buckets[domain] = TokenBucket(rate, burst)
+            return bucket.take(wanted)
+
+
+class SMTPConnectionPool:
+    """
+    Reusable SMTP sessions, at most max_connections open at a time.
+
+    A session is closed after max_messages_per_connection transactions or
+    when it fails, and checked with NOOP before reuse if it sat idle.
+    """
+
+    def __init__(self, host: str, port: int = 587, username: Optional[str] = None,
+                 password: Optional[str] = None, starttls: bool = True, use_ssl: bool = False,
+                 timeout: float = 30.0, max_connections: int = 4, max_messages_per_connection: int = 100,
+                 idle_check: float = 30.0):
+        """
+        Initialize the pool.
+
+        Args:
+            host (str): SMTP server
+            port (int): SMTP port
+            username (Optional[str]): Login user (no login when omitted)
+            password (Optional[str]): Login password
+            starttls (bool): Upgrade plain connections with STARTTLS
+            use_ssl (bool): Connect with implicit TLS (SMTPS)
+            timeout (float): Socket timeout in seconds
+            max_connections (int): Open sessions allowed
+            max_messages_per_connection (int): Transactions before a session is recycled
+            idle_check (float): Idle seconds after which a session is checked with NOOP
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self.max_messages_per_connection = max_messages_per_connection
+        self.idle_check = idle_check
+        self._idle: List[Tuple[smtplib.SMTP, int, float]] = []
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a session; it is discarded if the block raises.
+
+        Yields:
+            smtplib.SMTP: Connected (and logged in) session
+        """
+        self._slots.acquire()
+        try:
+            smtp, sent = self._checkout()
+            try:
+                yield smtp
+            except Exception:
+                self._discard(smtp)
+                raise
+            sent += 1
+            if sent >= self.max_messages_per_connection:
+                self._discard(smtp)
+            else:
+                with self._lock:
+                    self._idle.append((smtp, sent, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    def close(self):
+        """Close every idle session"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for smtp, _, _ in idle:
+            self._discard(smtp)
+
+    def _checkout(self) -> Tuple[smtplib.SMTP, int]:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                smtp, sent, idle_since = self._idle.pop()
+            if time.monotonic() - idle_since < self.idle_check:
+                return smtp, sent
+            try:
+                if smtp.noop()[0] == 250:
+                    return smtp, sent
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard(smtp)
+
+        get_metrics_registry().counter('smtp_connections_opened_total').inc()
+        if self.use_ssl:
+            smtp = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+        else:
+            smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            smtp.ehlo()
+            if self.starttls and not self.use_ssl and smtp.has_extn('starttls'):
+                smtp.starttls()
+                smtp.ehlo()
+            if self.username:
+                smtp.login(self.username, self.password or '')
+        except Exception:
+            self._discard(smtp)
+            raise
+        return smtp, 0
+
+    @staticmethod
+    def _discard(smtp: smtplib.SMTP):
+        try:
+            smtp.quit()
+        except Exception:
+            try:
+                smtp.close()
+            except Exception:
+                pass
+
+
+class MailSender:
+    """Sends one message to a group of recipients in as few SMTP transactions as possible"""
+
+    def __init__(self, pool: SMTPConnectionPool, from_address: str, recipients_per_message: int = 50):
+        """
+        Initialize the sender.
+
+        Args:
+            pool (SMTPConnectionPool): SMTP sessions
+            from_address (str): Envelope and header sender
+            recipients_per_message (int): Envelope recipients per SMTP transaction
+        """
+        self.pool = pool
+        self.from_address = from_address
+        self.recipients_per_message = max(1, recipients_per_message)
+
+    def send(self, recipients: Sequence[str], subject: str, content: str) -> Dict[str, Optional[DeliveryError]]:
+        """
+        Deliver a message to every recipient.
+
+        Args:
+            recipients (Sequence[str]): Recipient addresses
+            subject (str): Subject
+            content (str): Plain-text body
+
+        Returns:
+            Dict[str, Optional[DeliveryError]]: None for each accepted recipient,
+                otherwise the error
+        """
+        results: Dict[str, Optional[DeliveryError]] = {}
+        for offset in range(0, len(recipients), self.recipients_per_message):
+            chunk = list(recipients[offset:offset + self.recipients_per_message])
+            results.update(self._send_chunk(chunk, subject, content))
+        return results
+
+    def _send_chunk(self, recipients: List[str], subject: str, content: str) -> Dict[str, Optional[DeliveryError]]:
+        metrics = get_metrics_registry()
+        message = self.build_message(recipients, subject, content)
+        start = time.perf_counter()
+        try:
+            with self.pool.connection() as smtp:
+                refused = smtp.send_message(message, from_addr=self.from_address, to_addrs=recipients)
+        except smtplib.SMTPRecipientsRefused as e:
+            refused = e.recipients
+        except (smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+            error = DeliveryError(f"{e.smtp_code} {_decode(e.smtp_error)}", permanent=500 <= e.smtp_code < 600)
+            return {recipient: error for recipient in recipients}
+        except (smtplib.SMTPException, OSError) as e:
+            # Connection, authentication or timeout problem: try the whole chunk again later
+            metrics.counter('smtp_errors_total', {'type': type(e).__name__}).inc()
+            error = DeliveryError(f"{type(e).__name__}: {e}")
+            return {recipient: error for recipient in recipients}
+        finally:
+            metrics.histogram('smtp_transaction_seconds').observe(time.perf_counter() - start)
+
+        results: Dict[str, Optional[DeliveryError]] = {recipient: None for recipient in recipients}
+        for recipient, (code, reply) in refused.items():
+            results[recipient] = DeliveryError(f"{code} {_decode(reply)}", permanent=500 <= code < 600)
+        return results
+
+    def build_message(self, recipients: List[str], subject: str, content: str) -> EmailMessage:
+        """Message with the recipients hidden when there is more than one"""
+        message = EmailMessage()
+        message['From'] = self.from_address
+        message['To'] = recipients[0] if len(recipients) == 1 else 'undisclosed-recipients:;'
+        message['Subject'] = subject
+        message['Date'] = formatdate(localtime=True)
+        message['Message-ID'] = make_msgid()
+        message.set_content(content or '')
+        return message
+
+
+def _decode(reply) -> str:
+    return reply.decode('utf-8', 'replace') if isinstance(reply, bytes) else str(reply)
+
+
+class EmailQueue:
+    """Email_Logs messages and their Email_Queue deliveries in MySQL"""
+
+    def __init__(self, connection_factory: Callable):
+        """
+        Initialize the queue.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+        """
+        self._connection_factory = connection_factory
+
+    def enqueue(self, sender_id: Optional[int], recipients: Iterable[str], subject: str, content: str,
+                email_type: str = 'notification') -> Tuple[int, int]:
+        """
+        Store a message and queue one delivery per distinct recipient.
+
+        Args:
+            sender_id (Optional[int]): Sending user
+            recipients (Iterable[str]): Recipient addresses
+            subject (str): Subject
+            content (str): Plain-text body
+            email_type (str): 'notification', 'announcement' or 'test'
+
+        Returns:
+            Tuple[int, int]: Email_ID and number of recipients queued
+        """
+        addresses = sorted({address.strip() for address in recipients if address and '@' in address})
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                INSERT INTO Email_Logs (Sender_ID, Subject, Content, Email_Type, Status, Recipient_Count)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """, (sender_id, subject, content, email_type, 'pending' if addresses else 'sent', len(addresses)))
+            email_id = cursor.lastrowid
+
+            for offset in range(0, len(addresses), ENQUEUE_CHUNK_SIZE):
+                chunk = addresses[offset:offset + ENQUEUE_CHUNK_SIZE]
+                cursor.execute(
+                    "INSERT INTO Email_Queue (Email_ID, Recipient, Domain) VALUES "
+                    + ', '.join(['(%s, %s, %s)'] * len(chunk)),
+                    [value for address in chunk for value in (email_id, address, recipient_domain(address))]
+                )
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        get_metrics_registry().counter('emails_queued_total', {'type': email_type}).inc(len(addresses))
+        return email_id, len(addresses)
+
+    def claim(self, limit: int) -> Tuple[List[Dict], Dict[int, Dict]]:
+        """
+        Lease due deliveries to this worker.
+
+        Args:
+            limit (int): Maximum rows
+
+        Returns:
+            Tuple[List[Dict], Dict[int, Dict]]: Queue rows, and their messages by Email_ID
+        """
+        conn = self._connection_factory()
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute("""
+                SELECT Queue_ID, Email_ID, Recipient, Domain, Attempts
+                FROM Email_Queue
+                WHERE Status = 'queued' AND Next_Attempt_At <= NOW()
+                ORDER BY Next_Attempt_At
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            """, (limit,))
+            rows = cursor.fetchall()
+            if not rows:
+                conn.rollback()
+                return [], {}
+
+            queue_ids = [row['Queue_ID'] for row in rows]
+            cursor.execute(f"""
+                UPDATE Email_Queue
+                SET Next_Attempt_At = NOW() + INTERVAL {CLAIM_LEASE_SECONDS} SECOND
+                WHERE Queue_ID IN ({', '.join(['%s'] * len(queue_ids))})
+            """, queue_ids)
+
+            email_ids = sorted({row['Email_ID'] for row in rows})
+            cursor.execute(f"""
+                SELECT Email_ID, Subject, Content
+                FROM Email_Logs
+                WHERE Email_ID IN ({', '.join(['%s'] * len(email_ids))})
+            """, email_ids)
+            messages = {message['Email_ID']: message for message in cursor.fetchall()}
+            conn.commit()
+            return rows, messages
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+    def record(self, results: Sequence[Tuple[int, int, str, bool, Optional[str], Optional[datetime]]]):
+        """
+        Write the outcome of a batch.
+
+        Args:
+            results: (Queue_ID, Email_ID, status, attempted, error, next attempt) per row;
+                status is 'sent', 'failed' or 'queued' (retry at next attempt)
+        """
+        if not results:
+            return
+        queue_ids = [result[0] for result in results]
+        in_list = ', '.join(['%s'] * len(queue_ids))
+
+        def case(values):
+            # CASE Queue_ID WHEN id THEN value ... END, for a per-row value in one UPDATE
+            return "CASE Queue_ID " + " ".join(["WHEN %s THEN %s"] * len(values)) + " END", \
+                [item for pair in zip(queue_ids, values) for item in pair]
+
+        status_sql, status_params = case([result[2] for result in results])
+        attempted_sql, attempted_params = case([int(result[3]) for result in results])
+        error_sql, error_params = case([(result[4] or '')[:1000] or None for result in results])
+        next_sql, next_params = case([result[5] for result in results])
+
+        sent: Dict[int, int] = {}
+        failed: Dict[int, int] = {}
+        for _, email_id, status, _, _, _ in results:
+            if status == SENT:
+                sent[email_id] = sent.get(email_id, 0) + 1
+            elif status == FAILED:
+                failed[email_id] = failed.get(email_id, 0) + 1
+
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"""
+                UPDATE Email_Queue
+                SET Status = {status_sql},
+                    Attempts = Attempts + {attempted_sql},
+                    Last_Error = COALESCE({error_sql}, Last_Error),
+                    Next_Attempt_At = COALESCE({next_sql}, Next_Attempt_At),
+                    Sent_At = IF(Status = 'sent', NOW(), Sent_At)
+                WHERE Queue_ID IN ({in_list})
+            """, status_params + attempted_params + error_params + next_params + queue_ids)
+
+            email_ids = sorted(set(sent) | set(failed))
+            if email_ids:
+                email_in_list = ', '.join(['%s'] * len(email_ids))
+                count_case = "CASE Email_ID " + " ".join(["WHEN %s THEN %s"] * len(email_ids)) + " END"
+                cursor.execute(f"""
+                    UPDATE Email_Logs
+                    SET Sent_Count = Sent_Count + {count_case},
+                        Failed_Count = Failed_Count + {count_case}
+                    WHERE Email_ID IN ({email_in_list})
+                """, [item for email_id in email_ids for item in (email_id, sent.get(email_id, 0))]
+                   + [item for email_id in email_ids for item in (email_id, failed.get(email_id, 0))]
+                   + email_ids)
+
+                # Messages whose last recipient just finished
+                cursor.execute(f"""
+                    UPDATE Email_Logs
+                    SET Status = IF(Sent_Count = 0 AND Failed_Count > 0, 'failed', 'sent'),
+                        Sent_At = NOW(),
+                        Error_Message = IF(Failed_Count > 0, CONCAT(Failed_Count, ' of ', Recipient_Count,
+                                                                    ' recipients failed'), NULL)
+                    WHERE Email_ID IN ({email_in_list})
+                    AND Status = 'pending'
+                    AND Sent_Count + Failed_Count >= Recipient_Count
+                """, email_ids)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+
+class MailDispatcher:
+    """
+    Worker threads that drain Email_Queue through a MailSender.
+
+    Each worker claims up to batch_size due rows, sends them grouped by
+    message and domain within the domain rate limits, and records the
+    results. Idle workers poll every poll_interval seconds and are woken at
+    once by wake() after a local enqueue.
+    """
+
+    def __init__(self, queue: EmailQueue, sender: MailSender, limiter: DomainRateLimiter,
+                 workers: int = 2, batch_size: int = 200, poll_interval: float = 5.0,
+                 max_attempts: int = 5, backoff_base: float = 60.0, backoff_max: float = 3600.0):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            queue (EmailQueue): Persistent queue
+            sender (MailSender): SMTP delivery
+            limiter (DomainRateLimiter): Per-domain rate limits
+            workers (int): Worker threads; 0 or less disables sending
+            batch_size (int): Rows claimed per batch
+            poll_interval (float): Seconds between polls of an empty queue
+            max_attempts (int): Attempts before a temporary failure becomes permanent
+            backoff_base (float): Delay after the first failure
+            backoff_max (float): Longest delay between attempts
+        """
+        self.queue = queue
+        self.sender = sender
+        self.limiter = limiter
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self):
+        """Start the workers (no-op when disabled or already running)"""
+        if self.workers <= 0 or self._threads:
+            return
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._loop, name=f'mail-worker-{index}', daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Mail dispatcher started ({self.workers} workers)")
+
+    def stop(self):
+        """Stop the workers after their current batch"""
+        self._stopped.set()
+        self._wake.set()
+
+    def wake(self):
+        """Make idle workers poll the queue now"""
+        self._wake.set()
+
+    def process_batch(self) -> int:
+        """
+        Claim, send and record one batch.
+
+        Returns:
+            int: Rows claimed (0 when nothing was due)
+        """
+        rows, messages = self.queue.claim(self.batch_size)
+        if not rows:
+            return 0
+
+        metrics = get_metrics_registry()
+        now = datetime.now()
+        results = []
+        groups: Dict[Tuple[int, str], List[Dict]] = {}
+        for row in rows:
+            groups.setdefault((row['Email_ID'], row['Domain']), []).append(row)
+
+        for (email_id, domain), group in groups.items():
+            message = messages.get(email_id)
+            if message is None:
+                results.extend((row['Queue_ID'], email_id, FAILED, False, 'Message not found', None)
+                               for row in group)
+                continue
+
+            allowed, delays = self.limiter.acquire(domain, len(group))
+            if allowed < len(group):
+                # Over the domain's rate: not an attempt, just try again once tokens refill
+                metrics.counter('emails_rate_limited_total').inc(len(group) - allowed)
+                results.extend((row['Queue_ID'], email_id, QUEUED, False, None,
+                                now + timedelta(seconds=max(delay, 1.0)))
+                               for row, delay in zip(group[allowed:], delays))
+                group = group[:allowed]
+            if not group:
+                continue
+
+            outcomes = self.sender.send([row['Recipient'] for row in group], message['Subject'], message['Content'])
+            for row in group:
+                error = outcomes.get(row['Recipient'])
+                attempts = row['Attempts'] + 1
+                if error is None:
+                    results.append((row['Queue_ID'], email_id, SENT, True, None, None))
+                elif error.permanent or attempts >= self.max_attempts:
+                    results.append((row['Queue_ID'], email_id, FAILED, True, str(error), None))
+                else:
+                    retry_at = now + timedelta(seconds=backoff_delay(attempts, self.backoff_base, self.backoff_max))
+                    results.append((row['Queue_ID'], email_id, QUEUED, True, str(error), retry_at))
+
+        self.queue.record(results)
+        for status in (SENT, FAILED):
+            count = sum(1 for result in results if result[2] == status)
+            if count:
+                metrics.counter('emails_delivered_total', {'status': status}).inc(count)
+        metrics.counter('emails_retried_total').inc(sum(1 for result in results if result[2] == QUEUED and result[3]))
+        return len(rows)
+
+    def _loop(self):
+        while not self._stopped.is_set():
+            try:
+                claimed = self.process_batch()
+            except Exception as e:
+                logger.error(f"Mail batch failed: {e}")
+                claimed = 0
+            if claimed < self.batch_size:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
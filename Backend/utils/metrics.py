@@ -0,0 +1,281 @@
+"""
+In-Process Metrics Utility
+
+This module provides lightweight counters and fixed-bucket histograms that
+are cheap enough to leave enabled in production, plus a registry that
+exposes a JSON snapshot of everything recorded.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Default latency buckets in seconds (upper bounds)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Optional[Dict[str, str]]) -> LabelKey:
+    """Turn a labels dict into a hashable, ordered key"""
+    if not labels:
+        return ()
+    return tuple(sorted((str(k), str(v)) for k, v in labels.items()))
+
+
+def _round(value: Optional[float]) -> Optional[float]:
+    """Round a metric value for JSON output"""
+    return round(value, 6) if value is not None else None
+
+
+class Counter:
+    """
+    A monotonically increasing counter.
+    """
+
+    __slots__ = ('_value', '_lock')
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        """
+        Increment the counter.
+
+        Args:
+            amount (int): Amount to add
+        """
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def snapshot(self) -> Dict[str, int]:
+        return {'value': self._value}
+
+
+class Histogram:
+    """
+    A fixed-bucket histogram.
+
+    Recording an observation is a bisect plus three additions under a lock,
+    so it adds well under a microsecond to the measured code path.
+    Quantiles are estimated by linear interpolation inside the bucket.
+    """
+
+    __slots__ = ('_bounds', '_counts', '_sum', '_count', '_max', '_lock')
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """
+        Initialize the histogram.
+
+        Args:
+            buckets (Sequence[float]): Increasing bucket upper bounds
+        """
+        self._bounds = tuple(sorted(buckets))
+        # One extra bucket for observations above the last bound
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+        self._count = 0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        """
+        Record one observation.
+
+        Args:
+            value (float): Observed value
+        """
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+            if value > self._max:
+                self._max = value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Context manager that observes the elapsed wall time in seconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile from the bucket counts.
+
+        Args:
+            q (float): Quantile between 0 and 1
+
+        Returns:
+            Optional[float]: Estimated value, or None when nothing was recorded
+        """
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            maximum = self._max
+        if total == 0:
+            return None
+
+        rank = q * total
+        cumulative = 0
+        for index, bucket_count in enumerate(counts):
+            if bucket_count and cumulative + bucket_count >= rank:
+                lower = self._bounds[index - 1] if index > 0 else 0.0
+                upper = self._bounds[index] if index < len(self._bounds) else maximum
+                fraction = (rank - cumulative) / bucket_count
+                return min(lower + (upper - lower) * fraction, maximum)
+            cumulative += bucket_count
+        return maximum
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            counts = list(self._counts)
+            total = self._count
+            total_sum = self._sum
+            maximum = self._max
+
+        buckets = {}
+        cumulative = 0
+        for bound, bucket_count in zip(self._bounds, counts):
+            cumulative += bucket_count
+            buckets[str(bound)] = cumulative
+        buckets['+Inf'] = total
+
+        return {
+            'count': total,
+            'sum': round(total_sum, 6),
+            'mean': round(total_sum / total, 6) if total else None,
+            'max': round(maximum, 6),
+            'p50': _round(self.quantile(0.5)),
+            'p90': _round(self.quantile(0.9)),
+            'p99': _round(self.quantile(0.99)),
+            'buckets': buckets
+        }
+
+
+class MetricsRegistry:
+    """
+    Get-or-create registry of named, labelled counters and histograms.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, Dict[LabelKey, Counter]] = {}
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+
+    def counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> Counter:
+        """
+        Get or create a counter.
+
+        Args:
+            name (str): Metric name
+            labels (Optional[Dict[str, str]]): Label values
+
+        Returns:
+            Counter: The counter for this name and label set
+        """
+        key = _label_key(labels)
+        series = self._counters.get(name)
+        if series is not None and key in series:
+            return series[key]
+
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            if key not in series:
+                series[key] = Counter()
+            return series[key]
+
+    def histogram(self, name: str, labels: Optional[Dict[str, str]] = None,
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        """
+        Get or create a histogram.
+
+        Args:
+            name (str): Metric name
+            labels (Optional[Dict[str, str]]): Label values
+            buckets (Sequence[float]): Bucket bounds used when the histogram is created
+
+        Returns:
+            Histogram: The histogram for this name and label set
+        """
+        key = _label_key(labels)
+        series = self._histograms.get(name)
+        if series is not None and key in series:
+            return series[key]
+
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram(buckets)
+            return series[key]
+
+    def counter_total(self, name: str) -> int:
+        """Sum a counter across all of its label sets"""
+        return sum(counter.value for counter in self._counters.get(name, {}).values())
+
+    def snapshot(self, prefix: Optional[str] = None) -> Dict[str, object]:
+        """
+        Build a JSON-serializable snapshot of all metrics.
+
+        Args:
+            prefix (Optional[str]): Only include metrics whose name starts with this
+
+        Returns:
+            Dict[str, object]: Counters and histograms keyed by name
+        """
+        def _series(metrics: Dict[str, Dict[LabelKey, object]]) -> Dict[str, List[dict]]:
+            result = {}
+            for name in sorted(metrics):
+                if prefix and not name.startswith(prefix):
+                    continue
+                result[name] = [
+                    {'labels': dict(key), **metric.snapshot()}
+                    for key, metric in sorted(metrics[name].items())
+                ]
+            return result
+
+        with self._lock:
+            counters = {name: dict(series) for name, series in self._counters.items()}
+            histograms = {name: dict(series) for name, series in self._histograms.items()}
+
+        return {
+            'uptime_seconds': round(time.time() - self._started_at, 1),
+            'counters': _series(counters),
+            'histograms': _series(histograms)
+        }
+
+    def reset(self):
+        """Drop every recorded metric"""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self._started_at = time.time()
+
+
+# Global metrics registry
+_metrics_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Get the global metrics registry"""
+    return _metrics_registry
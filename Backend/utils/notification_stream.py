@@ -0,0 +1,372 @@
+"""
+Notification Stream Utility
+
+This module pushes new notifications to connected clients and keeps each
+user's unread count in memory, so the notification badge neither polls nor
+counts rows.
+
+NotificationHub is an in-process publish/subscribe channel: every open
+Server-Sent Events stream holds a queue, and the notification writer
+publishes each row it stores to the recipient's queues. UnreadCounter loads a
+user's unread count once and then follows creates, reads and deletes; a
+count is reloaded after max_age seconds, which also bounds drift from writes
+made by other processes.
+
+StreamTickets lets a browser open a stream without putting its session
+token in the URL: the client exchanges its session for a short-lived,
+single-use ticket and passes that instead.
+"""
+
+import hashlib
+import logging
+import queue
+import secrets
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Events buffered per stream before the slowest client starts losing them
+STREAM_QUEUE_SIZE = 100
+
+
+class UnreadCounter:
+    """
+    Per-user unread notification counts.
+
+    Counts are loaded on first use and then adjusted in place. A load that
+    overlaps an adjustment is discarded and retried on the next read, so a
+    count read from the database never overwrites a newer change.
+    """
+
+    def __init__(self, connection_factory: Callable, max_age: float = 300.0, max_users: int = 100000):
+        """
+        Initialize the counter.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            max_age (float): Seconds before a count is reloaded from the database
+            max_users (int): Counts kept before the oldest are dropped
+        """
+        self._connection_factory = connection_factory
+        self.max_age = max_age
+        self.max_users = max_users
+        self._counts: Dict[int, Tuple[int, float]] = {}
+        self._versions: Dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> int:
+        """
+        Unread notifications of a user.
+
+        Args:
+            user_id (int): User ID
+
+        Returns:
+            int: Unread count
+        """
+        metrics = get_metrics_registry()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._counts.get(user_id)
+            if entry is not None and now - entry[1] < self.max_age:
+                metrics.counter('unread_count_cache_total', {'result': 'hit'}).inc()
+                return entry[0]
+            version = self._versions.setdefault(user_id, 0)
+
+        metrics.counter('unread_count_cache_total', {'result': 'miss'}).inc()
+        count = self._load(user_id)
+
+        with self._lock:
+            if self._versions.get(user_id, 0) == version:
+                self._counts[user_id] = (count, now)
+                self._evict()
+        return count
+
+    def adjust(self, user_id: int, delta: int) -> Optional[int]:
+        """
+        Apply a change to a user's count.
+
+        Args:
+            user_id (int): User ID
+            delta (int): Notifications created (positive) or read/deleted (negative)
+
+        Returns:
+            Optional[int]: New count, or None when the count is not cached
+        """
+        with self._lock:
+            self._touch(user_id)
+            entry = self._counts.get(user_id)
+            if entry is None:
+                return None
+            count = max(0, entry[0] + delta)
+            self._counts[user_id] = (count, entry[1])
+            return count
+
+    def reset(self, user_id: int):
+        """Set a user's count to zero (all notifications read)"""
+        with self._lock:
+            self._versions[user_id] = self._versions.get(user_id, 0) + 1
+            self._counts[user_id] = (0, time.monotonic())
+            self._evict()
+
+    def invalidate(self, user_id: int):
+        """Reload a user's count on the next read"""
+        with self._lock:
+            self._touch(user_id)
+            self._counts.pop(user_id, None)
+
+    def _load(self, user_id: int) -> int:
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT COUNT(*)
+                FROM Notifications
+                WHERE User_ID = %s AND Is_Read = FALSE
+            """, (user_id,))
+            return int(cursor.fetchone()[0])
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _touch(self, user_id: int):
+        # Only users that have been read carry a version (a load may be running)
+        if user_id in self._versions:
+            self._versions[user_id] += 1
+
+    def _evict(self):
+        # Dicts keep insertion order, so the first keys are the oldest readers
+        while len(self._versions) > self.max_users:
+            user_id = next(iter(self._versions))
+            del self._versions[user_id]
+            self._counts.pop(user_id, None)
+
+
+class StreamTickets:
+    """
+    Short-lived, single-use tickets for opening a notification stream.
+
+    EventSource cannot send an Authorization header, and a query string ends
+    up in access and proxy logs. A ticket found in a log is useless: it
+    expires after ttl seconds and is deleted when redeemed. Only its SHA-256
+    is stored, in a table so any process can redeem it.
+    """
+
+    def __init__(self, connection_factory: Callable, ttl: float = 30.0):
+        """
+        Initialize the ticket store.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            ttl (float): Seconds a ticket stays valid
+        """
+        self._connection_factory = connection_factory
+        self.ttl = ttl
+
+    def issue(self, user_id: int) -> str:
+        """
+        Create a ticket for a user.
+
+        Args:
+            user_id (int): Authenticated user
+
+        Returns:
+            str: Ticket to pass as ?ticket=
+        """
+        ticket = secrets.token_urlsafe(32)
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("DELETE FROM Notification_Stream_Tickets WHERE Expires_At < NOW() LIMIT 100")
+            cursor.execute("""
+                INSERT INTO Notification_Stream_Tickets (Ticket_Hash, User_ID, Expires_At)
+                VALUES (%s, %s, NOW() + INTERVAL %s SECOND)
+            """, (self._hash(ticket), user_id, int(self.ttl)))
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+        get_metrics_registry().counter('notification_stream_tickets_issued_total').inc()
+        return ticket
+
+    def redeem(self, ticket: str) -> Optional[int]:
+        """
+        Use up a ticket.
+
+        Args:
+            ticket (str): Ticket from issue()
+
+        Returns:
+            Optional[int]: User ID, or None if the ticket is unknown, expired or already used
+        """
+        ticket_hash = self._hash(ticket)
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                SELECT User_ID FROM Notification_Stream_Tickets
+                WHERE Ticket_Hash = %s AND Expires_At >= NOW()
+            """, (ticket_hash,))
+            row = cursor.fetchone()
+            cursor.execute("DELETE FROM Notification_Stream_Tickets WHERE Ticket_Hash = %s", (ticket_hash,))
+            # Of two concurrent redeems only the one whose DELETE removed the row wins
+            redeemed = row is not None and cursor.rowcount == 1
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+        return row[0] if redeemed else None
+
+    @staticmethod
+    def _hash(ticket: str) -> str:
+        return hashlib.sha256(ticket.encode('utf-8')).hexdigest()
+
+
+class NotificationHub:
+    """
+    In-process publish/subscribe for notification events.
+
+    Each subscription is a bounded queue of (event, data) pairs. A user may
+    hold max_streams_per_user streams; opening another closes the oldest.
+    """
+
+    def __init__(self, unread_counter: UnreadCounter, max_streams_per_user: int = 5):
+        """
+        Initialize the hub.
+
+        Args:
+            unread_counter (UnreadCounter): Unread counts sent with every change
+            max_streams_per_user (int): Open streams allowed per user
+        """
+        self.unread = unread_counter
+        self.max_streams_per_user = max_streams_per_user
+        self._subscribers: Dict[int, List[queue.Queue]] = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id: int) -> queue.Queue:
+        """
+        Open a subscription for a user.
+
+        Args:
+            user_id (int): User ID
+
+        Returns:
+            queue.Queue: Queue of (event, data) pairs; (None, None) means closed
+        """
+        subscription = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        with self._lock:
+            streams = self._subscribers.setdefault(user_id, [])
+            streams.append(subscription)
+            closed = streams[:-self.max_streams_per_user] if len(streams) > self.max_streams_per_user else []
+            del streams[:len(closed)]
+        for old in closed:
+            self._offer(old, (None, None))
+        get_metrics_registry().counter('notification_streams_opened_total').inc()
+        return subscription
+
+    def unsubscribe(self, user_id: int, subscription: queue.Queue):
+        """Close a subscription"""
+        with self._lock:
+            streams = self._subscribers.get(user_id, [])
+            if subscription in streams:
+                streams.remove(subscription)
+            if not streams:
+                self._subscribers.pop(user_id, None)
+
+    def connected_users(self) -> int:
+        """Users with at least one open stream"""
+        with self._lock:
+            return len(self._subscribers)
+
+    def notification_created(self, notification: Dict):
+        """
+        Count and push a stored notification.
+
+        Args:
+            notification (Dict): Notification row as returned by the API
+        """
+        user_id = notification['User_ID']
+        count = self.unread.adjust(user_id, 1)
+        self.publish(user_id, 'notification', notification)
+        self._publish_count(user_id, count)
+
+    def notifications_read(self, user_id: int, count: int = 1):
+        """Count notifications marked read and push the new unread count"""
+        self._publish_count(user_id, self.unread.adjust(user_id, -count))
+
+    def all_notifications_read(self, user_id: int):
+        """Reset the unread count after read-all and push it"""
+        self.unread.reset(user_id)
+        self._publish_count(user_id, 0)
+
+    def publish(self, user_id: int, event: str, data):
+        """
+        Send an event to every stream of a user.
+
+        Args:
+            user_id (int): Recipient
+            event (str): SSE event name
+            data: JSON-serialisable payload
+        """
+        with self._lock:
+            streams = list(self._subscribers.get(user_id, ()))
+        for subscription in streams:
+            if not self._offer(subscription, (event, data)):
+                get_metrics_registry().counter('notification_stream_dropped_total').inc()
+
+    def events(self, user_id: int, subscription: queue.Queue,
+               keepalive: float = 15.0) -> Iterator[Optional[Tuple[str, object]]]:
+        """
+        Events of a subscription, starting with the current unread count.
+
+        Args:
+            user_id (int): Subscriber
+            subscription (queue.Queue): Queue returned by subscribe()
+            keepalive (float): Seconds of silence after which None is yielded
+
+        Yields:
+            Optional[Tuple[str, object]]: (event, data), or None on an idle stream
+        """
+        try:
+            yield 'unread_count', {'unread_count': self.unread.get(user_id)}
+            while True:
+                try:
+                    event, data = subscription.get(timeout=keepalive)
+                except queue.Empty:
+                    yield None
+                    continue
+                if event is None:
+                    return
+                yield event, data
+        finally:
+            self.unsubscribe(user_id, subscription)
+
+    def _publish_count(self, user_id: int, count: Optional[int]):
+        if count is None:
+            # Not cached (no reader yet); streams load it themselves
+            with self._lock:
+                if user_id not in self._subscribers:
+                    return
+            count = self.unread.get(user_id)
+        self.publish(user_id, 'unread_count', {'unread_count': count})
+
+    @staticmethod
+    def _offer(subscription: queue.Queue, item) -> bool:
+        try:
+            subscription.put_nowait(item)
+            return True
+        except queue.Full:
+            return False
+
@@ -0,0 +1,499 @@
+"""
+Notification Dispatcher Utility
+
+This module writes in-app notifications. A notification to many users
+(every admin and editor, everyone holding a permission) becomes one
+multi-row INSERT instead of one statement per recipient, and the
+recipient sets come from an in-memory directory of role membership instead
+of a Users query per request.
+
+Notifications are queued in memory and written in batches by a background
+thread, so the request that triggers them commits only its own rows; queue
+them after the caller commits. Once a batch is stored, each notification is
+handed to the NotificationHub (if any), which pushes it to open streams and
+updates the recipient's unread count.
+
+NotificationArchiver moves read notifications past the retention window to
+Notifications_Archive in bounded batches, keeping the live table (and its
+per-user indexes) small.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+from utils.buffered_writer import BufferedWriter
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Column order of a notification row
+NOTIFICATION_COLUMNS = ('User_ID', 'Type', 'Title', 'Message', 'Related_Content_ID', 'Action_URL')
+
+# Rows per INSERT statement
+INSERT_CHUNK_SIZE = 500
+
+# Read notifications moved to the archive per transaction
+ARCHIVE_BATCH_SIZE = 1000
+
+# MySQL lock held while archiving, so only one process archives at a time
+ARCHIVE_LOCK_NAME = 'notifications_archive'
+
+NotificationRow = Tuple[int, str, str, str, Optional[int], Optional[str]]
+
+
+def insert_notifications(cursor, rows: Sequence[NotificationRow]) -> List[int]:
+    """
+    Write notification rows with multi-row INSERTs (the caller commits).
+
+    Args:
+        cursor: Open cursor
+        rows (Sequence[NotificationRow]): Rows in NOTIFICATION_COLUMNS order
+
+    Returns:
+        List[int]: Notification_ID of each row, in order
+    """
+    columns = ', '.join(NOTIFICATION_COLUMNS)
+    placeholders = '(' + ', '.join(['%s'] * len(NOTIFICATION_COLUMNS)) + ')'
+    notification_ids = []
+    for offset in range(0, len(rows), INSERT_CHUNK_SIZE):
+        chunk = rows[offset:offset + INSERT_CHUNK_SIZE]
+        cursor.execute(
+            f"INSERT INTO Notifications ({columns}) VALUES {', '.join([placeholders] * len(chunk))}",
+            [value for row in chunk for value in row]
+        )
+        # InnoDB gives the rows of one multi-row INSERT consecutive IDs;
+        # lastrowid is the first of them
+        notification_ids.extend(range(cursor.lastrowid, cursor.lastrowid + len(chunk)))
+    return notification_ids
+
+
+def notification_payload(notification_id: int, row: NotificationRow, created_at: datetime) -> Dict:
+    """Notification in the shape returned by GET /api/notifications"""
+    return {
+        'Notification_ID': notification_id,
+        'User_ID': row[0],
+        'Type': row[1],
+        'Title': row[2],
+        'Message': row[3],
+        'Is_Read': 0,
+        'Created_At': created_at,
+        'Related_Content_ID': row[4],
+        'Action_URL': row[5],
+    }
+
+
+def notification_rows(user_ids: Iterable[int], notification_type: str, title: str, message: str,
+                      related_content_id: Optional[int] = None, action_url: Optional[str] = None,
+                      exclude: Iterable[int] = ()) -> List[NotificationRow]:
+    """One row per distinct recipient (None and excluded users are skipped)"""
+    excluded = set(exclude)
+    return [
+        (user_id, notification_type, title, message, related_content_id, action_url)
+        for user_id in sorted({user_id for user_id in user_ids if user_id is not None} - excluded)
+    ]
+
+
+class RoleDirectory:
+    """
+    Versioned in-memory directory of role -> active user IDs.
+
+    A role's members are loaded on first use and kept until invalidate()
+    names the role, so broadcast targeting reads memory only. ttl bounds how
+    long a change made by another process can go unseen. Every invalidation
+    bumps version, and a load started under an older version is returned but
+    not kept, so a load racing a role change never caches the old members.
+    """
+
+    def __init__(self, connection_factory: Callable, ttl: float = 300.0):
+        """
+        Initialize the directory.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            ttl (float): Seconds an entry is trusted without an invalidation
+        """
+        self._connection_factory = connection_factory
+        self.ttl = ttl
+        self.version = 0
+        self._members: Dict[int, Tuple[FrozenSet[int], float]] = {}
+        self._permission_roles: Dict[str, Tuple[FrozenSet[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def users_with_roles(self, role_ids: Iterable[int]) -> FrozenSet[int]:
+        """
+        Active users whose role is one of role_ids.
+
+        Args:
+            role_ids (Iterable[int]): Role IDs (1 Admin, 2 Editor, 3 User)
+
+        Returns:
+            FrozenSet[int]: User IDs
+        """
+        role_ids = sorted({int(role_id) for role_id in role_ids})
+        now = time.monotonic()
+        members = set()
+        missing = []
+        with self._lock:
+            version = self.version
+            for role_id in role_ids:
+                entry = self._members.get(role_id)
+                if entry is not None and now - entry[1] < self.ttl:
+                    members.update(entry[0])
+                else:
+                    missing.append(role_id)
+        if not missing:
+            return frozenset(members)
+
+        loaded = {role_id: set() for role_id in missing}
+        placeholders = ', '.join(['%s'] * len(missing))
+        for role_id, user_id in self._query(f"""
+            SELECT Role_ID, User_ID FROM Users
+            WHERE Status = 'Active' AND Role_ID IN ({placeholders})
+        """, missing):
+            loaded[role_id].add(user_id)
+
+        get_metrics_registry().counter('role_directory_loads_total').inc()
+        with self._lock:
+            if self.version == version:
+                for role_id, user_ids in loaded.items():
+                    self._members[role_id] = (frozenset(user_ids), now)
+        for user_ids in loaded.values():
+            members.update(user_ids)
+        return frozenset(members)
+
+    def users_with_permission(self, permission_name: str) -> FrozenSet[int]:
+        """
+        Active users whose role grants a permission.
+
+        Args:
+            permission_name (str): Permission name, e.g. 'research_review'
+
+        Returns:
+            FrozenSet[int]: User IDs
+        """
+        now = time.monotonic()
+        with self._lock:
+            version = self.version
+            entry = self._permission_roles.get(permission_name)
+        if entry is None or now - entry[1] >= self.ttl:
+            role_ids = frozenset(row[0] for row in self._query(
+                "SELECT Role_ID FROM Permissions WHERE Permission_Name = %s", (permission_name,)))
+            with self._lock:
+                if self.version == version:
+                    self._permission_roles[permission_name] = (role_ids, now)
+        else:
+            role_ids = entry[0]
+        return self.users_with_roles(role_ids) if role_ids else frozenset()
+
+    def invalidate(self, role_ids: Optional[Iterable[int]] = None):
+        """
+        Drop cached members after a change to users' roles or statuses.
+
+        Args:
+            role_ids (Optional[Iterable[int]]): Roles whose members changed (default: every
+                role and the permission mapping)
+        """
+        with self._lock:
+            self.version += 1
+            if role_ids is None:
+                self._members.clear()
+                self._permission_roles.clear()
+                return
+            for role_id in role_ids:
+                if role_id is not None:
+                    self._members.pop(int(role_id), None)
+
+    def _query(self, sql: str, params) -> List[tuple]:
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql, params)
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+            conn.close()
+
+
+class NotificationDispatcher(BufferedWriter):
+    """
+    Fans notifications out to recipients and writes them in batches.
+
+    notify() queues rows; they are flushed every flush_interval seconds or
+    once flush_threshold rows are pending.
+    """
+
+    def __init__(self, connection_factory: Callable, recipients: RoleDirectory, hub=None,
+                 flush_interval: float = 1.0, flush_threshold: int = 200, max_pending: int = 50000):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            recipients (RoleDirectory): Role and permission membership
+            hub (NotificationHub): Receives every stored notification
+            flush_interval (float): Maximum seconds a queued notification waits
+            flush_threshold (int): Pending rows that trigger an early flush
+            max_pending (int): Maximum rows kept in memory (oldest dropped first)
+        """
+        super().__init__('notifications', flush_interval, flush_threshold)
+        self._connection_factory = connection_factory
+        self.recipients = recipients
+        self.hub = hub
+        self.max_pending = max_pending
+        self._pending = deque()
+
+    def notify(self, user_ids: Iterable[int], notification_type: str, title: str, message: str,
+               related_content_id: Optional[int] = None, action_url: Optional[str] = None,
+               exclude: Iterable[int] = ()) -> int:
+        """
+        Notify a set of users.
+
+        Args:
+            user_ids (Iterable[int]): Recipients (duplicates and None are ignored)
+            notification_type (str): Notification type, e.g. 'application'
+            title (str): Title
+            message (str): Message
+            related_content_id (Optional[int]): Related content or application ID
+            action_url (Optional[str]): Frontend route opened by the notification
+            exclude (Iterable[int]): Users not to notify (e.g. the actor)
+
+        Returns:
+            int: Number of notifications queued
+        """
+        rows = notification_rows(user_ids, notification_type, title, message,
+                                 related_content_id, action_url, exclude)
+        if not rows:
+            return 0
+
+        metrics = get_metrics_registry()
+        metrics.counter('notifications_dispatched_total', {'type': notification_type}).inc(len(rows))
+        with self._lock:
+            self._pending.extend(rows)
+            dropped = len(self._pending) - self.max_pending
+            for _ in range(max(dropped, 0)):
+                self._pending.popleft()
+            pending_size = len(self._pending)
+        if dropped > 0:
+            logger.warning(f"Notification queue full, dropped {dropped} oldest notifications")
+            metrics.counter('notifications_dropped_total').inc(dropped)
+        self.start()
+        self._pending_changed(pending_size)
+        return len(rows)
+
+    def notify_roles(self, role_ids: Iterable[int], notification_type: str, title: str, message: str,
+                     **kwargs) -> int:
+        """Notify every user with one of the roles (see notify for the other arguments)"""
+        return self._notify_group(lambda: self.recipients.users_with_roles(role_ids),
+                                  notification_type, title, message, **kwargs)
+
+    def notify_permission(self, permission_name: str, notification_type: str, title: str, message: str,
+                          **kwargs) -> int:
+        """Notify every user whose role grants the permission (see notify for the other arguments)"""
+        return self._notify_group(lambda: self.recipients.users_with_permission(permission_name),
+                                  notification_type, title, message, **kwargs)
+
+    def _notify_group(self, load_recipients: Callable, notification_type: str, title: str, message: str,
+                      **kwargs) -> int:
+        # Group notifications are sent after the caller's own work is committed,
+        # so a failed lookup is logged rather than failing the request
+        try:
+            user_ids = load_recipients()
+        except Exception as e:
+            logger.error(f"Could not load recipients for '{notification_type}' notification: {e}")
+            get_metrics_registry().counter('notification_recipient_errors_total').inc()
+            return 0
+        return self.notify(user_ids, notification_type, title, message, **kwargs)
+
+    def insert(self, cursor, rows: Sequence[NotificationRow]) -> Callable[[], None]:
+        """
+        Write notification rows in the caller's transaction instead of queueing them.
+
+        Args:
+            cursor: Cursor of the open transaction
+            rows (Sequence[NotificationRow]): Rows from notification_rows()
+
+        Returns:
+            Callable[[], None]: Publishes the rows to the hub; call it after commit
+        """
+        notification_ids = insert_notifications(cursor, rows) if rows else []
+        return lambda: self._published(notification_ids, rows)
+
+    def pending(self) -> int:
+        """Number of queued notifications"""
+        with self._lock:
+            return len(self._pending)
+
+    # BufferedWriter hooks
+
+    def _drain(self) -> Optional[List[NotificationRow]]:
+        if not self._pending:
+            return None
+        batch = list(self._pending)
+        self._pending.clear()
+        return batch
+
+    def _write(self, batch: List[NotificationRow]) -> int:
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            notification_ids = insert_notifications(cursor, batch)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        self._published(notification_ids, batch)
+        return len(batch)
+
+    def _published(self, notification_ids: List[int], rows: Sequence[NotificationRow]):
+        """Count stored notifications and hand them to the hub"""
+        get_metrics_registry().counter('notifications_written_total').inc(len(rows))
+        if self.hub is None:
+            return
+        created_at = datetime.now().replace(microsecond=0)
+        for notification_id, row in zip(notification_ids, rows):
+            try:
+                self.hub.notification_created(notification_payload(notification_id, row, created_at))
+            except Exception as e:
+                logger.error(f"Publishing notification {notification_id} failed: {e}")
+
+    def _requeue(self, batch: List[NotificationRow]):
+        self._pending.extendleft(reversed(batch))
+        while len(self._pending) > self.max_pending:
+            self._pending.popleft()
+
+
+class NotificationArchiver:
+    """
+    Moves read notifications older than retention_days to Notifications_Archive on a timer.
+
+    Each batch copies and deletes up to batch_size rows in one transaction,
+    so locks are short and an interrupted pass loses nothing.
+    """
+
+    def __init__(self, connection_factory: Callable, interval: float = 3600.0, retention_days: int = 90,
+                 batch_size: int = ARCHIVE_BATCH_SIZE, max_batches: int = 100):
+        """
+        Initialize the archiver.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            interval (float): Seconds between passes; 0 or less disables the timer
+            retention_days (int): Days a read notification stays in Notifications (minimum 1)
+            batch_size (int): Rows moved per transaction
+            max_batches (int): Batches per pass (the rest waits for the next pass)
+        """
+        self._connection_factory = connection_factory
+        self.interval = interval
+        self.retention_days = max(1, retention_days)
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self.last_result: Optional[Dict] = None
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the periodic archiving (no-op when disabled or already running)"""
+        if self.interval <= 0 or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._loop, name='notification-archiver', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the periodic archiving"""
+        self._stopped.set()
+
+    def archive(self) -> Dict:
+        """
+        Move one pass worth of old read notifications to the archive.
+
+        Returns:
+            Dict: 'archived' rows, 'batches' run, 'remaining' (True when the batch
+                limit was hit) and 'skipped' (True when another process is archiving)
+        """
+        metrics = get_metrics_registry()
+        start = time.perf_counter()
+        archived = batches = 0
+        remaining = False
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            cursor.execute("SELECT GET_LOCK(%s, 0)", (ARCHIVE_LOCK_NAME,))
+            if cursor.fetchone()[0] != 1:
+                return {'archived': 0, 'batches': 0, 'remaining': False, 'skipped': True}
+
+            try:
+                cutoff = datetime.now() - timedelta(days=self.retention_days)
+                while batches < self.max_batches:
+                    moved = self._archive_batch(conn, cursor, cutoff)
+                    archived += moved
+                    batches += 1
+                    if moved < self.batch_size:
+                        break
+                else:
+                    remaining = True
+            finally:
+                cursor.execute("SELECT RELEASE_LOCK(%s)", (ARCHIVE_LOCK_NAME,))
+                cursor.fetchone()
+        except Exception:
+            metrics.counter('notification_archive_errors_total').inc()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        metrics.counter('notifications_archived_total').inc(archived)
+        metrics.histogram('notification_archive_seconds').observe(time.perf_counter() - start)
+        self.last_result = {'archived': archived, 'batches': batches, 'remaining': remaining, 'skipped': False}
+        return self.last_result
+
+    def _archive_batch(self, conn, cursor, cutoff) -> int:
+        """Copy and delete the oldest batch_size read notifications created before cutoff"""
+        try:
+            # Oldest first along idx_notifications_read_created, locked until commit
+            cursor.execute("""
+                SELECT Notification_ID
+                FROM Notifications
+                WHERE Is_Read = TRUE AND Created_At < %s
+                ORDER BY Created_At
+                LIMIT %s
+                FOR UPDATE
+            """, (cutoff, self.batch_size))
+            notification_ids = [row[0] for row in cursor.fetchall()]
+            if not notification_ids:
+                conn.rollback()
+                return 0
+
+            placeholders = ', '.join(['%s'] * len(notification_ids))
+            cursor.execute(f"""
+                INSERT IGNORE INTO Notifications_Archive
+                    (Notification_ID, User_ID, Type, Title, Message, Is_Read, Created_At,
+                     Related_Content_ID, Action_URL)
+                SELECT Notification_ID, User_ID, Type, Title, Message, Is_Read, Created_At,
+                       Related_Content_ID, Action_URL
+                FROM Notifications
+                WHERE Notification_ID IN ({placeholders})
+            """, notification_ids)
+            cursor.execute(f"DELETE FROM Notifications WHERE Notification_ID IN ({placeholders})",
+                           notification_ids)
+            conn.commit()
+            return len(notification_ids)
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _loop(self):
+        while not self._stopped.wait(self.interval):
+            try:
+                self.archive()
+            except Exception as e:
+                logger.error(f"Notification archiving failed: {e}")
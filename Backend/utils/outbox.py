@@ -0,0 +1,260 @@
+"""
+Transactional Outbox Utility
+
+This module moves the side effects of a write (notifications, audit rows,
+lookups needed only to word a notification) out of the request. The handler
+records an event in Outbox_Events inside its own transaction, so the event
+exists exactly when the write committed, and returns.
+
+OutboxDispatcher threads claim pending events with FOR UPDATE SKIP LOCKED
+(several processes can dispatch side by side without taking each other's
+events) and run the registered handler for each one. A handler does its
+database work on the dispatcher's cursor, and the event is marked done in
+that same transaction, so each side effect is committed exactly once. Work
+outside the database (pushing to open streams) is returned by the handler
+as a callback and runs after the commit.
+"""
+
+import json
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Done events deleted per statement when purging
+PURGE_BATCH_SIZE = 1000
+
+# Characters of a handler error kept in Last_Error
+MAX_ERROR_LENGTH = 1000
+
+# handler(cursor, payload) -> optional callback to run after commit
+EventHandler = Callable[[object, Dict], Optional[Callable[[], None]]]
+
+
+def publish_event(cursor, event_type: str, payload: Dict) -> int:
+    """
+    Record an event in the caller's transaction (the caller commits).
+
+    Args:
+        cursor: Cursor of the transaction making the change
+        event_type (str): Registered handler name, e.g. 'content_saved'
+        payload (Dict): JSON-serialisable event data
+
+    Returns:
+        int: Event_ID
+    """
+    cursor.execute("""
+        INSERT INTO Outbox_Events (Event_Type, Payload)
+        VALUES (%s, %s)
+    """, (event_type, json.dumps(payload, default=str)))
+    get_metrics_registry().counter('outbox_events_published_total', {'type': event_type}).inc()
+    return cursor.lastrowid
+
+
+class OutboxDispatcher:
+    """
+    Background dispatcher for Outbox_Events.
+
+    Every poll_interval seconds (or at once after wake()) each worker claims
+    up to batch_size pending events and handles them in one transaction. A
+    failing event is rolled back to its savepoint and retried with
+    exponential backoff; after max_attempts it is marked failed.
+    """
+
+    def __init__(self, connection_factory: Callable, workers: int = 1, batch_size: int = 100,
+                 poll_interval: float = 1.0, max_attempts: int = 10, retry_base: float = 5.0,
+                 retry_max: float = 600.0, retention_hours: float = 24.0):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            workers (int): Dispatch threads; 0 leaves events to other processes
+            batch_size (int): Events claimed per transaction
+            poll_interval (float): Seconds between polls when idle
+            max_attempts (int): Attempts before an event is marked failed
+            retry_base (float): Delay before the first retry, doubled per attempt
+            retry_max (float): Longest retry delay
+            retention_hours (float): Hours done events are kept before purging
+        """
+        self._connection_factory = connection_factory
+        self.workers = workers
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.retention_hours = retention_hours
+        self._handlers: Dict[str, EventHandler] = {}
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._last_purge = 0.0
+
+    def handler(self, event_type: str):
+        """Decorator registering the handler of an event type"""
+        def register(function: EventHandler) -> EventHandler:
+            self._handlers[event_type] = function
+            return function
+        return register
+
+    def start(self):
+        """Start the worker threads (no-op when workers is 0 or already running)"""
+        if self.workers <= 0 or self._threads:
+            return
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._loop, name=f"outbox-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        logger.info(f"Outbox dispatcher started ({self.workers} workers, {len(self._handlers)} event types)")
+
+    def stop(self):
+        """Stop the worker threads after their current batch"""
+        self._stopped.set()
+        self._wake.set()
+
+    def wake(self):
+        """Poll now instead of at the next interval (call after committing an event)"""
+        self._wake.set()
+
+    def process_batch(self) -> Dict[str, int]:
+        """
+        Claim and handle one batch of pending events.
+
+        Returns:
+            Dict[str, int]: Events 'done', 'retried' and 'failed'
+        """
+        metrics = get_metrics_registry()
+        result = {'done': 0, 'retried': 0, 'failed': 0}
+        callbacks = []
+        start = time.perf_counter()
+        conn = self._connection_factory()
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute("""
+                SELECT Event_ID, Event_Type, Payload, Attempts
+                FROM Outbox_Events
+                WHERE Status = 'pending' AND Available_At <= NOW()
+                ORDER BY Available_At, Event_ID
+                LIMIT %s
+                FOR UPDATE SKIP LOCKED
+            """, (self.batch_size,))
+            events = cursor.fetchall()
+            if not events:
+                conn.rollback()
+                return result
+
+            for event in events:
+                outcome, callback = self._handle(cursor, event)
+                result[outcome] += 1
+                if callback is not None:
+                    callbacks.append(callback)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            metrics.counter('outbox_batch_errors_total').inc()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Outbox after-commit callback failed: {e}")
+
+        for outcome, count in result.items():
+            metrics.counter('outbox_events_total', {'outcome': outcome}).inc(count)
+        metrics.histogram('outbox_batch_seconds').observe(time.perf_counter() - start)
+        return result
+
+    def purge(self) -> int:
+        """
+        Delete done events older than retention_hours.
+
+        Returns:
+            int: Events deleted
+        """
+        cutoff = datetime.now() - timedelta(hours=self.retention_hours)
+        deleted = 0
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            while True:
+                cursor.execute("""
+                    DELETE FROM Outbox_Events
+                    WHERE Status = 'done' AND Processed_At < %s
+                    LIMIT %s
+                """, (cutoff, PURGE_BATCH_SIZE))
+                conn.commit()
+                deleted += cursor.rowcount
+                if cursor.rowcount < PURGE_BATCH_SIZE:
+                    return deleted
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _handle(self, cursor, event: Dict):
+        """Run one event's handler under a savepoint; returns (outcome, after-commit callback)"""
+        # Re-declaring the savepoint for each event replaces the previous one
+        event_id = event['Event_ID']
+        handler = self._handlers.get(event['Event_Type'])
+        cursor.execute("SAVEPOINT outbox_event")
+        try:
+            if handler is None:
+                raise LookupError(f"No handler for event type '{event['Event_Type']}'")
+            payload = event['Payload']
+            if isinstance(payload, (str, bytes, bytearray)):
+                payload = json.loads(payload)
+            callback = handler(cursor, payload)
+            cursor.execute("""
+                UPDATE Outbox_Events
+                SET Status = 'done', Attempts = Attempts + 1, Processed_At = NOW(), Last_Error = NULL
+                WHERE Event_ID = %s
+            """, (event_id,))
+            return 'done', callback
+        except Exception as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT outbox_event")
+            attempts = event['Attempts'] + 1
+            error = str(e)[:MAX_ERROR_LENGTH]
+            if attempts >= self.max_attempts:
+                logger.error(f"Outbox event {event_id} ({event['Event_Type']}) failed permanently: {error}")
+                cursor.execute("""
+                    UPDATE Outbox_Events
+                    SET Status = 'failed', Attempts = %s, Processed_At = NOW(), Last_Error = %s
+                    WHERE Event_ID = %s
+                """, (attempts, error, event_id))
+                return 'failed', None
+
+            delay = min(self.retry_max, self.retry_base * 2 ** (attempts - 1))
+            logger.warning(f"Outbox event {event_id} ({event['Event_Type']}) failed, retrying in {delay:.0f}s: {error}")
+            cursor.execute("""
+                UPDATE Outbox_Events
+                SET Attempts = %s, Available_At = NOW() + INTERVAL %s SECOND, Last_Error = %s
+                WHERE Event_ID = %s
+            """, (attempts, int(delay), error, event_id))
+            return 'retried', None
+
+    def _loop(self):
+        while not self._stopped.is_set():
+            try:
+                result = self.process_batch()
+                if time.monotonic() - self._last_purge > 3600:
+                    self._last_purge = time.monotonic()
+                    self.purge()
+            except Exception as e:
+                logger.error(f"Outbox dispatch failed: {e}")
+                result = None
+
+            # A full batch means more may be waiting; otherwise sleep until woken
+            if result is None or sum(result.values()) < self.batch_size:
+                self._wake.wait(self.poll_interval)
+                self._wake.clear()
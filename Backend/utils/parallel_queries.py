@@ -0,0 +1,183 @@
+"""
+Parallel Query Utility
+
+This module runs independent read-only queries of one request concurrently,
+each worker on its own pooled connection, so a dashboard that issues several
+aggregates waits roughly as long as its slowest query instead of their sum.
+
+The calling thread takes part with the connection it already holds. Extra
+connections are borrowed only up to a per-request concurrency cap, and a
+worker that cannot get one (pool exhausted) simply does not start, so the
+caller's connection drains the remaining queries sequentially. Each
+statement carries a MAX_EXECUTION_TIME hint for the batch time budget.
+With a PreparedStatementCache the queries run as cached server-side
+prepared statements; the hint is the same on every run, so the statement
+shape stays stable.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, NamedTuple, Sequence
+
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Leading SELECT keyword, where the optimizer hint is placed
+SELECT_PATTERN = re.compile(r'^\s*SELECT\b', re.IGNORECASE)
+
+# Histogram buckets for connections used per batch
+CONNECTION_BUCKETS = (1, 2, 3, 4, 6, 8, 12, 16)
+
+# MySQL error raised when MAX_EXECUTION_TIME interrupts a statement
+ER_QUERY_TIMEOUT = 3024
+
+
+class Query(NamedTuple):
+    """One read-only statement; fetch is 'all' (list of rows) or 'one' (single row)"""
+    sql: str
+    params: Sequence = ()
+    fetch: str = 'all'
+
+
+class QueryTimeout(Exception):
+    """Raised when a batch does not finish within its time budget"""
+
+
+class ParallelQueryRunner:
+    """
+    Runs named batches of independent queries on up to max_concurrency connections.
+
+    Worker threads are shared between requests; the cap applies per batch.
+    """
+
+    def __init__(self, connection_factory: Callable, max_concurrency: int = 3,
+                 timeout: float = 10.0, max_workers: int = 16, statement_cache=None):
+        """
+        Initialize the runner.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            max_concurrency (int): Connections used per batch, including the caller's
+            timeout (float): Seconds a batch may take before QueryTimeout is raised
+            max_workers (int): Worker threads shared by all batches
+            statement_cache (PreparedStatementCache): Run queries as cached prepared
+                statements (the pool must not reset sessions)
+        """
+        self._connection_factory = connection_factory
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.statement_cache = statement_cache
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='parallel-query')
+
+    def run(self, queries: Dict[str, Query], connection=None) -> Dict[str, Any]:
+        """
+        Execute every query and return the results by name.
+
+        Args:
+            queries (Dict[str, Query]): Independent read-only queries
+            connection: Connection the caller already holds; it runs queries too and
+                is the sequential fallback. A connection is borrowed when omitted.
+
+        Returns:
+            Dict[str, Any]: Rows as dictionaries ('all') or one dictionary or None ('one')
+
+        Raises:
+            QueryTimeout: If the batch exceeds the timeout
+        """
+        metrics = get_metrics_registry()
+        start = time.perf_counter()
+        deadline = time.monotonic() + self.timeout
+        pending = deque(queries.items())
+        results: Dict[str, Any] = {}
+        abandoned = threading.Event()
+
+        helpers = max(0, min(self.max_concurrency, len(queries)) - 1)
+        futures = [self._executor.submit(self._helper, pending, results, deadline, abandoned)
+                   for _ in range(helpers)]
+
+        owns_connection = connection is None
+        if owns_connection:
+            connection = self._connection_factory()
+        try:
+            self._drain(connection, pending, results, deadline, abandoned)
+        except Exception:
+            abandoned.set()
+            raise
+        finally:
+            if owns_connection:
+                connection.close()
+
+        _, not_done = wait(futures, timeout=max(0.0, deadline - time.monotonic()))
+        if not_done:
+            abandoned.set()
+            metrics.counter('parallel_query_timeouts_total').inc()
+            raise QueryTimeout(f"Queries still running after {self.timeout}s: "
+                               f"{sorted(set(queries) - set(results))}")
+        for future in futures:
+            future.result()
+
+        connections_used = 1 + sum(1 for future in futures if future.result())
+        if helpers and connections_used == 1:
+            metrics.counter('parallel_query_fallbacks_total').inc()
+        metrics.histogram('parallel_query_batch_seconds').observe(time.perf_counter() - start)
+        metrics.histogram('parallel_query_connections', buckets=CONNECTION_BUCKETS).observe(connections_used)
+        return results
+
+    def _helper(self, pending, results, deadline, abandoned) -> bool:
+        """Drain queries on a borrowed connection; False when none was available"""
+        if not pending or abandoned.is_set():
+            return False
+        try:
+            connection = self._connection_factory()
+        except Exception as e:
+            # Pool exhausted (or database unavailable): leave the queries to the caller
+            logger.debug(f"Parallel query helper got no connection: {e}")
+            return False
+        try:
+            self._drain(connection, pending, results, deadline, abandoned)
+        except Exception:
+            abandoned.set()
+            raise
+        finally:
+            connection.close()
+        return True
+
+    def _drain(self, connection, pending, results, deadline, abandoned):
+        cursor = None if self.statement_cache else connection.cursor(buffered=True, dictionary=True)
+        hint = f'SELECT /*+ MAX_EXECUTION_TIME({int(self.timeout * 1000)}) */'
+        try:
+            while not abandoned.is_set():
+                try:
+                    name, query = pending.popleft()
+                except IndexError:
+                    return
+                if time.monotonic() >= deadline:
+                    abandoned.set()
+                    raise QueryTimeout(f"Time budget exhausted before query '{name}'")
+                sql = SELECT_PATTERN.sub(hint, query.sql, count=1)
+                try:
+                    if self.statement_cache:
+                        results[name] = self.statement_cache.execute(connection, sql, query.params, query.fetch)
+                    else:
+                        cursor.execute(sql, tuple(query.params))
+                        results[name] = cursor.fetchone() if query.fetch == 'one' else cursor.fetchall()
+                except Exception as e:
+                    if getattr(e, 'errno', None) == ER_QUERY_TIMEOUT:
+                        get_metrics_registry().counter('parallel_query_timeouts_total').inc()
+                        raise QueryTimeout(f"Query '{name}' exceeded the time budget") from e
+                    raise
+        finally:
+            if cursor is not None:
+                cursor.close()
+
+    def close(self):
+        """Stop the worker threads once running batches finish"""
+        self._executor.shutdown(wait=False)
+
@@ -0,0 +1,200 @@
+"""
+Analytics Query Builder Utility
+
+This module builds analytics SQL from fixed fragments with every value
+passed as a parameter, and executes it as server-side prepared statements
+that are cached per connection and per statement shape.
+
+A shape is the SQL text. Optional filters add or leave out a known clause,
+so an endpoint has a handful of shapes however its parameters vary, and
+each shape is parsed and planned once per connection instead of once per
+request. The connections must come from a pool that does not reset the
+session on checkout, because a session reset deallocates the statements.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Analytics time ranges accepted by the API, in days
+TIME_RANGE_DAYS = {
+    '7d': 7,
+    '30d': 30,
+    '90d': 90,
+    '1y': 365,
+}
+
+CONTENT_TYPES = ('Blog_Post', 'Research_Paper', 'Note', 'Course', 'Job', 'Internship')
+
+
+class AnalyticsQuery:
+    """
+    Incrementally assembled SELECT statement.
+
+    Clauses are fixed SQL fragments with %s placeholders; values only ever
+    travel as parameters.
+    """
+
+    def __init__(self, select: str, *params: Any):
+        """
+        Start a query.
+
+        Args:
+            select (str): SELECT ... FROM ... [JOIN ...] part
+            *params (Any): Values for placeholders in the select part
+        """
+        self._select = select.strip()
+        self._select_params = list(params)
+        self._where: List[str] = []
+        self._where_params: List[Any] = []
+        self._group_by: Optional[str] = None
+        self._order_by: Optional[str] = None
+        self._limit: Optional[int] = None
+
+    def where(self, clause: str, *params: Any) -> 'AnalyticsQuery':
+        """Add a condition joined with AND"""
+        self._where.append(clause)
+        self._where_params.extend(params)
+        return self
+
+    def where_if(self, condition: bool, clause: str, *params: Any) -> 'AnalyticsQuery':
+        """Add a condition only when condition is true (one more shape, not one per value)"""
+        return self.where(clause, *params) if condition else self
+
+    def group_by(self, clause: str) -> 'AnalyticsQuery':
+        self._group_by = clause
+        return self
+
+    def order_by(self, clause: str) -> 'AnalyticsQuery':
+        self._order_by = clause
+        return self
+
+    def limit(self, count: int) -> 'AnalyticsQuery':
+        self._limit = int(count)
+        return self
+
+    def build(self) -> Tuple[str, tuple]:
+        """
+        Render the statement.
+
+        Returns:
+            Tuple[str, tuple]: SQL text (the shape) and its parameters
+        """
+        parts = [self._select]
+        params = list(self._select_params)
+        if self._where:
+            parts.append("WHERE " + "\n  AND ".join(self._where))
+            params.extend(self._where_params)
+        if self._group_by:
+            parts.append("GROUP BY " + self._group_by)
+        if self._order_by:
+            parts.append("ORDER BY " + self._order_by)
+        if self._limit is not None:
+            parts.append("LIMIT %s")
+            params.append(self._limit)
+        return "\n".join(parts), tuple(params)
+
+
+class PreparedStatementCache:
+    """
+    Server-side prepared statements kept per connection and per shape.
+
+    Connections are told apart by their server connection id, so a
+    reconnect starts with an empty cache. Each connection keeps at most
+    max_statements statements, least recently used closed first.
+    """
+
+    def __init__(self, max_statements: int = 64, max_connections: int = 32):
+        """
+        Initialize the cache.
+
+        Args:
+            max_statements (int): Prepared statements kept per connection
+            max_connections (int): Connections tracked before the oldest is forgotten
+        """
+        self.max_statements = max_statements
+        self.max_connections = max_connections
+        self._connections: 'OrderedDict[int, OrderedDict[str, Any]]' = OrderedDict()
+        self._shapes: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def execute(self, connection, sql: str, params: Sequence = (), fetch: str = 'all'):
+        """
+        Execute a statement through the connection's prepared statement for its shape.
+
+        Args:
+            connection: Connection checked out by the caller (not shared while in use)
+            sql (str): Statement text with %s placeholders
+            params (Sequence): Values for the placeholders
+            fetch (str): 'all' for a list of rows, 'one' for the first row or None
+
+        Returns:
+            List[Dict] or Optional[Dict]: Rows as dictionaries
+        """
+        metrics = get_metrics_registry()
+        statements = self._statements_for(connection)
+
+        with self._lock:
+            # The same string object every time, so the cursor recognises its statement
+            sql = self._shapes.setdefault(sql, sql)
+
+        cursor = statements.get(sql)
+        if cursor is None:
+            cursor = connection.cursor(prepared=True, dictionary=True)
+            statements[sql] = cursor
+            while len(statements) > self.max_statements:
+                _, evicted = statements.popitem(last=False)
+                self._close_cursor(evicted)
+            metrics.counter('prepared_statement_cache_total', {'result': 'prepare'}).inc()
+        else:
+            statements.move_to_end(sql)
+            metrics.counter('prepared_statement_cache_total', {'result': 'reuse'}).inc()
+
+        try:
+            cursor.execute(sql, tuple(params))
+            rows = cursor.fetchall()
+        except Exception:
+            # Drop the statement; it is prepared again on the next call
+            statements.pop(sql, None)
+            self._close_cursor(cursor)
+            raise
+
+        if fetch == 'one':
+            return rows[0] if rows else None
+        return rows
+
+    def stats(self) -> Dict[str, int]:
+        """Tracked connections and prepared statements"""
+        with self._lock:
+            return {
+                'connections': len(self._connections),
+                'statements': sum(len(statements) for statements in self._connections.values()),
+                'shapes': len(self._shapes),
+            }
+
+    def _statements_for(self, connection) -> 'OrderedDict[str, Any]':
+        connection_id = connection.connection_id
+        with self._lock:
+            statements = self._connections.get(connection_id)
+            if statements is None:
+                statements = self._connections[connection_id] = OrderedDict()
+                # Connection ids of closed or reconnected sessions are never seen again
+                while len(self._connections) > self.max_connections:
+                    self._connections.popitem(last=False)
+            else:
+                self._connections.move_to_end(connection_id)
+            return statements
+
+    @staticmethod
+    def _close_cursor(cursor):
+        try:
+            cursor.close()
+        except Exception as e:
+            logger.debug(f"Closing prepared statement failed: {e}")
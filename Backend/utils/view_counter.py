@@ -0,0 +1,187 @@
+"""
+View Counter Utility
+
+This module aggregates content view increments in memory and writes them to
+Content_Metrics in batched INSERT ... ON DUPLICATE KEY UPDATE statements,
+instead of locking the metrics row on every detail page read. Repeat views
+of the same content by the same viewer within a window are ignored.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
+
+from utils.buffered_writer import BufferedWriter
+from utils.metrics import get_metrics_registry
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# MySQL error raised when a row references a missing Content_ID
+FOREIGN_KEY_ERRNO = 1452
+
+# Rows per INSERT statement
+FLUSH_CHUNK_SIZE = 500
+
+
+class ViewCounter(BufferedWriter):
+    """
+    Write-coalescing view counter for Content_Metrics.Views.
+
+    Views are summed per content id and flushed every flush_interval seconds
+    or once flush_threshold views are pending. A failed flush puts the counts
+    back, up to max_pending distinct content ids, so a database outage loses
+    at most the overflow rather than growing memory without bound.
+    """
+
+    def __init__(self, connection_factory: Callable, flush_interval: float = 5.0,
+                 flush_threshold: int = 200, dedupe_window: float = 1800.0,
+                 max_tracked_viewers: int = 100000, max_pending: int = 50000):
+        """
+        Initialize the view counter.
+
+        Args:
+            connection_factory (Callable): Returns a pooled MySQL connection
+            flush_interval (float): Maximum seconds between flushes
+            flush_threshold (int): Pending views that trigger an early flush
+            dedupe_window (float): Seconds during which repeat views by one viewer are ignored
+            max_tracked_viewers (int): Maximum (viewer, content) pairs remembered for dedupe
+            max_pending (int): Maximum distinct content ids kept after failed flushes
+        """
+        super().__init__('view-counter', flush_interval, flush_threshold)
+        self._connection_factory = connection_factory
+        self.dedupe_window = dedupe_window
+        self.max_tracked_viewers = max_tracked_viewers
+        self.max_pending = max_pending
+        self._pending: Dict[int, int] = {}
+        self._pending_views = 0
+        self._recent_views = OrderedDict()
+
+    def record_view(self, content_id: int, viewer_key: Optional[str] = None) -> bool:
+        """
+        Count one view of a content item.
+
+        Args:
+            content_id (int): Content ID
+            viewer_key (Optional[str]): Stable key for the viewer (session or client
+                fingerprint); views without a key are never deduplicated
+
+        Returns:
+            bool: True if the view was counted, False if it was a repeat view
+        """
+        if content_id is None:
+            return False
+        content_id = int(content_id)
+        metrics = get_metrics_registry()
+        now = time.monotonic()
+
+        with self._lock:
+            if viewer_key:
+                key = (viewer_key, content_id)
+                last_seen = self._recent_views.get(key)
+                if last_seen is not None and now - last_seen < self.dedupe_window:
+                    metrics.counter('content_views_deduplicated_total').inc()
+                    return False
+                self._recent_views[key] = now
+                self._recent_views.move_to_end(key)
+                while len(self._recent_views) > self.max_tracked_viewers:
+                    self._recent_views.popitem(last=False)
+
+            self._pending[content_id] = self._pending.get(content_id, 0) + 1
+            self._pending_views += 1
+            pending_views = self._pending_views
+
+        metrics.counter('content_views_recorded_total').inc()
+        self.start()
+        self._pending_changed(pending_views)
+        return True
+
+    def pending_views(self, content_id: Optional[int] = None) -> int:
+        """
+        Views recorded but not yet written to the database.
+
+        Args:
+            content_id (Optional[int]): Limit to one content item
+
+        Returns:
+            int: Pending view count
+        """
+        with self._lock:
+            if content_id is None:
+                return self._pending_views
+            return self._pending.get(int(content_id), 0)
+
+    def _drain(self) -> Optional[Dict[int, int]]:
+        if not self._pending:
+            return None
+        batch = self._pending
+        self._pending = {}
+        self._pending_views = 0
+        return batch
+
+    def _requeue(self, batch: Dict[int, int]):
+        dropped = 0
+        for content_id, views in batch.items():
+            if content_id not in self._pending and len(self._pending) >= self.max_pending:
+                dropped += views
+                continue
+            self._pending[content_id] = self._pending.get(content_id, 0) + views
+            self._pending_views += views
+        if dropped:
+            logger.warning(f"View counter buffer full, dropped {dropped} views")
+            get_metrics_registry().counter('content_views_dropped_total').inc(dropped)
+
+    def _write(self, batch: Dict[int, int]) -> int:
+        # Sorted ids keep row lock order consistent across concurrent flushes
+        rows = sorted(batch.items())
+        conn = self._connection_factory()
+        cursor = conn.cursor()
+        try:
+            try:
+                self._upsert(cursor, rows)
+            except Exception as e:
+                if getattr(e, 'errno', None) != FOREIGN_KEY_ERRNO:
+                    raise
+                # Content deleted since it was viewed; keep the views for content that still exists
+                conn.rollback()
+                rows = self._existing_rows(cursor, rows)
+                self._upsert(cursor, rows)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+
+        written = sum(views for _, views in rows)
+        get_metrics_registry().counter('content_views_flushed_total').inc(written)
+        return written
+
+    @staticmethod
+    def _upsert(cursor, rows: List[tuple]):
+        """Add each (content_id, views) pair to Content_Metrics in chunked statements"""
+        for start in range(0, len(rows), FLUSH_CHUNK_SIZE):
+            chunk = rows[start:start + FLUSH_CHUNK_SIZE]
+            placeholders = ', '.join(['(%s, %s, NOW())'] * len(chunk))
+            params = [value for row in chunk for value in row]
+            cursor.execute(f"""
+                INSERT INTO Content_Metrics (Content_ID, Views, Last_Updated)
+                VALUES {placeholders}
+                ON DUPLICATE KEY UPDATE
+                    Views = Views + VALUES(Views),
+                    Last_Updated = NOW()
+            """, params)
+
+    @staticmethod
+    def _existing_rows(cursor, rows: List[tuple]) -> List[tuple]:
+        """Keep only rows whose Content_ID still exists"""
+        placeholders = ', '.join(['%s'] * len(rows))
+        cursor.execute(
+            f"SELECT Content_ID FROM Content WHERE Content_ID IN ({placeholders})",
+            [content_id for content_id, _ in rows]
+        )
+        existing = {row[0] for row in cursor.fetchall()}
+        return [row for row in rows if row[0] in existing]
@@ -49,6 +49,8 @@ interface AnalyticsData {
   totalLikes: number;
   totalShares: number;
   totalComments: number;
+  avgTimeSpent?: number;
+  bounceRate?: number;
   topContent: ContentMetrics[];
   contentByType: { type: string; count: number; views: number }[];
   dailyViews: { date: string; views: number; likes: number }[];
@@ -1,7 +1,7 @@
 import React from 'react';
 import { Heart, Loader2 } from 'lucide-react';
 import { Button } from '@/components/ui/button';
-import { useLike } from '@/hooks/useLike';
+import { useLike, InitialLikeStatus } from '@/hooks/useLike';
 import { useAuth } from '@/contexts/AuthContext';
 import { cn } from '@/lib/utils';
 import { toast } from 'sonner';
@@ -12,6 +12,7 @@ interface LikeButtonProps {
   size?: 'sm' | 'md' | 'lg';
   showCount?: boolean;
   className?: string;
+  initialStatus?: InitialLikeStatus;
 }
 
 /**
@@ -23,10 +24,11 @@ const LikeButton: React.FC<LikeButtonProps> = ({
   variant = 'default',
   size = 'md',
   showCount = true,
-  className
+  className,
+  initialStatus
 }) => {
   const { user } = useAuth();
-  const { isLiked, likeCount, isLoading, error, toggleLike, clearError } = useLike(contentId);
+  const { isLiked, likeCount, isLoading, error, toggleLike, clearError } = useLike(contentId, initialStatus);
 
   // Show error toast when error occurs
   React.useEffect(() => {
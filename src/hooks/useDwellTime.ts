@@ -0,0 +1,44 @@
+import { useEffect } from 'react';
+import { contentApi } from '@/services/api';
+
+/**
+ * Reports how long a content page was visible, once per visit.
+ * The time is sent when the page is first hidden (tab switch, close, navigation)
+ * or when the component unmounts, whichever happens first.
+ */
+export const useDwellTime = (contentId?: number) => {
+  useEffect(() => {
+    if (!contentId) return;
+
+    let visibleSince: number | null = document.visibilityState === 'visible' ? Date.now() : null;
+    let visibleMs = 0;
+    let sent = false;
+
+    const report = () => {
+      if (sent) return;
+      if (visibleSince !== null) {
+        visibleMs += Date.now() - visibleSince;
+        visibleSince = null;
+      }
+      sent = true;
+      contentApi.recordDwell(contentId, Math.round(visibleMs / 1000));
+    };
+
+    const handleVisibilityChange = () => {
+      if (document.visibilityState === 'hidden') {
+        report();
+      } else if (visibleSince === null) {
+        visibleSince = Date.now();
+      }
+    };
+
+    document.addEventListener('visibilitychange', handleVisibilityChange);
+    window.addEventListener('pagehide', report);
+
+    return () => {
+      document.removeEventListener('visibilitychange', handleVisibilityChange);
+      window.removeEventListener('pagehide', report);
+      report();
+    };
+  }, [contentId]);
+};
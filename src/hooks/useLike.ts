@@ -9,25 +9,36 @@ interface LikeState {
   error: string | null;
 }
 
+export interface InitialLikeStatus {
+  isLiked: boolean;
+  likeCount: number;
+}
+
 /**
  * Custom hook for managing like functionality on content (blog posts, research papers, etc.)
- * Provides methods to like/unlike content and track like status
+ * Provides methods to like/unlike content and track like status.
+ * Pass initialStatus (e.g. is_liked/like_count embedded in a listing response)
+ * to skip the per-item like-status request.
  */
-export const useLike = (contentId: number) => {
+export const useLike = (contentId: number, initialStatus?: InitialLikeStatus) => {
   const { user, isAuthenticated } = useAuth();
   const [state, setState] = useState<LikeState>({
-    isLiked: false,
-    likeCount: 0,
+    isLiked: initialStatus?.isLiked ?? false,
+    likeCount: initialStatus?.likeCount ?? 0,
     isLoading: false,
     error: null
   });
 
-  // Fetch initial like status
+  // Fetch initial like status unless the caller already has it
   useEffect(() => {
+    if (initialStatus) {
+      setState(prev => ({ ...prev, isLiked: initialStatus.isLiked, likeCount: initialStatus.likeCount }));
+      return;
+    }
     if (contentId && user && isAuthenticated) {
       fetchLikeStatus();
     }
-  }, [contentId, user, isAuthenticated]);
+  }, [contentId, user, isAuthenticated, initialStatus?.isLiked, initialStatus?.likeCount]);
 
   const fetchLikeStatus = async () => {
     if (!user || !isAuthenticated) return;
@@ -30,9 +30,12 @@ const AdminDashboard = () => {
   // State for different data types
   const [accessRequests, setAccessRequests] = useState<AccessRequest[]>([]);
   const [users, setUsers] = useState<User[]>([]);
+  const [usersCursor, setUsersCursor] = useState<string | null>(null);
+  const [usersLoaded, setUsersLoaded] = useState(false);
   const [analytics, setAnalytics] = useState<Analytics | null>(null);
 
   const [auditLogs, setAuditLogs] = useState<AuditLog[]>([]);
+  const [auditLogsCursor, setAuditLogsCursor] = useState<string | null>(null);
   const [emailUsers, setEmailUsers] = useState<any[]>([]);
   const [emailLogs, setEmailLogs] = useState<any[]>([]);
   const [selectedUsers, setSelectedUsers] = useState<number[]>([]);
@@ -118,6 +121,13 @@ const AdminDashboard = () => {
     fetchAllData();
   }, []);
 
+  // Re-query users when the search or role filter changes (once the tab has been opened)
+  useEffect(() => {
+    if (!usersLoaded) return;
+    const timer = setTimeout(() => fetchUsers(), 300);
+    return () => clearTimeout(timer);
+  }, [userSearchTerm, roleFilter]);
+
   const fetchAllData = async () => {
     setIsLoading(true);
     await Promise.all([
@@ -140,11 +150,18 @@ const AdminDashboard = () => {
     }
   };
 
-  const fetchUsers = async () => {
+  // Users are searched and paged on the server; "Load more" continues from usersCursor
+  const fetchUsers = async (loadMore = false) => {
     try {
       setUsersLoading(true);
-      const response = await adminApi.getAllUsers();
-      setUsers(response.users);
+      const response = await adminApi.getAllUsers({
+        q: userSearchTerm.trim() || undefined,
+        role: roleFilter,
+        cursor: loadMore ? usersCursor || undefined : undefined
+      });
+      setUsers(prev => loadMore ? [...prev, ...response.users] : response.users);
+      setUsersCursor(response.next_cursor || null);
+      setUsersLoaded(true);
     } catch (error) {
       toast({
         title: 'Error',
@@ -174,11 +191,14 @@ const AdminDashboard = () => {
 
 
 
-  const fetchAuditLogs = async () => {
+  const fetchAuditLogs = async (loadMore = false) => {
     try {
       setAuditLogsLoading(true);
-      const response = await adminApi.getAuditLogs();
-      setAuditLogs(response.audit_logs);
+      const response = await adminApi.getAuditLogs({
+        cursor: loadMore ? auditLogsCursor || undefined : undefined
+      });
+      setAuditLogs(prev => loadMore ? [...prev, ...response.audit_logs] : response.audit_logs);
+      setAuditLogsCursor(response.next_cursor || null);
     } catch (error) {
       console.error('Error fetching audit logs:', error);
       toast({
@@ -605,7 +625,6 @@ const AdminDashboard = () => {
       setSendingEmail(true);
 
       const response = await adminApi.sendEmail(
-        parseInt(user.id),
         selectedUsers,
         emailForm.subject,
         emailForm.content,
@@ -770,7 +789,7 @@ const AdminDashboard = () => {
                 <TabsTrigger
                   value="users"
                   className="data-[state=active]:bg-black data-[state=active]:text-white data-[state=active]:shadow-lg hover:bg-gray-200 flex items-center gap-2 px-6 py-3 rounded-lg text-sm font-semibold transition-all duration-300"
-                  onClick={() => !users.length && fetchUsers()}
+                  onClick={() => !usersLoaded && fetchUsers()}
                 >
                   <Users className="h-4 w-4" />
                   User Management
@@ -1174,7 +1193,7 @@ const AdminDashboard = () => {
                       </Select>
                     </div>
 
-                    {usersLoading ? (
+                    {usersLoading && !users.length ? (
                       <div className="flex items-center justify-center py-8">
                         <Loader2 className="h-8 w-8 animate-spin" />
                         <span className="ml-2">Loading users...</span>
@@ -1323,6 +1342,13 @@ const AdminDashboard = () => {
                             ))}
                           </TableBody>
                         </Table>
+                        {usersCursor && (
+                          <div className="flex justify-center mt-6">
+                            <Button variant="outline" onClick={() => fetchUsers(true)} disabled={usersLoading}>
+                              Load more users
+                            </Button>
+                          </div>
+                        )}
                       </div>
                     )}
                   </CardContent>
@@ -2013,7 +2039,7 @@ const AdminDashboard = () => {
                     </div>
                   </CardHeader>
                   <CardContent>
-                    {auditLogsLoading ? (
+                    {auditLogsLoading && !auditLogs.length ? (
                       <div className="flex items-center justify-center py-8">
                         <Loader2 className="h-8 w-8 animate-spin" />
                         <span className="ml-2">Loading activity logs...</span>
@@ -2056,6 +2082,13 @@ const AdminDashboard = () => {
                             ))}
                           </TableBody>
                         </Table>
+                        {auditLogsCursor && (
+                          <div className="flex justify-center mt-6">
+                            <Button variant="outline" onClick={() => fetchAuditLogs(true)} disabled={auditLogsLoading}>
+                              Load older activity
+                            </Button>
+                          </div>
+                        )}
                       </div>
                     )}
                   </CardContent>
@@ -8,6 +8,7 @@ import { Skeleton } from '@/components/ui/skeleton';
 import { Textarea } from '@/components/ui/textarea';
 import { useToast } from '@/components/ui/use-toast';
 import LikeButton from '@/components/ui/LikeButton';
+import { useDwellTime } from '@/hooks/useDwellTime';
 import {
   Calendar,
   User,
@@ -51,6 +52,8 @@ const BlogPost = () => {
   const canEdit = post && user && (user.id === post.user_id.toString() || user.role === 'Admin');
   const canDelete = post && user && user.role === 'Admin';
 
+  useDwellTime(post?.content_id);
+
   // Fetch blog post and comments
   useEffect(() => {
     const fetchBlogPost = async () => {
@@ -271,6 +274,7 @@ const BlogPost = () => {
     try {
       // Update share count
       setMetrics(prev => ({ ...prev, shares: prev.shares + 1 }));
+      contentApi.recordShare(post.content_id).catch(() => undefined);
 
       // Check if Web Share API is supported
       if (navigator.share && navigator.canShare && navigator.canShare(shareData)) {
@@ -446,6 +446,10 @@ const BlogPosts = () => {
                             variant="compact"
                             size="sm"
                             showCount={true}
+                            initialStatus={post.is_liked !== undefined && user ? {
+                              isLiked: post.is_liked,
+                              likeCount: post.like_count ?? 0
+                            } : undefined}
                           />
 
                           {canSaveContent && (
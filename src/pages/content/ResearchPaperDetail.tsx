@@ -3,6 +3,7 @@ import { useParams, useNavigate, Link } from 'react-router-dom';
 import { useAuth, Permission } from '@/contexts/AuthContext';
 import { contentApi, userApi } from '@/services/api';
 import { useToast } from '@/hooks/use-toast';
+import { useDwellTime } from '@/hooks/useDwellTime';
 import { Button } from '@/components/ui/button';
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from '@/components/ui/card';
 import { Badge } from '@/components/ui/badge';
@@ -64,6 +65,8 @@ const ResearchPaperDetail = () => {
   const canEdit = paper && user && (user.id === paper.user_id.toString() || user.role === 'Admin');
   const canDelete = paper && user && user.role === 'Admin';
 
+  useDwellTime(paper?.content_id);
+
   useEffect(() => {
     if (id) {
       fetchResearchPaper(parseInt(id));
@@ -164,6 +167,10 @@ const ResearchPaperDetail = () => {
   };
 
   const handleShare = async () => {
+    if (paper) {
+      contentApi.recordShare(paper.content_id).catch(() => undefined);
+    }
+
     if (navigator.share) {
       try {
         await navigator.share({
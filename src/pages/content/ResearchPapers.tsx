@@ -8,6 +8,7 @@ import { Badge } from '@/components/ui/badge';
 import { Skeleton } from '@/components/ui/skeleton';
 import { useToast } from '@/components/ui/use-toast';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from '@/components/ui/select';
+import LikeButton from '@/components/ui/LikeButton';
 import { FileText, Search, Download, Calendar, User, Plus, Loader2, Edit, Trash2, Save } from 'lucide-react';
 import { contentApi, userApi, ResearchPaper } from '@/services/api';
 
@@ -493,6 +494,16 @@ const ResearchPapers = () => {
 
                             {/* Comments/Citations badge - like in your image */}
                             <div className="flex items-center gap-2">
+                              <LikeButton
+                                contentId={paper.content_id}
+                                variant="compact"
+                                size="sm"
+                                showCount={true}
+                                initialStatus={paper.is_liked !== undefined && user ? {
+                                  isLiked: paper.is_liked,
+                                  likeCount: paper.like_count ?? 0
+                                } : undefined}
+                              />
                               <Badge variant="outline" className="border-blue-500 text-blue-600 bg-blue-50">
                                 💬 {paper.citation_count || 6}
                               </Badge>
@@ -64,10 +64,12 @@ export interface User {
   years_of_experience: number;
   role_name: string;
   is_active: boolean;
+  last_seen_at?: string | null;
 }
 
 export interface UsersResponse {
   users: User[];
+  next_cursor?: string | null;
 }
 
 export interface Analytics {
@@ -198,6 +200,7 @@ export interface AuditLog {
 
 export interface AuditLogsResponse {
   audit_logs: AuditLog[];
+  next_cursor?: string | null;
 }
 
 export interface LikeResponse {
@@ -214,6 +217,11 @@ export interface LikeStatusResponse {
   like_count: number;
 }
 
+export interface BulkLikeStatusResponse {
+  success: boolean;
+  statuses: Record<string, { is_liked: boolean; like_count: number }>;
+}
+
 export interface ApiError {
   error: string;
 }
@@ -510,8 +518,23 @@ export const adminApi = {
     });
   },
 
-  getAllUsers: async (): Promise<UsersResponse> => {
-    return apiClient.get<UsersResponse>('/admin/users');
+  getAllUsers: async (params?: {
+    q?: string;
+    role?: string;
+    status?: string;
+    active?: boolean;
+    limit?: number;
+    cursor?: string;
+  }): Promise<UsersResponse> => {
+    const queryParams = new URLSearchParams();
+    if (params?.q) queryParams.append('q', params.q);
+    if (params?.role && params.role !== 'all') queryParams.append('role', params.role);
+    if (params?.status) queryParams.append('status', params.status);
+    if (params?.active !== undefined) queryParams.append('active', params.active.toString());
+    if (params?.limit) queryParams.append('limit', params.limit.toString());
+    if (params?.cursor) queryParams.append('cursor', params.cursor);
+
+    return apiClient.get<UsersResponse>(`/admin/users?${queryParams}`);
   },
 
   getAnalytics: async (): Promise<Analytics> => {
@@ -522,8 +545,25 @@ export const adminApi = {
     return apiClient.get<AdminAnalytics>('/admin/analytics/enhanced');
   },
 
-  getAuditLogs: async (): Promise<AuditLogsResponse> => {
-    return apiClient.get<AuditLogsResponse>('/admin/audit_logs');
+  getAuditLogs: async (params?: {
+    admin_id?: number;
+    action_type?: string;
+    date_from?: string;
+    date_to?: string;
+    archive?: boolean;
+    limit?: number;
+    cursor?: string;
+  }): Promise<AuditLogsResponse> => {
+    const queryParams = new URLSearchParams();
+    if (params?.admin_id) queryParams.append('admin_id', params.admin_id.toString());
+    if (params?.action_type) queryParams.append('action_type', params.action_type);
+    if (params?.date_from) queryParams.append('date_from', params.date_from);
+    if (params?.date_to) queryParams.append('date_to', params.date_to);
+    if (params?.archive) queryParams.append('archive', 'true');
+    if (params?.limit) queryParams.append('limit', params.limit.toString());
+    if (params?.cursor) queryParams.append('cursor', params.cursor);
+
+    return apiClient.get<AuditLogsResponse>(`/admin/audit_logs?${queryParams}`);
   },
 
   updateUserRole: async (
@@ -613,14 +653,12 @@ export const adminApi = {
 
   // Email management
   sendEmail: async (
-    adminId: number,
     recipientUserIds: number[],
     subject: string,
     content: string,
     emailType: string = 'announcement'
   ): Promise<{ message: string; recipients_count: number }> => {
     return apiClient.post('/admin/send_email', {
-      admin_id: adminId,
       recipient_user_ids: recipientUserIds,
       subject,
       content,
@@ -725,6 +763,8 @@ export interface BlogPost {
   publication_date: string;
   author_name: string;
   comment_count: number;
+  like_count?: number;
+  is_liked?: boolean;
 }
 
 export interface ResearchPaper {
@@ -749,6 +789,8 @@ export interface ResearchPaper {
   citation_count: number;
   author_name: string;
   pdf_url?: string;
+  like_count?: number;
+  is_liked?: boolean;
 }
 
 export interface Job {
@@ -1453,6 +1495,25 @@ export const contentApi = {
   getLikeStatus: async (contentId: number): Promise<LikeStatusResponse> => {
     return apiClient.get<LikeStatusResponse>(`/api/content/${contentId}/like-status`);
   },
+
+  getBulkLikeStatus: async (contentIds: number[]): Promise<BulkLikeStatusResponse> => {
+    return apiClient.get<BulkLikeStatusResponse>(`/api/content/like-status?ids=${contentIds.join(',')}`);
+  },
+
+  // Engagement tracking
+  recordShare: async (contentId: number): Promise<{ success: boolean; message: string }> => {
+    return apiClient.post(`/api/content/${contentId}/share`);
+  },
+
+  // Fire-and-forget so it still goes out while the page is being hidden or closed
+  recordDwell: (contentId: number, seconds: number): void => {
+    const url = `${API_BASE_URL}/api/content/${contentId}/dwell`;
+    const body = JSON.stringify({ seconds });
+    if (navigator.sendBeacon && navigator.sendBeacon(url, body)) {
+      return;
+    }
+    fetch(url, { method: 'POST', body, keepalive: true }).catch(() => undefined);
+  },
 };
 
 export default apiClient;